@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Transparent-Pixel Canonicalization and Alpha Bleeding for Terror in the Jungle
+- Sprite PNGs carry leftover RGB noise under alpha 0; zeroing it gives
+  every encoder (pngquant palettes, deflate, WebP) less entropy to store
+- Optional bleed: each pass fills the 8-neighbour ring around what is
+  already coloured with the mean of its filled neighbours, so colour
+  spreads out a few pixels by chessboard distance and bilinear filtering
+  and mipmaps sample foliage green instead of black halos; beyond the
+  radius RGB is still zeroed
+- Used by smart_optimize_clean.py before pngquant or the lossless pass;
+  run on its own it reports the size each stage buys per sprite
+"""
+
+import sys
+import io
+import json
+import argparse
+import subprocess
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image
+    HAS_PIL = True
+
+from pipeline_journal import write_text_atomic
+
+Image.MAX_IMAGE_PIXELS = None
+
+ALPHA_MODES = ['off', 'zero', 'bleed']
+STAGES = ['as_is', 'zero', 'bleed']
+
+# A few texels covers bilinear filtering and the first mip levels without paying for a wide halo
+DEFAULT_BLEED_RADIUS = 4
+
+NEIGHBOURS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def zero_transparent(rgba: np.ndarray) -> np.ndarray:
+    """Copy with RGB cleared wherever alpha is 0"""
+    out = rgba.copy()
+    out[rgba[..., 3] == 0, :3] = 0
+    return out
+
+
+def dilate(mask: np.ndarray) -> np.ndarray:
+    """8-neighbour binary dilation"""
+    padded = np.pad(mask, 1)
+    height, width = mask.shape
+    grown = mask.copy()
+    for dy, dx in NEIGHBOURS:
+        grown |= padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+    return grown
+
+
+def bleed_edges(rgba: np.ndarray, radius: int = DEFAULT_BLEED_RADIUS) -> np.ndarray:
+    """
+    Zero RGB under alpha 0, then fill transparent texels within `radius`
+    (chessboard distance) of visible ones with the mean colour of their
+    already-filled neighbours, one ring per pass. Only the frontier is
+    touched, so cost scales with the sprite outline rather than its area.
+    Alpha is never changed.
+    """
+    out = zero_transparent(rgba)
+    filled = rgba[..., 3] > 0
+    height, width = filled.shape
+
+    for _ in range(radius):
+        ys, xs = np.nonzero(dilate(filled) & ~filled)
+        if len(ys) == 0:
+            break
+
+        total = np.zeros((len(ys), 3), dtype=np.uint32)
+        count = np.zeros(len(ys), dtype=np.uint32)
+        for dy, dx in NEIGHBOURS:
+            ny, nx = ys + dy, xs + dx
+            inside = (ny >= 0) & (ny < height) & (nx >= 0) & (nx < width)
+            ny, nx = np.clip(ny, 0, height - 1), np.clip(nx, 0, width - 1)
+            use = inside & filled[ny, nx]
+            total += out[ny, nx, :3] * use[:, None]
+            count += use
+
+        out[ys, xs, :3] = (total + count[:, None] // 2) // count[:, None]
+        filled[ys, xs] = True
+    return out
+
+
+def prepare_rgba(rgba: np.ndarray, mode: str, radius: int = DEFAULT_BLEED_RADIUS) -> np.ndarray:
+    if mode == 'zero':
+        return zero_transparent(rgba)
+    if mode == 'bleed':
+        return bleed_edges(rgba, radius)
+    return rgba
+
+
+def has_transparency(img: Image.Image) -> bool:
+    return img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info
+
+
+def prepare_image(img: Image.Image, mode: str,
+                  radius: int = DEFAULT_BLEED_RADIUS) -> Tuple[Image.Image, Optional[dict]]:
+    """In-memory variant for images the caller has already decoded or resized"""
+    if mode == 'off' or not has_transparency(img):
+        return img, None
+    rgba = np.asarray(img.convert('RGBA'))
+    if not (rgba[..., 3] == 0).any():
+        return img, None
+    prepared = prepare_rgba(rgba, mode, radius)
+    return Image.fromarray(prepared, 'RGBA'), alpha_stats(rgba, prepared, mode, radius)
+
+
+def alpha_stats(rgba: np.ndarray, prepared: np.ndarray, mode: str, radius: int) -> dict:
+    transparent = rgba[..., 3] == 0
+    stats = {
+        'mode': mode,
+        'transparent_fraction': round(float(transparent.mean()), 4),
+        'noisy_pixels': int((rgba[transparent, :3] != 0).any(axis=1).sum())
+    }
+    if mode == 'bleed':
+        stats['radius'] = radius
+        stats['bled_pixels'] = int((prepared[transparent, :3] != 0).any(axis=1).sum())
+    return stats
+
+
+def encode_png(rgba: np.ndarray) -> int:
+    buffer = io.BytesIO()
+    Image.fromarray(rgba, 'RGBA').save(buffer, 'PNG', optimize=True)
+    return buffer.tell()
+
+
+def encode_webp(rgba: np.ndarray) -> int:
+    buffer = io.BytesIO()
+    # Pillow drops RGB under alpha 0 itself unless told to keep it
+    Image.fromarray(rgba, 'RGBA').save(buffer, 'WEBP', lossless=True, method=4, exact=True)
+    return buffer.tell()
+
+
+def encode_pngquant(rgba: np.ndarray) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / 'in.png'
+        Image.fromarray(rgba, 'RGBA').save(source, 'PNG', compress_level=1)
+        result = subprocess.run(['pngquant', '--quality=90-100', '--speed=3', '--output',
+                                 str(Path(tmp) / 'out.png'), str(source)], capture_output=True)
+        if result.returncode != 0:
+            return 0
+        return (Path(tmp) / 'out.png').stat().st_size
+
+
+ENCODERS = {
+    'png': encode_png,
+    'webp': encode_webp,
+    'pngquant': encode_pngquant
+}
+
+
+class AlphaBleedReport:
+    def __init__(self, project_root: Path, radius: int, encoders: List[str], workers: Optional[int] = None):
+        self.project_root = project_root
+        self.assets_dir = project_root / 'public' / 'assets'
+        self.radius = radius
+        self.encoders = encoders
+        self.workers = workers
+
+    def measure(self, path: Path) -> Optional[dict]:
+        with Image.open(path) as img:
+            if not has_transparency(img):
+                return None
+            rgba = np.asarray(img.convert('RGBA'))
+        if not (rgba[..., 3] == 0).any():
+            return None
+
+        variants = {
+            'as_is': rgba,
+            'zero': zero_transparent(rgba),
+            'bleed': bleed_edges(rgba, self.radius)
+        }
+        jobs = [(encoder, stage) for encoder in self.encoders for stage in STAGES]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            sizes = list(pool.map(lambda job: ENCODERS[job[0]](variants[job[1]]), jobs))
+
+        encoded: Dict[str, dict] = {}
+        for (encoder, stage), size in zip(jobs, sizes):
+            encoded.setdefault(encoder, {})[stage] = size
+        for sizes_by_stage in encoded.values():
+            base = sizes_by_stage['as_is']
+            if base:
+                sizes_by_stage['zero_delta'] = round(sizes_by_stage['zero'] / base - 1, 4)
+                sizes_by_stage['bleed_delta'] = round(sizes_by_stage['bleed'] / base - 1, 4)
+
+        return {
+            'width': int(rgba.shape[1]),
+            'height': int(rgba.shape[0]),
+            'source_bytes': path.stat().st_size,
+            'alpha': alpha_stats(rgba, variants['bleed'], 'bleed', self.radius),
+            'encoded': encoded
+        }
+
+    def run(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - ALPHA CANONICALIZATION REPORT")
+        print("=" * 70)
+
+        sprites = sorted(self.assets_dir.glob('*.png'))
+        print(f"\n Measuring {len(sprites)} PNGs, bleed radius {self.radius}, encoders: {', '.join(self.encoders)}")
+        header = '  '.join(f"{encoder + ' KB':>11} {'zero':>7} {'bleed':>7}" for encoder in self.encoders)
+        print(f"\n   {'sprite':<26} {'clear':>6} {'noisy':>6}  {header}")
+
+        assets = {}
+        totals = {encoder: dict.fromkeys(STAGES, 0) for encoder in self.encoders}
+        for path in sprites:
+            entry = self.measure(path)
+            if entry is None:
+                continue
+            assets[path.name] = entry
+            columns = []
+            for encoder in self.encoders:
+                sizes = entry['encoded'][encoder]
+                for stage in STAGES:
+                    totals[encoder][stage] += sizes[stage]
+                if not sizes['as_is']:
+                    columns.append(f"{'failed':>11} {'':>7} {'':>7}")
+                    continue
+                columns.append(f"{sizes['as_is'] / 1024:>11.1f} {sizes['zero_delta']:>+7.1%} "
+                               f"{sizes['bleed_delta']:>+7.1%}")
+            alpha = entry['alpha']
+            noisy = alpha['noisy_pixels'] / max(1, round(alpha['transparent_fraction'] * entry['width'] * entry['height']))
+            print(f"   {path.name[:26]:<26} {alpha['transparent_fraction']:>6.1%} {noisy:>6.1%}  {'  '.join(columns)}")
+
+        summary = {}
+        for encoder, sizes in totals.items():
+            if sizes['as_is']:
+                summary[encoder] = dict(sizes, zero_delta=round(sizes['zero'] / sizes['as_is'] - 1, 4),
+                                        bleed_delta=round(sizes['bleed'] / sizes['as_is'] - 1, 4))
+                print(f"\n {encoder}: {sizes['as_is'] / (1024 * 1024):.2f} MB as is, "
+                      f"{summary[encoder]['zero_delta']:+.1%} zeroed, {summary[encoder]['bleed_delta']:+.1%} bled")
+
+        report = {
+            'created': datetime.now().isoformat(),
+            'radius': self.radius,
+            'encoders': self.encoders,
+            'totals': summary,
+            'assets': assets
+        }
+        report_path = self.project_root / 'alpha_bleed_report.json'
+        write_text_atomic(report_path, json.dumps(report, indent=2))
+        print(f"\n Report saved to: {report_path}")
+        return report
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Measure what zeroing and bleeding transparent pixels saves')
+    parser.add_argument('--radius', type=int, default=DEFAULT_BLEED_RADIUS, help='Bleed radius in pixels')
+    parser.add_argument('--encoders', nargs='+', choices=list(ENCODERS), default=['png', 'webp'],
+                        help='Encoders to measure (default: png webp)')
+    parser.add_argument('--workers', type=int, help='Encoder threads (default: CPU count)')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    AlphaBleedReport(project_root, args.radius, args.encoders, args.workers).run()
+
+
+if __name__ == "__main__":
+    main()
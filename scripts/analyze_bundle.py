@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Bundle Composition Analyzer for Terror in the Jungle
+- Reads the Vite build in dist/ and the source maps next to each chunk
+  (build with `npm run build:analyze`, i.e. `vite build --sourcemap hidden`)
+- Attributes minified and gzip (and brotli, if available) bytes to every
+  original module and npm package, split into startup and lazy chunks
+- Flags duplicated packages/modules and legacy code shipped in the bundle
+  (*.old.ts, debug-only modules), plus src/ files that never reach it
+- Diffs against a baseline build or report to catch startup payload regressions
+"""
+
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+REPORT_VERSION = 1
+
+CHUNK_EXTENSIONS = {'.js', '.mjs', '.css'}
+
+# Source paths that should never ship; matched against project-relative module paths
+LEGACY_PATTERNS = [
+    ('old_copy', re.compile(r'\.old\.[cm]?[jt]sx?$')),
+    ('backup_copy', re.compile(r'(\.bak|\.orig|~)$|[._-](backup|copy)\.[jt]sx?$', re.IGNORECASE)),
+    ('debug_module', re.compile(r'(^|/)Debug[A-Z]\w*\.[jt]sx?$')),
+]
+
+UNMAPPED = '(unmapped)'
+
+BASE64_VALUES = {c: i for i, c in enumerate('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/')}
+
+SCRIPT_SRC = re.compile(r'<script[^>]*\bsrc="([^"]+)"', re.IGNORECASE)
+PRELOAD_HREF = re.compile(r'<link[^>]*\brel="(?:modulepreload|stylesheet)"[^>]*\bhref="([^"]+)"', re.IGNORECASE)
+PRELOAD_HREF_FIRST = re.compile(r'<link[^>]*\bhref="([^"]+)"[^>]*\brel="(?:modulepreload|stylesheet)"', re.IGNORECASE)
+
+
+def decode_vlq(segment: str) -> List[int]:
+    values = []
+    value = shift = 0
+    for char in segment:
+        digit = BASE64_VALUES[char]
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+def decode_mappings(mappings: str) -> List[List[Tuple[int, Optional[int]]]]:
+    """
+    Per generated line, the (generated column, source index) of each segment.
+    Columns reset every line; the source index is relative across the whole map.
+    """
+    lines = []
+    source = 0
+    for line in mappings.split(';'):
+        column = 0
+        segments = []
+        for segment in line.split(','):
+            if not segment:
+                continue
+            fields = decode_vlq(segment)
+            column += fields[0]
+            if len(fields) >= 4:
+                source += fields[1]
+                segments.append((column, source))
+            else:
+                segments.append((column, None))
+        lines.append(segments)
+    return lines
+
+
+def utf8_slice_sizes(line: str, columns: List[int]) -> List[int]:
+    """
+    UTF-8 byte length of line[columns[i]:columns[i+1]] (last slice runs to the
+    end of the line). Source map columns count UTF-16 code units.
+    """
+    if line.isascii():
+        bounds = columns + [len(line)]
+        return [max(0, bounds[i + 1] - bounds[i]) for i in range(len(columns))]
+    units = line.encode('utf-16-le')
+    bounds = [min(2 * c, len(units)) for c in columns] + [len(units)]
+    return [len(units[bounds[i]:bounds[i + 1]].decode('utf-16-le', errors='ignore').encode('utf-8'))
+            for i in range(len(columns))]
+
+
+def package_of(module: str) -> str:
+    parts = module.split('/')
+    if 'node_modules' in parts:
+        index = len(parts) - 1 - parts[::-1].index('node_modules')
+        name = parts[index + 1] if index + 1 < len(parts) else '(node_modules)'
+        if name.startswith('@') and index + 2 < len(parts):
+            name = f"{name}/{parts[index + 2]}"
+        return name
+    if module.startswith('('):
+        return '(virtual)'
+    return parts[0] if len(parts) > 1 else '(app)'
+
+
+def legacy_kind(module: str) -> Optional[str]:
+    if 'node_modules/' in module:
+        return None
+    for kind, pattern in LEGACY_PATTERNS:
+        if pattern.search(module):
+            return kind
+    return None
+
+
+def gzip_size(data: bytes) -> int:
+    return len(gzip.compress(data, 9, mtime=0))
+
+
+def brotli_size(data: bytes) -> Optional[int]:
+    return len(brotli.compress(data, quality=11)) if HAS_BROTLI else None
+
+
+class BundleAnalyzer:
+    def __init__(self, dist_dir: Path, project_root: Optional[Path] = None):
+        self.dist_dir = Path(dist_dir).resolve()
+        # dist/ sits in the project root; source map paths resolve against it
+        self.project_root = Path(project_root or self.dist_dir.parent).resolve()
+
+    def find_chunks(self) -> List[Path]:
+        return sorted(path for path in self.dist_dir.rglob('*')
+                      if path.is_file() and path.suffix in CHUNK_EXTENSIONS)
+
+    def startup_chunks(self) -> set:
+        """Chunks index.html pulls in before the game can start: entry scripts, preloads, stylesheets"""
+        index = self.dist_dir / 'index.html'
+        if not index.exists():
+            return set()
+        html = index.read_text(encoding='utf-8', errors='replace')
+        startup = set()
+        for pattern in (SCRIPT_SRC, PRELOAD_HREF, PRELOAD_HREF_FIRST):
+            for url in pattern.findall(html):
+                name = url.split('?')[0].split('/')[-1]
+                startup.update(rel for rel in self.chunk_names if rel.split('/')[-1] == name)
+        return startup
+
+    def module_path(self, map_dir: Path, source_root: str, source: str) -> str:
+        source = re.sub(r'^file://', '', source)
+        # Vite emits real files relative to the map; anything else is a virtual module
+        if not re.match(r'^(\.|/|[A-Za-z]:[\\/])', source):
+            return f"({source.lstrip(chr(0))})"
+        resolved = (map_dir / source_root / source).resolve()
+        try:
+            return resolved.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def analyze_chunk(self, path: Path) -> Tuple[dict, Dict[str, bytearray], Dict[str, str]]:
+        """Chunk totals, the generated bytes of each module and a hash of each module's original source"""
+        data = path.read_bytes()
+        map_path = path.with_name(path.name + '.map')
+        slices: Dict[str, bytearray] = {}
+        hashes: Dict[str, str] = {}
+
+        if not map_path.exists():
+            slices[UNMAPPED] = bytearray(data)
+        else:
+            source_map = json.loads(map_path.read_text(encoding='utf-8'))
+            source_root = source_map.get('sourceRoot') or ''
+            modules = [self.module_path(map_path.parent, source_root, source)
+                       for source in source_map.get('sources', [])]
+            for module, content in zip(modules, source_map.get('sourcesContent') or []):
+                if content is not None:
+                    hashes[module] = hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+            text = data.decode('utf-8', errors='replace')
+            lines = text.split('\n')
+            mapped_lines = decode_mappings(source_map.get('mappings', ''))
+            for number, line in enumerate(lines):
+                segments = mapped_lines[number] if number < len(mapped_lines) else []
+                # Newlines belong to the line they terminate
+                newline = b'\n' if number < len(lines) - 1 else b''
+                if not segments or segments[0][0] > 0:
+                    segments = [(0, None)] + segments
+                columns = [column for column, _ in segments]
+                sizes = utf8_slice_sizes(line, columns)
+                encoded = line.encode('utf-8')
+                offset = 0
+                module = UNMAPPED
+                for (column, source), size in zip(segments, sizes):
+                    module = modules[source] if source is not None and source < len(modules) else UNMAPPED
+                    if size:
+                        slices.setdefault(module, bytearray()).extend(encoded[offset:offset + size])
+                    offset += size
+                tail = encoded[offset:] + newline
+                if tail:
+                    slices.setdefault(module, bytearray()).extend(tail)
+
+        chunk = {
+            'file': path.relative_to(self.dist_dir).as_posix(),
+            'raw': len(data),
+            'gzip': gzip_size(data),
+            'brotli': brotli_size(data),
+            'source_map': map_path.exists(),
+            'modules': len(slices)
+        }
+        return chunk, slices, hashes
+
+    def attribute_compressed(self, chunk: dict, slices: Dict[str, bytearray]) -> Dict[str, dict]:
+        """
+        Compressed bytes per module. Each module's generated code is compressed
+        on its own, then scaled so the modules of a chunk sum to the chunk's
+        real compressed size (shared dictionary context is spread pro rata).
+        """
+        sizes = {}
+        for codec, compress in (('gzip', gzip_size), ('brotli', brotli_size)):
+            if chunk[codec] is None:
+                continue
+            alone = {module: compress(bytes(code)) if code else 0 for module, code in slices.items()}
+            total = sum(alone.values()) or 1
+            for module, size in alone.items():
+                sizes.setdefault(module, {})[codec] = size * chunk[codec] / total
+        return sizes
+
+    def analyze(self) -> dict:
+        chunk_paths = self.find_chunks()
+        self.chunk_names = [path.relative_to(self.dist_dir).as_posix() for path in chunk_paths]
+        startup = self.startup_chunks()
+
+        chunks = []
+        modules: Dict[str, dict] = {}
+        source_hashes: Dict[str, str] = {}
+        for path in chunk_paths:
+            chunk, slices, hashes = self.analyze_chunk(path)
+            chunk['startup'] = chunk['file'] in startup
+            chunks.append(chunk)
+            source_hashes.update(hashes)
+            compressed = self.attribute_compressed(chunk, slices)
+            for module, code in slices.items():
+                entry = modules.setdefault(module, {
+                    'package': package_of(module) if module != UNMAPPED else UNMAPPED,
+                    'raw': 0, 'gzip': 0.0, 'brotli': 0.0 if HAS_BROTLI else None,
+                    'startup_raw': 0, 'startup_gzip': 0.0, 'chunks': []
+                })
+                entry['raw'] += len(code)
+                entry['gzip'] += compressed.get(module, {}).get('gzip', 0.0)
+                if HAS_BROTLI:
+                    entry['brotli'] += compressed.get(module, {}).get('brotli', 0.0)
+                if chunk['startup']:
+                    entry['startup_raw'] += len(code)
+                    entry['startup_gzip'] += compressed.get(module, {}).get('gzip', 0.0)
+                entry['chunks'].append(chunk['file'])
+
+        for entry in modules.values():
+            for key in ('gzip', 'brotli', 'startup_gzip'):
+                if entry[key] is not None:
+                    entry[key] = int(round(entry[key]))
+
+        packages: Dict[str, dict] = {}
+        for module, entry in modules.items():
+            package = packages.setdefault(entry['package'], {
+                'raw': 0, 'gzip': 0, 'brotli': 0 if HAS_BROTLI else None,
+                'startup_raw': 0, 'startup_gzip': 0, 'modules': 0
+            })
+            package['modules'] += 1
+            for key in ('raw', 'gzip', 'brotli', 'startup_raw', 'startup_gzip'):
+                if package[key] is not None:
+                    package[key] += entry[key]
+
+        totals = {
+            'chunks': len(chunks),
+            'raw': sum(c['raw'] for c in chunks),
+            'gzip': sum(c['gzip'] for c in chunks),
+            'brotli': sum(c['brotli'] for c in chunks) if HAS_BROTLI else None,
+            'startup_raw': sum(c['raw'] for c in chunks if c['startup']),
+            'startup_gzip': sum(c['gzip'] for c in chunks if c['startup']),
+            'unmapped_raw': modules.get(UNMAPPED, {}).get('raw', 0),
+            'modules': len([m for m in modules if m != UNMAPPED]),
+            'chunks_without_source_map': [c['file'] for c in chunks if not c['source_map']]
+        }
+
+        return {
+            'version': REPORT_VERSION,
+            'timestamp': datetime.now().isoformat(),
+            'dist': str(self.dist_dir),
+            'totals': totals,
+            'chunks': chunks,
+            'packages': dict(sorted(packages.items(), key=lambda kv: -kv[1]['raw'])),
+            'modules': dict(sorted(modules.items(), key=lambda kv: -kv[1]['raw'])),
+            'duplicates': self.find_duplicates(modules, source_hashes),
+            'legacy': self.find_legacy(modules)
+        }
+
+    def find_duplicates(self, modules: Dict[str, dict], source_hashes: Dict[str, str]) -> dict:
+        # The same package resolved from more than one node_modules directory
+        package_roots: Dict[str, set] = {}
+        for module, entry in modules.items():
+            if 'node_modules/' in module:
+                root = module[:module.rindex('node_modules/')] + 'node_modules/' + entry['package']
+                package_roots.setdefault(entry['package'], set()).add(root)
+        packages = [{
+            'package': name,
+            'copies': sorted(roots),
+            'raw': sum(e['raw'] for m, e in modules.items() if e['package'] == name)
+        } for name, roots in sorted(package_roots.items()) if len(roots) > 1]
+
+        # One module emitted into several chunks
+        in_chunks = [{'module': module, 'chunks': entry['chunks'], 'raw': entry['raw']}
+                     for module, entry in modules.items()
+                     if module != UNMAPPED and len(entry['chunks']) > 1]
+
+        # Byte-identical sources shipped under different paths
+        by_hash: Dict[str, List[str]] = {}
+        for module, digest in source_hashes.items():
+            by_hash.setdefault(digest, []).append(module)
+        identical = [{
+            'modules': sorted(paths),
+            'wasted_raw': sum(sorted(modules[p]['raw'] for p in paths if p in modules)[:-1])
+        } for paths in by_hash.values() if len(paths) > 1]
+
+        return {
+            'packages': packages,
+            'modules_in_multiple_chunks': sorted(in_chunks, key=lambda d: -d['raw']),
+            'identical_sources': sorted(identical, key=lambda d: -d['wasted_raw'])
+        }
+
+    def find_legacy(self, modules: Dict[str, dict]) -> dict:
+        shipped = [{'module': module, 'kind': kind, 'raw': modules[module]['raw'],
+                    'startup': modules[module]['startup_raw'] > 0}
+                   for module in modules
+                   for kind in [legacy_kind(module)] if kind]
+
+        # src/ files the bundler never reached: dead weight in the tree rather than the payload
+        src_dir = self.project_root / 'src'
+        unreferenced = []
+        if src_dir.exists():
+            shipped_paths = set(modules)
+            for path in sorted(src_dir.rglob('*')):
+                if path.suffix not in ('.ts', '.tsx', '.js') or path.name.endswith('.d.ts'):
+                    continue
+                rel = path.relative_to(self.project_root).as_posix()
+                if rel not in shipped_paths:
+                    unreferenced.append({'module': rel, 'kind': legacy_kind(rel),
+                                         'bytes': path.stat().st_size})
+
+        return {'shipped': sorted(shipped, key=lambda d: -d['raw']), 'unreferenced_sources': unreferenced}
+
+
+def diff_reports(baseline: dict, current: dict) -> dict:
+    """Per-total, per-package and per-module byte deltas (current - baseline)"""
+    def delta_table(old: Dict[str, dict], new: Dict[str, dict]) -> List[dict]:
+        rows = []
+        for name in set(old) | set(new):
+            before = old.get(name, {})
+            after = new.get(name, {})
+            row = {'name': name, 'status': 'added' if not before else 'removed' if not after else 'changed'}
+            for key in ('raw', 'gzip', 'startup_raw', 'startup_gzip'):
+                row[f'{key}_before'] = before.get(key, 0)
+                row[f'{key}_after'] = after.get(key, 0)
+                row[f'{key}_delta'] = row[f'{key}_after'] - row[f'{key}_before']
+            if row['raw_delta'] or row['startup_raw_delta'] or row['status'] != 'changed':
+                rows.append(row)
+        return sorted(rows, key=lambda r: (-abs(r['startup_gzip_delta']), -abs(r['raw_delta']), r['name']))
+
+    totals = {}
+    for key in ('raw', 'gzip', 'startup_raw', 'startup_gzip', 'modules', 'chunks'):
+        before = baseline['totals'].get(key) or 0
+        after = current['totals'].get(key) or 0
+        totals[key] = {'before': before, 'after': after, 'delta': after - before}
+
+    return {
+        'baseline': baseline.get('dist'),
+        'current': current.get('dist'),
+        'totals': totals,
+        'packages': delta_table(baseline['packages'], current['packages']),
+        'modules': delta_table(baseline['modules'], current['modules'])
+    }
+
+
+def kb(value: Optional[float]) -> str:
+    return '-' if value is None else f"{value / 1024:.1f}KB"
+
+
+def signed_kb(value: float) -> str:
+    return f"{'+' if value > 0 else ''}{value / 1024:.1f}KB"
+
+
+def print_report(report: dict, top: int):
+    totals = report['totals']
+    print("\n" + "=" * 70)
+    print("TERROR IN THE JUNGLE - BUNDLE COMPOSITION")
+    print("=" * 70)
+    print(f"\n {totals['chunks']} chunks, {totals['modules']} modules: {kb(totals['raw'])} minified, "
+          f"{kb(totals['gzip'])} gzip" + (f", {kb(totals['brotli'])} brotli" if totals['brotli'] else ''))
+    print(f" Startup payload: {kb(totals['startup_raw'])} minified, {kb(totals['startup_gzip'])} gzip")
+    if totals['unmapped_raw']:
+        print(f" Unmapped bytes (helpers, preload polyfill, no source map): {kb(totals['unmapped_raw'])}")
+    for chunk in totals['chunks_without_source_map']:
+        print(f"   No source map: {chunk} (build with `npm run build:analyze`)")
+
+    print(f"\n {'package':<28} {'modules':>7} {'minified':>10} {'gzip':>10} {'startup gz':>11}")
+    print("-" * 70)
+    for name, package in list(report['packages'].items())[:top]:
+        print(f" {name[:28]:<28} {package['modules']:>7} {kb(package['raw']):>10} "
+              f"{kb(package['gzip']):>10} {kb(package['startup_gzip']):>11}")
+
+    print(f"\n Top {top} modules:")
+    print("-" * 70)
+    for name, module in list(report['modules'].items())[:top]:
+        print(f" {kb(module['raw']):>9} {kb(module['gzip']):>9}  {name}")
+
+    duplicates = report['duplicates']
+    if duplicates['packages'] or duplicates['modules_in_multiple_chunks'] or duplicates['identical_sources']:
+        print("\n Duplicates:")
+        for item in duplicates['packages']:
+            print(f"   package {item['package']} ({kb(item['raw'])}) from {len(item['copies'])} locations: "
+                  f"{', '.join(item['copies'])}")
+        for item in duplicates['modules_in_multiple_chunks']:
+            print(f"   {item['module']} in {len(item['chunks'])} chunks ({kb(item['raw'])})")
+        for item in duplicates['identical_sources']:
+            print(f"   identical sources ({kb(item['wasted_raw'])} wasted): {', '.join(item['modules'])}")
+
+    legacy = report['legacy']
+    if legacy['shipped']:
+        print("\n Legacy/debug code shipped in the bundle:")
+        for item in legacy['shipped']:
+            print(f"   {item['module']} [{item['kind']}] {kb(item['raw'])}" + (' (startup)' if item['startup'] else ''))
+    flagged = [item for item in legacy['unreferenced_sources'] if item['kind']]
+    if flagged:
+        print("\n Legacy/debug sources in src/ (not bundled, safe to delete):")
+        for item in flagged:
+            print(f"   {item['module']} [{item['kind']}]")
+    print(f" {len(legacy['unreferenced_sources'])} src/ files are not part of the bundle")
+
+
+def print_diff(diff: dict, top: int):
+    print("\n" + "=" * 70)
+    print("BUNDLE DIFF")
+    print("=" * 70)
+    print(f"\n Baseline: {diff['baseline']}")
+    print(f" Current:  {diff['current']}\n")
+    for key, label in (('startup_gzip', 'Startup gzip'), ('startup_raw', 'Startup minified'),
+                       ('gzip', 'Total gzip'), ('raw', 'Total minified')):
+        values = diff['totals'][key]
+        print(f" {label:<18} {kb(values['before']):>10} -> {kb(values['after']):>10}  ({signed_kb(values['delta'])})")
+
+    for title, rows in (('Packages', diff['packages']), ('Modules', diff['modules'])):
+        if not rows:
+            continue
+        print(f"\n {title} ({len(rows)} changed):")
+        print("-" * 70)
+        for row in rows[:top]:
+            print(f" {row['status']:<8} {signed_kb(row['raw_delta']):>10} min {signed_kb(row['gzip_delta']):>10} gz "
+                  f"{signed_kb(row['startup_gzip_delta']):>10} startup  {row['name']}")
+
+
+def load_report(path: Path) -> dict:
+    """A saved report, or a dist/ directory to analyze on the spot"""
+    path = Path(path)
+    if path.is_dir():
+        return BundleAnalyzer(path).analyze()
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Attribute bundle bytes to modules and packages via source maps')
+    parser.add_argument('--dist', default=str(project_root / 'dist'), help='Vite build output directory')
+    parser.add_argument('--output', default=str(project_root / 'bundle_report.json'),
+                        help='JSON report path ("-" for stdout)')
+    parser.add_argument('--baseline', help='Baseline report JSON or dist/ directory to diff against')
+    parser.add_argument('--diff-output', help='Write the diff as JSON to this path')
+    parser.add_argument('--max-startup-growth', type=float,
+                        help='Exit non-zero if startup gzip grew by more than this many KB versus the baseline')
+    parser.add_argument('--top', type=int, default=20, help='Rows to print per table')
+    args = parser.parse_args()
+
+    dist_dir = Path(args.dist)
+    if not dist_dir.exists():
+        print(f" Build output not found: {dist_dir} (run `npm run build:analyze` first)", file=sys.stderr)
+        sys.exit(1)
+
+    report = BundleAnalyzer(dist_dir).analyze()
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        print_report(report, args.top)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n Detailed report saved to: {args.output}")
+
+    if not args.baseline:
+        return
+
+    diff = diff_reports(load_report(Path(args.baseline)), report)
+    if args.output != '-':
+        print_diff(diff, args.top)
+    if args.diff_output:
+        # Status lines go to stderr so `--output -` keeps stdout pure JSON
+        with open(args.diff_output, 'w') as f:
+            json.dump(diff, f, indent=2)
+        print(f"\n Diff saved to: {args.diff_output}", file=sys.stderr)
+
+    growth = diff['totals']['startup_gzip']['delta'] / 1024
+    if args.max_startup_growth is not None and growth > args.max_startup_growth:
+        print(f"\n Startup payload grew {growth:.1f}KB gzip (limit {args.max_startup_growth:.1f}KB)", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Frame-Time Telemetry Analyzer for Terror in the Jungle
+- Reads captures written by src/core/FrameTelemetry.ts (F2 in game), either
+  the binary .tijt format or NDJSON, streaming them in fixed-size blocks
+- Reports p50/p95/p99/max for frame, update, render and every GameSystem
+  from fixed-resolution histograms, so memory stays flat for long sessions
+- Attributes each spike frame to the system (or render, GC, stall) that
+  ran furthest over its own median
+- Prints a flame-style breakdown and writes folded stacks for flamegraph.pl
+  or speedscope; --compare diffs two captures, e.g. VR sessions across builds
+"""
+
+import sys
+import json
+import struct
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b'TIJT'
+SUPPORTED_VERSIONS = {1}
+
+# Mirrors FRAME_FLAG_* in FrameTelemetry.ts
+FLAG_GC_SUSPECT = 1
+FLAG_VR = 2
+FLAG_STALL = 4
+
+BLOCK_FRAMES = 16384
+
+# Histogram resolution; anything above the range is kept exactly
+HISTOGRAM_STEP_MS = 0.05
+HISTOGRAM_RANGE_MS = 1000.0
+
+# Frame budgets by display: Quest-class headsets at 90 Hz, desktop at 60 Hz
+VR_BUDGET_MS = 1000.0 / 90
+DESKTOP_BUDGET_MS = 1000.0 / 60
+DEFAULT_SPIKE_FACTOR = 1.5
+
+UNTIMED = '(untimed update)'
+OUTSIDE = '(outside frame work)'
+GC = '(gc suspect)'
+STALL = '(stall)'
+
+
+def unique_names(names: List[str]) -> List[str]:
+    """A system registered twice (e.g. vrSystem) is updated twice; keep both entries apart"""
+    seen: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        seen[name] = seen.get(name, 0) + 1
+        unique.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+    return unique
+
+
+def record_dtype(system_count: int) -> np.dtype:
+    return np.dtype([
+        ('t', '<f8'), ('frame', '<f4'), ('update', '<f4'), ('render', '<f4'), ('heap', '<f4'),
+        ('combatants', '<u2'), ('flags', '<u2'), ('systems', '<f4', (system_count,))
+    ])
+
+
+def read_capture(path: Path, warn: bool = True) -> Tuple[dict, Iterator[np.ndarray]]:
+    """Capture header and an iterator over blocks of frame records (structured arrays)"""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+
+    if magic == MAGIC:
+        with open(path, 'rb') as f:
+            f.read(4)
+            version, header_length = struct.unpack('<HI', f.read(6))
+            header = json.loads(f.read(header_length).decode('utf-8'))
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"{path}: unsupported telemetry version {version}")
+        return header, iter_binary(path, 10 + header_length, record_dtype(len(header['systems'])), warn)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        header = json.loads(f.readline())
+    if header.get('format') != 'tij-frame-telemetry':
+        raise ValueError(f"{path}: not a frame telemetry capture")
+    return header, iter_ndjson(path, record_dtype(len(header['systems'])))
+
+
+def iter_binary(path: Path, offset: int, dtype: np.dtype, warn: bool = True) -> Iterator[np.ndarray]:
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while True:
+            data = f.read(dtype.itemsize * BLOCK_FRAMES)
+            usable = len(data) - len(data) % dtype.itemsize
+            if usable:
+                yield np.frombuffer(data[:usable], dtype=dtype)
+            if len(data) < dtype.itemsize * BLOCK_FRAMES:
+                if warn and usable != len(data):
+                    print(f" Warning: {path.name} ends with a partial record ({len(data) - usable} bytes ignored)",
+                          file=sys.stderr)
+                return
+
+
+def iter_ndjson(path: Path, dtype: np.dtype) -> Iterator[np.ndarray]:
+    block = np.zeros(BLOCK_FRAMES, dtype=dtype)
+    count = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        f.readline()
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            row = block[count]
+            row['t'] = record['t']
+            row['frame'] = record['frame']
+            row['update'] = record['update']
+            row['render'] = record['render']
+            row['heap'] = np.nan if record.get('heap') is None else record['heap']
+            row['combatants'] = record.get('combatants', 0)
+            row['flags'] = record.get('flags', 0)
+            row['systems'] = record['systems']
+            count += 1
+            if count == BLOCK_FRAMES:
+                yield block.copy()
+                count = 0
+    if count:
+        yield block[:count].copy()
+
+
+class Histogram:
+    """Fixed-step histograms for many series at once; exact values above the range"""
+
+    def __init__(self, series: int):
+        self.bins = int(HISTOGRAM_RANGE_MS / HISTOGRAM_STEP_MS)
+        self.counts = np.zeros((series, self.bins), dtype=np.int64)
+        self.overflow: List[List[float]] = [[] for _ in range(series)]
+        self.totals = np.zeros(series)
+        self.maxima = np.zeros(series)
+        self.frames = 0
+
+    def add(self, values: np.ndarray):
+        """values: (frames, series) in ms"""
+        values = np.nan_to_num(np.maximum(values, 0.0))
+        self.frames += values.shape[0]
+        self.totals += values.sum(axis=0)
+        self.maxima = np.maximum(self.maxima, values.max(axis=0, initial=0.0))
+        indices = (values / HISTOGRAM_STEP_MS).astype(np.int64)
+        for series in range(values.shape[1]):
+            column = indices[:, series]
+            inside = column < self.bins
+            self.counts[series] += np.bincount(column[inside], minlength=self.bins)
+            if not inside.all():
+                self.overflow[series].extend(values[~inside, series].tolist())
+
+    def percentile(self, series: int, fraction: float) -> float:
+        if self.frames == 0:
+            return 0.0
+        rank = fraction * (self.frames - 1)
+        cumulative = np.cumsum(self.counts[series])
+        in_range = int(cumulative[-1])
+        if rank < in_range:
+            index = int(np.searchsorted(cumulative, rank, side='right'))
+            return min((index + 0.5) * HISTOGRAM_STEP_MS, float(self.maxima[series]))
+        overflow = sorted(self.overflow[series])
+        return overflow[min(len(overflow) - 1, int(rank - in_range))]
+
+    def summary(self, series: int) -> dict:
+        return {
+            'mean': round(self.totals[series] / self.frames, 3) if self.frames else 0.0,
+            'p50': round(self.percentile(series, 0.50), 3),
+            'p95': round(self.percentile(series, 0.95), 3),
+            'p99': round(self.percentile(series, 0.99), 3),
+            'max': round(float(self.maxima[series]), 3),
+            'total_ms': round(float(self.totals[series]), 1)
+        }
+
+
+class TelemetryAnalyzer:
+    def __init__(self, path: Path, budget_ms: Optional[float] = None, spike_factor: float = DEFAULT_SPIKE_FACTOR,
+                 worst: int = 20):
+        self.path = Path(path)
+        self.budget_ms = budget_ms
+        self.spike_factor = spike_factor
+        self.worst = worst
+        self.header, _ = read_capture(self.path, warn=False)
+        self.systems: List[str] = unique_names(self.header['systems'])
+        self.passes = 0
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        self.passes += 1
+        return read_capture(self.path, warn=self.passes == 1)[1]
+
+    @staticmethod
+    def components(block: np.ndarray) -> Dict[str, np.ndarray]:
+        """Frame time split into parts that add up to frame_ms"""
+        systems = block['systems'].astype(np.float64)
+        update = block['update'].astype(np.float64)
+        render = block['render'].astype(np.float64)
+        return {
+            'systems': systems,
+            'untimed': np.maximum(update - systems.sum(axis=1), 0.0),
+            'render': render,
+            'outside': np.maximum(block['frame'].astype(np.float64) - update - render, 0.0)
+        }
+
+    def spike_threshold(self, flags: np.ndarray) -> np.ndarray:
+        if self.budget_ms is not None:
+            budget = np.full(flags.shape, self.budget_ms)
+        else:
+            budget = np.where(flags & FLAG_VR, VR_BUDGET_MS, DESKTOP_BUDGET_MS)
+        return budget * self.spike_factor
+
+    def analyze(self) -> dict:
+        labels = ['frame', 'update', 'render', UNTIMED, OUTSIDE] + self.systems
+        histogram = Histogram(len(labels))
+        frames = vr_frames = gc_frames = stall_frames = 0
+        duration_ms = 0.0
+        by_combatants: Dict[int, Histogram] = {}
+
+        # Pass 1: distributions
+        for block in self.blocks():
+            parts = self.components(block)
+            values = np.column_stack([block['frame'], block['update'], block['render'],
+                                      parts['untimed'], parts['outside'], parts['systems']])
+            histogram.add(values)
+            frames += len(block)
+            vr_frames += int(np.count_nonzero(block['flags'] & FLAG_VR))
+            gc_frames += int(np.count_nonzero(block['flags'] & FLAG_GC_SUSPECT))
+            stall_frames += int(np.count_nonzero(block['flags'] & FLAG_STALL))
+            if len(block):
+                duration_ms = float(block['t'][-1])
+            buckets = block['combatants'] // 16
+            for bucket in np.unique(buckets):
+                bucket_hist = by_combatants.setdefault(int(bucket), Histogram(1))
+                bucket_hist.add(block['frame'][buckets == bucket].reshape(-1, 1).astype(np.float64))
+
+        if frames == 0:
+            raise ValueError(f"{self.path}: capture has no frames")
+
+        summaries = {label: histogram.summary(i) for i, label in enumerate(labels)}
+        medians = np.array([summaries[label]['p50'] for label in labels])
+
+        # Pass 2: attribute every spike frame to the component furthest over its median
+        spike_labels = self.systems + ['render', UNTIMED, OUTSIDE]
+        spike_medians = np.concatenate([medians[5:], medians[[2, 3, 4]]])
+        culprits: Dict[str, dict] = {}
+        worst: List[dict] = []
+        spikes = 0
+        folded: Dict[str, float] = {}
+        spike_folded: Dict[str, float] = {}
+        for block in self.blocks():
+            parts = self.components(block)
+            matrix = np.column_stack([parts['systems'], parts['render'], parts['untimed'], parts['outside']])
+            self.fold(folded, matrix.sum(axis=0))
+
+            mask = block['frame'] > self.spike_threshold(block['flags'])
+            if not mask.any():
+                continue
+            spikes += int(mask.sum())
+            excess = matrix[mask] - spike_medians
+            self.fold(spike_folded, matrix[mask].sum(axis=0))
+            for row, frame in zip(excess, block[mask]):
+                culprit = self.label_outside(spike_labels[int(np.argmax(row))], int(frame['flags']))
+                entry = culprits.setdefault(culprit, {'spikes': 0, 'excess_ms': 0.0})
+                entry['spikes'] += 1
+                entry['excess_ms'] += float(row.max())
+                worst.append({
+                    'time_s': round(float(frame['t']) / 1000, 3),
+                    'frame_ms': round(float(frame['frame']), 2),
+                    'culprit': culprit,
+                    'combatants': int(frame['combatants']),
+                    'flags': self.flag_names(int(frame['flags'])),
+                    'over_median_ms': {self.label_outside(spike_labels[i], int(frame['flags'])): round(float(row[i]), 2)
+                                       for i in np.argsort(row)[::-1][:3] if row[i] > 0}
+                })
+            worst = sorted(worst, key=lambda s: -s['frame_ms'])[:self.worst]
+
+        for entry in culprits.values():
+            entry['excess_ms'] = round(entry['excess_ms'], 1)
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'capture': str(self.path),
+            'header': self.header,
+            'frames': frames,
+            'duration_s': round(duration_ms / 1000, 1),
+            'vr_frames': vr_frames,
+            'gc_suspect_frames': gc_frames,
+            'stall_frames': stall_frames,
+            'spike_threshold_ms': (round(self.budget_ms * self.spike_factor, 2) if self.budget_ms is not None
+                                   else {'vr': round(VR_BUDGET_MS * self.spike_factor, 2),
+                                         'desktop': round(DESKTOP_BUDGET_MS * self.spike_factor, 2)}),
+            'frame': summaries['frame'],
+            'update': summaries['update'],
+            'render': summaries['render'],
+            'untimed_update': summaries[UNTIMED],
+            'outside_frame_work': summaries[OUTSIDE],
+            'systems': {name: summaries[name] for name in self.systems},
+            'by_combatants': {f"{bucket * 16}-{bucket * 16 + 15}": dict(frames=hist.frames, **{
+                key: value for key, value in hist.summary(0).items() if key in ('p50', 'p95', 'p99')})
+                for bucket, hist in sorted(by_combatants.items())},
+            'spikes': spikes,
+            'spike_culprits': dict(sorted(culprits.items(), key=lambda kv: -kv[1]['excess_ms'])),
+            'worst_spikes': worst,
+            'folded': {stack: round(ms, 3) for stack, ms in folded.items()},
+            'spike_folded': {stack: round(ms, 3) for stack, ms in spike_folded.items()}
+        }
+
+    def fold(self, folded: Dict[str, float], totals: np.ndarray):
+        """Accumulate per-component ms into flame-graph stacks"""
+        stacks = [f"frame;update;{name}" for name in self.systems] + [
+            'frame;render', f"frame;update;{UNTIMED}", f"frame;{OUTSIDE}"]
+        for stack, value in zip(stacks, totals):
+            folded[stack] = folded.get(stack, 0.0) + float(value)
+
+    @staticmethod
+    def label_outside(label: str, flags: int) -> str:
+        """Time outside the update and render is GC or a stall when the capture flagged it"""
+        if label != OUTSIDE:
+            return label
+        if flags & FLAG_GC_SUSPECT:
+            return GC
+        if flags & FLAG_STALL:
+            return STALL
+        return label
+
+    @staticmethod
+    def flag_names(flags: int) -> List[str]:
+        return [name for bit, name in ((FLAG_GC_SUSPECT, 'gc_suspect'), (FLAG_VR, 'vr'), (FLAG_STALL, 'stall'))
+                if flags & bit]
+
+
+def print_flame(folded: Dict[str, float], title: str, width: int = 40):
+    """Icicle view of folded stacks: each level's share of the root"""
+    total = sum(folded.values())
+    if total <= 0:
+        return
+    tree: Dict[str, float] = {}
+    for stack, value in folded.items():
+        parts = stack.split(';')
+        for depth in range(1, len(parts) + 1):
+            key = ';'.join(parts[:depth])
+            tree[key] = tree.get(key, 0.0) + value
+
+    print(f"\n {title}")
+    print("-" * 70)
+
+    def walk(prefix: str, depth: int):
+        children = sorted((key for key in tree if key.startswith(prefix + ';') and key.count(';') == prefix.count(';') + 1),
+                          key=lambda key: -tree[key])
+        for key in children:
+            share = tree[key] / total
+            if share < 0.001:
+                continue
+            bar = '#' * max(1, int(round(share * width)))
+            print(f" {'  ' * depth}{key.split(';')[-1][:34 - 2 * depth]:<{34 - 2 * depth}} {share:>6.1%} {bar}")
+            walk(key, depth + 1)
+
+    walk('frame', 0)
+
+
+def print_report(report: dict, top: int):
+    print("\n" + "=" * 70)
+    print("TERROR IN THE JUNGLE - FRAME TELEMETRY")
+    print("=" * 70)
+    header = report['header']
+    print(f"\n Capture: {report['capture']}")
+    print(f" {report['frames']} frames over {report['duration_s']}s"
+          f" (mode {header.get('game_mode', '?')}, {report['vr_frames']} VR frames)")
+    print(f" GC-suspect frames: {report['gc_suspect_frames']}, stalls: {report['stall_frames']}, "
+          f"spikes: {report['spikes']} (threshold {report['spike_threshold_ms']})")
+
+    print(f"\n {'':<26} {'mean':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>8}")
+    print("-" * 70)
+    rows = [('frame', report['frame']), ('update', report['update']), ('render', report['render']),
+            ('untimed update', report['untimed_update']), ('outside frame work', report['outside_frame_work'])]
+    rows += sorted(report['systems'].items(), key=lambda kv: -kv[1]['p95'])[:top]
+    for name, stats in rows:
+        print(f" {name[:26]:<26} {stats['mean']:>7.2f} {stats['p50']:>7.2f} {stats['p95']:>7.2f} "
+              f"{stats['p99']:>7.2f} {stats['max']:>8.2f}")
+
+    if len(report['by_combatants']) > 1:
+        print("\n Frame time by live combatants:")
+        for bucket, stats in report['by_combatants'].items():
+            print(f"   {bucket:>7}: {stats['frames']:>7} frames  p50 {stats['p50']:.2f}  p95 {stats['p95']:.2f}  "
+                  f"p99 {stats['p99']:.2f}")
+
+    if report['spike_culprits']:
+        print("\n Spike attribution (component furthest over its median):")
+        for culprit, entry in report['spike_culprits'].items():
+            print(f"   {culprit:<28} {entry['spikes']:>6} spikes  {entry['excess_ms']:>9.1f}ms over median")
+        print("\n Worst spikes:")
+        for spike in report['worst_spikes'][:top]:
+            detail = ', '.join(f"{name} +{ms}ms" for name, ms in spike['over_median_ms'].items())
+            print(f"   t={spike['time_s']:>8.2f}s  {spike['frame_ms']:>7.2f}ms  {spike['culprit']:<24} {detail}")
+
+    print_flame(report['folded'], 'Where frame time goes (all frames):')
+    print_flame(report['spike_folded'], 'Where frame time goes (spike frames):')
+
+
+def compare_reports(baseline: dict, current: dict) -> dict:
+    def delta(old: dict, new: dict) -> dict:
+        return {key: {'before': old.get(key, 0.0), 'after': new.get(key, 0.0),
+                      'delta': round(new.get(key, 0.0) - old.get(key, 0.0), 3)}
+                for key in ('mean', 'p50', 'p95', 'p99', 'max')}
+
+    systems = sorted(set(baseline['systems']) | set(current['systems']))
+    return {
+        'baseline': baseline['capture'],
+        'current': current['capture'],
+        'frame': delta(baseline['frame'], current['frame']),
+        'update': delta(baseline['update'], current['update']),
+        'render': delta(baseline['render'], current['render']),
+        'spikes_per_1000_frames': {
+            'before': round(1000 * baseline['spikes'] / baseline['frames'], 2),
+            'after': round(1000 * current['spikes'] / current['frames'], 2)
+        },
+        'systems': {name: delta(baseline['systems'].get(name, {}), current['systems'].get(name, {}))
+                    for name in systems}
+    }
+
+
+def print_comparison(comparison: dict, top: int):
+    print("\n" + "=" * 70)
+    print("FRAME TELEMETRY COMPARISON")
+    print("=" * 70)
+    print(f"\n Baseline: {comparison['baseline']}")
+    print(f" Current:  {comparison['current']}")
+    spikes = comparison['spikes_per_1000_frames']
+    print(f" Spikes per 1000 frames: {spikes['before']} -> {spikes['after']}")
+
+    print(f"\n {'':<26} {'p50':>15} {'p95':>15} {'p99':>15}")
+    print("-" * 70)
+    rows = [('frame', comparison['frame']), ('update', comparison['update']), ('render', comparison['render'])]
+    rows += sorted(comparison['systems'].items(), key=lambda kv: -abs(kv[1]['p95']['delta']))[:top]
+    for name, stats in rows:
+        cells = [f"{stats[key]['after']:.2f} ({stats[key]['delta']:+.2f})" for key in ('p50', 'p95', 'p99')]
+        print(f" {name[:26]:<26} {cells[0]:>15} {cells[1]:>15} {cells[2]:>15}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analyze frame-time telemetry captures')
+    parser.add_argument('capture', help='Capture file (.tijt binary or .ndjson)')
+    parser.add_argument('--compare', help='Baseline capture to compare against')
+    parser.add_argument('--budget-ms', type=float,
+                        help='Frame budget for spike detection (default: 90 Hz in VR, 60 Hz on desktop)')
+    parser.add_argument('--spike-factor', type=float, default=DEFAULT_SPIKE_FACTOR,
+                        help='A frame over budget x factor counts as a spike')
+    parser.add_argument('--output', help='Write the JSON report to this path ("-" for stdout)')
+    parser.add_argument('--folded', help='Write folded stacks (microseconds) for flamegraph.pl/speedscope')
+    parser.add_argument('--top', type=int, default=15, help='Rows to print per table')
+    args = parser.parse_args()
+
+    path = Path(args.capture)
+    if not path.exists():
+        print(f" Capture not found: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        report = TelemetryAnalyzer(path, args.budget_ms, args.spike_factor).analyze()
+        baseline = (TelemetryAnalyzer(Path(args.compare), args.budget_ms, args.spike_factor).analyze()
+                    if args.compare else None)
+    except ValueError as e:
+        print(f" {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if baseline:
+        report['comparison'] = compare_reports(baseline, report)
+
+    if args.folded:
+        with open(args.folded, 'w') as f:
+            for stack, ms in sorted(report['folded'].items()):
+                f.write(f"{stack} {int(round(ms * 1000))}\n")
+        # Status lines go to stderr so `--output -` keeps stdout pure JSON
+        print(f"\n Folded stacks saved to: {args.folded}", file=sys.stderr)
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        return
+
+    print_report(report, args.top)
+    if baseline:
+        print_comparison(report['comparison'], args.top)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n Detailed report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
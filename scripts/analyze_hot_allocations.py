@@ -0,0 +1,527 @@
+#!/usr/bin/env python3
+"""
+Hot-Loop Allocation Analyzer for Terror in the Jungle
+- Parses src/**/*.ts and finds every class implementing GameSystem
+- Follows each update() method through the helpers it calls
+- Flags allocations, spreads, .map/.filter chains, closures and string
+  formatting on the per-frame path
+- Ranks findings by estimated executions per frame and call depth
+- Writes a machine-readable JSON report for burning down GC pressure
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+IDENT = r'[A-Za-z_$][\w$]*'
+
+MEMBER_MODIFIERS = r'(?:(?:public|private|protected|static|async|override|readonly|get|set)\s+)*'
+
+NOT_METHODS = {
+    'if', 'for', 'while', 'switch', 'catch', 'return', 'function', 'new',
+    'typeof', 'super', 'await', 'with'
+}
+
+# Each pattern is matched against comment/string-stripped code
+ALLOCATION_PATTERNS = [
+    ('new_three', re.compile(r'\bnew\s+THREE\.(\w+)\s*\('), 'new THREE.{0}()'),
+    ('new_object', re.compile(r'\bnew\s+(?!THREE\.)(\w+)\s*[(<]'), 'new {0}()'),
+    ('clone', re.compile(r'\.clone\s*\(\s*\)'), '.clone()'),
+    ('array_spread', re.compile(r'\[\s*\.\.\.'), '[...spread]'),
+    ('object_spread', re.compile(r'\{\s*\.\.\.'), '{...spread}'),
+    ('array_from', re.compile(r'\bArray\.from\s*\('), 'Array.from()'),
+    ('object_iter', re.compile(r'\bObject\.(keys|values|entries)\s*\('), 'Object.{0}()'),
+    ('array_chain', re.compile(r'\.(map|filter|reduce|flatMap|slice|concat|sort)\s*\('), '.{0}()'),
+    ('closure', re.compile(r'(?:\([^()]*\)|\b' + IDENT + r')\s*=>'), 'arrow closure'),
+    ('closure', re.compile(r'\bfunction\s*\('), 'function closure'),
+    ('string_format', re.compile(r'\.(toFixed|toString|join|split|padStart|padEnd)\s*\('), '.{0}()'),
+]
+
+LOOP_HEADER = re.compile(r'\b(for|while)\s*\(')
+DO_HEADER = re.compile(r'\bdo\s*\{')
+ITERATOR_CALL = re.compile(r'\.(forEach|map|filter|reduce|flatMap|some|every|find|findIndex|sort)\s*\(')
+
+THIS_CALL = re.compile(r'\bthis\.(' + IDENT + r')\s*\(')
+FIELD_CALL = re.compile(r'\bthis\.(' + IDENT + r')\s*[!?]?\.\s*(' + IDENT + r')\s*\(')
+
+
+def strip_source(text: str) -> Tuple[str, List[int]]:
+    """
+    Blank out comments, string and template literal contents, keeping every
+    offset (and therefore every line number) identical to the original.
+    Returns the stripped code and the offsets of interpolated template literals.
+    """
+    out = list(text)
+    templates = []
+    i, n = 0, len(text)
+    last_code = ''
+
+    def blank(start: int, end: int):
+        for k in range(start, end):
+            if out[k] != '\n':
+                out[k] = ' '
+
+    while i < n:
+        c = text[i]
+        nxt = text[i + 1] if i + 1 < n else ''
+        if c == '/' and nxt == '/':
+            end = text.find('\n', i)
+            end = n if end == -1 else end
+            blank(i, end)
+            i = end
+        elif c == '/' and nxt == '*':
+            end = text.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            blank(i, end)
+            i = end
+        elif c == '/' and last_code in '(,=:[!&|?{};+-*%<>~^':
+            # Regex literal
+            j = i + 1
+            in_class = False
+            while j < n and text[j] != '\n':
+                if text[j] == '\\':
+                    j += 2
+                    continue
+                if text[j] == '[':
+                    in_class = True
+                elif text[j] == ']':
+                    in_class = False
+                elif text[j] == '/' and not in_class:
+                    break
+                j += 1
+            blank(i + 1, j)
+            i = j + 1
+            last_code = '/'
+        elif c in '\'"':
+            j = i + 1
+            while j < n and text[j] != c and text[j] != '\n':
+                j += 2 if text[j] == '\\' else 1
+            blank(i + 1, j)
+            i = j + 1
+            last_code = c
+        elif c == '`':
+            j = i + 1
+            interpolated = False
+            depth = 0
+            while j < n:
+                if text[j] == '\\':
+                    j += 2
+                    continue
+                if depth == 0 and text[j] == '`':
+                    break
+                if text[j] == '$' and j + 1 < n and text[j + 1] == '{':
+                    interpolated = True
+                    depth += 1
+                    j += 2
+                    continue
+                if depth > 0 and text[j] == '{':
+                    depth += 1
+                elif depth > 0 and text[j] == '}':
+                    depth -= 1
+                j += 1
+            blank(i + 1, j)
+            if interpolated:
+                templates.append(i)
+            i = j + 1
+            last_code = '`'
+        else:
+            if not c.isspace():
+                last_code = c
+            i += 1
+
+    return ''.join(out), templates
+
+
+def match_close(code: str, open_index: int) -> int:
+    """Return the index of the bracket closing the one at open_index"""
+    pairs = {'{': '}', '(': ')', '[': ']'}
+    opener = code[open_index]
+    closer = pairs[opener]
+    depth = 0
+    for k in range(open_index, len(code)):
+        if code[k] == opener:
+            depth += 1
+        elif code[k] == closer:
+            depth -= 1
+            if depth == 0:
+                return k
+    return len(code) - 1
+
+
+class TSMethod:
+    def __init__(self, cls: 'TSClass', name: str, body_start: int, body_end: int):
+        self.cls = cls
+        self.name = name
+        self.body_start = body_start
+        self.body_end = body_end
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.cls.name}.{self.name}"
+
+
+class TSClass:
+    def __init__(self, name: str, source: 'TSSource', body_start: int, body_end: int,
+                 extends: Optional[str], implements: List[str]):
+        self.name = name
+        self.source = source
+        self.body_start = body_start
+        self.body_end = body_end
+        self.extends = extends
+        self.implements = implements
+        self.methods: Dict[str, TSMethod] = {}
+        self.field_types: Dict[str, str] = {}
+
+
+class TSSource:
+    def __init__(self, path: Path, rel_path: str):
+        self.path = path
+        self.rel_path = rel_path
+        self.text = path.read_text(encoding='utf-8')
+        self.code, self.templates = strip_source(self.text)
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', self.text)]
+
+    def line_of(self, offset: int) -> int:
+        lo, hi = 0, len(self.line_starts) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.line_starts[mid] <= offset:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo + 1
+
+    def line_text(self, offset: int) -> str:
+        line = self.line_of(offset)
+        start = self.line_starts[line - 1]
+        end = self.text.find('\n', start)
+        return self.text[start:end if end != -1 else len(self.text)].strip()
+
+
+class HotAllocationAnalyzer:
+    def __init__(self, src_dir: Path, loop_iterations: int = 10, max_depth: int = 8):
+        self.src_dir = Path(src_dir)
+        self.project_root = self.src_dir.parent
+        self.loop_iterations = loop_iterations
+        self.max_depth = max_depth
+
+        self.sources: List[TSSource] = []
+        self.classes: Dict[str, TSClass] = {}
+        self.findings: Dict[Tuple[str, int, str], dict] = {}
+        self.visited_methods: Set[str] = set()
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    def parse(self):
+        """Parse every TypeScript file under src/"""
+        for path in sorted(self.src_dir.rglob('*.ts')):
+            if path.name.endswith('.d.ts'):
+                continue
+            rel_path = path.relative_to(self.project_root).as_posix()
+            source = TSSource(path, rel_path)
+            self.sources.append(source)
+            self.parse_classes(source)
+
+    def parse_classes(self, source: TSSource):
+        code = source.code
+        header = re.compile(
+            r'\bclass\s+(' + IDENT + r')\s*(?:<[^{]*?>)?'
+            r'(?:\s+extends\s+(' + IDENT + r'(?:\.' + IDENT + r')*)\s*(?:<[^{]*?>)?)?'
+            r'(?:\s+implements\s+([^{]+))?\s*\{'
+        )
+        for match in header.finditer(code):
+            name = match.group(1)
+            extends = match.group(2).split('.')[-1] if match.group(2) else None
+            implements = [s.strip().split('<')[0] for s in (match.group(3) or '').split(',') if s.strip()]
+            body_start = match.end()
+            body_end = match_close(code, match.end() - 1)
+            cls = TSClass(name, source, body_start, body_end, extends, implements)
+            self.parse_members(cls)
+            # Later duplicate names (e.g. *.old.ts) must not shadow live classes
+            if name not in self.classes or '.old.' in self.classes[name].source.rel_path:
+                self.classes[name] = cls
+
+    def parse_members(self, cls: TSClass):
+        code = cls.source.code
+        body = code[cls.body_start:cls.body_end]
+
+        # Depth of every position relative to the class body
+        depth = [0] * (len(body) + 1)
+        d = 0
+        for k, ch in enumerate(body):
+            if ch in '})]':
+                d -= 1
+            depth[k] = d
+            if ch in '{([':
+                d += 1
+
+        method_re = re.compile(r'(?<![\w$.])' + MEMBER_MODIFIERS + r'(' + IDENT + r')\s*[?!]?\s*(?:<[^>(]*>)?\s*\(')
+        for match in method_re.finditer(body):
+            name = match.group(1)
+            if depth[match.start()] != 0 or name in NOT_METHODS:
+                continue
+            paren_open = match.end() - 1
+            paren_close = match_close(body, paren_open)
+            rest = body[paren_close + 1:]
+            sig = re.match(r'\s*(?::\s*[^;={]+?)?\s*\{', rest)
+            if not sig:
+                continue
+            brace_open = paren_close + 1 + sig.end() - 1
+            brace_close = match_close(body, brace_open)
+            cls.methods[name] = TSMethod(cls, name,
+                                         cls.body_start + brace_open + 1,
+                                         cls.body_start + brace_close)
+
+        # Arrow-function properties: private onTick = (dt: number) => { ... }
+        arrow_re = re.compile(MEMBER_MODIFIERS + r'(' + IDENT + r')\s*=\s*(?:async\s*)?\([^()]*\)\s*(?::\s*[^=]+?)?=>\s*\{')
+        for match in arrow_re.finditer(body):
+            if depth[match.start()] != 0:
+                continue
+            brace_open = match.end() - 1
+            brace_close = match_close(body, brace_open)
+            cls.methods[match.group(1)] = TSMethod(cls, match.group(1),
+                                                   cls.body_start + brace_open + 1,
+                                                   cls.body_start + brace_close)
+
+        # Field types from declarations and constructor parameter properties
+        field_re = re.compile(MEMBER_MODIFIERS + r'(' + IDENT + r')\s*[?!]?\s*:\s*(' + IDENT + r'(?:\.' + IDENT + r')*)')
+        for match in field_re.finditer(body):
+            type_name = match.group(2).split('.')[-1]
+            if type_name[0].isupper():
+                cls.field_types.setdefault(match.group(1), type_name)
+
+        # this.field = new Type(...)
+        for match in re.finditer(r'\bthis\.(' + IDENT + r')\s*=\s*new\s+(' + IDENT + r'(?:\.' + IDENT + r')*)', body):
+            cls.field_types.setdefault(match.group(1), match.group(2).split('.')[-1])
+
+    def find_method(self, class_name: str, method_name: str) -> Optional[TSMethod]:
+        seen = set()
+        while class_name and class_name in self.classes and class_name not in seen:
+            seen.add(class_name)
+            cls = self.classes[class_name]
+            if method_name in cls.methods:
+                return cls.methods[method_name]
+            class_name = cls.extends
+        return None
+
+    def field_type(self, class_name: str, field: str) -> Optional[str]:
+        seen = set()
+        while class_name and class_name in self.classes and class_name not in seen:
+            seen.add(class_name)
+            cls = self.classes[class_name]
+            if field in cls.field_types:
+                return cls.field_types[field]
+            class_name = cls.extends
+        return None
+
+    # ------------------------------------------------------------------
+    # Per-frame path traversal
+    # ------------------------------------------------------------------
+
+    def loop_ranges(self, method: TSMethod) -> List[Tuple[int, int]]:
+        """Ranges (absolute offsets) of loop bodies and iterator callbacks"""
+        code = method.cls.source.code
+        body = code[method.body_start:method.body_end]
+        ranges = []
+
+        for match in LOOP_HEADER.finditer(body):
+            paren_close = match_close(body, match.end() - 1)
+            rest = body[paren_close + 1:]
+            stripped = rest.lstrip()
+            if stripped.startswith('{'):
+                open_index = paren_close + 1 + (len(rest) - len(stripped))
+                ranges.append((open_index, match_close(body, open_index)))
+            elif match.group(1) == 'for' or not stripped.startswith(';'):
+                end = body.find(';', paren_close)
+                ranges.append((paren_close, end if end != -1 else len(body)))
+
+        for match in DO_HEADER.finditer(body):
+            open_index = match.end() - 1
+            ranges.append((open_index, match_close(body, open_index)))
+
+        for match in ITERATOR_CALL.finditer(body):
+            open_index = match.end() - 1
+            close_index = match_close(body, open_index)
+            # The callback itself is created once; only its body runs per element
+            arrow = body.find('=>', open_index, close_index)
+            ranges.append((arrow if arrow != -1 else open_index, close_index))
+
+        return [(method.body_start + a, method.body_start + b) for a, b in ranges]
+
+    @staticmethod
+    def loop_depth(ranges: List[Tuple[int, int]], offset: int) -> int:
+        return sum(1 for a, b in ranges if a < offset < b)
+
+    def record(self, method: TSMethod, offset: int, kind: str, detail: str,
+               depth: int, frequency: float, loops: int, entry: str, path: List[str]):
+        source = method.cls.source
+        line = source.line_of(offset)
+        key = (source.rel_path, line, detail)
+        finding = self.findings.get(key)
+        if finding is None:
+            finding = {
+                'file': source.rel_path,
+                'line': line,
+                'kind': kind,
+                'detail': detail,
+                'method': method.qualified_name,
+                'code': source.line_text(offset),
+                'call_depth': depth,
+                'loop_depth': loops,
+                'est_per_frame': frequency,
+                'entry_systems': [],
+                'call_path': path,
+            }
+            self.findings[key] = finding
+        else:
+            if frequency > finding['est_per_frame']:
+                finding['est_per_frame'] = frequency
+                finding['loop_depth'] = loops
+            if depth < finding['call_depth']:
+                finding['call_depth'] = depth
+                finding['call_path'] = path
+        if entry not in finding['entry_systems']:
+            finding['entry_systems'].append(entry)
+
+    def scan_method(self, method: TSMethod, depth: int, frequency: float,
+                    entry: str, path: List[str], stack: Set[str]):
+        """Record allocations in one method and recurse into the helpers it calls"""
+        self.visited_methods.add(method.qualified_name)
+        source = method.cls.source
+        code = source.code
+        body = code[method.body_start:method.body_end]
+        ranges = self.loop_ranges(method)
+
+        def freq_at(offset: int) -> Tuple[float, int]:
+            loops = self.loop_depth(ranges, offset)
+            return frequency * (self.loop_iterations ** loops), loops
+
+        for kind, pattern, label in ALLOCATION_PATTERNS:
+            for match in pattern.finditer(body):
+                offset = method.body_start + match.start()
+                detail = label.format(*match.groups()) if match.groups() else label
+                freq, loops = freq_at(offset)
+                self.record(method, offset, kind, detail, depth, freq, loops, entry, path)
+
+        for offset in source.templates:
+            if method.body_start <= offset < method.body_end:
+                freq, loops = freq_at(offset)
+                self.record(method, offset, 'string_format', 'template literal', depth, freq, loops, entry, path)
+
+        if depth >= self.max_depth:
+            return
+
+        callees = []
+        for match in THIS_CALL.finditer(body):
+            callees.append((match.start(), method.cls.name, match.group(1)))
+        for match in FIELD_CALL.finditer(body):
+            type_name = self.field_type(method.cls.name, match.group(1))
+            if type_name:
+                callees.append((match.start(), type_name, match.group(2)))
+
+        for rel_offset, class_name, method_name in callees:
+            callee = self.find_method(class_name, method_name)
+            if callee is None or callee.qualified_name in stack:
+                continue
+            freq, _ = freq_at(method.body_start + rel_offset)
+            self.scan_method(callee, depth + 1, freq, entry,
+                             path + [callee.qualified_name],
+                             stack | {callee.qualified_name})
+
+    def entry_classes(self) -> List[TSClass]:
+        return [cls for cls in self.classes.values()
+                if 'GameSystem' in cls.implements and 'update' in cls.methods]
+
+    def analyze(self) -> dict:
+        self.parse()
+        entries = self.entry_classes()
+        for cls in entries:
+            update = cls.methods['update']
+            self.scan_method(update, 0, 1.0, cls.name, [update.qualified_name], {update.qualified_name})
+
+        ranked = sorted(self.findings.values(),
+                        key=lambda f: (-f['est_per_frame'], f['call_depth'], f['file'], f['line']))
+        for rank, finding in enumerate(ranked, 1):
+            finding['rank'] = rank
+
+        by_kind: Dict[str, int] = {}
+        by_system: Dict[str, float] = {}
+        for finding in ranked:
+            by_kind[finding['kind']] = by_kind.get(finding['kind'], 0) + 1
+            for system in finding['entry_systems']:
+                by_system[system] = by_system.get(system, 0) + finding['est_per_frame']
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'loop_iterations_assumed': self.loop_iterations,
+            'max_call_depth': self.max_depth,
+            'files_parsed': len(self.sources),
+            'entry_systems': sorted(cls.name for cls in entries),
+            'methods_on_frame_path': len(self.visited_methods),
+            'total_findings': len(ranked),
+            'findings_by_kind': dict(sorted(by_kind.items())),
+            'est_allocations_per_frame_by_system': dict(
+                sorted(by_system.items(), key=lambda kv: -kv[1])),
+            'findings': ranked,
+        }
+
+
+def print_summary(report: dict, top: int):
+    print("\n" + "=" * 70)
+    print("TERROR IN THE JUNGLE - HOT-LOOP ALLOCATION ANALYZER")
+    print("=" * 70)
+    print(f"\n Parsed {report['files_parsed']} files, "
+          f"{len(report['entry_systems'])} GameSystems, "
+          f"{report['methods_on_frame_path']} methods on the per-frame path")
+    print(f" Findings: {report['total_findings']}")
+    for kind, count in report['findings_by_kind'].items():
+        print(f"   {kind:<15} {count}")
+
+    print(f"\n Top {top} by estimated executions per frame:")
+    print("-" * 70)
+    for finding in report['findings'][:top]:
+        print(f"{finding['rank']:4d}. x{finding['est_per_frame']:<8g} depth {finding['call_depth']}  "
+              f"{finding['file']}:{finding['line']}  {finding['detail']}")
+        print(f"       {finding['method']}: {finding['code'][:80]}")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Find GC allocations on the per-frame update() path')
+    parser.add_argument('--src', default=str(project_root / 'src'), help='TypeScript source directory')
+    parser.add_argument('--output', default=str(project_root / 'hot_allocation_report.json'),
+                        help='JSON report path ("-" for stdout)')
+    parser.add_argument('--loop-iterations', type=int, default=10,
+                        help='Assumed iterations per loop level when estimating frequency')
+    parser.add_argument('--max-depth', type=int, default=8, help='Maximum call depth to follow')
+    parser.add_argument('--top', type=int, default=25, help='Number of findings to print')
+    args = parser.parse_args()
+
+    src_dir = Path(args.src)
+    if not src_dir.exists():
+        print(f" Source directory not found: {src_dir}")
+        sys.exit(1)
+
+    analyzer = HotAllocationAnalyzer(src_dir, args.loop_iterations, args.max_depth)
+    report = analyzer.analyze()
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        return
+
+    print_summary(report, args.top)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n Detailed report saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Audio Codec Selection and Streaming Segmenter for Terror in the Jungle
+- calibrate: encodes sample sources of every audio category (ambient,
+  transmission, sfx) with Vorbis at the pipeline's quality and with Opus at
+  a bitrate ladder, measures both against the source with a log-spectral
+  distance, and picks Opus for a category when the cheapest Opus bitrate that
+  is at least as close to the source is also smaller. The choice is written
+  to scripts/audio_codecs.json; SmartOptimizer.optimize_audio follows its
+  Vorbis qualities everywhere, but only stream segments use an Opus pick
+- segment: splits long ambience tracks into fixed-duration, independently
+  decodable segments (with a short overlap for crossfading) plus an index,
+  so the client streams them with a bounded decode buffer. The index records
+  each track's MIME type; browsers that can't play it (or fail to decode a
+  segment) fall back to the track's full Vorbis file from src/config/audio.ts
+"""
+
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+from benchmark_asset_budgets import (AUDIO_CONTEXT_SAMPLE_RATE, AUDIO_EXTENSIONS, BYTES_PER_DECODED_SAMPLE,
+                                     discover_runtime_assets)
+from extract_audio_loops import read_audio, write_wav
+from smart_optimize_clean import SmartOptimizer
+from pipeline_journal import write_text_atomic
+
+CODECS_VERSION = 1
+STREAMS_VERSION = 1
+CATEGORIES = ['ambient', 'transmission', 'sfx']
+
+# Vorbis settings the pipeline used before codec selection existed
+VORBIS_QUALITY = {'ambient': '5', 'transmission': '5', 'sfx': '7'}
+OPUS_BITRATES = ['48k', '64k', '96k', '128k', '160k', '192k']
+
+# Opus always decodes at 48 kHz; compare everything there
+ANALYSIS_RATE = 48000
+FFT_SIZE = 2048
+HOP_SIZE = 1024
+SPECTRUM_FLOOR_DB = -100.0
+
+MAX_SAMPLES_PER_CATEGORY = 4
+
+# Streaming layout
+DEFAULT_SEGMENT_SECONDS = 10.0
+DEFAULT_OVERLAP_SECONDS = 0.05
+DEFAULT_MIN_STREAM_SECONDS = 30.0
+MIME_TYPES = {'.webm': 'audio/webm; codecs="opus"', '.ogg': 'audio/ogg; codecs="vorbis"'}
+
+
+def decode_to_rate(path: Path, rate: int = ANALYSIS_RATE) -> np.ndarray:
+    """Mono float32 at a fixed rate via ffmpeg, so every codec is compared alike"""
+    result = subprocess.run(['ffmpeg', '-v', 'error', '-i', str(path), '-ac', '1', '-ar', str(rate),
+                             '-f', 'f32le', '-'], capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype='<f4')
+
+
+def log_spectral_distance(reference: np.ndarray, decoded: np.ndarray) -> float:
+    """Mean per-frame RMS difference of the dB magnitude spectra (lower is closer)"""
+    length = min(len(reference), len(decoded))
+    if length < FFT_SIZE:
+        return 0.0
+    window = np.hanning(FFT_SIZE).astype(np.float32)
+    starts = np.arange(0, length - FFT_SIZE + 1, HOP_SIZE)
+    frames = np.lib.stride_tricks.sliding_window_view
+
+    def spectra(signal: np.ndarray) -> np.ndarray:
+        framed = frames(signal[:length], FFT_SIZE)[starts] * window
+        magnitude = np.abs(np.fft.rfft(framed, axis=1))
+        return np.maximum(20 * np.log10(magnitude + 1e-12), SPECTRUM_FLOOR_DB)
+
+    ref, dec = spectra(reference), spectra(decoded)
+    # Frames that are silent in the source say nothing about codec quality
+    audible = ref.max(axis=1) > SPECTRUM_FLOOR_DB + 20
+    if not audible.any():
+        return 0.0
+    return float(np.sqrt(((ref[audible] - dec[audible]) ** 2).mean(axis=1)).mean())
+
+
+def encode(source: Path, output: Path, codec: str, setting: str):
+    if codec == 'opus':
+        args = ['-c:a', 'libopus', '-b:a', setting, '-vbr', 'on', '-application', 'audio']
+    else:
+        args = ['-c:a', 'libvorbis', '-q:a', setting]
+    subprocess.run(['ffmpeg', '-v', 'error', '-i', str(source), *args, '-y', str(output)],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+
+class CodecCalibrator:
+    def __init__(self, project_root: Path, output_path: Path):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.output_path = Path(output_path)
+
+    def sample_sources(self) -> Dict[str, List[Path]]:
+        """Up to a few sources per category, preferring lossless WAV over re-encoding"""
+        groups: Dict[str, List[Path]] = {category: [] for category in CATEGORIES}
+        for path in discover_runtime_assets(self.assets_dir):
+            if path.suffix.lower() in AUDIO_EXTENSIONS:
+                groups[SmartOptimizer.detect_audio_category(path.name)].append(path)
+        for category, paths in groups.items():
+            paths.sort(key=lambda p: (p.suffix.lower() != '.wav', p.name))
+            del paths[MAX_SAMPLES_PER_CATEGORY:]
+        return groups
+
+    def measure(self, sources: List[Path], codec: str, setting: str, staging: Path) -> dict:
+        total_bytes = 0
+        distances = []
+        for source in sources:
+            output = staging / f"{source.stem}.{codec}.{setting}{'.webm' if codec == 'opus' else '.ogg'}"
+            encode(source, output, codec, setting)
+            total_bytes += output.stat().st_size
+            distances.append(log_spectral_distance(decode_to_rate(source), decode_to_rate(output)))
+        return {'bytes': total_bytes, 'lsd_db': round(float(np.mean(distances)), 3)}
+
+    def calibrate_category(self, category: str, sources: List[Path], staging: Path) -> dict:
+        vorbis = self.measure(sources, 'vorbis', VORBIS_QUALITY[category], staging)
+        print(f"   vorbis q{VORBIS_QUALITY[category]:<5} {vorbis['bytes']:>10,} bytes  LSD {vorbis['lsd_db']:.2f} dB")
+
+        opus = None
+        ladder = {}
+        for bitrate in OPUS_BITRATES:
+            result = self.measure(sources, 'opus', bitrate, staging)
+            ladder[bitrate] = result
+            print(f"   opus {bitrate:<7} {result['bytes']:>10,} bytes  LSD {result['lsd_db']:.2f} dB")
+            if result['lsd_db'] <= vorbis['lsd_db']:
+                opus = (bitrate, result)
+                break
+
+        choice = {
+            'codec': 'vorbis',
+            'quality': VORBIS_QUALITY[category],
+            'samples': [p.relative_to(self.assets_dir).as_posix() for p in sources],
+            'vorbis': vorbis,
+            'opus_ladder': ladder
+        }
+        if opus and opus[1]['bytes'] < vorbis['bytes']:
+            choice.update(codec='opus', bitrate=opus[0], container='webm')
+            del choice['quality']
+            saving = 1 - opus[1]['bytes'] / vorbis['bytes']
+            print(f"   -> opus {opus[0]} ({saving:.0%} smaller at equal or better quality)")
+        else:
+            print("   -> vorbis (Opus was not smaller at equal quality)")
+        return choice
+
+    def run(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - AUDIO CODEC CALIBRATION")
+        print("=" * 70)
+
+        categories = {}
+        with tempfile.TemporaryDirectory(prefix='codec-calibration-') as staging:
+            for category, sources in self.sample_sources().items():
+                print(f"\n [{category}] {len(sources)} sample(s)")
+                if not sources:
+                    continue
+                categories[category] = self.calibrate_category(category, sources, Path(staging))
+
+        table = {'version': CODECS_VERSION, 'created': datetime.now().isoformat(), 'categories': categories}
+        write_text_atomic(self.output_path, json.dumps(table, indent=2))
+        print(f"\n Codec table saved to: {self.output_path}")
+        return table
+
+
+class StreamSegmenter:
+    def __init__(self, project_root: Path, segment_seconds: float = DEFAULT_SEGMENT_SECONDS,
+                 overlap_seconds: float = DEFAULT_OVERLAP_SECONDS):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.streams_dir = self.assets_dir / 'streams'
+        self.segment_seconds = segment_seconds
+        self.overlap_seconds = overlap_seconds
+        # Encoder only: segments are staged under streams/, never in the optimized folders
+        self.optimizer = SmartOptimizer(self.assets_dir)
+        self.has_ffmpeg = shutil.which('ffmpeg') is not None
+
+    def long_tracks(self, min_seconds: float) -> List[Path]:
+        tracks = []
+        for path in discover_runtime_assets(self.assets_dir):
+            rel = path.relative_to(self.assets_dir)
+            if path.suffix.lower() not in AUDIO_EXTENSIONS or rel.parts[0] == 'streams':
+                continue
+            if SmartOptimizer.detect_audio_category(path.name) != 'ambient':
+                continue
+            data, rate = read_audio(path)
+            if len(data) / rate >= min_seconds:
+                tracks.append(path)
+        return tracks
+
+    def segment_track(self, path: Path) -> dict:
+        data, rate = read_audio(path)
+        segment_frames = int(self.segment_seconds * rate)
+        overlap_frames = int(self.overlap_seconds * rate)
+        track_dir = self.streams_dir / path.stem
+        staging = Path(tempfile.mkdtemp(dir=self.streams_dir, prefix=f'.{path.stem}-'))
+
+        segments = []
+        try:
+            for index, start in enumerate(range(0, len(data), segment_frames)):
+                end = min(len(data), start + segment_frames + overlap_frames)
+                wav_path = staging / f"{path.stem}_{index:03d}.wav"
+                write_wav(wav_path, data[start:end], rate)
+                if self.has_ffmpeg:
+                    stats = self.optimizer.optimize_audio(wav_path, staging, category='ambient', allow_opus=True)
+                    wav_path.unlink()
+                else:
+                    stats = {'output': wav_path.name, 'optimized_size': wav_path.stat().st_size}
+                segments.append({
+                    'file': stats['output'],
+                    'start': round(start / rate, 6),
+                    'duration': round((min(len(data), start + segment_frames) - start) / rate, 6),
+                    'frames': end - start,
+                    'bytes': stats['optimized_size']
+                })
+
+            # Swap the whole track directory at once so the client never sees a mix of runs
+            if track_dir.exists():
+                old_dir = self.streams_dir / f'.{path.stem}-old'
+                shutil.rmtree(old_dir, ignore_errors=True)
+                track_dir.rename(old_dir)
+                staging.rename(track_dir)
+                shutil.rmtree(old_dir, ignore_errors=True)
+            else:
+                staging.rename(track_dir)
+            track_dir.chmod(0o755)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        suffix = Path(segments[0]['file']).suffix if segments else '.ogg'
+        for segment in segments:
+            segment['file'] = f"streams/{path.stem}/{segment['file']}"
+
+        full_decoded = round(len(data) / rate * AUDIO_CONTEXT_SAMPLE_RATE) * data.shape[1] * BYTES_PER_DECODED_SAMPLE
+        segment_decoded = round((segment_frames + overlap_frames) / rate * AUDIO_CONTEXT_SAMPLE_RATE) \
+            * data.shape[1] * BYTES_PER_DECODED_SAMPLE
+        return {
+            'source': f"assets/{path.relative_to(self.assets_dir).as_posix()}",
+            'codec': {'.webm': 'opus', '.ogg': 'vorbis'}.get(suffix, 'pcm'),
+            'mime': MIME_TYPES.get(suffix, 'audio/wav'),
+            'sample_rate': rate,
+            'channels': int(data.shape[1]),
+            'duration': round(len(data) / rate, 6),
+            'segment_seconds': self.segment_seconds,
+            'overlap_seconds': self.overlap_seconds,
+            'decoded_bytes_full': full_decoded,
+            'decoded_bytes_per_segment': segment_decoded,
+            'segments': segments
+        }
+
+    def run(self, tracks: List[Path]) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - AMBIENCE STREAM SEGMENTER")
+        print("=" * 70)
+        if not self.has_ffmpeg:
+            print("\n ffmpeg not found - segments are written as WAV")
+
+        self.streams_dir.mkdir(parents=True, exist_ok=True)
+        streams = {}
+        for path in tracks:
+            track = self.segment_track(path)
+            streams[path.stem] = track
+            total = sum(segment['bytes'] for segment in track['segments'])
+            print(f"   {path.name}: {track['duration']:.1f}s -> {len(track['segments'])} x "
+                  f"{self.segment_seconds:g}s {track['codec']} segments ({total / 1024:.0f} KB), "
+                  f"decoded {track['decoded_bytes_full'] / (1024 * 1024):.1f} MB -> "
+                  f"{track['decoded_bytes_per_segment'] / (1024 * 1024):.1f} MB per segment")
+
+        index = {'version': STREAMS_VERSION, 'created': datetime.now().isoformat(), 'tracks': streams}
+        index_path = self.streams_dir / 'streams.json'
+        write_text_atomic(index_path, json.dumps(index, indent=2))
+        print(f"\n Stream index saved to: {index_path}")
+        return index
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    assets_dir = project_root / 'public' / 'assets'
+
+    parser = argparse.ArgumentParser(description='Choose audio codecs per category and segment long ambience')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    calibrate = sub.add_parser('calibrate', help='Compare Vorbis and Opus per category')
+    calibrate.add_argument('--output', default=str(script_dir / 'audio_codecs.json'), help='Codec table path')
+
+    segment = sub.add_parser('segment', help='Split long ambience tracks into streaming segments')
+    segment.add_argument('files', nargs='*', help='Tracks relative to public/assets (default: long ambient tracks)')
+    segment.add_argument('--segment-seconds', type=float, default=DEFAULT_SEGMENT_SECONDS, help='Segment length')
+    segment.add_argument('--overlap-seconds', type=float, default=DEFAULT_OVERLAP_SECONDS,
+                         help='Extra audio at the end of each segment for crossfading')
+    segment.add_argument('--min-seconds', type=float, default=DEFAULT_MIN_STREAM_SECONDS,
+                         help='Only segment tracks at least this long')
+    args = parser.parse_args()
+
+    if not assets_dir.exists():
+        print(f" Assets directory not found: {assets_dir}")
+        sys.exit(1)
+
+    if args.command == 'calibrate':
+        if not shutil.which('ffmpeg'):
+            print(" ffmpeg is required for codec calibration")
+            sys.exit(1)
+        CodecCalibrator(project_root, Path(args.output)).run()
+    else:
+        segmenter = StreamSegmenter(project_root, args.segment_seconds, args.overlap_seconds)
+        tracks = [assets_dir / rel for rel in args.files] if args.files else segmenter.long_tracks(args.min_seconds)
+        missing = [str(t) for t in tracks if not t.exists()]
+        if missing:
+            print(f" Not found: {', '.join(missing)}")
+            sys.exit(1)
+        segmenter.run(tracks)
+
+
+if __name__ == "__main__":
+    main()
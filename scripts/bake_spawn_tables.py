@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Spawn Candidate Baker for Terror in the Jungle
+- Reads every game mode's zones from src/config/gameModes.ts and samples
+  spawn points around each zone on the terrain's own 2m height grid, so
+  baked heights are exactly what ImprovedChunk.getHeightAt returns
+- Rejects points whose squad footprint (SquadManager's wedge formation) is
+  too steep, under water or inside a static structure's clearance
+- Ranks the rest by line-of-sight exposure (share of surrounding vantage
+  points that can see a standing soldier there), slope and distance, then
+  thins them so consecutive spawns do not stack
+- Writes public/spawn_tables.json: per mode and zone, a flat array of
+  x, y, z, exposure and the terrain height under every formation slot, so
+  respawns and squad spawns are a table lookup with no terrain queries
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from pipeline_journal import write_text_atomic
+from bake_terrain_lods import NOISE_SEED, CHUNK_SIZE, SEGMENTS, TerrainNoise, terrain_height
+
+TABLE_VERSION = 1
+
+# Runtime height grid spacing; candidates and formation slots sit on grid vertices
+GRID_STEP = CHUNK_SIZE / SEGMENTS
+
+# WaterSystem.WATER_LEVEL plus enough margin that nobody spawns wading
+WATER_LEVEL = 0.0
+WATER_MARGIN = 0.5
+
+MAX_SLOPE_DEGREES = 30.0
+MIN_RADIUS = 6.0          # Keep clear of the zone's flag pole
+RING_BEYOND_ZONE = 30.0   # Search out to zone radius + this (CombatantSystem spawns 20-50m out)
+MIN_SPACING = 8.0         # Between kept candidates, about one squad footprint
+MAX_CANDIDATES = 24
+
+# Line of sight: vantage points on rings around each candidate, eye height for both ends
+LOS_DISTANCES = [30.0, 60.0, 100.0, 150.0]
+LOS_DIRECTIONS = 16
+EYE_HEIGHT = 1.7
+
+# Ranking weights (lower score spawns first)
+EXPOSURE_WEIGHT = 0.6
+SLOPE_WEIGHT = 0.25
+DISTANCE_WEIGHT = 0.15
+
+# Static structures spawns must stay out of: (mode, x, z, radius)
+STATIC_CLEARANCE = [
+    ('open_frontier', 40.0, -1400.0, 14.0)  # HelipadSystem: platform radius 12 + cleared margin
+]
+
+
+def formation_offsets(slots: int) -> np.ndarray:
+    """SquadManager.calculateFormationPosition without its random jitter: leader, then rows of 3"""
+    offsets = [(0.0, 0.0)]
+    for i in range(1, slots):
+        row, column = (i - 1) // 3, (i - 1) % 3 - 1
+        offsets.append((column * 4.0, -row * 4.0))
+    return np.array(offsets)
+
+
+def load_game_modes(game_modes_path: Path) -> List[dict]:
+    """Mode id, squad size, chunk render distance, respawn time and zones of every *_CONFIG in gameModes.ts"""
+    text = game_modes_path.read_text(encoding='utf-8')
+    enum_values = dict(re.findall(r"(\w+)\s*=\s*'(\w+)'", text))
+    number = r'(-?\d+(?:\.\d+)?)'
+    zone_pattern = re.compile(
+        r"id:\s*'(\w+)',\s*name:\s*'([^']*)',\s*position:\s*new THREE\.Vector3\("
+        + number + r',\s*' + number + r',\s*' + number + r'\),\s*radius:\s*' + number
+        + r',\s*isHomeBase:\s*(true|false),\s*owner:\s*(Faction\.\w+|null)'
+    )
+
+    modes = []
+    blocks = re.split(r'export const \w+_CONFIG: GameModeConfig = ', text)[1:]
+    for block in blocks:
+        mode_id = re.search(r'id:\s*GameMode\.(\w+)', block)
+        squad = re.search(r'squadSize:\s*\{\s*min:\s*(\d+),\s*max:\s*(\d+)', block)
+        render = re.search(r'chunkRenderDistance:\s*(\d+)', block)
+        respawn = re.search(r'respawnTime:\s*(\d+(?:\.\d+)?)', block)
+        if not mode_id:
+            continue
+        zones = []
+        for zone_id, name, x, _, z, radius, home, owner in zone_pattern.findall(block):
+            zones.append({
+                'id': zone_id,
+                'name': name,
+                'x': float(x),
+                'z': float(z),
+                'radius': float(radius),
+                'home_base': home == 'true',
+                'owner': None if owner == 'null' else owner.split('.')[1]
+            })
+        modes.append({
+            'id': enum_values.get(mode_id.group(1), mode_id.group(1).lower()),
+            'squad_max': int(squad.group(2)) if squad else 6,
+            'render_distance': int(render.group(1)) if render else 6,
+            'respawn_time': float(respawn.group(1)) if respawn else 5.0,
+            'zones': zones
+        })
+    return modes
+
+
+class HeightGrid:
+    """Runtime-equivalent heights over a grid-aligned square, with bilinear lookups like getHeightAtLocal"""
+
+    def __init__(self, noise: TerrainNoise, center_x: float, center_z: float, extent: float):
+        self.x0 = np.floor((center_x - extent) / GRID_STEP) * GRID_STEP
+        self.z0 = np.floor((center_z - extent) / GRID_STEP) * GRID_STEP
+        count = int(np.ceil(2 * extent / GRID_STEP)) + 2
+        xs = self.x0 + np.arange(count) * GRID_STEP
+        zs = self.z0 + np.arange(count) * GRID_STEP
+        world_x, world_z = np.meshgrid(xs, zs)
+        # float32 like the runtime's Float32Array height data
+        self.heights = terrain_height(noise, world_x, world_z).astype(np.float32).astype(np.float64)
+        self.count = count
+
+        dz, dx = np.gradient(self.heights, GRID_STEP)
+        self.slope = np.degrees(np.arctan(np.hypot(dx, dz)))
+
+    def cell(self, x: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        gx = np.clip((x - self.x0) / GRID_STEP, 0, self.count - 1.000001)
+        gz = np.clip((z - self.z0) / GRID_STEP, 0, self.count - 1.000001)
+        ix, iz = np.floor(gx).astype(np.int64), np.floor(gz).astype(np.int64)
+        return ix, iz, gx - ix, gz - iz
+
+    def height(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        ix, iz, fx, fz = self.cell(x, z)
+        h = self.heights
+        top = h[iz, ix] * (1 - fx) + h[iz, ix + 1] * fx
+        bottom = h[iz + 1, ix] * (1 - fx) + h[iz + 1, ix + 1] * fx
+        return top * (1 - fz) + bottom * fz
+
+    def slope_at(self, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+        ix, iz, fx, fz = self.cell(x, z)
+        return self.slope[iz + np.rint(fz).astype(np.int64), ix + np.rint(fx).astype(np.int64)]
+
+
+def exposure(grid: HeightGrid, x: np.ndarray, z: np.ndarray, ground: np.ndarray) -> np.ndarray:
+    """Share of vantage points (LOS_DIRECTIONS x LOS_DISTANCES) with a clear line to each candidate"""
+    angles = np.arange(LOS_DIRECTIONS) * (2 * np.pi / LOS_DIRECTIONS)
+    target_y = ground + EYE_HEIGHT
+    visible = np.zeros(len(x))
+    for distance in LOS_DISTANCES:
+        steps = max(2, int(distance / GRID_STEP))
+        t = (np.arange(1, steps) / steps)[None, :]
+        for angle in angles:
+            ox, oz = x + np.cos(angle) * distance, z + np.sin(angle) * distance
+            eye_y = grid.height(ox, oz) + EYE_HEIGHT
+            px = x[:, None] + (ox - x)[:, None] * t
+            pz = z[:, None] + (oz - z)[:, None] * t
+            line_y = target_y[:, None] + (eye_y - target_y)[:, None] * t
+            visible += (grid.height(px, pz) < line_y).all(axis=1)
+    return visible / (LOS_DIRECTIONS * len(LOS_DISTANCES))
+
+
+class SpawnTableBaker:
+    def __init__(self, project_root: Path, seed: int = NOISE_SEED, max_candidates: int = MAX_CANDIDATES):
+        self.project_root = project_root
+        self.output_path = project_root / 'public' / 'spawn_tables.json'
+        self.seed = seed
+        self.max_candidates = max_candidates
+        self.noise = TerrainNoise(seed)
+
+    def bake_zone(self, mode: dict, zone: dict, offsets: np.ndarray) -> Tuple[List[float], dict]:
+        outer = zone['radius'] + RING_BEYOND_ZONE
+        footprint = float(np.abs(offsets).max())
+        grid = HeightGrid(self.noise, zone['x'], zone['z'], outer + footprint + max(LOS_DISTANCES) + GRID_STEP)
+
+        # Candidate lattice on grid vertices inside the search ring
+        lattice = np.arange(-np.ceil(outer / GRID_STEP), np.ceil(outer / GRID_STEP) + 1) * GRID_STEP
+        ox, oz = np.meshgrid(lattice, lattice)
+        cx = np.round((zone['x'] + ox.reshape(-1)) / GRID_STEP) * GRID_STEP
+        cz = np.round((zone['z'] + oz.reshape(-1)) / GRID_STEP) * GRID_STEP
+        distance = np.hypot(cx - zone['x'], cz - zone['z'])
+        keep = (distance >= MIN_RADIUS) & (distance <= outer)
+        cx, cz, distance = cx[keep], cz[keep], distance[keep]
+        counts = {'sampled': int(len(cx))}
+
+        # Every formation slot must be dry, walkable and clear of static structures
+        slot_x = cx[:, None] + offsets[None, :, 0]
+        slot_z = cz[:, None] + offsets[None, :, 1]
+        slot_h = grid.height(slot_x, slot_z)
+        dry = (slot_h >= WATER_LEVEL + WATER_MARGIN).all(axis=1)
+        flat = (grid.slope_at(slot_x, slot_z) <= MAX_SLOPE_DEGREES).all(axis=1)
+        clear = np.ones(len(cx), dtype=bool)
+        for mode_id, x, z, radius in STATIC_CLEARANCE:
+            if mode_id == mode['id']:
+                clear &= (np.hypot(slot_x - x, slot_z - z) > radius).all(axis=1)
+        counts['wet'] = int((~dry).sum())
+        counts['steep'] = int((dry & ~flat).sum())
+        counts['blocked'] = int((dry & flat & ~clear).sum())
+
+        keep = dry & flat & clear
+        cx, cz, distance, slot_h = cx[keep], cz[keep], distance[keep], slot_h[keep]
+        if len(cx) == 0:
+            counts['kept'] = 0
+            return [], counts
+
+        ground = slot_h[:, 0]
+        exposed = exposure(grid, cx, cz, ground)
+        slope = grid.slope_at(cx[:, None] + offsets[None, :, 0], cz[:, None] + offsets[None, :, 1]).max(axis=1)
+        score = (EXPOSURE_WEIGHT * exposed + SLOPE_WEIGHT * slope / MAX_SLOPE_DEGREES
+                 + DISTANCE_WEIGHT * distance / outer)
+
+        # Best first, skipping anything too close to an already kept spawn
+        chosen: List[int] = []
+        for i in np.argsort(score, kind='stable'):
+            if len(chosen) == self.max_candidates:
+                break
+            if chosen and np.hypot(cx[chosen] - cx[i], cz[chosen] - cz[i]).min() < MIN_SPACING:
+                continue
+            chosen.append(int(i))
+
+        data: List[float] = []
+        for i in chosen:
+            data.extend([float(cx[i]), round(float(ground[i]), 2), float(cz[i]), round(float(exposed[i]), 3)])
+            data.extend(round(float(h), 2) for h in slot_h[i])
+        counts['kept'] = len(chosen)
+        counts['exposure_mean'] = round(float(exposed[chosen].mean()), 3)
+        counts['exposure_best'] = round(float(exposed[chosen].min()), 3)
+        return data, counts
+
+    def run(self, modes: List[dict]) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - SPAWN TABLE BAKER")
+        print("=" * 70)
+        print(f"\n Seed {self.seed}, slope <= {MAX_SLOPE_DEGREES} deg, above water + {WATER_MARGIN}m, "
+              f"up to {self.max_candidates} candidates per zone")
+
+        tables: Dict[str, dict] = {}
+        report: Dict[str, dict] = {}
+        for mode in modes:
+            offsets = formation_offsets(mode['squad_max'])
+            stride = 4 + len(offsets)
+            print(f"\n {mode['id']}: {len(mode['zones'])} zones, {len(offsets)} formation slots")
+            print(f"   {'zone':<20} {'sampled':>8} {'wet':>6} {'steep':>6} {'blocked':>8} {'kept':>5} "
+                  f"{'exp avg':>8} {'exp best':>9}")
+
+            zones, zone_report = {}, {}
+            for zone in mode['zones']:
+                data, counts = self.bake_zone(mode, zone, offsets)
+                zones[zone['id']] = data
+                zone_report[zone['id']] = counts
+                exposure_columns = (f"{counts['exposure_mean']:>8.1%} {counts['exposure_best']:>9.1%}"
+                                    if counts['kept'] else f"{'-':>8} {'-':>9}")
+                print(f"   {zone['id'][:20]:<20} {counts['sampled']:>8} {counts['wet']:>6} {counts['steep']:>6} "
+                      f"{counts['blocked']:>8} {counts['kept']:>5} {exposure_columns}")
+                if not counts['kept']:
+                    print(f"   ⚠️  {zone['id']}: no usable spawn; the game falls back to random offsets there")
+
+            tables[mode['id']] = {
+                'stride': stride,
+                'formation': offsets.tolist(),
+                'zones': zones
+            }
+            report[mode['id']] = zone_report
+
+        output = {
+            'version': TABLE_VERSION,
+            'seed': self.seed,
+            'created': datetime.now().isoformat(),
+            # Per candidate: x, y (ground), z, exposure, then ground height under each formation slot
+            'layout': ['x', 'y', 'z', 'exposure', 'slot_heights...'],
+            'modes': tables
+        }
+        write_text_atomic(self.output_path, json.dumps(output, separators=(',', ':')))
+        print(f"\n Spawn tables: {self.output_path} ({self.output_path.stat().st_size / 1024:.1f} KB)")
+
+        report_path = self.project_root / 'spawn_table_report.json'
+        write_text_atomic(report_path, json.dumps({
+            'created': output['created'],
+            'seed': self.seed,
+            'filters': {
+                'max_slope_degrees': MAX_SLOPE_DEGREES,
+                'water_level': WATER_LEVEL + WATER_MARGIN,
+                'min_radius': MIN_RADIUS,
+                'ring_beyond_zone': RING_BEYOND_ZONE,
+                'min_spacing': MIN_SPACING
+            },
+            'modes': report
+        }, indent=2))
+        print(f" Report saved to: {report_path}")
+        return output
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    game_modes = project_root / 'src' / 'config' / 'gameModes.ts'
+
+    parser = argparse.ArgumentParser(description='Bake ranked spawn candidates per game mode zone')
+    parser.add_argument('--seed', type=int, default=NOISE_SEED, help='Noise seed (ImprovedChunkManager uses 12345)')
+    parser.add_argument('--max-candidates', type=int, default=MAX_CANDIDATES, help='Candidates kept per zone')
+    parser.add_argument('--mode', action='append', help='Only bake these game mode ids (default: all)')
+    args = parser.parse_args()
+
+    if not game_modes.exists():
+        print(f" Game modes not found: {game_modes}")
+        sys.exit(1)
+
+    modes = load_game_modes(game_modes)
+    if args.mode:
+        modes = [m for m in modes if m['id'] in args.mode]
+    if not modes:
+        print(" No game modes to bake")
+        sys.exit(1)
+
+    SpawnTableBaker(project_root, args.seed, args.max_candidates).run(modes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+Terrain LOD Baker for Terror in the Jungle
+- Reproduces ImprovedChunk's height field offline (same seeded Perlin noise
+  and layer mix) for every chunk the game modes can reach
+- Simplifies each chunk's 33x33 grid with a right-triangulated irregular
+  network (RTIN): one error pass per chunk, then one mesh per LOD level
+  that stays within that level's maximum vertical error
+- Hangs skirts from every chunk border so neighbours at different levels
+  never show cracks, and packs quantized vertices (u8 col, u8 row, u16
+  height) and u16 indices into public/terrain/terrain_lods.bin
+- Level 0 stays the runtime PlaneGeometry; the baked levels replace it for
+  the distant rings ImprovedChunkManager.calculateLOD assigns
+
+Pack layout (all integers little-endian):
+    0   4   magic 'TJTL'
+    4   2   format version
+    6   2   reserved
+    8   4   index length in bytes
+    12  4   data offset (first chunk block)
+    16  ..  UTF-8 JSON index: seed, chunk size, segments, levels, skirt depth
+            and "chunks": {"x,z": [offset, length]} (absolute offsets)
+    ..      one 4-byte-aligned block per chunk: per level a 12-byte header
+            (u16 vertex count, u16 index count, f32 y min, f32 y step), then
+            every level's vertices followed by its indices (padded to 4)
+"""
+
+import os
+import re
+import sys
+import math
+import json
+import struct
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import List, Tuple
+
+import numpy as np
+
+from pipeline_journal import write_text_atomic
+
+PACK_MAGIC = b'TJTL'
+PACK_VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+LEVEL_HEADER = struct.Struct('<HHff')
+
+# Must match ImprovedChunkManager / ImprovedChunk
+NOISE_SEED = 12345
+CHUNK_SIZE = 64
+SEGMENTS = 32
+
+# Max vertical error (metres) for LOD levels 1, 2, 3; level 0 is the full runtime grid
+DEFAULT_LEVEL_ERRORS = [0.25, 1.0, 3.0]
+
+# Skirts reach below the worst error any neighbour can have, plus a margin
+SKIRT_MARGIN = 0.5
+
+# fdlibm s_sin.c / k_sin.c / k_cos.c / e_rem_pio2.c constants. V8 implements
+# Math.sin with this exact algorithm; the platform libm behind math.sin
+# disagrees in the last bit for a few percent of inputs, and the seeded RNG
+# in NoiseGenerator.seedRandom amplifies one such bit into a different
+# permutation table (and entirely different terrain).
+_S1, _S2, _S3 = -1.66666666666666324348e-01, 8.33333333332248946124e-03, -1.98412698298579493134e-04
+_S4, _S5, _S6 = 2.75573137070700676789e-06, -2.50507602534068634195e-08, 1.58969099521155010221e-10
+_C1, _C2, _C3 = 4.16666666666666019037e-02, -1.38888888888741095749e-03, 2.48015872894767294178e-05
+_C4, _C5, _C6 = -2.75573143513906633035e-07, 2.08757232129817482790e-09, -1.13596475577881948265e-11
+_INVPIO2 = 6.36619772367581382433e-01
+_PIO2_1, _PIO2_1T = 1.57079632673412561417e+00, 6.07710050650619224932e-11
+_PIO2_2, _PIO2_2T = 6.07710050630396597660e-11, 2.02226624879595063154e-21
+_PIO2_3, _PIO2_3T = 2.02226624871116645580e-21, 8.47842766036889956997e-32
+_NPIO2_HW = [
+    0x3FF921FB, 0x400921FB, 0x4012D97C, 0x401921FB, 0x401F6A7A, 0x4022D97C, 0x4025FDBB, 0x402921FB,
+    0x402C463A, 0x402F6A7A, 0x4031475C, 0x4032D97C, 0x40346B9C, 0x4035FDBB, 0x40378FDB, 0x403921FB,
+    0x403AB41B, 0x403C463A, 0x403DD85A, 0x403F6A7A, 0x40407E4C, 0x4041475C, 0x4042106C, 0x4042D97C,
+    0x4043A28C, 0x40446B9C, 0x404534AC, 0x4045FDBB, 0x4046C6CB, 0x40478FDB, 0x404858EB, 0x404921FB
+]
+_F64 = struct.Struct('<d')
+_U64 = struct.Struct('<Q')
+
+
+def _high_word(x: float) -> int:
+    """Upper 32 bits of a double, signed like fdlibm's __HI()"""
+    hi = _U64.unpack(_F64.pack(x))[0] >> 32
+    return hi - (1 << 32) if hi & 0x80000000 else hi
+
+
+def _from_high_word(hi: int) -> float:
+    return _F64.unpack(_U64.pack((hi & 0xffffffff) << 32))[0]
+
+
+def _kernel_sin(x: float, y: float, iy: int) -> float:
+    if _high_word(x) & 0x7fffffff < 0x3e400000 and int(x) == 0:
+        return x
+    z = x * x
+    v = z * x
+    r = _S2 + z * (_S3 + z * (_S4 + z * (_S5 + z * _S6)))
+    if iy == 0:
+        return x + v * (_S1 + z * r)
+    return x - ((z * (0.5 * y - v * r) - y) - v * _S1)
+
+
+def _kernel_cos(x: float, y: float) -> float:
+    ix = _high_word(x) & 0x7fffffff
+    if ix < 0x3e400000 and int(x) == 0:
+        return 1.0
+    z = x * x
+    r = z * (_C1 + z * (_C2 + z * (_C3 + z * (_C4 + z * (_C5 + z * _C6)))))
+    if ix < 0x3FD33333:
+        return 1.0 - (0.5 * z - (z * r - x * y))
+    qx = 0.28125 if ix > 0x3fe90000 else _from_high_word(ix - 0x00200000)
+    return (1.0 - qx) - ((0.5 * z - qx) - (z * r - x * y))
+
+
+def _rem_pio2(x: float) -> Tuple[int, float, float]:
+    """x = n * pi/2 + (y0 + y1) for |x| < 2^19 * pi/2 (fdlibm's medium path)"""
+    hx = _high_word(x)
+    ix = hx & 0x7fffffff
+    if ix < 0x4002d97c:  # |x| < 3pi/4
+        sign = 1 if hx > 0 else -1
+        z = x - sign * _PIO2_1
+        if ix != 0x3ff921fb:
+            y0 = z - sign * _PIO2_1T
+            return sign, y0, (z - y0) - sign * _PIO2_1T
+        z -= sign * _PIO2_2
+        y0 = z - sign * _PIO2_2T
+        return sign, y0, (z - y0) - sign * _PIO2_2T
+    if ix > 0x413921fb:
+        raise ValueError(f"v8_sin: |{x}| is outside the supported range")
+    t = abs(x)
+    n = int(t * _INVPIO2 + 0.5)
+    fn = float(n)
+    r = t - fn * _PIO2_1
+    w = fn * _PIO2_1T
+    y0 = r - w
+    if n >= 32 or ix == _NPIO2_HW[n - 1]:
+        j = ix >> 20
+        if j - ((_high_word(y0) >> 20) & 0x7ff) > 16:  # 2nd iteration, 118 bits
+            t = r
+            w = fn * _PIO2_2
+            r = t - w
+            w = fn * _PIO2_2T - ((t - r) - w)
+            y0 = r - w
+            if j - ((_high_word(y0) >> 20) & 0x7ff) > 49:  # 3rd iteration, 151 bits
+                t = r
+                w = fn * _PIO2_3
+                r = t - w
+                w = fn * _PIO2_3T - ((t - r) - w)
+                y0 = r - w
+    y1 = (r - y0) - w
+    if hx < 0:
+        return -n, -y0, -y1
+    return n, y0, y1
+
+
+def v8_sin(x: float) -> float:
+    """Bit-exact JavaScript Math.sin (fdlibm __ieee754_sin as used by V8)"""
+    ix = _high_word(x) & 0x7fffffff
+    if ix <= 0x3fe921fb:
+        return _kernel_sin(x, 0.0, 0)
+    if ix >= 0x7ff00000:
+        return x - x
+    n, y0, y1 = _rem_pio2(x)
+    quadrant = n & 3
+    if quadrant == 0:
+        return _kernel_sin(y0, y1, 1)
+    if quadrant == 1:
+        return _kernel_cos(y0, y1)
+    if quadrant == 2:
+        return -_kernel_sin(y0, y1, 1)
+    return -_kernel_cos(y0, y1)
+
+
+class TerrainNoise:
+    """NumPy port of src/utils/NoiseGenerator.ts (2D Perlin noise)"""
+
+    def __init__(self, seed: int = NOISE_SEED):
+        p = list(range(256))
+        random = self.seed_random(seed)
+        for i in range(255, 0, -1):
+            j = math.floor(random() * (i + 1))
+            p[i], p[j] = p[j], p[i]
+        self.permutation = np.array(p + p, dtype=np.int64)
+
+    @staticmethod
+    def seed_random(seed: float):
+        state = [v8_sin(seed) * 10000]
+
+        def random() -> float:
+            state[0] = v8_sin(state[0]) * 10000
+            return state[0] - math.floor(state[0])
+        return random
+
+    @staticmethod
+    def fade(t: np.ndarray) -> np.ndarray:
+        return t * t * t * (t * (t * 6 - 15) + 10)
+
+    @staticmethod
+    def lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+        return a + t * (b - a)
+
+    @staticmethod
+    def grad(h: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        h = h & 15
+        u = np.where(h < 8, x, y)
+        v = np.where(h < 4, y, np.where((h == 12) | (h == 14), x, 0.0))
+        return np.where(h & 1 == 0, u, -u) + np.where(h & 2 == 0, v, -v)
+
+    def noise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        p = self.permutation
+        fx, fy = np.floor(x), np.floor(y)
+        X = fx.astype(np.int64) & 255
+        Y = fy.astype(np.int64) & 255
+        x = x - fx
+        y = y - fy
+        u, v = self.fade(x), self.fade(y)
+
+        A = p[X] + Y
+        AA, AB = p[A], p[A + 1]
+        B = p[X + 1] + Y
+        BA, BB = p[B], p[B + 1]
+        return self.lerp(
+            self.lerp(self.grad(p[AA], x, y), self.grad(p[BA], x - 1, y), u),
+            self.lerp(self.grad(p[AB], x, y - 1), self.grad(p[BB], x - 1, y - 1), u),
+            v
+        )
+
+
+def smoothstep(edge0: float, edge1: float, x: np.ndarray) -> np.ndarray:
+    x = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
+    return x * x * (3 - 2 * x)
+
+
+def terrain_height(noise: TerrainNoise, world_x: np.ndarray, world_z: np.ndarray) -> np.ndarray:
+    """ImprovedChunk.generateHeightData for arbitrary world positions"""
+    n = noise.noise
+    continental = n(world_x * 0.001, world_z * 0.001)
+    ridge = np.power(1 - np.abs(n(world_x * 0.003, world_z * 0.003)), 1.5)
+    valley = n(world_x * 0.008, world_z * 0.008)
+    valley = np.power(np.abs(valley), 0.7) * np.sign(valley)
+    hills = (n(world_x * 0.015, world_z * 0.015) * 0.5
+             + n(world_x * 0.03, world_z * 0.03) * 0.25
+             + n(world_x * 0.06, world_z * 0.06) * 0.125)
+    detail = n(world_x * 0.1, world_z * 0.1) * 0.1
+
+    height = (continental * 0.5 + 0.5) * 30
+    height = height + ridge * 80 * smoothstep(-0.3, 0.2, continental)
+    height = height + valley * 40
+    height = height + hills * 35
+    height = height + detail * 8
+
+    water = n(world_x * 0.003, world_z * 0.003)
+    river = n(world_x * 0.01, world_z * 0.01)
+    lake = (water < -0.4) & (height < 15)
+    river_valley = ~lake & (np.abs(river) < 0.1) & (height < 25)
+    lowland = ~lake & ~river_valley & (height < 20)
+    height = np.where(lake, -3 - water * 2, height)
+    height = np.where(river_valley, height * 0.3 - 2, height)
+    height = np.where(lowland, height * 0.7, height)
+    return np.maximum(-8, height)
+
+
+def height_field(noise: TerrainNoise, min_chunk: int, max_chunk: int,
+                 size: int = CHUNK_SIZE, segments: int = SEGMENTS) -> np.ndarray:
+    """
+    Heights for every chunk in [min_chunk, max_chunk] on both axes as one
+    shared grid (neighbouring chunks share their border samples), stored
+    as float32 like the runtime's Float32Array. Row = z, column = x.
+    """
+    count = (max_chunk - min_chunk + 1) * segments + 1
+    coords = min_chunk * size + np.arange(count) * (size / segments)
+    world_x, world_z = np.meshgrid(coords, coords)
+    return terrain_height(noise, world_x, world_z).astype(np.float32)
+
+
+def triangle_samples(cols: np.ndarray, rows: np.ndarray, size: int) -> List[tuple]:
+    """
+    Grid samples covered by each triangle ((T, 3) vertex cols/rows), grouped
+    by bounding-box size: (triangle ids, (T', P) sample indices, barycentric
+    weights w0/w1/w2 and an inside mask)
+    """
+    min_x, min_y = cols.min(axis=1), rows.min(axis=1)
+    spans = np.stack([cols.max(axis=1) - min_x, rows.max(axis=1) - min_y], axis=1)
+    groups = []
+    for span_x, span_y in np.unique(spans, axis=0):
+        ids = np.nonzero((spans[:, 0] == span_x) & (spans[:, 1] == span_y))[0]
+        ox, oy = np.meshgrid(np.arange(span_x + 1), np.arange(span_y + 1))
+        xs = min_x[ids, None] + ox.reshape(1, -1)
+        ys = min_y[ids, None] + oy.reshape(1, -1)
+        (x0, x1, x2), (y0, y1, y2) = cols[ids].T[:, :, None], rows[ids].T[:, :, None]
+        det = (y1 - y2) * (x0 - x2) + (x2 - x1) * (y0 - y2)
+        w0 = ((y1 - y2) * (xs - x2) + (x2 - x1) * (ys - y2)) / det
+        w1 = ((y2 - y0) * (xs - x2) + (x0 - x2) * (ys - y2)) / det
+        w2 = 1 - w0 - w1
+        inside = (w0 >= -1e-9) & (w1 >= -1e-9) & (w2 >= -1e-9)
+        groups.append((ids, ys * size + xs, w0, w1, w2, inside))
+    return groups
+
+
+def max_gap(flat: np.ndarray, corners: np.ndarray, group: tuple) -> np.ndarray:
+    """Worst |plane - sample| per triangle of one group; corners are (T, 3) grid indices"""
+    ids, samples, w0, w1, w2, inside = group
+    h = flat[corners[ids]]
+    surface = w0 * h[:, 0, None] + w1 * h[:, 1, None] + w2 * h[:, 2, None]
+    return np.where(inside, np.abs(surface - flat[samples]), 0.0).max(axis=1)
+
+
+class Rtin:
+    """
+    Right-triangulated irregular network over a (2^k + 1)^2 grid, after
+    Mapbox's Martini: triangles are the nodes of a binary tree split at the
+    hypotenuse midpoint, so any error threshold yields a crack-free mesh
+    inside the tile. Unlike Martini, which only checks each midpoint against
+    its hypotenuse, a triangle's error is the true worst gap over every grid
+    sample it covers, so a level's max error is a hard bound.
+    """
+
+    def __init__(self, grid_size: int = SEGMENTS + 1):
+        tile = grid_size - 1
+        if tile & (tile - 1):
+            raise ValueError(f"grid size must be 2^k + 1, got {grid_size}")
+        self.grid_size = grid_size
+        self.tile = tile
+        self.triangle_count = tile * tile * 2 - 2
+        self.parent_count = self.triangle_count - tile * tile
+
+        coords = np.zeros((self.triangle_count, 4), dtype=np.int64)
+        for i in range(self.triangle_count):
+            tid = i + 2
+            ax = ay = bx = by = cx = cy = 0
+            if tid & 1:
+                bx = by = cx = tile
+            else:
+                ax = ay = cy = tile
+            tid >>= 1
+            while tid > 1:
+                mx, my = (ax + bx) >> 1, (ay + by) >> 1
+                if tid & 1:
+                    bx, by, ax, ay = ax, ay, cx, cy
+                else:
+                    ax, ay, bx, by = bx, by, cx, cy
+                cx, cy = mx, my
+                tid >>= 1
+            coords[i] = (ax, ay, bx, by)
+
+        # Precompute per-triangle indices; triangles of one tree depth are a contiguous range
+        ax, ay, bx, by = coords.T
+        mx, my = (ax + bx) >> 1, (ay + by) >> 1
+        cx, cy = mx + my - ay, my + ax - mx
+        size = grid_size
+        self.corners = np.stack([ay * size + ax, by * size + bx, cy * size + cx], axis=1)
+        self.middle = my * size + mx
+        self.left_child = ((ay + cy) >> 1) * size + ((ax + cx) >> 1)
+        self.right_child = ((by + cy) >> 1) * size + ((bx + cx) >> 1)
+        self.depth_ranges = []
+        depth = 1
+        while (1 << depth) - 2 < self.triangle_count:
+            self.depth_ranges.append(((1 << depth) - 2, min((1 << (depth + 1)) - 2, self.triangle_count)))
+            depth += 1
+        self.samples = [triangle_samples(np.stack([ax, bx, cx], axis=1)[start:end],
+                                         np.stack([ay, by, cy], axis=1)[start:end], size)
+                        for start, end in self.depth_ranges]
+
+    def errors(self, heights: np.ndarray) -> np.ndarray:
+        """
+        Per-vertex error map: the worst gap of either triangle that would
+        leave this midpoint out, folded with its children so a split parent
+        is always reachable. Triangles sharing a hypotenuse share the value,
+        which keeps every threshold crack-free.
+        """
+        flat = heights.reshape(-1).astype(np.float64)
+        errors = np.zeros(flat.shape, dtype=np.float64)
+        # Deepest (smallest) triangles first so parents can fold in their children
+        for (start, end), groups in zip(reversed(self.depth_ranges), reversed(self.samples)):
+            middle = self.middle[start:end]
+            corners = self.corners[start:end]
+            error = np.zeros(end - start)
+            for group in groups:
+                error[group[0]] = max_gap(flat, corners, group)
+            if start < self.parent_count:
+                error = np.maximum(error, np.maximum(errors[self.left_child[start:end]],
+                                                     errors[self.right_child[start:end]]))
+            np.maximum.at(errors, middle, error)
+        return errors
+
+    def mesh(self, errors: np.ndarray, max_error: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Grid (col, row) vertices and triangles for one error threshold"""
+        size, tile = self.grid_size, self.tile
+        triangles: List[Tuple[int, int, int]] = []
+        stack = [(0, 0, tile, tile, tile, 0), (tile, tile, 0, 0, 0, tile)]
+        while stack:
+            ax, ay, bx, by, cx, cy = stack.pop()
+            mx, my = (ax + bx) >> 1, (ay + by) >> 1
+            if abs(ax - cx) + abs(ay - cy) > 1 and errors[my * size + mx] > max_error:
+                stack.append((bx, by, cx, cy, mx, my))
+                stack.append((cx, cy, ax, ay, mx, my))
+            else:
+                triangles.append((ay * size + ax, by * size + bx, cy * size + cx))
+
+        grid_indices = np.array(triangles, dtype=np.int64)
+        used, remapped = np.unique(grid_indices, return_inverse=True)
+        vertices = np.stack([used % size, used // size], axis=1)
+        return vertices, remapped.reshape(-1, 3)
+
+
+def measured_error(heights: np.ndarray, vertices: np.ndarray, triangles: np.ndarray) -> float:
+    """Largest vertical gap between the grid samples and the simplified surface"""
+    size = heights.shape[0]
+    corners = vertices[:, 1][triangles] * size + vertices[:, 0][triangles]
+    flat = heights.reshape(-1).astype(np.float64)
+    groups = triangle_samples(vertices[:, 0][triangles].astype(np.int64),
+                              vertices[:, 1][triangles].astype(np.int64), size)
+    return max(float(max_gap(flat, corners, group).max()) for group in groups)
+
+
+def add_skirts(vertices: np.ndarray, heights_y: np.ndarray, triangles: np.ndarray,
+               tile: int, depth: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drop a vertical curtain from every triangle edge that lies on the chunk
+    border (both ends on the same side of the tile).
+    """
+    cols, rows = vertices[:, 0], vertices[:, 1]
+    a = triangles.reshape(-1)
+    b = triangles[:, [1, 2, 0]].reshape(-1)
+    same_col = (cols[a] == cols[b]) & ((cols[a] == 0) | (cols[a] == tile))
+    same_row = (rows[a] == rows[b]) & ((rows[a] == 0) | (rows[a] == tile))
+    border = np.stack([a, b], axis=1)[same_col | same_row]
+    if len(border) == 0:
+        return vertices, heights_y, triangles
+
+    border_vertices = np.unique(border)
+    lowered = np.full(len(vertices), -1, dtype=np.int64)
+    lowered[border_vertices] = len(vertices) + np.arange(len(border_vertices))
+
+    top_a, top_b = border[:, 0], border[:, 1]
+    skirt = np.concatenate([
+        np.stack([top_a, top_b, lowered[top_b]], axis=1),
+        np.stack([top_a, lowered[top_b], lowered[top_a]], axis=1)
+    ])
+    return (np.concatenate([vertices, vertices[border_vertices]]),
+            np.concatenate([heights_y, heights_y[border_vertices] - depth]),
+            np.concatenate([triangles, skirt]))
+
+
+def orient_up(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    """
+    Counter-clockwise seen from +Y, like PlaneGeometry after rotateX(-PI/2).
+    With x = col and z = row the face normal's y is -cross below, so
+    positive cross means the triangle faces down. Skirts are vertical
+    (cross 0) and left as built; the terrain material is double sided.
+    """
+    cols, rows = vertices[:, 0].astype(np.int64), vertices[:, 1].astype(np.int64)
+    a, b, c = triangles.T
+    cross = (cols[b] - cols[a]) * (rows[c] - rows[a]) - (rows[b] - rows[a]) * (cols[c] - cols[a])
+    oriented = triangles.copy()
+    down = cross > 0
+    oriented[down, 1], oriented[down, 2] = triangles[down, 2], triangles[down, 1]
+    return oriented
+
+
+def pack_level(vertices: np.ndarray, y: np.ndarray, triangles: np.ndarray) -> Tuple[bytes, bytes]:
+    y_min = float(y.min())
+    y_step = max(float(y.max()) - y_min, 1e-6) / 65535
+    quantized = np.rint((y - y_min) / y_step).astype(np.uint16)
+    packed = np.zeros(len(vertices), dtype=[('col', 'u1'), ('row', 'u1'), ('y', '<u2')])
+    packed['col'], packed['row'], packed['y'] = vertices[:, 0], vertices[:, 1], quantized
+    indices = triangles.astype('<u2').reshape(-1).tobytes()
+    if len(indices) % 4:
+        indices += b'\0\0'
+    header = LEVEL_HEADER.pack(len(vertices), triangles.size, y_min, y_step)
+    return header, packed.tobytes() + indices
+
+
+def load_world_extent(game_modes_path: Path) -> Tuple[int, int]:
+    """Largest worldSize and chunkRenderDistance across the game mode configs"""
+    text = game_modes_path.read_text(encoding='utf-8')
+    sizes = [int(v) for v in re.findall(r'worldSize:\s*(\d+)', text)]
+    distances = [int(v) for v in re.findall(r'chunkRenderDistance:\s*(\d+)', text)]
+    if not sizes:
+        raise ValueError(f"no worldSize found in {game_modes_path}")
+    return max(sizes), max(distances) if distances else 8
+
+
+class TerrainLodBaker:
+    def __init__(self, project_root: Path, world_size: int, margin: int, level_errors: List[float],
+                 seed: int = NOISE_SEED):
+        self.project_root = project_root
+        self.output_dir = project_root / 'public' / 'terrain'
+        self.world_size = world_size
+        self.margin = margin
+        self.level_errors = level_errors
+        self.seed = seed
+        self.skirt_depth = max(level_errors) + SKIRT_MARGIN
+        self.rtin = Rtin(SEGMENTS + 1)
+
+    def chunk_range(self) -> Tuple[int, int]:
+        half = self.world_size / 2
+        return math.floor(-half / CHUNK_SIZE) - self.margin, math.floor(half / CHUNK_SIZE) + self.margin
+
+    def bake_chunk(self, heights: np.ndarray) -> Tuple[bytes, List[dict]]:
+        errors = self.rtin.errors(heights)
+        headers, bodies, stats = [], [], []
+        for max_error in self.level_errors:
+            vertices, triangles = self.rtin.mesh(errors, max_error)
+            surface_triangles = len(triangles)
+            error = measured_error(heights, vertices, triangles)
+            y = heights[vertices[:, 1], vertices[:, 0]].astype(np.float64)
+            vertices, y, triangles = add_skirts(vertices, y, triangles, self.rtin.tile, self.skirt_depth)
+            header, body = pack_level(vertices, y, orient_up(vertices, triangles))
+            headers.append(header)
+            bodies.append(body)
+            stats.append({'triangles': surface_triangles, 'total_triangles': len(triangles),
+                          'vertices': len(vertices), 'bytes': len(header) + len(body), 'error': error})
+        return b''.join(headers) + b''.join(bodies), stats
+
+    def run(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - TERRAIN LOD BAKER")
+        print("=" * 70)
+
+        low, high = self.chunk_range()
+        count = high - low + 1
+        print(f"\n World {self.world_size}m + {self.margin} chunk margin: chunks {low}..{high} "
+              f"({count * count} chunks, {CHUNK_SIZE}m, {SEGMENTS}x{SEGMENTS} segments)")
+        print(f" Level errors: {', '.join(f'L{i + 1} {e}m' for i, e in enumerate(self.level_errors))}, "
+              f"skirt depth {self.skirt_depth}m")
+
+        noise = TerrainNoise(self.seed)
+        field = height_field(noise, low, high)
+
+        blocks: List[Tuple[str, bytes]] = []
+        level_stats = [[] for _ in self.level_errors]
+        for cz in range(low, high + 1):
+            for cx in range(low, high + 1):
+                row, col = (cz - low) * SEGMENTS, (cx - low) * SEGMENTS
+                heights = field[row:row + SEGMENTS + 1, col:col + SEGMENTS + 1]
+                block, stats = self.bake_chunk(heights)
+                blocks.append((f"{cx},{cz}", block))
+                for level, entry in enumerate(stats):
+                    level_stats[level].append(entry)
+            print(f"\r Baked row {cz - low + 1}/{count}", end='', flush=True)
+        print()
+
+        index = {
+            'version': PACK_VERSION,
+            'seed': self.seed,
+            'chunk_size': CHUNK_SIZE,
+            'segments': SEGMENTS,
+            'skirt_depth': self.skirt_depth,
+            'levels': [{'level': i + 1, 'max_error': e} for i, e in enumerate(self.level_errors)],
+            'chunks': {}
+        }
+        # Offsets depend on the index length, which depends on the offsets: iterate until it settles
+        data_offset, previous = HEADER.size, None
+        while data_offset != previous:
+            previous, offset = data_offset, data_offset
+            for key, block in blocks:
+                index['chunks'][key] = [offset, len(block)]
+                offset += len(block)
+            index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+            data_offset = (HEADER.size + len(index_bytes) + 3) // 4 * 4
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        pack_path = self.output_dir / 'terrain_lods.bin'
+        fd, tmp_name = tempfile.mkstemp(dir=self.output_dir, prefix='.terrain_lods.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, len(index_bytes), data_offset))
+            f.write(index_bytes)
+            f.write(b'\0' * (data_offset - HEADER.size - len(index_bytes)))
+            for _, block in blocks:
+                f.write(block)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, pack_path)
+
+        full_triangles = SEGMENTS * SEGMENTS * 2
+        print(f"\n   {'level':>5} {'max err':>8} {'measured':>9} {'tris avg':>9} {'tris max':>9} "
+              f"{'vs full':>8} {'KB':>9}")
+        levels = []
+        for i, stats in enumerate(level_stats):
+            triangles = np.array([s['triangles'] for s in stats])
+            summary = {
+                'level': i + 1,
+                'max_error': self.level_errors[i],
+                'measured_error': round(max(s['error'] for s in stats), 4),
+                'triangles_mean': round(float(triangles.mean()), 1),
+                'triangles_max': int(triangles.max()),
+                'skirt_triangles_mean': round(float(np.mean([s['total_triangles'] - s['triangles'] for s in stats])), 1),
+                'bytes': int(sum(s['bytes'] for s in stats))
+            }
+            levels.append(summary)
+            print(f"   {'L' + str(i + 1):>5} {summary['max_error']:>7.2f}m {summary['measured_error']:>8.3f}m "
+                  f"{summary['triangles_mean']:>9.1f} {summary['triangles_max']:>9} "
+                  f"{summary['triangles_mean'] / full_triangles:>8.1%} {summary['bytes'] / 1024:>9.1f}")
+
+        pack_size = pack_path.stat().st_size
+        print(f"\n Pack: {pack_path} ({pack_size / (1024 * 1024):.2f} MB, index {len(index_bytes) / 1024:.0f} KB)")
+
+        report = {
+            'created': datetime.now().isoformat(),
+            'world_size': self.world_size,
+            'chunk_range': [low, high],
+            'chunks': len(blocks),
+            'full_triangles': full_triangles,
+            'skirt_depth': self.skirt_depth,
+            'pack_bytes': pack_size,
+            'levels': levels
+        }
+        report_path = self.project_root / 'terrain_lod_report.json'
+        write_text_atomic(report_path, json.dumps(report, indent=2))
+        print(f" Report saved to: {report_path}")
+        return report
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    game_modes = project_root / 'src' / 'config' / 'gameModes.ts'
+
+    parser = argparse.ArgumentParser(description='Bake error-bounded terrain LOD meshes per chunk')
+    parser.add_argument('--world-size', type=int, help='World edge in metres (default: largest game mode)')
+    parser.add_argument('--margin', type=int, help='Extra chunk rings around the world '
+                                                   '(default: largest chunk render distance + 1)')
+    parser.add_argument('--errors', type=float, nargs='+', default=DEFAULT_LEVEL_ERRORS,
+                        help='Max vertical error per LOD level from 1 up, in metres')
+    parser.add_argument('--seed', type=int, default=NOISE_SEED, help='Noise seed (ImprovedChunkManager uses 12345)')
+    args = parser.parse_args()
+
+    world_size, render_distance = args.world_size, None
+    if world_size is None or args.margin is None:
+        if not game_modes.exists():
+            print(f" Game modes not found: {game_modes}; pass --world-size and --margin")
+            sys.exit(1)
+        default_size, render_distance = load_world_extent(game_modes)
+        world_size = world_size or default_size
+    margin = args.margin if args.margin is not None else render_distance + 1
+
+    if sorted(args.errors) != args.errors or args.errors[0] <= 0:
+        print(" Level errors must be positive and increasing")
+        sys.exit(1)
+
+    TerrainLodBaker(project_root, world_size, margin, args.errors, args.seed).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Asset Performance Budget Benchmark for Terror in the Jungle
+- Measures what every shipped asset costs at runtime, not just on disk:
+  download bytes, decode time, decoded RAM and GPU VRAM (including mips)
+- Applies the same clamp rules as AssetLoader.downscaleIfNeeded
+- Compares each category against scripts/asset_budgets.json per quality tier
+- Exits non-zero when a new asset or setting pushes a category over budget
+"""
+
+import io
+import re
+import sys
+import json
+import time
+import wave
+import struct
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image
+    HAS_PIL = True
+
+try:
+    import soundfile
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+
+# Pixel-art sprites are huge; decoding them is exactly what we are measuring
+Image.MAX_IMAGE_PIXELS = None
+
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp'}
+AUDIO_EXTENSIONS = {'.wav', '.ogg', '.opus', '.webm'}
+
+# Where the client names every file it loads from public/assets: source file,
+# pattern for the names, prefix under public/assets. Anything else in that
+# folder (favicons, the splash fallback, pre-optimization WAVs, archives) is
+# shipped but never requested, so it must not count against the budgets.
+RUNTIME_ASSET_SOURCES = [
+    # AssetLoader.discoverAssets: knownAssets textures
+    ('src/systems/assets/AssetLoader.ts', r"const knownAssets = \[(.*?)\];", r"'([^'\s]+\.\w+)'", ''),
+    # AudioManager: every SOUND_CONFIGS path (relative to public/)
+    ('src/config/audio.ts', None, r"path:\s*'assets/([^']+)'", ''),
+    # RadioTransmissionSystem.discoverTransmissions
+    ('src/systems/audio/RadioTransmissionSystem.ts', r"const transmissionFiles = \[(.*?)\];", r"'([^'\s]+\.\w+)'",
+     'transmissions/'),
+    # HelicopterModel rotor loop, loaded by literal path
+    ('src/systems/helicopter/HelicopterModel.ts', None, r"BASE_URL\}assets/([^`$]+)`", ''),
+]
+
+# Web Audio decodes into Float32 AudioBuffers at the context sample rate
+AUDIO_CONTEXT_SAMPLE_RATE = 48000
+BYTES_PER_DECODED_SAMPLE = 4
+
+# three.js uploads every image texture as RGBA8
+BYTES_PER_TEXEL = 4
+
+# Floor for generated decode budgets so tiny categories don't gate on timer noise
+MIN_DECODE_BUDGET_MS = 100
+
+
+def categorize_asset(filename: str) -> str:
+    """Mirror AssetLoader.categorizeAsset, with an extra 'audio' category"""
+    name = filename.lower()
+
+    if Path(name).suffix in AUDIO_EXTENSIONS:
+        return 'audio'
+    if 'floor' in name or 'ground' in name:
+        return 'ground'
+    if any(x in name for x in ['tree', 'grass', 'dipterocarp', 'banyan', 'palm', 'fern', 'elephant']):
+        return 'foliage'
+    if 'soldier' in name or 'solider' in name:
+        return 'enemy'
+    if 'skybox' in name or 'sky' in name:
+        return 'skybox'
+    return 'unknown'
+
+
+def clamp_max_dimension(name: str) -> int:
+    """Mirror the maxDim heuristic in AssetLoader.downscaleIfNeeded"""
+    lower = name.lower()
+    max_dim = 2048
+    if 'skybox' in lower:
+        max_dim = 1024
+    if 'forestfloor' in lower or 'waternormals' in lower:
+        max_dim = 1024
+    if any(x in lower for x in ['fern', 'areca', 'elephant', 'fanpalm']):
+        max_dim = 2048
+    return max_dim
+
+
+def clamp_dimensions(name: str, width: int, height: int, scale: float = 1.0) -> Tuple[int, int]:
+    """Dimensions the texture has on the GPU after AssetLoader.downscaleIfNeeded"""
+    max_dim = max(1, int(clamp_max_dimension(name) * scale))
+    if width <= max_dim and height <= max_dim:
+        return width, height
+    factor = min(max_dim / width, max_dim / height)
+    return max(1, int(width * factor)), max(1, int(height * factor))
+
+
+def texture_vram_bytes(width: int, height: int, mipmaps: bool) -> int:
+    """GPU memory for an RGBA8 texture, optionally with a full mip chain"""
+    total = width * height * BYTES_PER_TEXEL
+    if mipmaps:
+        while width > 1 or height > 1:
+            width = max(1, width // 2)
+            height = max(1, height // 2)
+            total += width * height * BYTES_PER_TEXEL
+    return total
+
+
+def runtime_asset_names(project_root: Path) -> List[str]:
+    """Paths relative to public/assets that the client requests, read from its sources"""
+    names = []
+    for source, block, pattern, prefix in RUNTIME_ASSET_SOURCES:
+        path = Path(project_root) / source
+        if not path.exists():
+            continue
+        text = path.read_text(encoding='utf-8')
+        if block:
+            match = re.search(block, text, re.S)
+            text = match.group(1) if match else ''
+        names.extend(prefix + name for name in re.findall(pattern, text))
+    return sorted(set(names))
+
+
+def discover_runtime_assets(assets_dir: Path, project_root: Optional[Path] = None) -> List[Path]:
+    """
+    Every image/audio file the game loads from assets_dir (public/assets or
+    a mirror of it), per RUNTIME_ASSET_SOURCES; names that are not on disk
+    are left out
+    """
+    project_root = Path(project_root) if project_root else Path(__file__).resolve().parent.parent
+    assets = []
+    for name in runtime_asset_names(project_root):
+        path = Path(assets_dir) / name
+        if path.is_file() and path.suffix.lower() in IMAGE_EXTENSIONS | AUDIO_EXTENSIONS:
+            assets.append(path)
+    return assets
+
+
+def probe_ogg(path: Path) -> Optional[dict]:
+    """
+    Read channels, sample rate and length from an Ogg Vorbis/Opus stream
+    without decoding it (identification header + last page granule position)
+    """
+    data = path.read_bytes()
+    if not data.startswith(b'OggS'):
+        return None
+
+    channels = sample_rate = None
+    pre_skip = 0
+    codec = None
+    last_granule = 0
+    pos = 0
+    while pos + 27 <= len(data) and data[pos:pos + 4] == b'OggS':
+        granule = struct.unpack_from('<q', data, pos + 6)[0]
+        segments = data[pos + 26]
+        table = data[pos + 27:pos + 27 + segments]
+        body_start = pos + 27 + segments
+        body_len = sum(table)
+        body = data[body_start:body_start + body_len]
+        if codec is None:
+            if body[:7] == b'\x01vorbis':
+                codec = 'vorbis'
+                channels = body[11]
+                sample_rate = struct.unpack_from('<I', body, 12)[0]
+            elif body[:8] == b'OpusHead':
+                codec = 'opus'
+                channels = body[9]
+                pre_skip = struct.unpack_from('<H', body, 10)[0]
+                # Opus granule positions always count 48 kHz samples
+                sample_rate = 48000
+        if granule > 0:
+            last_granule = granule
+        pos = body_start + body_len
+
+    if codec is None or not sample_rate:
+        return None
+    frames = max(0, last_granule - pre_skip)
+    return {
+        'codec': codec,
+        'channels': channels,
+        'sample_rate': sample_rate,
+        'frames': frames,
+        'duration_s': frames / sample_rate
+    }
+
+
+class AssetBudgetBenchmark:
+    def __init__(self, project_root: Path, budget_path: Path, decode_repeats: int = 1,
+                 measure_decode: bool = True):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.budget_path = Path(budget_path)
+        self.decode_repeats = max(1, decode_repeats)
+        self.measure_decode = measure_decode
+
+        with open(self.budget_path) as f:
+            self.budgets = json.load(f)
+
+    def time_decode(self, decode) -> Optional[float]:
+        if not self.measure_decode:
+            return None
+        best = None
+        for _ in range(self.decode_repeats):
+            start = time.perf_counter()
+            decode()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return round(best, 2)
+
+    def measure_image(self, path: Path) -> dict:
+        data = path.read_bytes()
+
+        def decode():
+            with Image.open(io.BytesIO(data)) as img:
+                img.load()
+
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+
+        return {
+            'kind': 'texture',
+            'width': width,
+            'height': height,
+            'decode_ms': self.time_decode(decode)
+        }
+
+    def measure_audio(self, path: Path) -> dict:
+        data = path.read_bytes()
+        info = {'kind': 'audio', 'decode_ms': None}
+
+        if path.suffix.lower() == '.wav':
+            with wave.open(io.BytesIO(data)) as wav:
+                info.update(channels=wav.getnchannels(), sample_rate=wav.getframerate(),
+                            frames=wav.getnframes())
+
+            def decode():
+                with wave.open(io.BytesIO(data)) as wav:
+                    wav.readframes(wav.getnframes())
+            info['decode_ms'] = self.time_decode(decode)
+        else:
+            probe = probe_ogg(path)
+            if probe:
+                info.update(channels=probe['channels'], sample_rate=probe['sample_rate'],
+                            frames=probe['frames'])
+            if HAS_SOUNDFILE:
+                def decode():
+                    soundfile.read(io.BytesIO(data), dtype='float32')
+                try:
+                    info['decode_ms'] = self.time_decode(decode)
+                except RuntimeError:
+                    pass
+
+        return info
+
+    def measure_assets(self) -> List[dict]:
+        """Tier-independent measurements, taken once per asset"""
+        measured = []
+        for path in discover_runtime_assets(self.assets_dir):
+            rel = path.relative_to(self.assets_dir).as_posix()
+            entry = {
+                'asset': rel,
+                'category': categorize_asset(path.name),
+                'download_bytes': path.stat().st_size
+            }
+            print(f"  {rel}...", end="", flush=True)
+            if path.suffix.lower() in IMAGE_EXTENSIONS:
+                entry.update(self.measure_image(path))
+            else:
+                entry.update(self.measure_audio(path))
+            decode = f"{entry['decode_ms']:.1f} ms" if entry['decode_ms'] is not None else "no decoder"
+            print(f" {decode}")
+            measured.append(entry)
+        return measured
+
+    def cost_for_tier(self, entry: dict, tier: dict) -> dict:
+        """Runtime cost of one asset under a quality tier's settings"""
+        cost = {
+            'asset': entry['asset'],
+            'category': entry['category'],
+            'download_bytes': entry['download_bytes'],
+            'decode_ms': entry['decode_ms'] or 0.0
+        }
+
+        if entry['kind'] == 'texture':
+            width, height = entry['width'], entry['height']
+            gpu_w, gpu_h = clamp_dimensions(Path(entry['asset']).name, width, height,
+                                            tier.get('max_dimension_scale', 1.0))
+            # The browser decodes the full image, then downscaleIfNeeded draws a copy
+            decoded = width * height * BYTES_PER_TEXEL
+            if (gpu_w, gpu_h) != (width, height):
+                decoded += gpu_w * gpu_h * BYTES_PER_TEXEL
+            cost.update(
+                source_dimensions=f"{width}x{height}",
+                gpu_dimensions=f"{gpu_w}x{gpu_h}",
+                decoded_ram_bytes=decoded,
+                # AssetLoader and PixelPerfectUtils use NearestFilter without mipmaps
+                vram_bytes=texture_vram_bytes(gpu_w, gpu_h, tier.get('mipmaps', False))
+            )
+        else:
+            frames = entry.get('frames') or 0
+            rate = entry.get('sample_rate') or AUDIO_CONTEXT_SAMPLE_RATE
+            channels = entry.get('channels') or 1
+            resampled = int(frames * AUDIO_CONTEXT_SAMPLE_RATE / rate)
+            cost.update(
+                duration_s=round(frames / rate, 3),
+                decoded_ram_bytes=resampled * channels * BYTES_PER_DECODED_SAMPLE,
+                vram_bytes=0
+            )
+        return cost
+
+    def evaluate_tier(self, tier_name: str, measured: List[dict]) -> dict:
+        tier = self.budgets['tiers'][tier_name]
+        costs = [self.cost_for_tier(entry, tier) for entry in measured]
+
+        totals: Dict[str, Dict[str, float]] = {}
+        for cost in costs:
+            bucket = totals.setdefault(cost['category'], {
+                'assets': 0, 'download_bytes': 0, 'decode_ms': 0.0,
+                'decoded_ram_bytes': 0, 'vram_bytes': 0
+            })
+            bucket['assets'] += 1
+            for metric in ('download_bytes', 'decode_ms', 'decoded_ram_bytes', 'vram_bytes'):
+                bucket[metric] += cost[metric]
+
+        violations = []
+        category_budgets = tier.get('budgets', {})
+        for category, bucket in sorted(totals.items()):
+            budget = category_budgets.get(category)
+            if budget is None:
+                violations.append({'category': category, 'metric': 'category',
+                                   'actual': bucket['assets'], 'budget': None,
+                                   'message': f"category '{category}' has no budget"})
+                continue
+            for metric, limit in budget.items():
+                if metric == 'decode_ms' and not self.measure_decode:
+                    continue
+                actual = bucket.get(metric, 0)
+                if actual > limit:
+                    violations.append({'category': category, 'metric': metric,
+                                       'actual': actual, 'budget': limit,
+                                       'message': f"{category}.{metric} {actual:,.0f} > {limit:,.0f}"})
+
+        return {
+            'settings': {k: v for k, v in tier.items() if k != 'budgets'},
+            'categories': totals,
+            'assets': costs,
+            'violations': violations,
+            'passed': not violations
+        }
+
+    def write_budgets(self, results: Dict[str, dict], headroom: float, decode_headroom: float):
+        """Reset every tier's budgets to the measured totals plus headroom"""
+        for tier_name, result in results.items():
+            budgets = {}
+            for category, bucket in sorted(result['categories'].items()):
+                budgets[category] = {}
+                for metric in ('download_bytes', 'decode_ms', 'decoded_ram_bytes', 'vram_bytes'):
+                    if bucket[metric] <= 0:
+                        continue
+                    # Decode time varies by machine, so it gets a looser gate
+                    if metric == 'decode_ms':
+                        limit = max(int(bucket[metric] * (1 + decode_headroom)), MIN_DECODE_BUDGET_MS)
+                    else:
+                        limit = int(bucket[metric] * (1 + headroom)) + 1
+                    budgets[category][metric] = limit
+            self.budgets['tiers'][tier_name]['budgets'] = budgets
+
+        with open(self.budget_path, 'w') as f:
+            json.dump(self.budgets, f, indent=2)
+            f.write('\n')
+        print(f"\n Budgets rewritten with {headroom * 100:.0f}% headroom: {self.budget_path}")
+
+    def run(self, tiers: List[str]) -> Dict[str, dict]:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - ASSET BUDGET BENCHMARK")
+        print("=" * 70)
+
+        if not HAS_SOUNDFILE:
+            print("\n soundfile not installed - compressed audio decode time will not be measured")
+
+        print(f"\n Measuring assets in {self.assets_dir}...")
+        measured = self.measure_assets()
+        return {tier: self.evaluate_tier(tier, measured) for tier in tiers}
+
+
+def mb(value: float) -> str:
+    return f"{value / (1024 * 1024):8.2f} MB"
+
+
+def print_results(results: Dict[str, dict]):
+    for tier_name, result in results.items():
+        print(f"\n Tier: {tier_name}  {result['settings']}")
+        print("-" * 70)
+        print(f"   {'category':<10} {'assets':>6} {'download':>11} {'decode':>10} {'RAM':>11} {'VRAM':>11}")
+        for category, bucket in sorted(result['categories'].items()):
+            print(f"   {category:<10} {bucket['assets']:>6} {mb(bucket['download_bytes'])} "
+                  f"{bucket['decode_ms']:7.0f} ms {mb(bucket['decoded_ram_bytes'])} {mb(bucket['vram_bytes'])}")
+        if result['passed']:
+            print("   Within budget")
+        for violation in result['violations']:
+            print(f"   OVER BUDGET: {violation['message']}")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Measure runtime asset cost against per-tier budgets')
+    parser.add_argument('--budgets', default=str(script_dir / 'asset_budgets.json'), help='Budget file')
+    parser.add_argument('--tier', action='append', help='Tier to check (default: all tiers)')
+    parser.add_argument('--repeats', type=int, default=1, help='Decode repetitions (best time is kept)')
+    parser.add_argument('--skip-decode', action='store_true', help='Skip decode timing (no decode_ms gates)')
+    parser.add_argument('--output', default=str(project_root / 'asset_budget_report.json'), help='JSON report path')
+    parser.add_argument('--write-budgets', action='store_true',
+                        help='Rewrite the budget file from this run instead of gating')
+    parser.add_argument('--headroom', type=float, default=0.15, help='Headroom used by --write-budgets')
+    parser.add_argument('--decode-headroom', type=float, default=1.0,
+                        help='Headroom for decode_ms used by --write-budgets')
+    args = parser.parse_args()
+
+    benchmark = AssetBudgetBenchmark(project_root, Path(args.budgets), args.repeats, not args.skip_decode)
+    tiers = args.tier or list(benchmark.budgets['tiers'].keys())
+    unknown = [t for t in tiers if t not in benchmark.budgets['tiers']]
+    if unknown:
+        print(f" Unknown tier(s): {', '.join(unknown)}")
+        sys.exit(2)
+
+    results = benchmark.run(tiers)
+    print_results(results)
+
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'budget_file': str(args.budgets),
+        'decode_measured': not args.skip_decode,
+        'tiers': results
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n Detailed report saved to: {args.output}")
+
+    if args.write_budgets:
+        benchmark.write_budgets(results, args.headroom, args.decode_headroom)
+        return
+
+    if not all(result['passed'] for result in results.values()):
+        print("\n Asset budget check FAILED")
+        sys.exit(1)
+    print("\n Asset budget check passed")
+
+
+if __name__ == "__main__":
+    main()
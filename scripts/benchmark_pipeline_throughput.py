@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Asset Pipeline Throughput Benchmark for Terror in the Jungle
+- Generates a deterministic synthetic corpus (same seed, same bytes):
+  RGBA pixel-art sprites at 1K-8K with wide transparent margins and RGB
+  noise under alpha 0, seamless tiling textures, WAVs of varying length,
+  rate and channel count, and favicon/splash sources
+- Runs each pipeline stage (SmartOptimizer sprite/texture variants and
+  audio encodes, AudioCompressor, the icon generator, a full
+  smart_optimize_clean.py run) and whole-pipeline watch builds, serial vs
+  parallel and cold vs warm manifest cache
+- Every stage runs in a fresh process on its own copy of the corpus and
+  records files/sec, MB/sec, peak RSS (including ffmpeg/pngquant) and CPU
+  utilization; results are appended to a JSON history
+- Compares against a stored baseline for the same corpus and exits
+  non-zero when a stage got slower or hungrier than the tolerance allows
+"""
+
+import io
+import os
+import sys
+import json
+import math
+import time
+import wave
+import shutil
+import hashlib
+import argparse
+import platform
+import contextlib
+import multiprocessing
+from pathlib import Path
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import resource
+    HAS_RESOURCE = True
+except ImportError:
+    # Windows: no getrusage, peak RSS is not reported
+    HAS_RESOURCE = False
+
+from pipeline_journal import file_sha1, write_text_atomic
+from smart_optimize_clean import Image, SmartOptimizer
+from compress_audio import AudioCompressor
+from generate_icons import IconGenerator
+from watch_assets import AssetWatcher
+
+HISTORY_VERSION = 1
+DEFAULT_SEED = 1337
+
+# Sprite edge lengths; --quick keeps the two smallest for a fast smoke run
+SPRITE_SIZES = [1024, 2048, 4096, 8192]
+QUICK_SPRITE_SIZES = [1024, 2048]
+# Names pick SmartOptimizer's soldier / tree / foliage sizing rules in turn
+SPRITE_KINDS = ['Soldier', 'Palm', 'Fern']
+# Pixel-art sprites are authored small and upscaled with nearest neighbour
+SPRITE_PIXEL_SCALE = 8
+SPRITE_PALETTE_COLORS = 24
+
+TEXTURE_SIZES = [512, 1024, 2048]
+
+# (name, seconds, channels, sample rate); RotorBlades and transmissions feed AudioCompressor
+WAV_SPECS = [
+    ('synth_shot', 0.5, 1, 44100),
+    ('synth_reload', 2.0, 2, 44100),
+    ('synth_jungle_ambient', 30.0, 2, 44100),
+    ('synth_footsteps', 8.0, 1, 22050),
+    ('RotorBlades', 12.0, 2, 44100),
+    ('transmissions/synth_transmission1', 3.0, 1, 22050),
+    ('transmissions/synth_transmission2', 5.0, 1, 22050),
+    ('transmissions/synth_transmission3', 4.0, 2, 22050)
+]
+
+ICON_SIZE = 1024
+SPLASH_SIZE = (1920, 1080)
+
+# Throughput may drop / peak RSS may grow this much before a stage counts as a regression
+DEFAULT_TOLERANCE = 0.15
+
+
+# ----------------------------------------------------------------------
+# Synthetic corpus
+# ----------------------------------------------------------------------
+
+def synth_sprite(size: int, seed: int) -> np.ndarray:
+    """RGBA pixel-art blob filling the middle ~40%, noise under the transparent margin"""
+    rng = np.random.default_rng(seed)
+    cells = size // SPRITE_PIXEL_SCALE
+    yy, xx = np.mgrid[0:cells, 0:cells] / cells - 0.5
+    angle = np.arctan2(yy, xx)
+    wobble = 1 + 0.15 * np.sin(angle * rng.integers(3, 8) + rng.uniform(0, math.tau))
+    inside = (xx / 0.28) ** 2 + (yy / 0.38) ** 2 < wobble ** 2
+
+    palette = rng.integers(20, 235, (SPRITE_PALETTE_COLORS, 3), dtype=np.uint8)
+    bands = ((yy + 0.5) * 6 + rng.random((cells, cells)) * 1.5).astype(int) % SPRITE_PALETTE_COLORS
+    low = np.zeros((cells, cells, 4), dtype=np.uint8)
+    low[..., :3] = palette[bands]
+    low[..., 3] = np.where(inside, 255, 0)
+
+    sprite = np.repeat(np.repeat(low, SPRITE_PIXEL_SCALE, axis=0), SPRITE_PIXEL_SCALE, axis=1)
+    # Export tools leave faint colour under alpha 0; alpha_bleed.py is what cleans it up
+    transparent = sprite[..., 3] == 0
+    sprite[transparent, :3] = rng.integers(0, 6, (int(transparent.sum()), 3), dtype=np.uint8)
+    return sprite
+
+
+def synth_texture(size: int, seed: int) -> np.ndarray:
+    """Opaque RGB texture that tiles seamlessly (integer-period waves plus a tiled grain)"""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:size, 0:size] / size * math.tau
+    field = np.zeros((size, size))
+    for _ in range(6):
+        fx, fy = rng.integers(1, 9, 2)
+        field += np.sin(xx * fx + yy * fy + rng.uniform(0, math.tau))
+    grain = np.tile(rng.random((64, 64)), (size // 64, size // 64))
+    shade = (field / 12 + 0.5) * 0.8 + grain * 0.2
+    base = np.array([70, 95, 40]) + rng.integers(-15, 15, 3)
+    texture = np.clip(base[None, None, :] * (0.5 + shade[..., None]), 0, 255)
+    return texture.astype(np.uint8)
+
+
+def synth_wav(path: Path, seconds: float, channels: int, rate: int, seed: int):
+    """16-bit PCM: a few detuned tones with decaying noise bursts"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    frames = []
+    for channel in range(channels):
+        tones = sum(np.sin(math.tau * rng.uniform(80, 900) * t + channel) for _ in range(3)) / 3
+        bursts = rng.standard_normal(len(t)) * np.exp(-(t % rng.uniform(0.25, 1.5)) * 8)
+        frames.append(0.5 * tones + 0.3 * bursts)
+    samples = np.clip(np.stack(frames, axis=1), -1, 1)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes((samples * 32767).astype('<i2').tobytes())
+
+
+def synth_icon(seed: int) -> np.ndarray:
+    """Icon on a white background, as generate_icons.py expects in 'white' mode"""
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:ICON_SIZE, 0:ICON_SIZE] / ICON_SIZE - 0.5
+    icon = np.full((ICON_SIZE, ICON_SIZE, 3), 255, dtype=np.uint8)
+    disc = xx ** 2 + yy ** 2 < 0.3 ** 2
+    icon[disc] = rng.integers(30, 160, 3, dtype=np.uint8)
+    leaf = (np.abs(xx) < 0.05) & (np.abs(yy) < 0.25)
+    icon[leaf] = rng.integers(120, 220, 3, dtype=np.uint8)
+    return icon
+
+
+def synth_splash(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    width, height = SPLASH_SIZE
+    gradient = np.linspace(0, 1, height)[:, None, None] * np.array([20, 60, 30])[None, None, :]
+    noise = rng.integers(0, 40, (height, width, 3))
+    return np.clip(10 + gradient + noise, 0, 255).astype(np.uint8)
+
+
+class SyntheticCorpus:
+    """
+    Deterministic benchmark inputs under <dir>/assets (pipeline sources)
+    and <dir>/icons (icon generator sources). Each file has its own seed,
+    so a seed and size list always give the same pixels and samples.
+    `fingerprint` hashes the encoded files, so runs are only compared
+    against a baseline built from byte-identical inputs.
+    """
+
+    def __init__(self, base_dir: Path, seed: int, sprite_sizes: List[int]):
+        self.seed = seed
+        self.sprite_sizes = sprite_sizes
+        key = f"seed{seed}-" + '-'.join(str(size) for size in sprite_sizes)
+        self.dir = Path(base_dir) / f'corpus-{key}'
+        self.assets_dir = self.dir / 'assets'
+        self.icons_dir = self.dir / 'icons'
+        self.index_path = self.dir / 'corpus.json'
+
+    def sprite_names(self) -> List[str]:
+        return [f"Synth{SPRITE_KINDS[i % len(SPRITE_KINDS)]}{size}.png" for i, size in enumerate(self.sprite_sizes)]
+
+    def texture_names(self) -> List[str]:
+        return [f"synthfloor{size}.png" for size in TEXTURE_SIZES]
+
+    def ensure(self) -> dict:
+        """Generate the corpus unless an identical one is already on disk"""
+        if self.index_path.exists():
+            return json.loads(self.index_path.read_text())
+
+        print(f" Generating synthetic corpus in {self.dir}")
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self.assets_dir.mkdir(parents=True)
+        self.icons_dir.mkdir(parents=True)
+        seed = self.seed
+
+        for index, (name, size) in enumerate(zip(self.sprite_names(), self.sprite_sizes)):
+            Image.fromarray(synth_sprite(size, seed + index), 'RGBA').save(self.assets_dir / name, 'PNG')
+            print(f"   {name}")
+        for index, (name, size) in enumerate(zip(self.texture_names(), TEXTURE_SIZES)):
+            Image.fromarray(synth_texture(size, seed + 100 + index), 'RGB').save(self.assets_dir / name, 'PNG')
+            print(f"   {name}")
+        for index, (name, seconds, channels, rate) in enumerate(WAV_SPECS):
+            synth_wav(self.assets_dir / f"{name}.wav", seconds, channels, rate, seed + 200 + index)
+            print(f"   {name}.wav ({seconds:g}s, {channels}ch, {rate} Hz)")
+        Image.fromarray(synth_icon(seed + 300), 'RGB').save(self.icons_dir / 'favicon1.png', 'PNG')
+        Image.fromarray(synth_splash(seed + 301), 'RGB').save(self.icons_dir / 'background.png', 'PNG')
+
+        files = {path.relative_to(self.dir).as_posix(): file_sha1(path)
+                 for path in sorted(self.dir.rglob('*')) if path.is_file() and path != self.index_path}
+        fingerprint = hashlib.sha1(json.dumps(files, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+        index = {'seed': self.seed, 'sprite_sizes': self.sprite_sizes, 'fingerprint': fingerprint, 'files': files}
+        write_text_atomic(self.index_path, json.dumps(index, indent=2))
+        return index
+
+
+# ----------------------------------------------------------------------
+# Stages (each runs in its own process, inside a workspace project root)
+# ----------------------------------------------------------------------
+
+def input_totals(paths: List[Path]) -> Tuple[int, int]:
+    return len(paths), sum(path.stat().st_size for path in paths)
+
+
+def stage_png_variants(workspace: Path, names: List[str]) -> dict:
+    """SmartOptimizer's per-PNG work: one decode, same-size and resized variants"""
+    optimizer = SmartOptimizer(workspace / 'public' / 'assets')
+    optimizer.prepare_output_dirs()
+    sources = [optimizer.assets_dir / name for name in names]
+    for path in sources:
+        source = optimizer.decode_png(path)
+        optimizer.optimize_png_same_size(source, optimizer.optimized_dir / path.name)
+        optimizer.optimize_png_smart_resize(source, optimizer.optimized_resize_dir / path.name)
+        source.close()
+    return dict(zip(('files', 'bytes'), input_totals(sources)))
+
+
+def stage_sprite_variants(workspace: Path, options: dict) -> dict:
+    return stage_png_variants(workspace, options['sprites'])
+
+
+def stage_texture_variants(workspace: Path, options: dict) -> dict:
+    return stage_png_variants(workspace, options['textures'])
+
+
+def stage_audio_encode(workspace: Path, options: dict) -> dict:
+    optimizer = SmartOptimizer(workspace / 'public' / 'assets')
+    optimizer.prepare_output_dirs()
+    if not optimizer.tools['ffmpeg']:
+        return {'skipped': 'ffmpeg not installed'}
+    sources = sorted(optimizer.assets_dir.glob('*.wav'))
+    for path in sources:
+        optimizer.optimize_audio(path, optimizer.optimized_dir)
+    return dict(zip(('files', 'bytes'), input_totals(sources)))
+
+
+def stage_audio_compressor(workspace: Path, options: dict) -> dict:
+    compressor = AudioCompressor(workspace)
+    sources = [compressor.assets_dir / 'RotorBlades.wav'] + sorted((compressor.assets_dir / 'transmissions').glob('*.wav'))
+    files, size = input_totals(sources)
+    if not compressor.run(resume=False):
+        return {'skipped': 'ffmpeg not installed or nothing compressed'}
+    return {'files': files, 'bytes': size}
+
+
+def stage_favicons(workspace: Path, options: dict) -> dict:
+    assets_dir = workspace / 'public' / 'assets'
+    sources = [assets_dir / 'favicon1.png', assets_dir / 'background.png']
+    IconGenerator(workspace, sources[0], 'white', sources[1]).run()
+    return dict(zip(('files', 'bytes'), input_totals(sources)))
+
+
+def stage_smart_optimize(workspace: Path, options: dict) -> dict:
+    """The whole smart_optimize_clean.py run: backup, journal, every PNG and WAV, publish, report"""
+    optimizer = SmartOptimizer(workspace / 'public' / 'assets')
+    sources = sorted(optimizer.assets_dir.glob('*.png'))
+    if optimizer.tools['ffmpeg']:
+        sources += sorted(optimizer.assets_dir.glob('*.wav'))
+    optimizer.run_optimization(resume=False)
+    return dict(zip(('files', 'bytes'), input_totals(sources)))
+
+
+def stage_watch(workspace: Path, options: dict) -> dict:
+    """watch_assets.py --once: an incremental build of every source on a worker pool"""
+    watcher = AssetWatcher(workspace, workers=options['workers'])
+    sources = list(watcher.discover_sources().values())
+    watcher.sync_once()
+    return dict(zip(('files', 'bytes'), input_totals(sources)))
+
+
+# name -> (runner, workers for the stage, run once unmeasured first to warm the cache)
+STAGES: Dict[str, Tuple[Callable[[Path, dict], dict], str, bool]] = {
+    'sprite_variants': (stage_sprite_variants, 'serial', False),
+    'texture_variants': (stage_texture_variants, 'serial', False),
+    'audio_encode': (stage_audio_encode, 'serial', False),
+    'audio_compressor': (stage_audio_compressor, 'serial', False),
+    'favicons': (stage_favicons, 'serial', False),
+    'smart_optimize': (stage_smart_optimize, 'serial', False),
+    'watch:serial:cold': (stage_watch, 'serial', False),
+    'watch:serial:warm': (stage_watch, 'serial', True),
+    'watch:parallel:cold': (stage_watch, 'parallel', False),
+    'watch:parallel:warm': (stage_watch, 'parallel', True)
+}
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Largest RSS of this process or any tool it ran. Linux carries ru_maxrss
+    across exec, so a spawned stage would report its parent's peak; the
+    process's own high-water mark comes from /proc where available.
+    """
+    if not HAS_RESOURCE:
+        return None
+    unit = 1 if sys.platform == 'darwin' else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * unit
+    status = Path('/proc/self/status')
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                own = int(line.split()[1]) * 1024
+    return max(own, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * unit)
+
+
+def run_stage_process(name: str, workspace: str, options: dict, verbose: bool, conn):
+    """Child process entry point: run one stage and send back its measurements"""
+    runner = STAGES[name][0]
+    sink = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        before, start = os.times(), time.perf_counter()
+        with sink:
+            result = runner(Path(workspace), options)
+        wall, after = time.perf_counter() - start, os.times()
+        # Children count too: ffmpeg and pngquant do real work outside the interpreter
+        cpu = sum(getattr(after, field) - getattr(before, field)
+                  for field in ('user', 'system', 'children_user', 'children_system'))
+        result.update(wall_seconds=wall, cpu_seconds=cpu, peak_rss_bytes=peak_rss_bytes())
+        conn.send(result)
+    except BaseException as e:
+        conn.send({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Benchmark driver
+# ----------------------------------------------------------------------
+
+class ThroughputBenchmark:
+    def __init__(self, project_root: Path, work_dir: Path, seed: int, sprite_sizes: List[int],
+                 workers: int, repeats: int = 1, verbose: bool = False):
+        self.project_root = Path(project_root)
+        self.work_dir = Path(work_dir)
+        self.corpus = SyntheticCorpus(self.work_dir, seed, sprite_sizes)
+        self.workers = workers
+        self.repeats = max(1, repeats)
+        self.verbose = verbose
+        # Fresh interpreters: peak RSS must not include the parent or earlier stages
+        self.context = multiprocessing.get_context('spawn')
+
+    def prepare_workspace(self, stage: str) -> Path:
+        """A throwaway project root holding a pristine copy of the corpus"""
+        workspace = self.work_dir / 'work' / stage.replace(':', '-')
+        shutil.rmtree(workspace, ignore_errors=True)
+        assets_dir = workspace / 'public' / 'assets'
+        shutil.copytree(self.corpus.assets_dir, assets_dir)
+        if stage == 'favicons':
+            for path in self.corpus.icons_dir.iterdir():
+                shutil.copy2(path, assets_dir / path.name)
+        return workspace
+
+    def spawn(self, stage: str, workspace: Path, options: dict) -> dict:
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(target=run_stage_process,
+                                       args=(stage, str(workspace), options, self.verbose, sender))
+        process.start()
+        sender.close()
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = {'error': 'stage process died without reporting'}
+        process.join()
+        if process.exitcode not in (0, None) and 'error' not in result:
+            result['error'] = f"exit code {process.exitcode}"
+        return result
+
+    def measure(self, stage: str) -> dict:
+        _, mode, warm = STAGES[stage]
+        options = {
+            'workers': self.workers if mode == 'parallel' else 1,
+            'sprites': self.corpus.sprite_names(),
+            'textures': self.corpus.texture_names()
+        }
+
+        runs = []
+        for _ in range(self.repeats):
+            workspace = self.prepare_workspace(stage)
+            if warm:
+                # Cold build first (not measured) so the manifest and outputs exist
+                primed = self.spawn(stage, workspace, options)
+                if 'error' in primed or 'skipped' in primed:
+                    return primed
+            result = self.spawn(stage, workspace, options)
+            shutil.rmtree(workspace, ignore_errors=True)
+            if 'error' in result or 'skipped' in result:
+                return result
+            runs.append(result)
+
+        # Best wall time stands for throughput; memory takes the worst run
+        best = min(runs, key=lambda run: run['wall_seconds'])
+        wall = max(best['wall_seconds'], 1e-9)
+        peaks = [run['peak_rss_bytes'] for run in runs if run['peak_rss_bytes'] is not None]
+        return {
+            'workers': options['workers'],
+            'files': best['files'],
+            'input_bytes': best['bytes'],
+            'wall_seconds': round(wall, 3),
+            'files_per_sec': round(best['files'] / wall, 3),
+            'mb_per_sec': round(best['bytes'] / (1024 * 1024) / wall, 3),
+            'peak_rss_mb': round(max(peaks) / (1024 * 1024), 1) if peaks else None,
+            'cpu_seconds': round(best['cpu_seconds'], 3),
+            # Of all cores; above 1/cores means the stage ran on more than one
+            'cpu_utilization': round(best['cpu_seconds'] / (wall * (os.cpu_count() or 1)), 3),
+            'repeats': len(runs)
+        }
+
+    def run(self, stages: List[str]) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - PIPELINE THROUGHPUT BENCHMARK")
+        print("=" * 70)
+
+        corpus = self.corpus.ensure()
+        size_mb = sum((self.corpus.dir / rel).stat().st_size for rel in corpus['files']) / (1024 * 1024)
+        print(f"\n Corpus {corpus['fingerprint']}: {len(corpus['files'])} files, {size_mb:.1f} MB "
+              f"(seed {corpus['seed']}, sprites {', '.join(map(str, corpus['sprite_sizes']))})")
+        print(f" {os.cpu_count()} CPUs, parallel stages use {self.workers} workers, "
+              f"best of {self.repeats} run{'s' if self.repeats != 1 else ''}")
+
+        results = {}
+        for stage in stages:
+            print(f"\n {stage}...", end='', flush=True)
+            result = self.measure(stage)
+            results[stage] = result
+            if 'error' in result:
+                print(f" failed: {result['error']}")
+            elif 'skipped' in result:
+                print(f" skipped ({result['skipped']})")
+            else:
+                print(f" {result['wall_seconds']:.1f}s")
+
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'corpus': corpus['fingerprint'],
+            'seed': corpus['seed'],
+            'sprite_sizes': corpus['sprite_sizes'],
+            'machine': {
+                'platform': platform.platform(),
+                'python': platform.python_version(),
+                'cpus': os.cpu_count(),
+                'tools': {tool: shutil.which(tool) is not None for tool in ('pngquant', 'optipng', 'ffmpeg')}
+            },
+            'stages': results
+        }
+
+
+def compare(run: dict, baseline: Optional[dict], tolerance: float) -> List[dict]:
+    """Per-stage changes against the baseline; regressions are flagged"""
+    if not baseline:
+        return []
+    if baseline.get('corpus') != run['corpus']:
+        print(f"\n Baseline was recorded on corpus {baseline.get('corpus')}, not {run['corpus']}; not comparing")
+        return []
+
+    comparisons = []
+    for stage, result in run['stages'].items():
+        reference = baseline['stages'].get(stage)
+        if not reference or 'files_per_sec' not in result or 'files_per_sec' not in reference:
+            continue
+        entry = {'stage': stage, 'regressions': []}
+        for metric in ('files_per_sec', 'mb_per_sec'):
+            change = result[metric] / reference[metric] - 1 if reference[metric] else 0.0
+            entry[metric] = round(change, 3)
+            if change < -tolerance:
+                entry['regressions'].append(f"{metric} {change * 100:+.1f}%")
+        if result.get('peak_rss_mb') and reference.get('peak_rss_mb'):
+            change = result['peak_rss_mb'] / reference['peak_rss_mb'] - 1
+            entry['peak_rss_mb'] = round(change, 3)
+            if change > tolerance:
+                entry['regressions'].append(f"peak_rss_mb {change * 100:+.1f}%")
+        comparisons.append(entry)
+    return comparisons
+
+
+def print_results(run: dict, comparisons: List[dict]):
+    changes = {entry['stage']: entry for entry in comparisons}
+    print(f"\n {'stage':<22} {'files/s':>8} {'MB/s':>8} {'peak MB':>8} {'CPU':>6} {'wall s':>8}  vs baseline")
+    for stage, result in run['stages'].items():
+        if 'files_per_sec' not in result:
+            print(f" {stage:<22} {result.get('skipped') or result.get('error')}")
+            continue
+        peak = f"{result['peak_rss_mb']:.0f}" if result['peak_rss_mb'] is not None else '-'
+        entry = changes.get(stage)
+        versus = f"{entry['files_per_sec'] * 100:+.1f}%" if entry else '-'
+        if entry and entry['regressions']:
+            versus += f"  REGRESSED: {', '.join(entry['regressions'])}"
+        print(f" {stage:<22} {result['files_per_sec']:>8.2f} {result['mb_per_sec']:>8.2f} {peak:>8} "
+              f"{result['cpu_utilization'] * 100:>5.0f}% {result['wall_seconds']:>8.2f}  {versus}")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Measure asset and audio pipeline throughput on a synthetic corpus')
+    parser.add_argument('--stage', action='append', choices=list(STAGES), help='Stage to run (default: all)')
+    parser.add_argument('--quick', action='store_true',
+                        help=f"Sprites at {', '.join(map(str, QUICK_SPRITE_SIZES))} only")
+    parser.add_argument('--sprite-sizes', type=int, nargs='+', help='Sprite edge lengths to generate')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Corpus seed')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='Workers for parallel stages')
+    parser.add_argument('--repeats', type=int, default=1, help='Runs per stage (best time is kept)')
+    parser.add_argument('--work-dir', default=str(project_root / '.pipeline' / 'benchmark'),
+                        help='Corpus cache and stage workspaces')
+    parser.add_argument('--history', default=str(project_root / 'pipeline_benchmark_history.json'),
+                        help='JSON history every run is appended to')
+    parser.add_argument('--baseline', default=str(script_dir / 'pipeline_benchmark_baseline.json'),
+                        help='Baseline to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the baseline instead of gating')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Allowed throughput drop / peak RSS growth before a stage regresses')
+    parser.add_argument('--verbose', action='store_true', help='Show each pipeline\'s own output')
+    args = parser.parse_args()
+
+    sprite_sizes = args.sprite_sizes or (QUICK_SPRITE_SIZES if args.quick else SPRITE_SIZES)
+    benchmark = ThroughputBenchmark(project_root, Path(args.work_dir), args.seed, sprite_sizes,
+                                    args.workers, args.repeats, args.verbose)
+    run = benchmark.run(args.stage or list(STAGES))
+
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text()) if baseline_path.exists() else None
+    comparisons = [] if args.save_baseline else compare(run, baseline, args.tolerance)
+    run['comparison'] = comparisons
+    print_results(run, comparisons)
+
+    history_path = Path(args.history)
+    history = {'version': HISTORY_VERSION, 'runs': []}
+    if history_path.exists():
+        history = json.loads(history_path.read_text())
+    history['runs'].append(run)
+    write_text_atomic(history_path, json.dumps(history, indent=2))
+    print(f"\n History saved to: {history_path} ({len(history['runs'])} runs)")
+
+    if args.save_baseline:
+        write_text_atomic(baseline_path, json.dumps({k: v for k, v in run.items() if k != 'comparison'}, indent=2))
+        print(f" Baseline saved to: {baseline_path}")
+        return
+
+    failed = [stage for stage, result in run['stages'].items() if 'error' in result]
+    regressed = [entry['stage'] for entry in comparisons if entry['regressions']]
+    if failed or regressed:
+        print(f"\n Throughput check FAILED ({', '.join(failed + regressed)})")
+        sys.exit(1)
+    if baseline is None:
+        print("\n No baseline yet; run with --save-baseline to store one")
+    else:
+        print("\n Throughput within baseline tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Critical-Path Load Plan Builder for Terror in the Jungle
+- Orders runtime assets so the game can render as early as possible:
+  critical (ground, first-person weapon, skybox), then nearby ground
+  foliage, then everything else
+- Records the exact byte size of every asset so loading progress is real
+- Generates tiny blurred LQIP placeholders (a few hundred bytes each) as
+  inline data URIs, which AssetLoader shows until full textures arrive
+- Writes public/load_plan.json
+"""
+
+import io
+import sys
+import json
+import base64
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import List, Optional
+
+try:
+    from PIL import Image, ImageFilter
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image, ImageFilter
+    HAS_PIL = True
+
+from benchmark_asset_budgets import IMAGE_EXTENSIONS, categorize_asset, discover_runtime_assets
+from pipeline_journal import write_text_atomic
+
+Image.MAX_IMAGE_PIXELS = None
+
+PLAN_VERSION = 1
+TIERS = ['critical', 'nearby', 'deferred']
+
+# What the player sees on the first rendered frame
+CRITICAL_ASSETS = ['forestfloor', 'first-person', 'skybox']
+
+# Small ground foliage that fills the chunks around the spawn point
+NEARBY_ASSETS = ['fern', 'fanpalm', 'elephantear', 'grass', 'waternormals']
+
+# Placeholder encoding: shrink until the PNG fits the byte budget; a flat
+# 1x1 average colour is the last resort and always fits
+PLACEHOLDER_SIZES = [16, 12, 8, 4]
+PLACEHOLDER_COLORS = [16, 8, 4]
+
+# Blurred normal-map detail only adds noise to the lighting, so these get the flat average up front
+FLAT_PLACEHOLDER_ASSETS = ['normal']
+
+
+def classify_tier(filename: str) -> str:
+    lower = filename.lower()
+    if any(key in lower for key in CRITICAL_ASSETS):
+        return 'critical'
+    if any(key in lower for key in NEARBY_ASSETS):
+        return 'nearby'
+    return 'deferred'
+
+
+def encode_png(image: Image.Image) -> bytes:
+    # convert() carries the source's ICC profile along; a few KB of iCCP dwarfs the pixels
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True, icc_profile=None)
+    return buffer.getvalue()
+
+
+def make_placeholder(path: Path, max_bytes: int) -> Optional[dict]:
+    """Blurred, palette-quantized thumbnail (or flat colour) encoded as a PNG data URI"""
+    with Image.open(path) as img:
+        width, height = img.size
+        img.draft('RGB', (64, 64))
+        rgba = img.convert('RGBA')
+
+    # reduce() is a cheap box filter; it keeps 8K sprites from dominating runtime
+    factor = max(1, min(rgba.width, rgba.height) // 64)
+    if factor > 1:
+        rgba = rgba.reduce(factor)
+
+    best = None
+    flat = any(key in path.name.lower() for key in FLAT_PLACEHOLDER_ASSETS)
+    for size in ([] if flat else PLACEHOLDER_SIZES):
+        scale = size / max(width, height)
+        thumb_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        thumb = rgba.resize(thumb_size, Image.Resampling.LANCZOS)
+        thumb = thumb.filter(ImageFilter.GaussianBlur(radius=0.6))
+        for colors in PLACEHOLDER_COLORS:
+            data = encode_png(thumb.quantize(colors=colors, method=Image.Quantize.FASTOCTREE))
+            if best is None or len(data) < len(best[0]):
+                best = (data, thumb_size)
+            if len(data) <= max_bytes:
+                break
+        if best and len(best[0]) <= max_bytes:
+            break
+
+    if best is None or len(best[0]) > max_bytes:
+        best = (encode_png(rgba.resize((1, 1), Image.Resampling.BOX)), (1, 1))
+    data, thumb_size = best
+    return {
+        'width': width,
+        'height': height,
+        'placeholder': 'data:image/png;base64,' + base64.b64encode(data).decode('ascii'),
+        'placeholder_bytes': len(data),
+        'placeholder_dimensions': f"{thumb_size[0]}x{thumb_size[1]}"
+    }
+
+
+class LoadPlanBuilder:
+    def __init__(self, project_root: Path, placeholder_bytes: int = 400):
+        self.project_root = Path(project_root)
+        self.public_dir = self.project_root / 'public'
+        self.assets_dir = self.public_dir / 'assets'
+        self.placeholder_bytes = placeholder_bytes
+
+    def build(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - LOAD PLAN BUILDER")
+        print("=" * 70)
+
+        entries: List[dict] = []
+        for path in discover_runtime_assets(self.assets_dir):
+            rel = path.relative_to(self.assets_dir).as_posix()
+            is_image = path.suffix.lower() in IMAGE_EXTENSIONS
+            entry = {
+                'file': rel,
+                'name': path.stem,
+                'path': f"assets/{rel}",
+                'category': categorize_asset(path.name),
+                'tier': classify_tier(path.name) if is_image else 'deferred',
+                'bytes': path.stat().st_size
+            }
+            if is_image:
+                entry.update(make_placeholder(path, self.placeholder_bytes))
+            entries.append(entry)
+
+        # Textures before audio inside a tier, then smallest first
+        entries.sort(key=lambda e: (TIERS.index(e['tier']), 'placeholder' not in e, e['bytes'], e['file']))
+        cumulative = 0
+        for order, entry in enumerate(entries):
+            cumulative += entry['bytes']
+            entry['order'] = order
+            entry['cumulative_bytes'] = cumulative
+
+        tier_bytes = {tier: sum(e['bytes'] for e in entries if e['tier'] == tier) for tier in TIERS}
+        plan = {
+            'version': PLAN_VERSION,
+            'created': datetime.now().isoformat(),
+            'tiers': TIERS,
+            'tier_bytes': tier_bytes,
+            'total_bytes': cumulative,
+            'assets': entries
+        }
+
+        print(f"\n {'#':>3}  {'tier':<9} {'bytes':>10}  {'lqip':>5}  file")
+        print("-" * 70)
+        for entry in entries:
+            lqip = entry.get('placeholder_bytes', '')
+            print(f" {entry['order']:3d}  {entry['tier']:<9} {entry['bytes']:>10,}  {lqip:>5}  {entry['file']}")
+
+        print("\n Bytes per tier:")
+        for tier in TIERS:
+            print(f"   {tier:<9} {tier_bytes[tier] / (1024 * 1024):8.2f} MB")
+        return plan
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Build the prioritized asset load plan with LQIP placeholders')
+    parser.add_argument('--output', default=str(project_root / 'public' / 'load_plan.json'), help='Plan path')
+    parser.add_argument('--placeholder-bytes', type=int, default=400,
+                        help='Target maximum size of each placeholder PNG')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    plan = LoadPlanBuilder(project_root, args.placeholder_bytes).build()
+    write_text_atomic(Path(args.output), json.dumps(plan, indent=2))
+    print(f"\n Load plan saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Arrival Prefetch Manifest Builder for Terror in the Jungle
+- For every game mode, every zone a player or squad can spawn at and
+  every helipad, works out what the client needs on arrival: the chunks
+  around the landing point and the textures the first seconds there will
+  touch that the client is still streaming
+- Chunks carry their ring (ImprovedChunkManager's chessboard distance),
+  runtime LOD level and both halves of their load cost: the download (the
+  baked LOD block Range-fetched from public/terrain, 0 without a pack; the
+  height field itself is generated locally) and the generation slot the
+  chunk manager paces at one chunk per LOAD_DELAY; water normals are only
+  listed where the arrival area actually has water, and enemy sprites at
+  the distance of the nearest zone enemies can hold
+- Only textures AssetLoader streams after startup are listed (placeholder
+  entries outside the critical tier of public/load_plan.json); critical
+  textures block startup and AudioManager loads every sound up front, so
+  neither has anything left to download by the time of a respawn
+- Each arrival's items are ordered by ring, then download size, so
+  whatever the respawn countdown has time for is the most useful part
+- Writes public/prefetch_manifest.json; the respawn screen warms the
+  chunk manager and texture stream from it while the timer runs
+"""
+
+import sys
+import json
+import math
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pipeline_journal import write_text_atomic
+from benchmark_asset_budgets import discover_runtime_assets
+from bake_terrain_lods import CHUNK_SIZE, NOISE_SEED, HEADER, PACK_MAGIC, TerrainNoise, terrain_height
+from bake_spawn_tables import WATER_LEVEL, load_game_modes
+
+MANIFEST_VERSION = 1
+
+# Chunks the respawn countdown can realistically warm: ImprovedChunkManager ingests one per LOAD_DELAY (100ms)
+DEFAULT_RADIUS = 4
+CHUNK_LOAD_DELAY = 0.1
+
+# Water detection resolution inside each chunk (metres)
+WATER_SAMPLE_STEP = 8.0
+
+# HelipadSystem landing pads: (mode, id, x, z)
+HELIPADS = [
+    ('open_frontier', 'us_helipad', 40.0, -1400.0)
+]
+
+# Texture names as AssetLoader registers them, grouped by when an arrival needs them
+ALWAYS_TEXTURES = ['forestfloor', 'skybox', 'first-person']
+FOLIAGE_TEXTURES = ['Fern', 'ElephantEarPlants', 'FanPalmCluster', 'CoconutPalm',
+                    'ArecaPalmCluster', 'DipterocarpGiant', 'TwisterBanyan']
+FRIENDLY_TEXTURES = ['ASoldierWalking', 'ASoldierAlert', 'ASoldierFiring']
+ENEMY_TEXTURES = ['EnemySoldierWalking', 'EnemySoldierAlert', 'EnemySoldierFiring', 'EnemySoldierBack']
+WATER_TEXTURES = ['waternormals']
+
+
+def calculate_lod(distance: float) -> int:
+    """ImprovedChunkManager.calculateLOD"""
+    if distance <= 3:
+        return 0
+    if distance <= 5:
+        return 1
+    if distance <= 7:
+        return 2
+    return 3
+
+
+def load_streamed_textures(plan_path: Path) -> set:
+    """
+    Files AssetLoader streams after startup: load plan entries with a
+    placeholder outside the critical tier. Without a plan every texture
+    loads before the game starts, so nothing is left to prefetch.
+    """
+    if not plan_path.exists():
+        return set()
+    plan = json.loads(plan_path.read_text(encoding='utf-8'))
+    return {entry['file'] for entry in plan['assets']
+            if entry.get('placeholder') and entry['tier'] != 'critical'}
+
+
+def load_terrain_index(pack_path: Path) -> Dict[str, int]:
+    """Baked LOD block size per chunk key, or {} when terrain_lods.bin has not been baked"""
+    if not pack_path.exists():
+        return {}
+    with open(pack_path, 'rb') as f:
+        magic, _, _, index_length, _ = HEADER.unpack(f.read(HEADER.size))
+        if magic != PACK_MAGIC:
+            return {}
+        index = json.loads(f.read(index_length))
+    return {key: length for key, (_, length) in index['chunks'].items()}
+
+
+def load_spawn_positions(tables_path: Path) -> Dict[Tuple[str, str], Tuple[float, float]]:
+    """Best baked spawn candidate per (mode, zone), where the respawn actually lands"""
+    if not tables_path.exists():
+        return {}
+    tables = json.loads(tables_path.read_text(encoding='utf-8'))
+    positions = {}
+    for mode, entry in tables['modes'].items():
+        for zone_id, data in entry['zones'].items():
+            if data:
+                positions[(mode, zone_id)] = (data[0], data[2])
+    return positions
+
+
+class PrefetchManifestBuilder:
+    def __init__(self, project_root: Path, radius: int = DEFAULT_RADIUS, seed: int = NOISE_SEED):
+        self.project_root = project_root
+        self.public_dir = project_root / 'public'
+        self.radius = radius
+        self.noise = TerrainNoise(seed)
+
+        self.asset_files: Dict[str, Path] = {}
+        for path in discover_runtime_assets(self.public_dir / 'assets'):
+            # Top-level files are what AssetLoader registers by name
+            if path.parent == self.public_dir / 'assets':
+                self.asset_files[path.stem] = path
+        self.chunk_bytes = load_terrain_index(self.public_dir / 'terrain' / 'terrain_lods.bin')
+        self.spawn_positions = load_spawn_positions(self.public_dir / 'spawn_tables.json')
+        self.streamed = load_streamed_textures(self.public_dir / 'load_plan.json')
+        self.missing: set = set()
+
+    def water_rings(self, center: Tuple[int, int]) -> Optional[int]:
+        """Ring of the nearest chunk whose terrain dips below the water level"""
+        cx, cz = center
+        per_chunk = int(CHUNK_SIZE / WATER_SAMPLE_STEP)
+        count = (2 * self.radius + 1) * per_chunk + 1
+        coords = np.arange(count) * WATER_SAMPLE_STEP
+        world_x, world_z = np.meshgrid((cx - self.radius) * CHUNK_SIZE + coords,
+                                       (cz - self.radius) * CHUNK_SIZE + coords)
+        wet = terrain_height(self.noise, world_x, world_z) < WATER_LEVEL
+        best = None
+        for dz in range(-self.radius, self.radius + 1):
+            for dx in range(-self.radius, self.radius + 1):
+                row, col = (dz + self.radius) * per_chunk, (dx + self.radius) * per_chunk
+                if wet[row:row + per_chunk + 1, col:col + per_chunk + 1].any():
+                    ring = max(abs(dx), abs(dz))
+                    best = ring if best is None else min(best, ring)
+        return best
+
+    def texture_item(self, name: str, ring: int) -> Optional[dict]:
+        path = self.asset_files.get(name)
+        if path is None or not path.exists():
+            self.missing.add(name)
+            return None
+        if path.name not in self.streamed:
+            # Already resident once the game has started
+            return None
+        rel = path.relative_to(self.public_dir).as_posix()
+        return {'type': 'texture', 'ring': ring, 'bytes': path.stat().st_size, 'path': rel, 'name': name}
+
+    def build_arrival(self, mode: dict, kind: str, x: float, z: float, enemy_zones: List[dict]) -> dict:
+        center = (math.floor(x / CHUNK_SIZE), math.floor(z / CHUNK_SIZE))
+        items: List[dict] = []
+
+        for dz in range(-self.radius, self.radius + 1):
+            for dx in range(-self.radius, self.radius + 1):
+                chunk_x, chunk_z = center[0] + dx, center[1] + dz
+                # updateChunkVisibility measures from the chunk centre in chunk units
+                distance = max(abs((chunk_x + 0.5) * CHUNK_SIZE - x), abs((chunk_z + 0.5) * CHUNK_SIZE - z)) / CHUNK_SIZE
+                key = f"{chunk_x},{chunk_z}"
+                items.append({
+                    'type': 'chunk',
+                    'key': key,
+                    'ring': max(abs(dx), abs(dz)),
+                    'lod': calculate_lod(distance),
+                    # Download only: the LOD block attachTerrainLods fetches after generation
+                    'bytes': self.chunk_bytes.get(key, 0),
+                    'generate_seconds': CHUNK_LOAD_DELAY
+                })
+
+        assets: List[Optional[dict]] = []
+        for name in ALWAYS_TEXTURES + FOLIAGE_TEXTURES + FRIENDLY_TEXTURES:
+            assets.append(self.texture_item(name, 0))
+        if enemy_zones:
+            enemy_ring = min(max(abs(math.floor(zone['x'] / CHUNK_SIZE) - center[0]),
+                                 abs(math.floor(zone['z'] / CHUNK_SIZE) - center[1])) for zone in enemy_zones)
+            for name in ENEMY_TEXTURES:
+                assets.append(self.texture_item(name, enemy_ring))
+        water_ring = self.water_rings(center)
+        if water_ring is not None:
+            for name in WATER_TEXTURES:
+                assets.append(self.texture_item(name, water_ring))
+        items.extend(item for item in assets if item)
+
+        # Nearest ring first; inside a ring the cheapest items land first
+        items.sort(key=lambda item: (item['ring'], item['bytes'], item['type'], item.get('key') or item['path']))
+        cumulative = 0
+        for item in items:
+            cumulative += item['bytes']
+            item['cumulative_bytes'] = cumulative
+
+        chunk_count = sum(1 for item in items if item['type'] == 'chunk')
+        countdown_chunks = int(mode['respawn_time'] / CHUNK_LOAD_DELAY)
+        return {
+            'kind': kind,
+            'position': [round(x, 2), round(z, 2)],
+            'chunk': list(center),
+            'water_ring': water_ring,
+            'chunks': chunk_count,
+            'countdown_chunks': min(chunk_count, countdown_chunks),
+            'bytes': cumulative,
+            'generate_seconds': round(chunk_count * CHUNK_LOAD_DELAY, 2),
+            'items': items
+        }
+
+    def build(self, modes: List[dict]) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - ARRIVAL PREFETCH MANIFEST")
+        print("=" * 70)
+        print(f"\n Prefetch radius {self.radius} chunks, "
+              f"{'baked terrain LODs' if self.chunk_bytes else 'no terrain LOD pack'}, "
+              f"{'baked spawn tables' if self.spawn_positions else 'zone centres (no spawn tables)'}, "
+              f"{len(self.streamed)} streamed textures")
+
+        manifest_modes = {}
+        for mode in modes:
+            # Enemies show up at OPFOR bases and at any zone OPFOR can capture
+            enemy_zones = [zone for zone in mode['zones'] if zone['owner'] != 'US']
+            arrivals = {}
+            targets = [('zone', zone['id'], zone['x'], zone['z']) for zone in mode['zones'] if zone['owner'] != 'OPFOR']
+            targets += [('helipad', pad_id, x, z) for pad_mode, pad_id, x, z in HELIPADS if pad_mode == mode['id']]
+
+            print(f"\n {mode['id']}: render distance {mode['render_distance']}, respawn {mode['respawn_time']:.0f}s")
+            print(f"   {'arrival':<20} {'kind':<8} {'chunks':>7} {'fit':>5} {'gen s':>6} {'water':>6} {'MB':>8}")
+            for kind, arrival_id, x, z in targets:
+                x, z = self.spawn_positions.get((mode['id'], arrival_id), (x, z))
+                arrival = self.build_arrival(mode, kind, x, z, enemy_zones)
+                arrivals[arrival_id] = arrival
+                water = '-' if arrival['water_ring'] is None else f"ring {arrival['water_ring']}"
+                print(f"   {arrival_id[:20]:<20} {kind:<8} {arrival['chunks']:>7} {arrival['countdown_chunks']:>5} "
+                      f"{arrival['generate_seconds']:>6.1f} {water:>6} {arrival['bytes'] / (1024 * 1024):>8.2f}")
+
+            manifest_modes[mode['id']] = {
+                'render_distance': mode['render_distance'],
+                'respawn_time': mode['respawn_time'],
+                'arrivals': arrivals
+            }
+
+        if self.missing:
+            print(f"\n ⚠️  Not found under public/ (left out): {', '.join(sorted(self.missing))}")
+
+        return {
+            'version': MANIFEST_VERSION,
+            'created': datetime.now().isoformat(),
+            'chunk_size': CHUNK_SIZE,
+            'radius': self.radius,
+            'modes': manifest_modes
+        }
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    game_modes = project_root / 'src' / 'config' / 'gameModes.ts'
+
+    parser = argparse.ArgumentParser(description='Build per-arrival chunk and asset prefetch lists')
+    parser.add_argument('--output', default=str(project_root / 'public' / 'prefetch_manifest.json'),
+                        help='Manifest path')
+    parser.add_argument('--radius', type=int, default=DEFAULT_RADIUS, help='Chunk rings to prefetch around an arrival')
+    parser.add_argument('--seed', type=int, default=NOISE_SEED, help='Noise seed (ImprovedChunkManager uses 12345)')
+    args = parser.parse_args()
+
+    if not game_modes.exists():
+        print(f" Game modes not found: {game_modes}")
+        sys.exit(1)
+
+    manifest = PrefetchManifestBuilder(project_root, args.radius, args.seed).build(load_game_modes(game_modes))
+    output = Path(args.output)
+    write_text_atomic(output, json.dumps(manifest, separators=(',', ':')))
+    print(f"\n Manifest saved to: {output} ({output.stat().st_size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,19 +6,26 @@ Audio Compression Script for Helicopter and Transmission Audio
 """
 
 import os
+import argparse
 import subprocess
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from pipeline_journal import RunJournal, file_sha1
+
+# Vorbis quality per source; part of the journal config so changing one restarts a run
+ROTOR_QUALITY = '7'
+TRANSMISSION_QUALITY = '5'
+
 class AudioCompressor:
     def __init__(self, project_root: str):
         self.project_root = Path(project_root)
         self.assets_dir = self.project_root / 'public' / 'assets'
 
-        # Create backup directory
+        # Backup directory (created on first backup; a resumed run reuses its own)
         self.backup_dir = self.project_root / 'audio_backup' / datetime.now().strftime('%Y%m%d_%H%M%S')
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        self.journal = None
 
     def check_ffmpeg(self):
         """Check if ffmpeg is available"""
@@ -32,13 +39,26 @@ class AudioCompressor:
 
     def backup_original(self, file_path: Path):
         """Create backup of original file"""
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
         backup_path = self.backup_dir / file_path.name
         shutil.copy2(file_path, backup_path)
         print(f"  Backed up: {file_path.name}")
 
     def compress_audio(self, input_path: Path, quality: str = '6') -> bool:
-        """Convert WAV to OGG with specified quality"""
+        """
+        Convert WAV to OGG with specified quality. The OGG is staged and
+        journaled; it is published and the WAV removed only once the whole
+        run has finished (see publish_and_clean).
+        """
         output_path = input_path.with_suffix('.ogg')
+        unit = input_path.relative_to(self.assets_dir).as_posix()
+        source_sha1 = file_sha1(input_path)
+
+        if self.journal.completed(unit, source_sha1):
+            print(f"  ✓ {input_path.name} already compressed in the interrupted run")
+            return True
+
+        staged_path = self.journal.stage(output_path)
 
         try:
             cmd = [
@@ -47,21 +67,20 @@ class AudioCompressor:
                 '-c:a', 'libvorbis',
                 '-q:a', quality,
                 '-y',  # Overwrite output file
-                str(output_path)
+                str(staged_path)
             ]
 
-            result = subprocess.run(cmd, capture_output=True, stderr=subprocess.DEVNULL)
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-            if result.returncode == 0 and output_path.exists():
+            if result.returncode == 0 and staged_path.exists():
                 # Get file sizes
                 original_size = input_path.stat().st_size
-                compressed_size = output_path.stat().st_size
+                compressed_size = staged_path.stat().st_size
                 reduction = (1 - compressed_size/original_size) * 100
 
                 print(f"  ✓ {input_path.name} → {output_path.name} ({reduction:.1f}% smaller)")
 
-                # Remove original WAV file
-                input_path.unlink()
+                self.journal.finish(unit, source_sha1, [output_path], quality=quality)
                 return True
             else:
                 print(f"  ✗ Failed to compress {input_path.name}")
@@ -71,6 +90,26 @@ class AudioCompressor:
             print(f"  ✗ Error compressing {input_path.name}: {e}")
             return False
 
+    def publish_and_clean(self) -> int:
+        """
+        Publish every staged OGG atomically, then remove the WAVs they came
+        from, but only those whose backup copy is verified intact
+        """
+        self.journal.publish()
+
+        removed = 0
+        for unit, record in self.journal.units.items():
+            source = self.assets_dir / unit
+            backup = self.backup_dir / source.name
+            if not source.exists():
+                continue
+            if backup.exists() and file_sha1(backup) == record['source_sha1']:
+                source.unlink()
+                removed += 1
+            else:
+                print(f"  Keeping {unit}: no verified backup in {self.backup_dir}")
+        return removed
+
     def process_helicopter_audio(self):
         """Process helicopter rotor blade audio"""
         rotor_file = self.assets_dir / 'RotorBlades.wav'
@@ -79,7 +118,7 @@ class AudioCompressor:
             print("\n🚁 Processing helicopter audio:")
             self.backup_original(rotor_file)
             # Use higher quality for helicopter audio (important for immersion)
-            success = self.compress_audio(rotor_file, quality='7')
+            success = self.compress_audio(rotor_file, quality=ROTOR_QUALITY)
             return success
         else:
             print("  No RotorBlades.wav found")
@@ -105,27 +144,46 @@ class AudioCompressor:
         for wav_file in wav_files:
             self.backup_original(wav_file)
             # Use medium quality for transmissions (they should sound a bit compressed anyway)
-            if self.compress_audio(wav_file, quality='5'):
+            if self.compress_audio(wav_file, quality=TRANSMISSION_QUALITY):
                 success_count += 1
 
         print(f"  ✓ Successfully compressed {success_count}/{len(wav_files)} transmission files")
         return success_count > 0
 
-    def run(self):
-        """Run the complete audio compression process"""
+    def run(self, resume: bool = True):
+        """Run the complete audio compression process (resumes an interrupted run unless resume=False)"""
         print("HELICOPTER & TRANSMISSION AUDIO COMPRESSOR")
         print("=" * 50)
 
         if not self.check_ffmpeg():
             return False
 
+        self.journal = RunJournal(self.project_root, 'compress_audio', {
+            'rotor_quality': ROTOR_QUALITY,
+            'transmission_quality': TRANSMISSION_QUALITY
+        }, resume=resume)
+        print(f"\n{self.journal.describe()}")
+        if self.journal.state.get('backup_dir'):
+            self.backup_dir = Path(self.journal.state['backup_dir'])
+        else:
+            self.journal.set_state(backup_dir=str(self.backup_dir))
+
         print(f"\nBackup directory: {self.backup_dir}")
 
-        # Process helicopter audio
-        helicopter_success = self.process_helicopter_audio()
+        try:
+            # Process helicopter audio
+            helicopter_success = self.process_helicopter_audio()
+
+            # Process transmissions
+            transmission_success = self.process_transmissions()
+        except KeyboardInterrupt:
+            print(f"\n\nInterrupted: {len(self.journal.units)} files journaled, nothing published or deleted.")
+            print("Run again to resume.")
+            return False
 
-        # Process transmissions
-        transmission_success = self.process_transmissions()
+        # Publish every OGG, then drop the backed-up WAVs, then commit the run
+        removed = self.publish_and_clean()
+        self.journal.commit()
 
         # Summary
         print("\n" + "=" * 50)
@@ -142,7 +200,7 @@ class AudioCompressor:
         else:
             print("✗ Transmission audio files not processed")
 
-        print(f"\nOriginal files backed up to: {self.backup_dir}")
+        print(f"\nOriginal files backed up to: {self.backup_dir} ({removed} WAVs removed from assets)")
         print("\nNext steps:")
         print("1. Update AssetLoader to load .ogg files instead of .wav")
         print("2. Wire helicopter audio into HelicopterModel system")
@@ -154,8 +212,12 @@ def main():
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 
+    parser = argparse.ArgumentParser(description='Compress helicopter and transmission WAVs to OGG')
+    parser.add_argument('--fresh', action='store_true', help='Ignore an interrupted run and start over')
+    args = parser.parse_args()
+
     compressor = AudioCompressor(project_root)
-    compressor.run()
+    compressor.run(resume=not args.fresh)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
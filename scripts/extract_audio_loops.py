@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Seamless Loop Extractor for Terror in the Jungle
+- Finds the shortest segment of a looping sound (rotor blades, jungle
+  ambience) that repeats seamlessly, so the browser decodes seconds of PCM
+  instead of the whole recording
+- Candidate loop lengths come from an FFT autocorrelation; each candidate
+  seam is scored on waveform phase match and spectral-envelope match
+- The winning loop is sample-aligned, given a short equal-power crossfade
+  into the audio preceding its start, and encoded like the rest of the pipeline
+- Loop points (in the loop file and in the source) go to
+  public/assets/loops/loops.json
+"""
+
+import sys
+import json
+import wave
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import soundfile
+    HAS_SOUNDFILE = True
+except ImportError:
+    HAS_SOUNDFILE = False
+
+from benchmark_asset_budgets import AUDIO_CONTEXT_SAMPLE_RATE, BYTES_PER_DECODED_SAMPLE
+from smart_optimize_clean import SmartOptimizer
+from pipeline_journal import write_text_atomic
+
+LOOPS_VERSION = 1
+
+# Looped sounds in the game and the loop lengths that make sense for each
+LOOP_SOURCES = {
+    'RotorBlades.ogg': {'min_seconds': 1.0, 'max_seconds': 8.0, 'crossfade_ms': 30},
+    'optimized/jungle1.ogg': {'min_seconds': 15.0, 'max_seconds': 60.0, 'crossfade_ms': 400},
+    'optimized/jungle2.ogg': {'min_seconds': 15.0, 'max_seconds': 60.0, 'crossfade_ms': 400}
+}
+DEFAULT_SETTINGS = {'min_seconds': 1.0, 'max_seconds': 30.0, 'crossfade_ms': 50}
+
+# Coarse autocorrelation runs on a decimated mono mix
+ANALYSIS_RATE = 11025
+CANDIDATE_LAGS = 24
+
+# Seam scoring
+SEAM_WINDOW_SECONDS = 0.1
+SEAM_STARTS = 48
+SPECTRAL_BANDS = 32
+PHASE_WEIGHT = 0.5
+ALIGN_SECONDS = 0.005
+
+# Loops scoring at least this are considered seamless; the shortest one wins
+DEFAULT_MIN_SCORE = 0.8
+
+# Without a seamless candidate (noise-like ambience never matches phase),
+# take the shortest loop within this margin of the best score
+SCORE_TOLERANCE = 0.05
+
+
+def read_audio(path: Path) -> Tuple[np.ndarray, int]:
+    """Decode to float32 (frames, channels) with soundfile, wave or ffmpeg"""
+    if HAS_SOUNDFILE:
+        data, rate = soundfile.read(str(path), dtype='float32', always_2d=True)
+        return data, rate
+
+    if path.suffix.lower() == '.wav':
+        with wave.open(str(path), 'rb') as wav:
+            channels, width, rate = wav.getnchannels(), wav.getsampwidth(), wav.getframerate()
+            raw = wav.readframes(wav.getnframes())
+        if width == 1:
+            data = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+        elif width == 2:
+            data = np.frombuffer(raw, dtype='<i2').astype(np.float32) / 32768
+        elif width == 4:
+            data = np.frombuffer(raw, dtype='<i4').astype(np.float32) / 2147483648
+        else:
+            raise ValueError(f"{path.name}: unsupported {width * 8}-bit WAV")
+        return data.reshape(-1, channels), rate
+
+    probe = subprocess.run(['ffprobe', '-v', 'error', '-select_streams', 'a:0',
+                            '-show_entries', 'stream=channels,sample_rate',
+                            '-of', 'default=noprint_wrappers=1', str(path)],
+                           capture_output=True, text=True, check=True)
+    fields = dict(line.split('=', 1) for line in probe.stdout.split())
+    channels, rate = int(fields['channels']), int(fields['sample_rate'])
+    result = subprocess.run(['ffmpeg', '-v', 'error', '-i', str(path), '-f', 'f32le', '-'],
+                            capture_output=True, check=True)
+    return np.frombuffer(result.stdout, dtype='<f4').reshape(-1, channels), rate
+
+
+def write_wav(path: Path, data: np.ndarray, rate: int):
+    pcm = np.clip(np.rint(data * 32767), -32768, 32767).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(data.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+
+
+def normalized_autocorrelation(signal: np.ndarray) -> np.ndarray:
+    """Autocorrelation per lag, normalized by the energy of the overlapping parts"""
+    n = len(signal)
+    size = 1 << (2 * n - 1).bit_length()
+    spectrum = np.fft.rfft(signal, size)
+    raw = np.fft.irfft(spectrum * np.conj(spectrum), size)[:n]
+    energy = np.concatenate([[0.0], np.cumsum(signal.astype(np.float64) ** 2)])
+    lags = np.arange(n)
+    head = energy[n - lags]            # signal[0:n-lag]
+    tail = energy[n] - energy[lags]    # signal[lag:n]
+    return raw / np.sqrt(np.maximum(head * tail, 1e-12))
+
+
+def band_spectrum(segment: np.ndarray) -> np.ndarray:
+    """Log magnitude in log-spaced bands: a coarse spectral envelope"""
+    magnitude = np.abs(np.fft.rfft(segment * np.hanning(len(segment))))
+    edges = np.unique(np.geomspace(1, len(magnitude), SPECTRAL_BANDS + 1).astype(int))
+    bands = np.add.reduceat(magnitude, edges[:-1]) / np.diff(edges)
+    return np.log(bands + 1e-9)
+
+
+def seam_score(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    """(phase match, spectral match) of the audio after the loop end vs after its start"""
+    denominator = np.sqrt(float(np.dot(a, a)) * float(np.dot(b, b)))
+    phase = max(0.0, float(np.dot(a, b) / denominator)) if denominator > 0 else 0.0
+    spectral = float(np.exp(-np.mean(np.abs(band_spectrum(a) - band_spectrum(b)))))
+    return phase, spectral
+
+
+def equal_power_crossfade(loop: np.ndarray, lead_in: np.ndarray) -> np.ndarray:
+    """Fade the loop tail into the audio that precedes its first sample"""
+    length = len(lead_in)
+    if length == 0:
+        return loop
+    t = (np.arange(length, dtype=np.float32) + 0.5) / length
+    fade_out = np.cos(t * np.pi / 2)[:, None]
+    fade_in = np.sin(t * np.pi / 2)[:, None]
+    result = loop.copy()
+    result[-length:] = loop[-length:] * fade_out + lead_in * fade_in
+    return result
+
+
+class LoopExtractor:
+    def __init__(self, rate: int, min_seconds: float, max_seconds: float, crossfade_ms: float,
+                 min_score: float = DEFAULT_MIN_SCORE):
+        self.rate = rate
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.crossfade = int(rate * crossfade_ms / 1000)
+        self.min_score = min_score
+        self.window = int(rate * SEAM_WINDOW_SECONDS)
+
+    def candidate_lags(self, mono: np.ndarray) -> List[int]:
+        """Full-rate loop lengths at the strongest autocorrelation peaks"""
+        factor = max(1, self.rate // ANALYSIS_RATE)
+        usable = len(mono) // factor * factor
+        coarse = mono[:usable].reshape(-1, factor).mean(axis=1)
+        coarse_rate = self.rate / factor
+
+        correlation = normalized_autocorrelation(coarse - coarse.mean())
+        low = max(1, int(self.min_seconds * coarse_rate))
+        # The seam needs room for a crossfade before the start and a window after the end
+        high = min(int(self.max_seconds * coarse_rate),
+                   int((len(mono) - self.crossfade - 2 * self.window) / factor))
+        if high <= low:
+            return []
+
+        window = correlation[low - 1:high + 1]
+        peaks = np.where((window[1:-1] >= window[:-2]) & (window[1:-1] >= window[2:]))[0] + low
+        if len(peaks) == 0:
+            peaks = np.array([low + int(np.argmax(correlation[low:high]))])
+        best = peaks[np.argsort(correlation[peaks])[::-1][:CANDIDATE_LAGS]]
+        return sorted(int(lag * factor) for lag in best)
+
+    def align(self, mono: np.ndarray, start: int, lag: int) -> int:
+        """Nudge the loop length by a few samples to line up waveform phase at the seam"""
+        reach = int(self.rate * ALIGN_SECONDS)
+        reference = mono[start:start + self.window]
+        search = mono[start + lag - reach:start + lag + reach + self.window]
+        if len(search) < len(reference) + 2 * reach or start + lag - reach < 0:
+            return lag
+        scores = np.correlate(search, reference, mode='valid')
+        return lag + int(np.argmax(scores)) - reach
+
+    def best_seam(self, mono: np.ndarray, lag: int) -> Optional[dict]:
+        """Best loop start for one loop length"""
+        first = self.crossfade
+        last = len(mono) - lag - self.window - int(self.rate * ALIGN_SECONDS)
+        if last <= first:
+            return None
+
+        best = None
+        for start in np.linspace(first, last, num=min(SEAM_STARTS, last - first + 1)).astype(int):
+            phase, spectral = seam_score(mono[start:start + self.window],
+                                         mono[start + lag:start + lag + self.window])
+            score = PHASE_WEIGHT * phase + (1 - PHASE_WEIGHT) * spectral
+            if best is None or score > best['score']:
+                best = {'start': int(start), 'length': lag, 'score': score, 'phase': phase, 'spectral': spectral}
+
+        aligned = self.align(mono, best['start'], lag)
+        if aligned != lag:
+            start = best['start']
+            phase, spectral = seam_score(mono[start:start + self.window],
+                                         mono[start + aligned:start + aligned + self.window])
+            score = PHASE_WEIGHT * phase + (1 - PHASE_WEIGHT) * spectral
+            if score >= best['score']:
+                best.update(length=aligned, score=score, phase=phase, spectral=spectral)
+        return best
+
+    def find_loop(self, data: np.ndarray) -> Optional[dict]:
+        mono = data.mean(axis=1)
+        seams = [seam for seam in (self.best_seam(mono, lag) for lag in self.candidate_lags(mono)) if seam]
+        if not seams:
+            return None
+        seamless = [seam for seam in seams if seam['score'] >= self.min_score]
+        if seamless:
+            return min(seamless, key=lambda seam: seam['length'])
+        best = max(seam['score'] for seam in seams)
+        return min((seam for seam in seams if seam['score'] >= best - SCORE_TOLERANCE),
+                   key=lambda seam: seam['length'])
+
+    def extract(self, data: np.ndarray, seam: dict) -> np.ndarray:
+        start, length = seam['start'], seam['length']
+        crossfade = min(self.crossfade, start, length // 2)
+        return equal_power_crossfade(data[start:start + length], data[start - crossfade:start])
+
+
+class AudioLoopBuilder:
+    def __init__(self, project_root: Path, min_score: float = DEFAULT_MIN_SCORE):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.output_dir = self.assets_dir / 'loops'
+        self.min_score = min_score
+        self.optimizer = SmartOptimizer(self.assets_dir)
+        self.has_ffmpeg = shutil.which('ffmpeg') is not None
+
+    def encode(self, loop: np.ndarray, rate: int, name: str) -> Path:
+        """Encode the loop with the pipeline's codec for its category (WAV when ffmpeg is missing)"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.output_dir, prefix='.loop-') as staging:
+            staged = Path(staging) / f"{name}.wav"
+            write_wav(staged, loop, rate)
+            if self.has_ffmpeg:
+                stats = self.optimizer.optimize_audio(staged, Path(staging))
+                staged = Path(staging) / stats['output']
+            target = self.output_dir / staged.name
+            shutil.move(str(staged), target)
+            target.chmod(0o644)
+        return target
+
+    def process(self, rel: str, settings: dict) -> Optional[dict]:
+        path = self.assets_dir / rel
+        data, rate = read_audio(path)
+        extractor = LoopExtractor(rate, settings['min_seconds'], settings['max_seconds'],
+                                  settings['crossfade_ms'], self.min_score)
+        seam = extractor.find_loop(data)
+        if seam is None:
+            print(f"   {rel}: too short for a {settings['min_seconds']}s loop, skipped")
+            return None
+
+        loop = extractor.extract(data, seam)
+        output = self.encode(loop, rate, Path(rel).stem)
+        source_frames = len(data)
+        decoded_before = round(source_frames / rate * AUDIO_CONTEXT_SAMPLE_RATE) * data.shape[1] * BYTES_PER_DECODED_SAMPLE
+        decoded_after = round(len(loop) / rate * AUDIO_CONTEXT_SAMPLE_RATE) * data.shape[1] * BYTES_PER_DECODED_SAMPLE
+
+        entry = {
+            'source': f"assets/{rel}",
+            'file': f"assets/{output.relative_to(self.assets_dir).as_posix()}",
+            'sample_rate': rate,
+            'channels': int(data.shape[1]),
+            'loop_start': 0.0,
+            'loop_end': round(len(loop) / rate, 6),
+            'loop_frames': int(len(loop)),
+            'source_loop_start': round(seam['start'] / rate, 6),
+            'source_loop_end': round((seam['start'] + seam['length']) / rate, 6),
+            'crossfade_ms': round(min(extractor.crossfade, seam['start'], seam['length'] // 2) / rate * 1000, 1),
+            'score': round(seam['score'], 4),
+            'phase_match': round(seam['phase'], 4),
+            'spectral_match': round(seam['spectral'], 4),
+            'seamless': bool(seam['score'] >= self.min_score),
+            'source_bytes': path.stat().st_size,
+            'loop_bytes': output.stat().st_size,
+            'decoded_bytes_before': decoded_before,
+            'decoded_bytes_after': decoded_after
+        }
+        print(f"   {rel}: {source_frames / rate:.1f}s -> {entry['loop_end']:.2f}s loop at "
+              f"{entry['source_loop_start']:.2f}s (score {entry['score']:.2f}, "
+              f"{'seamless' if entry['seamless'] else 'best effort'}), decoded "
+              f"{decoded_before / (1024 * 1024):.1f} MB -> {decoded_after / (1024 * 1024):.1f} MB")
+        return entry
+
+    def run(self, sources: Dict[str, dict]) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - SEAMLESS LOOP EXTRACTOR")
+        print("=" * 70)
+        if not self.has_ffmpeg:
+            print("\n ffmpeg not found - loops are written as WAV")
+
+        loops = {}
+        for rel, settings in sources.items():
+            if not (self.assets_dir / rel).exists():
+                print(f"   {rel}: not found, skipped")
+                continue
+            try:
+                entry = self.process(rel, settings)
+            except (OSError, ValueError, subprocess.CalledProcessError) as e:
+                print(f"   {rel}: failed to decode ({e})")
+                continue
+            if entry:
+                loops[Path(rel).stem] = entry
+
+        manifest = {'version': LOOPS_VERSION, 'created': datetime.now().isoformat(), 'loops': loops}
+        if loops:
+            manifest_path = self.output_dir / 'loops.json'
+            write_text_atomic(manifest_path, json.dumps(manifest, indent=2))
+            print(f"\n Loop manifest saved to: {manifest_path}")
+        return manifest
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Extract seamless loops from looping audio assets')
+    parser.add_argument('files', nargs='*',
+                        help='Audio files relative to public/assets (default: the looped game sounds)')
+    parser.add_argument('--min-seconds', type=float, help='Shortest loop to consider')
+    parser.add_argument('--max-seconds', type=float, help='Longest loop to consider')
+    parser.add_argument('--crossfade-ms', type=float, help='Crossfade length at the seam')
+    parser.add_argument('--min-score', type=float, default=DEFAULT_MIN_SCORE,
+                        help='Seam score (0-1) required before a shorter loop is preferred')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    sources = {}
+    for rel in args.files or LOOP_SOURCES:
+        settings = dict(LOOP_SOURCES.get(rel, DEFAULT_SETTINGS))
+        for key in ('min_seconds', 'max_seconds', 'crossfade_ms'):
+            if getattr(args, key) is not None:
+                settings[key] = getattr(args, key)
+        sources[rel] = settings
+
+    AudioLoopBuilder(project_root, args.min_score).run(sources)
+
+
+if __name__ == "__main__":
+    main()
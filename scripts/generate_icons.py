@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Icon and Splash Generator for Terror in the Jungle
+Replaces process_favicon.py / process_favicon1.py with one pass that:
+- Cuts the icon out of its background with vectorized masks
+  ('white': white background made transparent, cropped, padded, squared;
+   'circle': everything outside the black circle made transparent)
+- Builds one premultiplied-alpha downsampling pyramid and derives every
+  target size from the nearest level above it
+- Writes optimized favicon PNGs, an opaque maskable icon, a multi-resolution
+  favicon.ico, background.png splash variants for LoadingStyles.ts and a web
+  app manifest
+"""
+
+import io
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+try:
+    from PIL import Image, features
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image, features
+    HAS_PIL = True
+
+# PNG favicons referenced by index.html and the manifest (64x64 minimum to avoid pixelation)
+PNG_SIZES = [64, 128, 180, 192, 256, 512]
+ICO_SIZES = [16, 24, 32, 48, 64]
+MAIN_FAVICON_SIZE = 64
+
+# Maskable icon: opaque, full-bleed, artwork inside the central 80% circle
+# that Android keeps under every mask shape
+MASKABLE_SIZE = 512
+MASKABLE_SAFE_ZONE = 0.8
+BACKGROUND_COLOR = '#0a141e'
+
+SPLASH_WIDTHS = [768, 1536]
+SPLASH_JPEG_QUALITY = 82
+SPLASH_WEBP_QUALITY = 80
+
+WHITE_THRESHOLD = 240
+BLACK_THRESHOLD = 50
+
+
+def remove_white_background(data: np.ndarray) -> np.ndarray:
+    """Make near-white pixels transparent"""
+    white = np.all(data[..., :3] > WHITE_THRESHOLD, axis=-1)
+    data[..., 3] = np.where(white, 0, 255)
+    return data
+
+
+def detect_circle_radius(data: np.ndarray) -> int:
+    """Distance from the centre to where the black circle starts on the centre row"""
+    height, width = data.shape[:2]
+    center_x, center_y = width // 2, height // 2
+    black = np.all(data[center_y, :, :3] < BLACK_THRESHOLD, axis=-1)
+    if not black.any():
+        return min(width, height) // 2 - 10
+    return abs(center_x - int(np.argmax(black)))
+
+
+def mask_outside_circle(data: np.ndarray, radius: int) -> np.ndarray:
+    height, width = data.shape[:2]
+    center_x, center_y = width // 2, height // 2
+    y, x = np.ogrid[:height, :width]
+    inside = (x - center_x) ** 2 + (y - center_y) ** 2 <= radius ** 2
+    data[..., 3] = np.where(inside, 255, 0)
+    return data
+
+
+def crop_pad_square(img: Image.Image) -> Image.Image:
+    """Crop to content, add 10% padding and centre on a transparent square"""
+    bbox = img.getbbox()
+    if bbox:
+        img = img.crop(bbox)
+    padding = min(img.width, img.height) // 10
+    size = max(img.width, img.height) + 2 * padding
+    square = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    square.paste(img, ((size - img.width) // 2, (size - img.height) // 2))
+    return square
+
+
+class DownsamplingPyramid:
+    """
+    Successive 2x LANCZOS reductions of one master image. Every target size is
+    resized from the smallest level that is still at least as large, so no
+    output pays for a full-resolution resample.
+    Levels are kept premultiplied ('RGBa') so transparent pixels don't bleed colour.
+    """
+
+    def __init__(self, master: Image.Image, min_size: int):
+        self.levels: List[Image.Image] = [master.convert('RGBa')]
+        while min(self.levels[-1].size) // 2 >= min_size:
+            level = self.levels[-1]
+            self.levels.append(level.resize((level.width // 2, level.height // 2), Image.Resampling.LANCZOS))
+
+    def get(self, width: int, height: int) -> Image.Image:
+        source = self.levels[0]
+        for level in self.levels:
+            if level.width >= width and level.height >= height:
+                source = level
+        if source.size != (width, height):
+            source = source.resize((width, height), Image.Resampling.LANCZOS)
+        return source.convert('RGBA')
+
+
+def artwork_radius(img: Image.Image) -> float:
+    """Distance from the centre to the farthest visible pixel"""
+    alpha = np.asarray(img.getchannel('A'))
+    ys, xs = np.nonzero(alpha)
+    if len(xs) == 0:
+        return img.width / 2
+    dx = xs + 0.5 - img.width / 2
+    dy = ys + 0.5 - img.height / 2
+    return float(np.sqrt(dx * dx + dy * dy).max())
+
+
+def png_bytes(img: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def write_optimized_png(img: Image.Image, path: Path) -> int:
+    """Save with zlib optimization, then let pngquant shrink it when available"""
+    path.write_bytes(png_bytes(img))
+    if shutil.which('pngquant'):
+        temp_path = path.with_suffix('.tmp.png')
+        result = subprocess.run(['pngquant', '--quality=90-100', '--speed=1', '--force',
+                                 '--output', str(temp_path), str(path)], capture_output=True)
+        if result.returncode == 0 and temp_path.exists():
+            if temp_path.stat().st_size < path.stat().st_size:
+                shutil.move(temp_path, path)
+            else:
+                temp_path.unlink()
+    return path.stat().st_size
+
+
+class IconGenerator:
+    def __init__(self, project_root: Path, source: Path, mode: str, splash_source: Path):
+        self.project_root = Path(project_root)
+        self.public_dir = self.project_root / 'public'
+        self.splash_dir = self.public_dir / 'splash'
+        self.source = Path(source)
+        self.mode = mode
+        self.splash_source = Path(splash_source)
+        self.outputs: Dict[str, int] = {}
+
+    def build_master(self) -> Image.Image:
+        with Image.open(self.source) as img:
+            data = np.array(img.convert('RGBA'))
+        height, width = data.shape[:2]
+
+        if self.mode == 'circle':
+            radius = detect_circle_radius(data)
+            print(f"Detected circle radius: {radius}")
+            master = Image.fromarray(mask_outside_circle(data, radius), 'RGBA')
+            return crop_pad_square(master) if master.width != master.height else master
+
+        master = crop_pad_square(Image.fromarray(remove_white_background(data), 'RGBA'))
+        print(f"Cropped {width}x{height} to content and squared to {master.width}x{master.height}")
+        return master
+
+    def record(self, path: Path, size: int):
+        rel = path.relative_to(self.public_dir).as_posix()
+        self.outputs[rel] = size
+        print(f"Created {rel} ({size:,} bytes)")
+
+    def write_icons(self, master: Image.Image):
+        pyramid = DownsamplingPyramid(master, min(ICO_SIZES))
+        print(f"Pyramid levels: {', '.join(f'{l.width}' for l in pyramid.levels)}")
+
+        for size in PNG_SIZES:
+            path = self.public_dir / f'favicon-{size}x{size}.png'
+            self.record(path, write_optimized_png(pyramid.get(size, size), path))
+
+        path = self.public_dir / 'favicon.png'
+        self.record(path, write_optimized_png(pyramid.get(MAIN_FAVICON_SIZE, MAIN_FAVICON_SIZE), path))
+
+        path = self.public_dir / 'favicon-transparent.png'
+        self.record(path, write_optimized_png(master, path))
+
+        path = self.public_dir / f'maskable-{MASKABLE_SIZE}x{MASKABLE_SIZE}.png'
+        self.record(path, write_optimized_png(self.build_maskable(master, pyramid), path))
+
+        # Every ICO frame comes from the pyramid instead of Pillow's own resize
+        frames = [pyramid.get(size, size) for size in ICO_SIZES]
+        path = self.public_dir / 'favicon.ico'
+        frames[-1].save(path, format='ICO', sizes=[(s, s) for s in ICO_SIZES], append_images=frames[:-1])
+        self.record(path, path.stat().st_size)
+
+    def build_maskable(self, master: Image.Image, pyramid: DownsamplingPyramid) -> Image.Image:
+        """Artwork scaled into the safe zone over an opaque background"""
+        # Two pixels of margin for LANCZOS ringing past the artwork edge
+        safe_radius = MASKABLE_SIZE * MASKABLE_SAFE_ZONE / 2 - 2
+        size = min(MASKABLE_SIZE, int(master.width * safe_radius / artwork_radius(master)))
+        icon = Image.new('RGBA', (MASKABLE_SIZE, MASKABLE_SIZE), BACKGROUND_COLOR)
+        artwork = pyramid.get(size, size)
+        offset = (MASKABLE_SIZE - size) // 2
+        icon.alpha_composite(artwork, (offset, offset))
+        return icon.convert('RGB')
+
+    def write_splash(self) -> List[dict]:
+        """Resized background.png variants for the loading screen"""
+        if not self.splash_source.exists():
+            print(f"Splash source not found, skipping: {self.splash_source}")
+            return []
+
+        self.splash_dir.mkdir(parents=True, exist_ok=True)
+        with Image.open(self.splash_source) as img:
+            splash = img.convert('RGB')
+
+        pyramid = DownsamplingPyramid(splash.convert('RGBA'), min(SPLASH_WIDTHS) // 2)
+        variants = []
+        has_webp = features.check('webp')
+        for width in SPLASH_WIDTHS:
+            if width > splash.width:
+                continue
+            height = round(splash.height * width / splash.width)
+            variant = pyramid.get(width, height).convert('RGB')
+            stem = f"{self.splash_source.stem}-{width}"
+
+            path = self.splash_dir / f"{stem}.jpg"
+            variant.save(path, 'JPEG', quality=SPLASH_JPEG_QUALITY, optimize=True, progressive=True)
+            self.record(path, path.stat().st_size)
+            variants.append({'width': width, 'type': 'image/jpeg', 'file': path.name})
+
+            if has_webp:
+                path = self.splash_dir / f"{stem}.webp"
+                variant.save(path, 'WEBP', quality=SPLASH_WEBP_QUALITY, method=6)
+                self.record(path, path.stat().st_size)
+                variants.append({'width': width, 'type': 'image/webp', 'file': path.name})
+        return variants
+
+    def write_manifest(self):
+        manifest = {
+            'name': 'Terror in the Jungle',
+            'short_name': 'Jungle',
+            'start_url': '.',
+            'display': 'fullscreen',
+            'orientation': 'landscape',
+            'background_color': BACKGROUND_COLOR,
+            'theme_color': '#5a8fb5',
+            'icons': [
+                {'src': f'favicon-{size}x{size}.png', 'sizes': f'{size}x{size}', 'type': 'image/png'}
+                for size in PNG_SIZES if size >= 128
+            ] + [
+                {'src': f'maskable-{MASKABLE_SIZE}x{MASKABLE_SIZE}.png', 'sizes': f'{MASKABLE_SIZE}x{MASKABLE_SIZE}',
+                 'type': 'image/png', 'purpose': 'maskable'}
+            ]
+        }
+        path = self.public_dir / 'site.webmanifest'
+        path.write_text(json.dumps(manifest, indent=2) + '\n')
+        self.record(path, path.stat().st_size)
+
+    def run(self):
+        print(f"Source: {self.source} (mode: {self.mode})")
+        master = self.build_master()
+        self.write_icons(master)
+        self.write_splash()
+        self.write_manifest()
+
+        total = sum(self.outputs.values())
+        print(f"\nIcon and splash generation complete: {len(self.outputs)} files, {total / 1024:.1f} KB")
+        print("\nTo use in HTML:")
+        print('<link rel="icon" type="image/x-icon" href="/favicon.ico">')
+        print('<link rel="icon" type="image/png" sizes="64x64" href="/favicon-64x64.png">')
+        print('<link rel="apple-touch-icon" sizes="180x180" href="/favicon-180x180.png">')
+        print('<link rel="manifest" href="/site.webmanifest">')
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+    assets_dir = project_root / 'public' / 'assets'
+
+    parser = argparse.ArgumentParser(description='Generate favicons, splash variants and the web app manifest')
+    parser.add_argument('source', nargs='?', default=str(assets_dir / 'favicon1.png'), help='Icon source image')
+    parser.add_argument('--mode', choices=['white', 'circle'], default='white',
+                        help="'white' removes a white background (favicon1.png), "
+                             "'circle' keeps the inside of a black circle (favicon.png)")
+    parser.add_argument('--splash', default=str(assets_dir / 'background.png'), help='Splash source image')
+    args = parser.parse_args()
+
+    if not Path(args.source).exists():
+        print(f"Error: File not found: {args.source}")
+        sys.exit(1)
+
+    IconGenerator(project_root, Path(args.source), args.mode, Path(args.splash)).run()
+
+
+if __name__ == "__main__":
+    main()
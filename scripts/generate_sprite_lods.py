@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Alpha-Coverage-Preserving Sprite LOD Generator for Terror in the Jungle
+- Builds a LOD chain for every billboard sprite (foliage and soldiers) by
+  successive 2x premultiplied LANCZOS reductions of the runtime texture
+- Remaps each level's alpha so the fraction of texels passing the 0.5
+  alpha test matches LOD0; plain downsampling shrinks coverage and makes
+  distant palms and soldiers thin out and vanish
+- Writes public/lods/<sprite>_lod<N>.png and public/lods/lods.json with the
+  screen-height and distance thresholds at which each LOD is sufficient
+"""
+
+import sys
+import json
+import math
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image
+    HAS_PIL = True
+
+from benchmark_asset_budgets import categorize_asset, texture_vram_bytes
+from generate_icons import DownsamplingPyramid
+from palettize_textures import ALPHA_CUTOFF, DEFAULT_CATEGORIES, load_runtime_rgba
+from pipeline_journal import write_text_atomic
+
+LOD_VERSION = 1
+
+# Smallest LOD edge; below this a billboard is a handful of pixels anyway
+DEFAULT_MIN_SIZE = 32
+
+# SandboxRenderer camera and a 1080p reference viewport (PixelationPass pixelSize 1)
+CAMERA_FOV_DEGREES = 75
+REFERENCE_VIEWPORT_HEIGHT = 1080
+
+# Billboard heights in world units (GPUBillboardSystem configs, CombatantRenderer quads)
+WORLD_HEIGHTS = {
+    'fern': 2.0,
+    'elephantearplants': 3.0,
+    'fanpalmcluster': 4.0,
+    'arecapalmcluster': 6.0,
+    'coconutpalm': 7.0,
+    'twisterbanyan': 18.0,
+    'dipterocarpgiant': 20.0
+}
+SOLDIER_HEIGHT = 7.0
+
+# Lowest alpha that may be promoted to the cutoff, so nearly empty levels don't turn noise into solid texels
+MIN_ALPHA_THRESHOLD = 16
+
+
+def world_height(name: str) -> Optional[float]:
+    lower = name.lower()
+    if 'soldier' in lower or 'solider' in lower:
+        return SOLDIER_HEIGHT
+    return WORLD_HEIGHTS.get(lower)
+
+
+def alpha_coverage(alpha: np.ndarray, cutoff: int = ALPHA_CUTOFF) -> float:
+    """Fraction of texels that survive the alpha test"""
+    return float((alpha >= cutoff).mean()) if alpha.size else 0.0
+
+
+def coverage_threshold(alpha: np.ndarray, target: float) -> float:
+    """
+    Alpha value that `target` of the texels reach: the k-th largest alpha
+    (k = target * texels). Moving it onto the cutoff restores the coverage.
+    """
+    flat = alpha.reshape(-1)
+    k = min(int(round(target * flat.size)), flat.size)
+    if k <= 0:
+        return 255.0
+    kth = float(np.partition(flat, flat.size - k)[flat.size - k])
+    return min(255.0, max(float(MIN_ALPHA_THRESHOLD), kth))
+
+
+def remap_alpha(rgba: np.ndarray, threshold: float, cutoff: int = ALPHA_CUTOFF) -> np.ndarray:
+    """
+    Piecewise-linear alpha remap sending `threshold` to the cutoff. Unlike a
+    plain scale it keeps 0 and 255 fixed, so opaque texels stay opaque for
+    the blended billboard shaders.
+    """
+    alpha = rgba[..., 3].astype(np.float32)
+    if threshold >= 255.0:
+        remapped = np.where(alpha >= 255.0, 255.0, alpha * cutoff / 255.0)
+    else:
+        remapped = np.where(alpha < threshold,
+                            alpha * cutoff / threshold,
+                            cutoff + (alpha - threshold) * (255.0 - cutoff) / (255.0 - threshold))
+    result = rgba.copy()
+    result[..., 3] = np.clip(np.rint(remapped), 0, 255).astype(np.uint8)
+    return result
+
+
+def distance_for_screen_height(height: float, screen_px: float, fov_degrees: float, viewport: int) -> float:
+    """Camera distance at which a billboard `height` units tall covers `screen_px` pixels"""
+    return height * viewport / (2.0 * math.tan(math.radians(fov_degrees) / 2.0) * screen_px)
+
+
+class SpriteLodGenerator:
+    def __init__(self, project_root: Path, categories: List[str], min_size: int = DEFAULT_MIN_SIZE,
+                 viewport_height: int = REFERENCE_VIEWPORT_HEIGHT):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.output_dir = self.project_root / 'public' / 'lods'
+        self.categories = categories
+        self.min_size = min_size
+        self.viewport_height = viewport_height
+
+    def find_sprites(self) -> List[Path]:
+        return [path for path in sorted(self.assets_dir.glob('*.png'))
+                if categorize_asset(path.name) in self.categories]
+
+    def process_sprite(self, path: Path) -> dict:
+        base = load_runtime_rgba(path)
+        target = alpha_coverage(base[..., 3])
+        pyramid = DownsamplingPyramid(Image.fromarray(base, 'RGBA'), self.min_size)
+        height_m = world_height(path.stem)
+
+        levels = [{
+            'lod': 0,
+            'file': f"assets/{path.name}",
+            'width': int(base.shape[1]),
+            'height': int(base.shape[0]),
+            'vram_bytes': texture_vram_bytes(base.shape[1], base.shape[0], False),
+            'coverage_naive': round(target, 4),
+            'coverage': round(target, 4),
+            'alpha_threshold': float(ALPHA_CUTOFF)
+        }]
+
+        for lod, level in enumerate(pyramid.levels[1:], start=1):
+            naive = np.asarray(level.convert('RGBA'))
+            threshold = coverage_threshold(naive[..., 3], target)
+            adjusted = remap_alpha(naive, threshold)
+
+            filename = f"{path.stem}_lod{lod}.png"
+            Image.fromarray(adjusted, 'RGBA').save(self.output_dir / filename, 'PNG', optimize=True)
+            levels.append({
+                'lod': lod,
+                'file': f"lods/{filename}",
+                'width': int(adjusted.shape[1]),
+                'height': int(adjusted.shape[0]),
+                'vram_bytes': texture_vram_bytes(adjusted.shape[1], adjusted.shape[0], False),
+                'coverage_naive': round(alpha_coverage(naive[..., 3]), 4),
+                'coverage': round(alpha_coverage(adjusted[..., 3]), 4),
+                'alpha_threshold': round(threshold, 1)
+            })
+
+        # A LOD is sufficient while the sprite covers no more screen pixels than it has texel rows
+        for level in levels:
+            level['max_screen_px'] = level['height'] if level['lod'] else None
+            level['min_distance_m'] = (
+                round(distance_for_screen_height(height_m, level['height'], CAMERA_FOV_DEGREES,
+                                                 self.viewport_height), 1)
+                if height_m and level['lod'] else (0.0 if height_m else None))
+
+        return {
+            'category': categorize_asset(path.name),
+            'world_height': height_m,
+            'target_coverage': round(target, 4),
+            'levels': levels
+        }
+
+    def run(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - SPRITE LOD GENERATOR")
+        print("=" * 70)
+        print(f"\n Alpha test at {ALPHA_CUTOFF}/255, smallest LOD edge {self.min_size}px, "
+              f"{self.viewport_height}px viewport at {CAMERA_FOV_DEGREES} deg FOV")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        sprites: Dict[str, dict] = {}
+        for path in self.find_sprites():
+            sprite = self.process_sprite(path)
+            sprites[path.stem] = sprite
+            print(f"\n {path.stem} ({sprite['category']}, coverage {sprite['target_coverage']:.1%})")
+            print(f"   {'lod':>3}  {'size':>11}  {'naive':>7}  {'kept':>7}  {'alpha':>6}  {'<= px':>6}  {'>= m':>7}")
+            for level in sprite['levels']:
+                size = f"{level['width']}x{level['height']}"
+                px = level['max_screen_px'] if level['max_screen_px'] is not None else '-'
+                dist = level['min_distance_m'] if level['min_distance_m'] is not None else '-'
+                print(f"   {level['lod']:>3}  {size:>11}  {level['coverage_naive']:>7.2%}  "
+                      f"{level['coverage']:>7.2%}  {level['alpha_threshold']:>6.1f}  {px:>6}  {dist:>7}")
+
+        table = {
+            'version': LOD_VERSION,
+            'created': datetime.now().isoformat(),
+            'alpha_cutoff': ALPHA_CUTOFF,
+            'camera_fov': CAMERA_FOV_DEGREES,
+            'viewport_height': self.viewport_height,
+            'sprites': sprites
+        }
+        table_path = self.output_dir / 'lods.json'
+        write_text_atomic(table_path, json.dumps(table, indent=2))
+        print(f"\n LOD table saved to: {table_path}")
+        return table
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Generate alpha-coverage-preserving billboard LODs')
+    parser.add_argument('--categories', nargs='+', default=DEFAULT_CATEGORIES,
+                        help='Asset categories to process (default: foliage enemy)')
+    parser.add_argument('--min-size', type=int, default=DEFAULT_MIN_SIZE, help='Smallest LOD edge in pixels')
+    parser.add_argument('--viewport-height', type=int, default=REFERENCE_VIEWPORT_HEIGHT,
+                        help='Viewport height used for the distance thresholds')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    SpriteLodGenerator(project_root, args.categories, args.min_size, args.viewport_height).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Asset Pack Builder for Terror in the Jungle
+- Bundles runtime assets into one binary pack per category, so the client
+  can fetch a whole category in a single request (or slice it by HTTP Range)
+- Every entry starts on an aligned offset so the loader can hand out
+  zero-copy views of the downloaded ArrayBuffer
+- Includes an mmap-based reader/verifier for the format
+
+Pack layout (all integers little-endian):
+    0   4   magic 'TJPK'
+    4   2   format version
+    6   2   entry alignment in bytes
+    8   4   index length in bytes
+    12  4   data offset (first entry, aligned)
+    16  ..  UTF-8 JSON index: {"pack": name, "entries": [
+                {"name", "offset", "length", "mime", "sha256"}, ...]}
+    ..      zero padding, then entry payloads at their aligned offsets
+Offsets in the index are absolute from the start of the file.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+import mimetypes
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+from benchmark_asset_budgets import categorize_asset, discover_runtime_assets
+from pipeline_journal import write_text_atomic
+
+PACK_MAGIC = b'TJPK'
+PACK_VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+DEFAULT_ALIGNMENT = 64
+PACK_EXTENSION = '.pack'
+
+MIME_OVERRIDES = {
+    '.ogg': 'audio/ogg',
+    '.opus': 'audio/ogg',
+    '.wav': 'audio/wav',
+    '.webm': 'audio/webm',
+    '.webp': 'image/webp'
+}
+
+
+def guess_mime(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in MIME_OVERRIDES:
+        return MIME_OVERRIDES[suffix]
+    return mimetypes.guess_type(path.name)[0] or 'application/octet-stream'
+
+
+def align(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
+class PackFormatError(Exception):
+    pass
+
+
+class AssetPackWriter:
+    def __init__(self, name: str, alignment: int = DEFAULT_ALIGNMENT):
+        if alignment <= 0 or alignment & (alignment - 1):
+            raise ValueError(f"alignment must be a power of two, got {alignment}")
+        self.name = name
+        self.alignment = alignment
+        self.entries: List[dict] = []
+
+    def add(self, name: str, data: bytes, mime: str):
+        self.entries.append({
+            'name': name,
+            'data': data,
+            'mime': mime,
+            'sha256': hashlib.sha256(data).hexdigest()
+        })
+
+    def layout(self) -> bytes:
+        """Assign aligned offsets and return the encoded index"""
+        # Offsets depend on the index length and vice versa; iterate to a fixed point
+        data_offset = align(HEADER.size, self.alignment)
+        while True:
+            offset = data_offset
+            index_entries = []
+            for entry in self.entries:
+                index_entries.append({
+                    'name': entry['name'],
+                    'offset': offset,
+                    'length': len(entry['data']),
+                    'mime': entry['mime'],
+                    'sha256': entry['sha256']
+                })
+                offset = align(offset + len(entry['data']), self.alignment)
+            index = json.dumps({'pack': self.name, 'entries': index_entries},
+                               separators=(',', ':')).encode('utf-8')
+            needed = align(HEADER.size + len(index), self.alignment)
+            if needed == data_offset:
+                self.data_offset = data_offset
+                self.index_entries = index_entries
+                return index
+            data_offset = needed
+
+    def write(self, output_path: Path) -> dict:
+        """Write the pack to a temp file and rename it into place"""
+        index = self.layout()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f'.{output_path.name}.', suffix='.tmp')
+        digest = hashlib.sha256()
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                def emit(chunk: bytes):
+                    f.write(chunk)
+                    digest.update(chunk)
+
+                emit(HEADER.pack(PACK_MAGIC, PACK_VERSION, self.alignment, len(index), self.data_offset))
+                emit(index)
+                emit(b'\0' * (self.data_offset - HEADER.size - len(index)))
+                position = self.data_offset
+                for entry, indexed in zip(self.entries, self.index_entries):
+                    emit(b'\0' * (indexed['offset'] - position))
+                    emit(entry['data'])
+                    position = indexed['offset'] + indexed['length']
+                emit(b'\0' * (align(position, self.alignment) - position))
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_name, 0o644)
+            os.replace(tmp_name, output_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        return {
+            'name': self.name,
+            'file': output_path.name,
+            'bytes': output_path.stat().st_size,
+            'payload_bytes': sum(e['length'] for e in self.index_entries),
+            'entries': len(self.index_entries),
+            'index_bytes': len(index),
+            'data_offset': self.data_offset,
+            'alignment': self.alignment,
+            'sha256': digest.hexdigest()
+        }
+
+
+class AssetPackReader:
+    """Memory-mapped, read-only view of a pack file"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PackFormatError(f"{self.path.name}: empty file")
+        self.view = memoryview(self._map)
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise PackFormatError(f"{self.path.name}: truncated header")
+        magic, version, alignment, index_length, data_offset = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise PackFormatError(f"{self.path.name}: bad magic {magic!r}")
+        if version != PACK_VERSION:
+            self.close()
+            raise PackFormatError(f"{self.path.name}: unsupported version {version}")
+
+        self.version = version
+        self.alignment = alignment
+        self.data_offset = data_offset
+        try:
+            index = json.loads(bytes(self.view[HEADER.size:HEADER.size + index_length]).decode('utf-8'))
+        except ValueError as e:
+            self.close()
+            raise PackFormatError(f"{self.path.name}: unreadable index ({e})")
+        self.name = index.get('pack')
+        self.entries: Dict[str, dict] = {entry['name']: entry for entry in index['entries']}
+
+    def get(self, name: str) -> memoryview:
+        """Zero-copy view of one entry's bytes"""
+        entry = self.entries[name]
+        return self.view[entry['offset']:entry['offset'] + entry['length']]
+
+    def verify(self) -> List[str]:
+        """Check bounds, alignment, overlap and hashes; returns a list of problems"""
+        problems = []
+        size = len(self._map)
+        if self.data_offset % self.alignment:
+            problems.append(f"data offset {self.data_offset} is not {self.alignment}-byte aligned")
+
+        previous_end = self.data_offset
+        for entry in sorted(self.entries.values(), key=lambda e: e['offset']):
+            name, offset, length = entry['name'], entry['offset'], entry['length']
+            if offset % self.alignment:
+                problems.append(f"{name}: offset {offset} is not {self.alignment}-byte aligned")
+            if offset < previous_end:
+                problems.append(f"{name}: overlaps the previous entry")
+            if offset + length > size:
+                problems.append(f"{name}: extends past end of file ({offset + length} > {size})")
+                continue
+            if hashlib.sha256(self.get(name)).hexdigest() != entry['sha256']:
+                problems.append(f"{name}: sha256 mismatch")
+            previous_end = offset + length
+        return problems
+
+    def close(self):
+        if getattr(self, 'view', None) is not None:
+            self.view.release()
+            self.view = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AssetPackBuilder:
+    def __init__(self, project_root: Path, source_dir: Path, pack_dir: Path,
+                 alignment: int = DEFAULT_ALIGNMENT):
+        self.project_root = Path(project_root)
+        self.source_dir = Path(source_dir)
+        self.pack_dir = Path(pack_dir)
+        self.alignment = alignment
+
+    def group_assets(self) -> Dict[str, List[Path]]:
+        groups: Dict[str, List[Path]] = {}
+        for path in discover_runtime_assets(self.source_dir):
+            groups.setdefault(categorize_asset(path.name), []).append(path)
+        return groups
+
+    def build(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - ASSET PACK BUILDER")
+        print("=" * 70)
+        print(f"\n Source: {self.source_dir}")
+        print(f" Output: {self.pack_dir}")
+
+        packs = []
+        for category, paths in sorted(self.group_assets().items()):
+            writer = AssetPackWriter(category, self.alignment)
+            for path in paths:
+                name = path.relative_to(self.source_dir).as_posix()
+                writer.add(name, path.read_bytes(), guess_mime(path))
+            info = writer.write(self.pack_dir / f"{category}{PACK_EXTENSION}")
+            info['assets'] = [e['name'] for e in writer.index_entries]
+            packs.append(info)
+            overhead = info['bytes'] - info['payload_bytes']
+            print(f"   {info['file']:<20} {info['entries']:3d} entries  "
+                  f"{info['bytes'] / (1024 * 1024):7.2f} MB  (+{overhead:,} bytes header/padding)")
+
+        manifest = {
+            'version': PACK_VERSION,
+            'created': datetime.now().isoformat(),
+            'alignment': self.alignment,
+            'packs': packs
+        }
+        manifest_path = self.pack_dir / 'packs.json'
+        write_text_atomic(manifest_path, json.dumps(manifest, indent=2))
+        print(f"\n Pack manifest saved to: {manifest_path}")
+        return manifest
+
+
+def verify_packs(paths: List[Path]) -> bool:
+    ok = True
+    for path in paths:
+        try:
+            with AssetPackReader(path) as reader:
+                problems = reader.verify()
+                status = 'OK' if not problems else 'FAILED'
+                print(f"   {path.name:<20} {len(reader.entries):3d} entries  {status}")
+                for problem in problems:
+                    print(f"     - {problem}")
+                ok = ok and not problems
+        except (OSError, PackFormatError) as e:
+            print(f"   {path.name:<20} FAILED: {e}")
+            ok = False
+    return ok
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Build and verify category asset packs')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Write one pack per asset category')
+    build.add_argument('--source', default=str(project_root / 'public' / 'assets'),
+                       help='Directory to pack (e.g. public/assets_optimized_resized)')
+    build.add_argument('--output', default=str(project_root / 'public' / 'packs'), help='Pack directory')
+    build.add_argument('--alignment', type=int, default=DEFAULT_ALIGNMENT, help='Entry alignment in bytes')
+
+    verify = sub.add_parser('verify', help='Verify packs with the mmap reader')
+    verify.add_argument('packs', nargs='*', help='Pack files (default: every pack in public/packs)')
+
+    listing = sub.add_parser('list', help='List the entries of a pack')
+    listing.add_argument('pack', help='Pack file')
+
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        builder = AssetPackBuilder(project_root, Path(args.source), Path(args.output), args.alignment)
+        builder.build()
+        ok = verify_packs(sorted(Path(args.output).glob(f'*{PACK_EXTENSION}')))
+        sys.exit(0 if ok else 1)
+    elif args.command == 'verify':
+        paths = [Path(p) for p in args.packs] or sorted((project_root / 'public' / 'packs').glob(f'*{PACK_EXTENSION}'))
+        if not paths:
+            print(" No packs found")
+            sys.exit(1)
+        sys.exit(0 if verify_packs(paths) else 1)
+    else:
+        with AssetPackReader(Path(args.pack)) as reader:
+            print(f"\n {reader.path.name}: pack '{reader.name}', v{reader.version}, "
+                  f"alignment {reader.alignment}, data at {reader.data_offset}")
+            for entry in sorted(reader.entries.values(), key=lambda e: e['offset']):
+                print(f"   {entry['offset']:>10}  {entry['length']:>10}  {entry['mime']:<12} {entry['name']}")
+
+
+if __name__ == "__main__":
+    main()
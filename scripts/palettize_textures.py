@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Palette-Indexed Texture Export for Terror in the Jungle
+- Builds one shared 256-entry palette per category (foliage, enemy) from the
+  pixels of every sprite in it: median-cut seeding, refined with k-means
+- Writes an 8-bit index map per sprite at its runtime resolution plus a
+  256x1 palette texture per category; index 0 is reserved for transparent
+- Reports the colour error per sprite and per category, and the GPU memory
+  saved versus RGBA8 (roughly 4x for billboards)
+- Outputs go to public/indexed/ with a palettes.json manifest
+"""
+
+import sys
+import json
+import time
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image
+    HAS_PIL = True
+
+from benchmark_asset_budgets import categorize_asset, clamp_dimensions
+from pipeline_journal import write_text_atomic
+
+Image.MAX_IMAGE_PIXELS = None
+
+PALETTE_VERSION = 1
+PALETTE_SIZE = 256
+TRANSPARENT_INDEX = 0
+
+# Billboard shaders discard below alpha 0.5
+ALPHA_CUTOFF = 128
+
+DEFAULT_CATEGORIES = ['foliage', 'enemy']
+
+# Nearest-colour lookups go through a 6-bit-per-channel table (262k entries)
+LUT_BITS = 6
+
+DISTANCE_CHUNK = 65536
+
+
+def load_runtime_rgba(path: Path) -> np.ndarray:
+    """Decode a sprite and shrink it to the size AssetLoader uploads"""
+    with Image.open(path) as img:
+        rgba = img.convert('RGBA')
+    width, height = clamp_dimensions(path.name, rgba.width, rgba.height)
+    if (width, height) != rgba.size:
+        premultiplied = rgba.convert('RGBa')
+        factor = max(1, min(rgba.width // width, rgba.height // height))
+        if factor > 1:
+            premultiplied = premultiplied.reduce(factor)
+        rgba = premultiplied.resize((width, height), Image.Resampling.LANCZOS).convert('RGBA')
+    return np.asarray(rgba)
+
+
+def nearest_color(pixels: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    """Index of the closest center for every pixel (squared RGB distance)"""
+    pixels = pixels.astype(np.float32)
+    centers = centers.astype(np.float32)
+    center_norms = (centers ** 2).sum(axis=1)
+    result = np.empty(len(pixels), dtype=np.int32)
+    for start in range(0, len(pixels), DISTANCE_CHUNK):
+        chunk = pixels[start:start + DISTANCE_CHUNK]
+        # |p - c|^2 minus the per-pixel |p|^2 term, which doesn't change the argmin
+        distances = center_norms[None, :] - 2.0 * chunk @ centers.T
+        result[start:start + DISTANCE_CHUNK] = np.argmin(distances, axis=1)
+    return result
+
+
+def median_cut(pixels: np.ndarray, n_colors: int) -> np.ndarray:
+    """Split the box with the largest range x population until n_colors boxes remain"""
+    boxes = [pixels]
+    scores = [float(np.ptp(pixels, axis=0).max()) * len(pixels)]
+    while len(boxes) < n_colors:
+        i = int(np.argmax(scores))
+        if scores[i] <= 0:
+            break
+        box = boxes.pop(i)
+        scores.pop(i)
+        channel = int(np.argmax(np.ptp(box, axis=0)))
+        order = np.argsort(box[:, channel], kind='stable')
+        mid = len(box) // 2
+        for half in (box[order[:mid]], box[order[mid:]]):
+            boxes.append(half)
+            scores.append(float(np.ptp(half, axis=0).max()) * len(half) if len(half) > 1 else 0.0)
+    return np.array([box.mean(axis=0) for box in boxes], dtype=np.float32)
+
+
+def kmeans_refine(pixels: np.ndarray, centers: np.ndarray, iterations: int) -> np.ndarray:
+    """Lloyd iterations starting from the median-cut palette"""
+    data = pixels.astype(np.float64)
+    centers = centers.astype(np.float64)
+    for _ in range(iterations):
+        labels = nearest_color(data, centers)
+        counts = np.bincount(labels, minlength=len(centers))
+        sums = np.stack([np.bincount(labels, weights=data[:, c], minlength=len(centers)) for c in range(3)], axis=1)
+        updated = centers.copy()
+        used = counts > 0
+        updated[used] = sums[used] / counts[used, None]
+        shift = np.abs(updated - centers).max()
+        centers = updated
+        if shift < 0.5:
+            break
+    return centers
+
+
+def build_lut(palette: np.ndarray, bits: int = LUT_BITS) -> np.ndarray:
+    """Nearest palette entry for every quantized RGB cell"""
+    levels = 1 << bits
+    step = 256 // levels
+    axis = np.arange(levels, dtype=np.float32) * step + (step - 1) / 2.0
+    grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1).reshape(-1, 3)
+    return nearest_color(grid, palette).astype(np.uint8)
+
+
+def lut_keys(rgb: np.ndarray, bits: int = LUT_BITS) -> np.ndarray:
+    shift = 8 - bits
+    r, g, b = (rgb[..., c].astype(np.int32) >> shift for c in range(3))
+    return (r << (2 * bits)) | (g << bits) | b
+
+
+def color_error(original: np.ndarray, quantized: np.ndarray) -> dict:
+    """Error statistics over opaque pixels, in 0-255 units"""
+    if len(original) == 0:
+        return {'pixels': 0, 'mean_abs': 0.0, 'rmse': 0.0, 'psnr_db': None, 'max': 0}
+    diff = original.astype(np.int32) - quantized.astype(np.int32)
+    mse = float((diff ** 2).mean())
+    return {
+        'pixels': int(len(original)),
+        'mean_abs': round(float(np.abs(diff).mean()), 3),
+        'rmse': round(mse ** 0.5, 3),
+        'psnr_db': round(10 * np.log10(255 ** 2 / mse), 2) if mse > 0 else None,
+        'max': int(np.abs(diff).max())
+    }
+
+
+class TexturePalettizer:
+    def __init__(self, project_root: Path, categories: List[str], colors: int = PALETTE_SIZE - 1,
+                 samples: int = 100000, iterations: int = 8, seed: int = 1):
+        self.project_root = Path(project_root)
+        self.assets_dir = self.project_root / 'public' / 'assets'
+        self.output_dir = self.project_root / 'public' / 'indexed'
+        self.categories = categories
+        self.colors = min(colors, PALETTE_SIZE - 1)
+        self.samples = samples
+        self.iterations = iterations
+        self.rng = np.random.default_rng(seed)
+
+    def group_sprites(self) -> Dict[str, List[Path]]:
+        groups: Dict[str, List[Path]] = {}
+        for path in sorted(self.assets_dir.glob('*.png')):
+            category = categorize_asset(path.name)
+            if category in self.categories:
+                groups.setdefault(category, []).append(path)
+        return groups
+
+    def sample_opaque(self, rgba: np.ndarray) -> np.ndarray:
+        opaque = rgba[rgba[..., 3] >= ALPHA_CUTOFF][:, :3]
+        if len(opaque) > self.samples:
+            opaque = opaque[self.rng.choice(len(opaque), self.samples, replace=False)]
+        return opaque
+
+    def build_palette(self, samples: np.ndarray) -> np.ndarray:
+        centers = median_cut(samples, self.colors)
+        centers = kmeans_refine(samples, centers, self.iterations)
+        return np.clip(np.rint(centers), 0, 255).astype(np.uint8)
+
+    def palette_image(self, palette: np.ndarray) -> Image.Image:
+        entries = np.zeros((PALETTE_SIZE, 4), dtype=np.uint8)
+        entries[TRANSPARENT_INDEX + 1:TRANSPARENT_INDEX + 1 + len(palette), :3] = palette
+        entries[TRANSPARENT_INDEX + 1:TRANSPARENT_INDEX + 1 + len(palette), 3] = 255
+        return Image.fromarray(entries.reshape(1, PALETTE_SIZE, 4), 'RGBA')
+
+    def index_sprite(self, rgba: np.ndarray, palette: np.ndarray, lut: np.ndarray) -> Tuple[np.ndarray, dict]:
+        opaque = rgba[..., 3] >= ALPHA_CUTOFF
+        indices = (lut[lut_keys(rgba[..., :3])] + TRANSPARENT_INDEX + 1).astype(np.uint8)
+        indices[~opaque] = TRANSPARENT_INDEX
+
+        original = rgba[..., :3][opaque]
+        quantized = palette[indices[opaque] - (TRANSPARENT_INDEX + 1)]
+        error = color_error(original, quantized)
+        # Alpha collapses to the cutoff; soft edges become hard
+        error['soft_alpha_pixels'] = int(((rgba[..., 3] > 0) & (rgba[..., 3] < 255)).sum())
+        return indices, error
+
+    def process_category(self, category: str, paths: List[Path]) -> dict:
+        print(f"\n [{category}] {len(paths)} sprites")
+        start = time.perf_counter()
+        sprites = {path.stem: load_runtime_rgba(path) for path in paths}
+        samples = np.concatenate([self.sample_opaque(rgba) for rgba in sprites.values()])
+        print(f"   Decoded in {time.perf_counter() - start:.1f}s, {len(samples):,} palette samples")
+
+        start = time.perf_counter()
+        palette = self.build_palette(samples)
+        lut = build_lut(palette)
+        print(f"   Palette: {len(palette)} colours + transparent in {time.perf_counter() - start:.1f}s")
+
+        palette_file = f"{category}_palette.png"
+        self.palette_image(palette).save(self.output_dir / palette_file, 'PNG', optimize=True)
+
+        entries = {}
+        total_rgba = total_indexed = 0
+        weighted_sq = weighted_abs = 0.0
+        total_pixels = 0
+        for name, rgba in sprites.items():
+            indices, error = self.index_sprite(rgba, palette, lut)
+            height, width = indices.shape
+            index_file = f"{name}.png"
+            Image.fromarray(indices, 'L').save(self.output_dir / index_file, 'PNG', optimize=True)
+
+            rgba_bytes = width * height * 4
+            indexed_bytes = width * height
+            total_rgba += rgba_bytes
+            total_indexed += indexed_bytes
+            total_pixels += error['pixels']
+            weighted_sq += error['rmse'] ** 2 * error['pixels']
+            weighted_abs += error['mean_abs'] * error['pixels']
+
+            entries[name] = {
+                'file': index_file,
+                'width': width,
+                'height': height,
+                'rgba_bytes': rgba_bytes,
+                'indexed_bytes': indexed_bytes,
+                'file_bytes': (self.output_dir / index_file).stat().st_size,
+                'error': error
+            }
+            psnr = f"{error['psnr_db']:.1f} dB" if error['psnr_db'] is not None else 'lossless'
+            print(f"   {name:<24} {width:>5}x{height:<5} mean {error['mean_abs']:5.2f}  "
+                  f"max {error['max']:3d}  {psnr}")
+
+        palette_bytes = PALETTE_SIZE * 4
+        rmse = (weighted_sq / total_pixels) ** 0.5 if total_pixels else 0.0
+        summary = {
+            'palette': palette_file,
+            'colors': int(len(palette)),
+            'transparent_index': TRANSPARENT_INDEX,
+            'alpha_cutoff': ALPHA_CUTOFF,
+            'rgba_bytes': total_rgba,
+            'indexed_bytes': total_indexed + palette_bytes,
+            'memory_ratio': round(total_rgba / (total_indexed + palette_bytes), 2),
+            'error': {
+                'mean_abs': round(weighted_abs / total_pixels, 3) if total_pixels else 0.0,
+                'rmse': round(rmse, 3),
+                'psnr_db': round(10 * np.log10(255 ** 2 / rmse ** 2), 2) if rmse > 0 else None
+            },
+            'sprites': entries
+        }
+        print(f"   GPU memory: {total_rgba / (1024 * 1024):.1f} MB RGBA8 -> "
+              f"{(total_indexed + palette_bytes) / (1024 * 1024):.1f} MB indexed "
+              f"({summary['memory_ratio']}x), category RMSE {summary['error']['rmse']}")
+        return summary
+
+    def run(self) -> dict:
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - PALETTE-INDEXED TEXTURE EXPORT")
+        print("=" * 70)
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        groups = self.group_sprites()
+        manifest = {
+            'version': PALETTE_VERSION,
+            'created': datetime.now().isoformat(),
+            'palette_size': PALETTE_SIZE,
+            'categories': {}
+        }
+        for category in self.categories:
+            if category not in groups:
+                print(f"\n [{category}] no sprites found, skipping")
+                continue
+            manifest['categories'][category] = self.process_category(category, groups[category])
+
+        manifest_path = self.output_dir / 'palettes.json'
+        write_text_atomic(manifest_path, json.dumps(manifest, indent=2))
+        print(f"\n Palette manifest saved to: {manifest_path}")
+        return manifest
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Export palette-indexed sprite textures per category')
+    parser.add_argument('--categories', nargs='+', default=DEFAULT_CATEGORIES,
+                        help='Asset categories to palettize (default: foliage enemy)')
+    parser.add_argument('--colors', type=int, default=PALETTE_SIZE - 1,
+                        help='Opaque palette entries per category (max 255)')
+    parser.add_argument('--samples', type=int, default=100000,
+                        help='Opaque pixels sampled per sprite for the palette')
+    parser.add_argument('--iterations', type=int, default=8, help='k-means refinement iterations')
+    parser.add_argument('--seed', type=int, default=1, help='Sampling seed')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    palettizer = TexturePalettizer(project_root, args.categories, args.colors,
+                                   args.samples, args.iterations, args.seed)
+    palettizer.run()
+
+
+if __name__ == "__main__":
+    main()
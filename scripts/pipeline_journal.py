@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Resumable Pipeline Runs for Terror in the Jungle
+- Write-ahead journal (JSON lines, fsynced) of every finished work unit,
+  so a crashed or interrupted run resumes where it stopped
+- Outputs are built in a staging directory next to the project and only
+  published, file by file with atomic renames, once every unit is done
+- A run is committed after publishing; the caller swaps its manifest or
+  report in between, so a reader never sees a half-written output set
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+JOURNAL_VERSION = 1
+
+
+def file_sha1(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def write_text_atomic(path: Path, text: str):
+    """Write next to the target, fsync and rename into place"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+class RunJournal:
+    """
+    One pipeline's journal and staging area under <root>/.pipeline/<name>/.
+    Units are keyed by name; a unit counts as done on resume only if its
+    source is unchanged and its staged (or already published) outputs still
+    match the hashes recorded when it finished.
+    """
+
+    def __init__(self, root: Path, name: str, config: dict, resume: bool = True):
+        self.root = Path(root).resolve()
+        self.dir = self.root / '.pipeline' / name
+        self.path = self.dir / 'journal.jsonl'
+        self.config_hash = hashlib.sha1(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+        self.units: Dict[str, dict] = {}
+        self.state: Dict[str, object] = {}
+        self.published = False
+        self.resumed = False
+
+        begin = self.load() if resume else None
+        if begin:
+            self.run_id = begin['run_id']
+            self.resumed = True
+        else:
+            self.start_fresh()
+        self.staging = self.dir / 'staging' / self.run_id
+
+    # ------------------------------------------------------------------
+    # Journal file
+    # ------------------------------------------------------------------
+
+    def load(self) -> Optional[dict]:
+        """Replay the journal; returns its begin record if the run can be resumed"""
+        if not self.path.exists():
+            return None
+
+        records = []
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # Torn final write from a crash: everything before it is intact
+                    break
+
+        if not records or records[0].get('event') != 'begin' or records[0].get('version') != JOURNAL_VERSION:
+            return None
+        begin = records[0]
+        if any(r.get('event') == 'commit' for r in records):
+            return None
+        if begin.get('config') != self.config_hash:
+            print(f" Settings changed since the interrupted run {begin['run_id']}; starting over")
+            return None
+
+        for record in records[1:]:
+            event = record.get('event')
+            if event == 'done':
+                self.units[record['unit']] = record
+            elif event == 'state':
+                self.state.update(record['values'])
+            elif event == 'published':
+                self.published = True
+        return begin
+
+    def start_fresh(self):
+        shutil.rmtree(self.dir / 'staging', ignore_errors=True)
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        begin = {
+            'event': 'begin',
+            'version': JOURNAL_VERSION,
+            'run_id': self.run_id,
+            'config': self.config_hash,
+            'started': datetime.now().isoformat()
+        }
+        write_text_atomic(self.path, json.dumps(begin) + '\n')
+
+    def append(self, record: dict):
+        record['time'] = datetime.now().isoformat()
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def set_state(self, **values):
+        """Run-level facts a resumed run must reuse (e.g. the backup directory)"""
+        self.state.update(values)
+        self.append({'event': 'state', 'values': values})
+
+    # ------------------------------------------------------------------
+    # Work units
+    # ------------------------------------------------------------------
+
+    def stage(self, target: Path) -> Path:
+        """Staging path for an output that will be published to `target`"""
+        staged = self.staging / Path(target).resolve().relative_to(self.root)
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        return staged
+
+    def completed(self, unit: str, source_sha1: str) -> Optional[dict]:
+        """The journaled result of a unit, if it can be reused as is"""
+        record = self.units.get(unit)
+        if not record or record['source_sha1'] != source_sha1:
+            return None
+        for rel, sha1 in record['outputs'].items():
+            staged = self.staging / rel
+            target = self.root / rel
+            if staged.exists():
+                if file_sha1(staged) != sha1:
+                    return None
+            elif not (target.exists() and file_sha1(target) == sha1):
+                return None
+        return record
+
+    def finish(self, unit: str, source_sha1: str, outputs: Iterable[Path], **data) -> dict:
+        """Journal a unit whose outputs are all staged"""
+        record = {
+            'event': 'done',
+            'unit': unit,
+            'source_sha1': source_sha1,
+            'outputs': {Path(t).resolve().relative_to(self.root).as_posix(): file_sha1(self.stage(t))
+                        for t in outputs},
+            **data
+        }
+        self.append(record)
+        self.units[unit] = record
+        return record
+
+    def pending_outputs(self) -> List[str]:
+        return [rel for record in self.units.values() for rel in record['outputs']]
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def publish(self) -> int:
+        """
+        Move every staged output into place with an atomic rename (staging
+        shares the filesystem). Idempotent, so a crash mid-publish is
+        finished by the next run. Returns the number of files moved.
+        """
+        moved = 0
+        for record in self.units.values():
+            for rel, sha1 in record['outputs'].items():
+                staged = self.staging / rel
+                target = self.root / rel
+                if staged.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.chmod(staged, 0o644)
+                    os.replace(staged, target)
+                    moved += 1
+                elif not (target.exists() and file_sha1(target) == sha1):
+                    raise RuntimeError(f"Staged output missing and not published: {rel}")
+        if not self.published:
+            self.append({'event': 'published', 'files': len(self.pending_outputs())})
+            self.published = True
+        return moved
+
+    def commit(self):
+        """Mark the run complete; the next run starts fresh"""
+        self.append({'event': 'commit'})
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def describe(self) -> str:
+        if self.resumed:
+            return f"Resuming run {self.run_id}: {len(self.units)} units already done"
+        return f"Run {self.run_id} (journal: {self.path})"
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Built-in Lossless PNG Recompressor for Terror in the Jungle
+- Fallback for smart_optimize_clean.py when pngquant/optipng are missing,
+  so a bare Linux box with only Python still gets optimized PNGs
+- Reduces colour type and bit depth where it is lossless (RGBA -> RGB,
+  grey -> L/LA, <= 256 colours -> palette, packed 1/2/4-bit samples)
+- Searches PNG row filters and zlib level/strategy/window combinations in
+  parallel threads (zlib releases the GIL) and keeps the smallest stream
+- Drops every ancillary chunk except tRNS and verifies the decoded pixels
+  match the source before the result is accepted
+"""
+
+import io
+import zlib
+import struct
+import shutil
+import argparse
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    print("Installing Pillow for image processing...")
+    subprocess.run(['pip', 'install', 'Pillow'], check=True)
+    from PIL import Image
+    HAS_PIL = True
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+COLOR_GRAY, COLOR_RGB, COLOR_PALETTE, COLOR_GRAY_ALPHA, COLOR_RGBA = 0, 2, 3, 4, 6
+CHANNELS = {COLOR_GRAY: 1, COLOR_RGB: 3, COLOR_PALETTE: 1, COLOR_GRAY_ALPHA: 2, COLOR_RGBA: 4}
+COLOR_NAMES = {COLOR_GRAY: 'gray', COLOR_RGB: 'rgb', COLOR_PALETTE: 'palette',
+               COLOR_GRAY_ALPHA: 'gray_alpha', COLOR_RGBA: 'rgba'}
+
+FILTERS = ['none', 'sub', 'up', 'average', 'paeth', 'adaptive']
+FILTER_TYPES = {'none': 0, 'sub': 1, 'up': 2, 'average': 3, 'paeth': 4}
+
+STRATEGIES = {
+    'default': zlib.Z_DEFAULT_STRATEGY,
+    'filtered': zlib.Z_FILTERED,
+    'rle': zlib.Z_RLE,
+    'huffman': zlib.Z_HUFFMAN_ONLY
+}
+
+# Default search; --exhaustive widens it
+SEARCH = {'levels': [9], 'strategies': ['default', 'filtered', 'rle'], 'windows': [15], 'filters_kept': 2}
+EXHAUSTIVE_SEARCH = {'levels': [6, 7, 8, 9], 'strategies': list(STRATEGIES), 'windows': [15, 13, 11, 9],
+                     'filters_kept': len(FILTERS)}
+
+# Quick pass used to rank filters before the full zlib search, on a row sample for big images
+RANKING_LEVEL = 6
+RANKING_SAMPLE_BYTES = 4 * 1024 * 1024
+RANKING_BAND_ROWS = 16
+
+# Rows are filtered and deflated in bands so an 8K sprite never needs a filtered copy in memory
+BAND_BYTES = 4 * 1024 * 1024
+
+
+def read_chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError('not a PNG file')
+    chunks = []
+    offset = len(PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length, kind = struct.unpack('>I4s', data[offset:offset + 8])
+        chunks.append((kind, data[offset + 8:offset + 8 + length]))
+        offset += 12 + length
+        if kind == b'IEND':
+            break
+    return chunks
+
+
+def write_chunk(out: io.BytesIO, kind: bytes, payload: bytes):
+    out.write(struct.pack('>I', len(payload)))
+    out.write(kind)
+    out.write(payload)
+    out.write(struct.pack('>I', zlib.crc32(kind + payload) & 0xffffffff))
+
+
+class Representation:
+    """Pixel data in one PNG colour type / bit depth, ready to filter"""
+
+    def __init__(self, color_type: int, bit_depth: int, samples: np.ndarray,
+                 palette: Optional[np.ndarray] = None):
+        self.color_type = color_type
+        self.bit_depth = bit_depth
+        self.samples = samples        # (H, W, channels) uint8/uint16, or (H, W) indices/gray
+        self.palette = palette        # (N, 4) RGBA for palette images
+
+    @property
+    def name(self) -> str:
+        return f"{COLOR_NAMES[self.color_type]}/{self.bit_depth}"
+
+    def bytes_per_pixel(self) -> int:
+        return max(1, CHANNELS[self.color_type] * self.bit_depth // 8)
+
+    def chunk_bytes(self) -> int:
+        """Size of the PLTE/tRNS chunks this representation adds to the file"""
+        if self.color_type != COLOR_PALETTE:
+            return 0
+        size = 12 + 3 * len(self.palette)
+        transparent = np.nonzero(self.palette[:, 3] < 255)[0]
+        if len(transparent):
+            size += 12 + int(transparent.max()) + 1
+        return size
+
+    def scanlines(self) -> np.ndarray:
+        """Unfiltered scanline bytes, (H, row_bytes)"""
+        samples = self.samples
+        height = samples.shape[0]
+        if self.bit_depth == 16:
+            return samples.astype('>u2').view(np.uint8).reshape(height, -1)
+        if self.bit_depth == 8:
+            return samples.reshape(height, -1).astype(np.uint8)
+        # Pack 1/2/4-bit samples, most significant bits first, rows padded to whole bytes
+        per_byte = 8 // self.bit_depth
+        width = samples.shape[1]
+        padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+        padded[:, :width] = samples
+        groups = padded.reshape(height, -1, per_byte)
+        shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * self.bit_depth
+        return np.bitwise_or.reduce(groups << shifts, axis=2).astype(np.uint8)
+
+
+def reduce_image(image: 'Image.Image', source_bit_depth: int) -> List[Representation]:
+    """Lossless representations of the image, most reduced first"""
+    if image.mode in ('I;16', 'I;16B', 'I'):
+        gray = np.asarray(image).astype(np.uint32)
+        if source_bit_depth == 16 and not np.all(gray % 257 == 0):
+            return [Representation(COLOR_GRAY, 16, gray.astype(np.uint16))]
+        image = Image.fromarray((gray // 257 if source_bit_depth == 16 else gray).astype(np.uint8), 'L')
+
+    rgba = np.asarray(image.convert('RGBA'))
+    height, width = rgba.shape[:2]
+    opaque = bool(np.all(rgba[..., 3] == 255))
+    gray = bool(np.all(rgba[..., 0] == rgba[..., 1]) and np.all(rgba[..., 1] == rgba[..., 2]))
+
+    candidates: List[Representation] = []
+
+    # Palette: every distinct RGBA colour gets an index; transparent entries first so tRNS stays short
+    packed = rgba.reshape(-1, 4).view(np.uint32).reshape(-1)
+    few_colors = len(np.unique(packed[::max(1, len(packed) // (1 << 20))])) <= 256
+    if few_colors:
+        colors, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+        few_colors = len(colors) <= 256
+    if few_colors:
+        palette = colors.view(np.uint8).reshape(-1, 4)
+        order = np.lexsort((-counts, palette[:, 3] == 255))
+        remap = np.empty(len(order), dtype=np.uint8)
+        remap[order] = np.arange(len(order), dtype=np.uint8)
+        indices = remap[inverse].reshape(height, width)
+        depth = next(d for d in (1, 2, 4, 8) if len(colors) <= 1 << d)
+        candidates.append(Representation(COLOR_PALETTE, depth, indices, palette[order]))
+
+    if gray:
+        luma = rgba[..., 0]
+        if opaque:
+            for depth, step in ((1, 255), (2, 85), (4, 17)):
+                if np.all(luma % step == 0):
+                    candidates.append(Representation(COLOR_GRAY, depth, (luma // step).astype(np.uint8)))
+                    break
+            candidates.append(Representation(COLOR_GRAY, 8, luma))
+        else:
+            candidates.append(Representation(COLOR_GRAY_ALPHA, 8, rgba[..., [0, 3]]))
+
+    if opaque:
+        candidates.append(Representation(COLOR_RGB, 8, rgba[..., :3]))
+    else:
+        candidates.append(Representation(COLOR_RGBA, 8, rgba))
+    return candidates
+
+
+def filter_scanlines(lines: np.ndarray, bpp: int, method: str, previous: Optional[np.ndarray] = None) -> bytes:
+    """
+    Apply a PNG filter (or per-row adaptive choice) and prefix each row with
+    its filter byte. `previous` is the unfiltered row above the band, if any.
+    """
+    raw = lines.astype(np.int16)
+    left = np.zeros_like(raw)
+    left[:, bpp:] = raw[:, :-bpp]
+    up = np.zeros_like(raw)
+    up[1:] = raw[:-1]
+    upleft = np.zeros_like(raw)
+    upleft[1:, bpp:] = raw[:-1, :-bpp]
+    if previous is not None:
+        up[0] = previous
+        upleft[0, bpp:] = previous[:-bpp]
+
+    def paeth():
+        p = left + up - upleft
+        pa, pb, pc = np.abs(p - left), np.abs(p - up), np.abs(p - upleft)
+        return np.where((pa <= pb) & (pa <= pc), left, np.where(pb <= pc, up, upleft))
+
+    predictors = {
+        'none': lambda: 0,
+        'sub': lambda: left,
+        'up': lambda: up,
+        'average': lambda: (left + up) >> 1,
+        'paeth': paeth
+    }
+
+    if method == 'adaptive':
+        # Minimum sum of absolute (signed) residuals per row, the libpng heuristic
+        filtered = [((raw - predictors[name]()) & 0xff).astype(np.uint8) for name in FILTER_TYPES]
+        costs = np.stack([np.abs(f.astype(np.int8).astype(np.int32)).sum(axis=1) for f in filtered])
+        choice = costs.argmin(axis=0)
+        rows = np.stack(filtered)[choice, np.arange(len(choice))]
+        types = choice.astype(np.uint8)
+    else:
+        rows = ((raw - predictors[method]()) & 0xff).astype(np.uint8)
+        types = np.full(len(rows), FILTER_TYPES[method], dtype=np.uint8)
+
+    return np.concatenate([types[:, None], rows], axis=1).tobytes()
+
+
+def filtered_bands(lines: np.ndarray, bpp: int, method: str) -> Iterator[bytes]:
+    rows = max(1, BAND_BYTES // lines.shape[1])
+    for start in range(0, len(lines), rows):
+        yield filter_scanlines(lines[start:start + rows], bpp, method, lines[start - 1] if start else None)
+
+
+def ranking_sample(lines: np.ndarray) -> List[Tuple[np.ndarray, Optional[np.ndarray]]]:
+    """Evenly spaced row bands (with the row above each) standing in for a large image"""
+    if lines.nbytes <= RANKING_SAMPLE_BYTES or len(lines) <= RANKING_BAND_ROWS:
+        return [(lines, None)]
+    count = max(1, RANKING_SAMPLE_BYTES // (lines.shape[1] * RANKING_BAND_ROWS))
+    starts = np.linspace(0, len(lines) - RANKING_BAND_ROWS, count).astype(int)
+    return [(lines[s:s + RANKING_BAND_ROWS], lines[s - 1] if s else None) for s in np.unique(starts)]
+
+
+def deflate(chunks: Iterable[bytes], level: int, strategy: str, window: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, window, 9, STRATEGIES[strategy])
+    out = [compressor.compress(chunk) for chunk in chunks]
+    out.append(compressor.flush())
+    return b''.join(out)
+
+
+def encode_png(rep: Representation, idat: bytes) -> bytes:
+    height, width = rep.samples.shape[:2]
+    out = io.BytesIO()
+    out.write(PNG_SIGNATURE)
+    write_chunk(out, b'IHDR', struct.pack('>IIBBBBB', width, height, rep.bit_depth, rep.color_type, 0, 0, 0))
+    if rep.color_type == COLOR_PALETTE:
+        write_chunk(out, b'PLTE', rep.palette[:, :3].tobytes())
+        alpha = rep.palette[:, 3]
+        if np.any(alpha < 255):
+            last = int(np.nonzero(alpha < 255)[0].max()) + 1
+            write_chunk(out, b'tRNS', alpha[:last].tobytes())
+    write_chunk(out, b'IDAT', idat)
+    write_chunk(out, b'IEND', b'')
+    return out.getvalue()
+
+
+def pixels_match(original: 'Image.Image', encoded: bytes) -> bool:
+    with Image.open(io.BytesIO(encoded)) as decoded:
+        decoded.load()
+        if original.mode in ('I;16', 'I;16B', 'I'):
+            # 16-bit grey may have been reduced to 8-bit grey or a palette of greys
+            expected = np.asarray(original).astype(np.uint32)
+            if decoded.mode in ('I;16', 'I;16B', 'I'):
+                return np.array_equal(expected, np.asarray(decoded).astype(np.uint32))
+            rgba = np.asarray(decoded.convert('RGBA')).astype(np.uint32)
+            return bool(np.all(rgba[..., 3] == 255)) and all(
+                np.array_equal(expected, rgba[..., c] * 257) for c in range(3))
+        return np.array_equal(np.asarray(original.convert('RGBA')), np.asarray(decoded.convert('RGBA')))
+
+
+def best_encoding(image: 'Image.Image', bit_depth: int, exhaustive: bool = False,
+                  workers: Optional[int] = None, label: str = 'image') -> Tuple[bytes, dict, int]:
+    """
+    Smallest lossless PNG encoding of an already-decoded image. Returns the
+    encoded bytes, the winning settings and how many candidates were tried.
+    """
+    search = EXHAUSTIVE_SEARCH if exhaustive else SEARCH
+    representations = reduce_image(image, bit_depth)
+
+    lines = [rep.scanlines() for rep in representations]
+    bpps = [rep.bytes_per_pixel() for rep in representations]
+
+    def quick_size(key):
+        index, method = key
+        sample = ranking_sample(lines[index])
+        chunks = (filter_scanlines(band, bpps[index], method, previous) for band, previous in sample)
+        return len(deflate(chunks, RANKING_LEVEL, 'default', 15))
+
+    def full_size(job):
+        (index, method), level, strategy, window = job
+        idat = deflate(filtered_bands(lines[index], bpps[index], method), level, strategy, window)
+        return len(idat) + representations[index].chunk_bytes()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # Rank filters per representation with a quick deflate, keep the best few.
+        # Filters can't help below a byte per pixel; libpng uses none there too
+        keys = [(index, method) for index, rep in enumerate(representations) for method in FILTERS
+                if rep.bit_depth >= 8 or method == 'none']
+        quick = dict(zip(keys, pool.map(quick_size, keys)))
+
+        # Drop representations whose best quick size is well behind the leader
+        best_quick = {index: min(size for key, size in quick.items() if key[0] == index)
+                      + rep.chunk_bytes() for index, rep in enumerate(representations)}
+        leader = min(best_quick.values())
+
+        jobs = []
+        for index in range(len(representations)):
+            if best_quick[index] > leader * 1.25 and not exhaustive:
+                continue
+            ranked = sorted((key for key in quick if key[0] == index), key=quick.get)
+            for key in ranked[:search['filters_kept']]:
+                for level in search['levels']:
+                    for strategy in search['strategies']:
+                        for window in search['windows']:
+                            jobs.append((key, level, strategy, window))
+
+        sizes = list(pool.map(full_size, jobs))
+
+    (index, method), level, strategy, window = jobs[int(np.argmin(sizes))]
+    rep = representations[index]
+    encoded = encode_png(rep, deflate(filtered_bands(lines[index], bpps[index], method),
+                                      level, strategy, window))
+
+    if not pixels_match(image, encoded):
+        raise RuntimeError(f"{label}: recompressed pixels differ from the source")
+
+    settings = {
+        'format': rep.name,
+        'filter': method,
+        'level': level,
+        'strategy': strategy,
+        'window_bits': window
+    }
+    return encoded, settings, len(jobs)
+
+
+def recompress_png(input_path: Path, output_path: Path, exhaustive: bool = False,
+                   workers: Optional[int] = None) -> dict:
+    """
+    Losslessly recompress one PNG. Writes the smaller of the best candidate
+    and the original to output_path and returns the winning settings.
+    """
+    input_path, output_path = Path(input_path), Path(output_path)
+    data = input_path.read_bytes()
+    chunks = read_chunks(data)
+    ihdr = chunks[0][1]
+    bit_depth, color_type = ihdr[8], ihdr[9]
+
+    result = {
+        'method': 'builtin',
+        'original_size': len(data),
+        'optimized_size': len(data),
+        'source_format': f"{COLOR_NAMES.get(color_type, color_type)}/{bit_depth}",
+        'stripped_chunks': sorted({kind.decode('latin-1') for kind, _ in chunks
+                                   if kind not in (b'IHDR', b'PLTE', b'IDAT', b'IEND', b'tRNS')}),
+        'settings': None,
+        'candidates': 0
+    }
+
+    with Image.open(input_path) as image:
+        image.load()
+        if bit_depth == 16 and color_type != COLOR_GRAY:
+            # Pillow decodes 16-bit colour to 8 bits; re-encoding would be lossy
+            result['skipped'] = '16-bit colour'
+            if output_path != input_path:
+                shutil.copy2(input_path, output_path)
+            return result
+
+        encoded, settings, result['candidates'] = best_encoding(image, bit_depth, exhaustive, workers,
+                                                               input_path.name)
+
+    if len(encoded) < len(data):
+        output_path.write_bytes(encoded)
+        result['optimized_size'] = len(encoded)
+        result['settings'] = settings
+    else:
+        # Nothing beat the source; keep it byte for byte
+        if output_path != input_path:
+            shutil.copy2(input_path, output_path)
+        result['best_candidate'] = dict(settings, size=len(encoded))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Lossless PNG recompression without external tools')
+    parser.add_argument('files', nargs='+', help='PNG files')
+    parser.add_argument('--output-dir', help='Write results here (default: replace in place)')
+    parser.add_argument('--exhaustive', action='store_true', help='Search every filter/level/strategy/window')
+    parser.add_argument('--workers', type=int, help='Compression threads (default: CPU count)')
+    args = parser.parse_args()
+
+    print("\n" + "=" * 70)
+    print("TERROR IN THE JUNGLE - LOSSLESS PNG RECOMPRESSOR")
+    print("=" * 70)
+
+    total_before = total_after = 0
+    for name in args.files:
+        source = Path(name)
+        target = Path(args.output_dir) / source.name if args.output_dir else source
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            result = recompress_png(source, target, args.exhaustive, args.workers)
+        except (OSError, ValueError, RuntimeError) as e:
+            print(f"\n {source.name}: failed ({e})")
+            continue
+
+        total_before += result['original_size']
+        total_after += result['optimized_size']
+        saved = 1 - result['optimized_size'] / result['original_size']
+        print(f"\n {source.name}: {result['original_size'] / 1024:.1f}KB -> "
+              f"{result['optimized_size'] / 1024:.1f}KB ({saved:.1%} smaller, {result['candidates']} candidates)")
+        if result['settings']:
+            s = result['settings']
+            print(f"   {result['source_format']} -> {s['format']}, filter {s['filter']}, "
+                  f"zlib level {s['level']} {s['strategy']} window {s['window_bits']}")
+        elif result.get('skipped'):
+            print(f"   Skipped: {result['skipped']}")
+        else:
+            print("   Source was already smaller; kept as is")
+        if result['stripped_chunks']:
+            print(f"   Stripped: {', '.join(result['stripped_chunks'])}")
+
+    if total_before:
+        print(f"\n Total: {total_before / (1024 * 1024):.2f}MB -> {total_after / (1024 * 1024):.2f}MB "
+              f"({1 - total_after / total_before:.1%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
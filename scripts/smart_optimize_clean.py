@@ -4,9 +4,12 @@ Smart Asset Optimization for Terror in the Jungle
 - Always creates backups
 - Preserves aspect ratios
 - Offers multiple optimization strategies
+- Decodes each PNG once with Pillow; every variant is built from that in memory
 """
 
 import os
+import io
+import argparse
 import subprocess
 import shutil
 from pathlib import Path
@@ -15,6 +18,10 @@ from typing import Dict, List, Tuple
 import json
 import math
 
+from pipeline_journal import RunJournal, file_sha1, write_text_atomic
+from png_recompress import COLOR_GRAY, best_encoding, read_chunks
+from alpha_bleed import ALPHA_MODES, DEFAULT_BLEED_RADIUS, prepare_image
+
 try:
     from PIL import Image
     HAS_PIL = True
@@ -25,8 +32,47 @@ except ImportError:
     from PIL import Image
     HAS_PIL = True
 
+class DecodedPng:
+    """
+    A source PNG read once and decoded by Pillow once. Every variant (same
+    size, resized, each encoder) is derived from `image` in memory. pngquant
+    only takes PNG, so each variant piped to it is decoded again there;
+    `decodes` counts the Pillow decodes and `pipe_decodes` the pngquant ones,
+    and both end up in the report.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data = self.path.read_bytes()
+        chunks = read_chunks(self.data)
+        self.bit_depth, self.color_type = chunks[0][1][8], chunks[0][1][9]
+        # What a re-encode drops; everything but tRNS is ancillary metadata
+        self.ancillary_chunks = sorted({kind.decode('latin-1') for kind, _ in chunks
+                                        if kind not in (b'IHDR', b'PLTE', b'IDAT', b'IEND', b'tRNS')})
+        self.decodes = 0
+        self.pipe_decodes = 0
+        self._image = None
+
+    @property
+    def is_16bit_color(self) -> bool:
+        return self.bit_depth == 16 and self.color_type != COLOR_GRAY
+
+    @property
+    def image(self) -> Image.Image:
+        if self._image is None:
+            self._image = Image.open(io.BytesIO(self.data))
+            self._image.load()
+            self.decodes += 1
+        return self._image
+
+    def close(self):
+        if self._image is not None:
+            self._image.close()
+            self._image = None
+
+
 class SmartOptimizer:
-    def __init__(self, assets_dir: str):
+    def __init__(self, assets_dir: str, alpha_mode: str = 'zero', bleed_radius: int = DEFAULT_BLEED_RADIUS):
         self.assets_dir = Path(assets_dir)
         self.project_root = self.assets_dir.parent.parent
 
@@ -35,11 +81,6 @@ class SmartOptimizer:
         self.optimized_dir = self.project_root / 'public' / 'assets_optimized'
         self.optimized_resize_dir = self.project_root / 'public' / 'assets_optimized_resized'
 
-        # Create directories
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
-        self.optimized_dir.mkdir(parents=True, exist_ok=True)
-        self.optimized_resize_dir.mkdir(parents=True, exist_ok=True)
-
         self.stats = {
             'backup_created': False,
             'original_total_size': 0,
@@ -48,6 +89,16 @@ class SmartOptimizer:
             'files': {}
         }
 
+        # External tools; PNGs fall back to the built-in recompressor (png_recompress.py)
+        self.tools = {tool: shutil.which(tool) is not None for tool in ('pngquant', 'optipng', 'ffmpeg')}
+
+        # RGB under alpha 0 is zeroed (or bled) before encoding; see alpha_bleed.py
+        self.alpha_mode = alpha_mode
+        self.bleed_radius = bleed_radius
+
+        # Per-category audio codec picked by scripts/audio_codecs.py (Vorbis when absent)
+        self.audio_codecs = self.load_audio_codecs()
+
         # Smart sizing rules - preserve aspect ratio
         self.sizing_rules = {
             'soldier': {
@@ -79,6 +130,7 @@ class SmartOptimizer:
     def backup_all_assets(self):
         """Create a complete backup of all original assets"""
         print("\n Creating backup archive...")
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy all files to archive
         all_files = list(self.assets_dir.glob('*.*'))
@@ -161,20 +213,87 @@ To restore these assets:
 
         return new_width, new_height
 
-    def optimize_png_same_size(self, input_path: Path, output_path: Path) -> dict:
+    def decode_png(self, path: Path) -> 'DecodedPng':
+        """Read and decode a source once; every variant is built from the result"""
+        return DecodedPng(path)
+
+    def encode_png_lossless(self, image: Image.Image, output_path: Path, source: 'DecodedPng' = None) -> dict:
+        """
+        Lossless encode of a decoded image to output_path: optipng when
+        installed, otherwise the built-in recompressor in memory. Pass the
+        source when `image` is its untouched pixels so its bytes can win.
+        """
+        if self.tools['optipng']:
+            # optipng only works on files, so it gets the one file we write anyway
+            if source is not None:
+                output_path.write_bytes(source.data)
+            else:
+                image.save(output_path, 'PNG', compress_level=1)
+            subprocess.run(['optipng', '-o5', '-quiet', str(output_path)], capture_output=True)
+            return {'method': 'optipng'}
+
+        if source is not None and source.is_16bit_color:
+            # Pillow decodes 16-bit colour to 8 bits; re-encoding would be lossy
+            output_path.write_bytes(source.data)
+            return {'method': 'builtin', 'settings': None, 'stripped_chunks': []}
+
+        bit_depth = source.bit_depth if source is not None else (16 if image.mode.startswith('I') else 8)
+        encoded, settings, _ = best_encoding(image, bit_depth, label=output_path.name)
+        if source is not None and len(source.data) <= len(encoded):
+            # Nothing beat the source; keep it byte for byte
+            output_path.write_bytes(source.data)
+            return {'method': 'builtin', 'settings': None, 'stripped_chunks': []}
+        output_path.write_bytes(encoded)
+        return {'method': 'builtin', 'settings': settings,
+                'stripped_chunks': source.ancillary_chunks if source is not None else []}
+
+    def run_pngquant(self, image: Image.Image, quality: str, source: 'DecodedPng' = None) -> bytes:
+        """
+        Lossy palette quantization through a pipe; None if pngquant is
+        missing or can't meet the quality. pngquant decodes what it is piped,
+        which is counted against the source.
+        """
+        if not self.tools['pngquant']:
+            return None
+        if source is not None:
+            source.pipe_decodes += 1
+        buffer = io.BytesIO()
+        # Stored, not deflated: pngquant only inflates it again
+        image.save(buffer, 'PNG', compress_level=0)
+        cmd = [
+            'pngquant',
+            '--quality=' + quality,
+            '--speed=1',
+            '-'
+        ]
+
+        result = subprocess.run(cmd, input=buffer.getvalue(), capture_output=True)
+        if result.returncode == 0 and result.stdout:
+            return result.stdout
+        return None
+
+    @staticmethod
+    def describe_compression(stats: dict) -> str:
+        compression = stats.get('compression') or {'method': 'copy'}
+        settings = compression.get('settings')
+        if compression['method'] == 'builtin' and settings:
+            return (f"built-in: {settings['format']}, filter {settings['filter']}, "
+                    f"zlib {settings['level']}/{settings['strategy']}/{settings['window_bits']}")
+        if compression['method'] == 'builtin':
+            return "built-in: source already optimal"
+        return compression['method']
+
+    def optimize_png_same_size(self, source: 'DecodedPng', output_path: Path) -> dict:
         """Optimize PNG keeping exact same dimensions"""
         stats = {
-            'original_size': input_path.stat().st_size,
+            'original_size': len(source.data),
             'optimized_size': 0,
             'dimensions_changed': False
         }
 
         try:
-            # First try pngquant (lossy but effective)
-            temp_path = output_path.with_suffix('.tmp.png')
-
             # Determine quality based on content
-            content_type = self.detect_content_type(input_path.name)
+            content_type = self.detect_content_type(source.path.name)
             if content_type == 'soldier':
                 quality = '95-100'  # Maximum quality for characters
             elif content_type == 'skybox':
@@ -182,39 +301,40 @@ To restore these assets:
             else:
                 quality = '90-100'  # High quality default
 
-            cmd = [
-                'pngquant',
-                '--quality=' + quality,
-                '--speed=1',
-                '--force',
-                '--output', str(temp_path),
-                str(input_path)
-            ]
+            # Canonicalize transparent pixels first; the encoders get the prepared pixels
+            prepared, alpha = prepare_image(source.image, self.alpha_mode, self.bleed_radius)
+            if alpha:
+                stats['alpha'] = alpha
 
-            result = subprocess.run(cmd, capture_output=True)
-
-            if result.returncode == 0 and temp_path.exists():
-                # Success with pngquant
-                shutil.move(temp_path, output_path)
+            # First try pngquant (lossy but effective)
+            quantized = self.run_pngquant(prepared, quality, source)
+            if quantized:
+                output_path.write_bytes(quantized)
+                stats['compression'] = {'method': 'pngquant', 'quality': quality}
             else:
-                # Fallback to optipng (lossless)
-                shutil.copy2(input_path, output_path)
-                cmd = ['optipng', '-o5', '-quiet', str(output_path)]
-                subprocess.run(cmd, capture_output=True)
+                # Fallback to a lossless pass; untouched pixels may keep the source bytes
+                stats['compression'] = self.encode_png_lossless(prepared, output_path,
+                                                                None if alpha else source)
 
             stats['optimized_size'] = output_path.stat().st_size
+            if stats['optimized_size'] > stats['original_size']:
+                # Bleeding can outweigh what the encoder saves; never ship a bigger file
+                output_path.write_bytes(source.data)
+                stats['optimized_size'] = stats['original_size']
+                stats['compression'] = {'method': 'copy'}
+                stats.pop('alpha', None)
 
         except Exception as e:
             print(f"     Optimization failed: {e}")
-            shutil.copy2(input_path, output_path)
+            output_path.write_bytes(source.data)
             stats['optimized_size'] = output_path.stat().st_size
 
         return stats
 
-    def optimize_png_smart_resize(self, input_path: Path, output_path: Path) -> dict:
+    def optimize_png_smart_resize(self, source: 'DecodedPng', output_path: Path) -> dict:
         """Optimize PNG with smart resizing based on content type"""
         stats = {
-            'original_size': input_path.stat().st_size,
+            'original_size': len(source.data),
             'optimized_size': 0,
             'original_dimensions': None,
             'new_dimensions': None,
@@ -223,157 +343,219 @@ To restore these assets:
 
         if not HAS_PIL:
             print("     PIL not available for resizing")
-            return self.optimize_png_same_size(input_path, output_path)
+            return self.optimize_png_same_size(source, output_path)
 
         try:
-            # Open image
-            with Image.open(input_path) as img:
-                stats['original_dimensions'] = f"{img.width}x{img.height}"
-
-                # Determine optimal size based on content
-                content_type = self.detect_content_type(input_path.name)
-                max_dim = self.sizing_rules.get(content_type, {'max_dimension': 2048})['max_dimension']
+            img = source.image
+            stats['original_dimensions'] = f"{img.width}x{img.height}"
 
-                # Calculate new dimensions preserving aspect ratio
-                new_width, new_height = self.calculate_new_dimensions(img.width, img.height, max_dim)
-                stats['new_dimensions'] = f"{new_width}x{new_height}"
+            # Determine optimal size based on content
+            content_type = self.detect_content_type(source.path.name)
+            max_dim = self.sizing_rules.get(content_type, {'max_dimension': 2048})['max_dimension']
 
-                if new_width != img.width or new_height != img.height:
-                    stats['dimensions_changed'] = True
+            # Calculate new dimensions preserving aspect ratio
+            new_width, new_height = self.calculate_new_dimensions(img.width, img.height, max_dim)
+            stats['new_dimensions'] = f"{new_width}x{new_height}"
 
-                    # Resize with high quality
-                    # Use LANCZOS for downscaling (best quality)
-                    resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            if new_width != img.width or new_height != img.height:
+                stats['dimensions_changed'] = True
 
-                    # Save with optimization
-                    resized.save(output_path, 'PNG', optimize=True)
-                    resized.close()
-                else:
-                    # No resize needed, just optimize
-                    img.save(output_path, 'PNG', optimize=True)
-
-                # Run pngquant on the result
-                temp_path = output_path.with_suffix('.tmp.png')
-                quality = '85-98' if content_type != 'soldier' else '95-100'
-
-                cmd = [
-                    'pngquant',
-                    '--quality=' + quality,
-                    '--speed=1',
-                    '--force',
-                    '--output', str(temp_path),
-                    str(output_path)
-                ]
+                # Resize with high quality
+                # Use LANCZOS for downscaling (best quality)
+                resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
-                result = subprocess.run(cmd, capture_output=True)
-                if result.returncode == 0 and temp_path.exists():
-                    shutil.move(temp_path, output_path)
+                # Resampling can leave new noise under alpha 0
+                prepared, stats['alpha'] = prepare_image(resized, self.alpha_mode, self.bleed_radius)
+            else:
+                # No resize needed, just optimize
+                prepared, stats['alpha'] = prepare_image(img, self.alpha_mode, self.bleed_radius)
+
+            # Run pngquant on the result, or a lossless pass when it can't
+            quality = '85-98' if content_type != 'soldier' else '95-100'
+            quantized = self.run_pngquant(prepared, quality, source)
+            if quantized:
+                output_path.write_bytes(quantized)
+                stats['compression'] = {'method': 'pngquant', 'quality': quality}
+            else:
+                untouched = not stats['dimensions_changed'] and not stats['alpha']
+                stats['compression'] = self.encode_png_lossless(prepared, output_path,
+                                                                source if untouched else None)
 
-                stats['optimized_size'] = output_path.stat().st_size
+            stats['optimized_size'] = output_path.stat().st_size
 
         except Exception as e:
             print(f"     Resize failed: {e}")
-            return self.optimize_png_same_size(input_path, output_path)
+            return self.optimize_png_same_size(source, output_path)
 
         return stats
 
-    def optimize_audio(self, input_path: Path, output_dir: Path) -> dict:
-        """Convert audio to OGG with high quality"""
+    def load_audio_codecs(self) -> dict:
+        codecs_path = Path(__file__).parent / 'audio_codecs.json'
+        if not codecs_path.exists():
+            return {}
+        try:
+            with open(codecs_path) as f:
+                return json.load(f).get('categories', {})
+        except (OSError, ValueError):
+            print(f"   Ignoring unreadable codec table: {codecs_path}")
+            return {}
+
+    @staticmethod
+    def detect_audio_category(filename: str) -> str:
+        """Audio category for codec selection: ambient, transmission or sfx"""
+        name = filename.lower()
+        if 'transmiss' in name:
+            return 'transmission'
+        if 'jungle' in name or 'ambient' in name:
+            return 'ambient'
+        return 'sfx'
+
+    def prepare_output_dirs(self):
+        """Create the optimized output folders (the archive is created when a backup is taken)"""
+        self.optimized_dir.mkdir(parents=True, exist_ok=True)
+        self.optimized_resize_dir.mkdir(parents=True, exist_ok=True)
+
+    def audio_suffix(self, category: str, quality: str = None, allow_opus: bool = False) -> str:
+        """
+        Vorbis in Ogg unless the caller can offer a fallback: src/config/audio.ts
+        points at fixed .ogg paths, and Safari's decodeAudioData has failed on
+        WebM Opus. Only callers whose client probes canPlayType (the ambience
+        stream index) pass allow_opus.
+        """
+        if allow_opus and quality is None and self.audio_codecs.get(category, {}).get('codec') == 'opus':
+            return '.webm'
+        return '.ogg'
+
+    def optimize_audio(self, input_path: Path, output_dir: Path, quality: str = None,
+                       category: str = None, allow_opus: bool = False) -> dict:
+        """Encode audio as Vorbis, or with the category's calibrated Opus bitrate when allow_opus is set"""
+        category = category or self.detect_audio_category(input_path.name)
+        choice = self.audio_codecs.get(category, {})
         stats = {
             'original_size': input_path.stat().st_size,
-            'optimized_size': 0
+            'optimized_size': 0,
+            'category': category
         }
 
-        output_path = output_dir / input_path.with_suffix('.ogg').name
+        output_path = output_dir / input_path.with_suffix(self.audio_suffix(category, quality, allow_opus)).name
+        stats['output'] = output_path.name
 
         try:
-            # Determine quality based on content
-            filename = input_path.name.lower()
-            if 'jungle' in filename or 'ambient' in filename:
-                quality = '5'  # 160kbps for ambient
+            if output_path.suffix == '.webm':
+                stats['codec'] = 'opus'
+                cmd = [
+                    'ffmpeg',
+                    '-i', str(input_path),
+                    '-c:a', 'libopus',
+                    '-b:a', choice['bitrate'],
+                    '-vbr', 'on',
+                    '-application', 'audio',
+                    '-y',
+                    str(output_path)
+                ]
             else:
-                quality = '7'  # 224kbps for SFX
-
-            cmd = [
-                'ffmpeg',
-                '-i', str(input_path),
-                '-c:a', 'libvorbis',
-                '-q:a', quality,
-                '-y',
-                str(output_path)
-            ]
-
-            subprocess.run(cmd, capture_output=True, stderr=subprocess.DEVNULL)
+                # Determine quality based on content unless the caller chose one
+                if quality is None:
+                    if 'quality' in choice:
+                        quality = choice['quality']
+                    elif category == 'ambient':
+                        quality = '5'  # 160kbps for ambient
+                    else:
+                        quality = '7'  # 224kbps for SFX
+
+                stats['codec'] = 'vorbis'
+                cmd = [
+                    'ffmpeg',
+                    '-i', str(input_path),
+                    '-c:a', 'libvorbis',
+                    '-q:a', quality,
+                    '-y',
+                    str(output_path)
+                ]
+
+            subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             stats['optimized_size'] = output_path.stat().st_size
 
         except Exception as e:
+            # Keep the source under its own name; raw PCM in a file called .ogg/.webm won't decode
             print(f"     Audio conversion failed: {e}")
+            if output_path.exists():
+                output_path.unlink()
+            output_path = output_dir / input_path.name
             shutil.copy2(input_path, output_path)
+            stats['output'] = output_path.name
+            stats['codec'] = 'copy'
             stats['optimized_size'] = output_path.stat().st_size
 
         return stats
 
     def check_dependencies(self):
-        """Check and install required tools"""
+        """Report external tools; True when everything the run can use is installed"""
         print("\n Checking dependencies...")
 
-        tools_needed = []
-
-        # Check pngquant
-        try:
-            subprocess.run(['pngquant', '--version'], capture_output=True, check=True)
-            print("   pngquant found")
-        except:
-            tools_needed.append('pngquant')
-            print("   pngquant not found")
-
-        # Check optipng
-        try:
-            subprocess.run(['optipng', '--version'], capture_output=True, check=True)
-            print("   optipng found")
-        except:
-            tools_needed.append('optipng')
-            print("   optipng not found")
+        for tool, found in self.tools.items():
+            print(f"   {tool} {'found' if found else 'not found'}")
 
-        # Check ffmpeg
-        try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            print("   ffmpeg found")
-        except:
-            tools_needed.append('ffmpeg')
-            print("   ffmpeg not found")
-
-        if tools_needed:
-            print("\n  Missing tools! To install:")
-            if 'pngquant' in tools_needed:
-                print("  pngquant: Download from https://pngquant.org/")
-            if 'optipng' in tools_needed:
+        if not (self.tools['pngquant'] and self.tools['optipng']):
+            print("\n  PNGs will use the built-in lossless recompressor for anything pngquant/optipng can't do.")
+            if not self.tools['pngquant']:
+                print("  pngquant (smaller, lossy palettes): Download from https://pngquant.org/")
+            if not self.tools['optipng']:
                 print("  optipng: Download from http://optipng.sourceforge.net/")
-            if 'ffmpeg' in tools_needed:
-                print("  ffmpeg: Download from https://ffmpeg.org/download.html")
-
-            return False
+        if not self.tools['ffmpeg']:
+            print("\n  Audio can't be encoded without ffmpeg; audio files will be skipped.")
+            print("  ffmpeg: Download from https://ffmpeg.org/download.html")
 
-        return True
+        return all(self.tools.values())
 
-    def run_optimization(self):
-        """Run the complete optimization process"""
+    def run_optimization(self, resume: bool = True):
+        """Run the complete optimization process (resumes an interrupted run unless resume=False)"""
         print("\n" + "="*70)
         print("TERROR IN THE JUNGLE - SMART ASSET OPTIMIZER")
         print("="*70)
 
-        # Check dependencies
-        if not self.check_dependencies():
-            print("\nPlease install missing tools first!")
+        # Check dependencies (missing tools only narrow what the run can do)
+        self.check_dependencies()
+        self.prepare_output_dirs()
+
+        # Every finished file is journaled; outputs are staged until the whole run is done
+        journal = RunJournal(self.project_root, 'smart_optimize', {
+            'sizing_rules': self.sizing_rules,
+            'audio_codecs': self.audio_codecs,
+            'tools': self.tools,
+            'alpha': [self.alpha_mode, self.bleed_radius]
+        }, resume=resume)
+        print(f"\n {journal.describe()}")
+
+        # Step 1: Backup everything (once per run; a resumed run reuses its backup)
+        if journal.state.get('archive_dir') and Path(journal.state['archive_dir']).exists():
+            self.archive_dir = Path(journal.state['archive_dir'])
+            self.stats['original_total_size'] = sum(f.stat().st_size for f in self.assets_dir.glob('*.*'))
+            self.stats['backup_created'] = True
+            print(f" Reusing backup: {self.archive_dir}")
+        elif not self.backup_all_assets():
+            print(" Backup failed! Aborting.")
             return
+        else:
+            journal.set_state(archive_dir=str(self.archive_dir))
 
-        # Step 1: Backup everything
-        if not self.backup_all_assets():
-            print(" Backup failed! Aborting.")
+        try:
+            self.process_sources(journal)
+        except KeyboardInterrupt:
+            print(f"\n\n Interrupted: {len(journal.units)} files journaled, nothing published.")
+            print(" Run again to resume.")
             return
 
+        # Step 4: Publish all outputs, swap the report, then commit the run
+        moved = journal.publish()
+        print(f"\n Published {moved} files")
+        self.generate_report()
+        journal.commit()
+
+    def process_sources(self, journal: RunJournal):
+        """Build every output into the journal's staging area, skipping units already done"""
         # Step 2: Process PNGs
-        png_files = list(self.assets_dir.glob('*.png'))
+        png_files = sorted(self.assets_dir.glob('*.png'))
         print(f"\n Processing {len(png_files)} PNG files...")
         print("-" * 50)
 
@@ -382,66 +564,98 @@ To restore these assets:
             content_type = self.detect_content_type(png_file.name)
             print(f"  Type: {content_type}")
 
-            # Version 1: Same dimensions
-            print("  Creating dimension-preserved version...", end="")
             output1 = self.optimized_dir / png_file.name
-            stats1 = self.optimize_png_same_size(png_file, output1)
-            reduction1 = (1 - stats1['optimized_size']/stats1['original_size']) * 100
-            print(f" {reduction1:.1f}% smaller")
-
-            # Version 2: Smart resize
-            print("  Creating smart-resized version...", end="")
             output2 = self.optimized_resize_dir / png_file.name
-            stats2 = self.optimize_png_smart_resize(png_file, output2)
-            reduction2 = (1 - stats2['optimized_size']/stats2['original_size']) * 100
+            unit = f"png:{png_file.name}"
+            source_sha1 = file_sha1(png_file)
+            done = journal.completed(unit, source_sha1)
 
-            if stats2['dimensions_changed']:
-                print(f" {reduction2:.1f}% smaller ({stats2['original_dimensions']} → {stats2['new_dimensions']})")
+            if done:
+                file_stats = done['stats']
+                print("  Done in a previous run")
             else:
-                print(f" {reduction2:.1f}% smaller (no resize needed)")
+                # One decode feeds both versions
+                source = self.decode_png(png_file)
+
+                # Version 1: Same dimensions
+                print("  Creating dimension-preserved version...", end="")
+                stats1 = self.optimize_png_same_size(source, journal.stage(output1))
+                reduction1 = (1 - stats1['optimized_size']/stats1['original_size']) * 100
+                print(f" {reduction1:.1f}% smaller ({self.describe_compression(stats1)})")
+
+                # Version 2: Smart resize
+                print("  Creating smart-resized version...", end="")
+                stats2 = self.optimize_png_smart_resize(source, journal.stage(output2))
+                source.close()
+                reduction2 = (1 - stats2['optimized_size']/stats2['original_size']) * 100
+
+                if stats2['dimensions_changed']:
+                    print(f" {reduction2:.1f}% smaller ({stats2['original_dimensions']} → {stats2['new_dimensions']}, "
+                          f"{self.describe_compression(stats2)})")
+                else:
+                    print(f" {reduction2:.1f}% smaller (no resize needed, {self.describe_compression(stats2)})")
 
-            # Track stats
-            self.stats['files'][png_file.name] = {
-                'type': content_type,
-                'original_size': stats1['original_size'],
-                'optimized_size': stats1['optimized_size'],
-                'optimized_resize_size': stats2['optimized_size'],
-                'dimensions': stats2.get('original_dimensions'),
-                'new_dimensions': stats2.get('new_dimensions')
-            }
+                file_stats = {
+                    'type': content_type,
+                    'original_size': stats1['original_size'],
+                    'optimized_size': stats1['optimized_size'],
+                    'optimized_resize_size': stats2['optimized_size'],
+                    'dimensions': stats2.get('original_dimensions'),
+                    'new_dimensions': stats2.get('new_dimensions'),
+                    'alpha': stats1.get('alpha'),
+                    'compression': stats1.get('compression'),
+                    'resize_compression': stats2.get('compression'),
+                    'decodes': source.decodes,
+                    'pipe_decodes': source.pipe_decodes
+                }
+                journal.finish(unit, source_sha1, [output1, output2], stats=file_stats)
 
-            self.stats['optimized_size'] += stats1['optimized_size']
-            self.stats['optimized_resize_size'] += stats2['optimized_size']
+            # Track stats
+            self.stats['files'][png_file.name] = file_stats
+            self.stats['optimized_size'] += file_stats['optimized_size']
+            self.stats['optimized_resize_size'] += file_stats['optimized_resize_size']
 
         # Step 3: Process Audio
-        audio_files = list(self.assets_dir.glob('*.wav'))
-        if audio_files:
+        audio_files = sorted(self.assets_dir.glob('*.wav'))
+        if audio_files and not self.tools['ffmpeg']:
+            print(f"\n Skipping {len(audio_files)} audio files (ffmpeg not installed)")
+        elif audio_files:
             print(f"\n Processing {len(audio_files)} audio files...")
             print("-" * 50)
 
             for audio_file in audio_files:
                 print(f"\n{audio_file.name}:")
 
-                # Convert to OGG for both directories
-                print("  Converting to OGG...", end="")
-                stats1 = self.optimize_audio(audio_file, self.optimized_dir)
-                stats2 = self.optimize_audio(audio_file, self.optimized_resize_dir)
+                unit = f"audio:{audio_file.name}"
+                source_sha1 = file_sha1(audio_file)
+                done = journal.completed(unit, source_sha1)
 
-                reduction = (1 - stats1['optimized_size']/stats1['original_size']) * 100
-                print(f" {reduction:.1f}% smaller")
-
-                self.stats['files'][audio_file.name] = {
-                    'type': 'audio',
-                    'original_size': stats1['original_size'],
-                    'optimized_size': stats1['optimized_size'],
-                    'optimized_resize_size': stats2['optimized_size']
-                }
-
-                self.stats['optimized_size'] += stats1['optimized_size']
-                self.stats['optimized_resize_size'] += stats2['optimized_size']
-
-        # Generate report
-        self.generate_report()
+                if done:
+                    file_stats = done['stats']
+                    print("  Done in a previous run")
+                else:
+                    # Encode once, stage it for both directories
+                    print("  Encoding audio...", end="")
+                    staged_dir = journal.stage(self.optimized_dir / audio_file.name).parent
+                    stats1 = self.optimize_audio(audio_file, staged_dir)
+                    output1 = self.optimized_dir / stats1['output']
+                    output2 = self.optimized_resize_dir / stats1['output']
+                    shutil.copy2(journal.stage(output1), journal.stage(output2))
+
+                    reduction = (1 - stats1['optimized_size']/stats1['original_size']) * 100
+                    print(f" {reduction:.1f}% smaller")
+
+                    file_stats = {
+                        'type': 'audio',
+                        'original_size': stats1['original_size'],
+                        'optimized_size': stats1['optimized_size'],
+                        'optimized_resize_size': stats1['optimized_size']
+                    }
+                    journal.finish(unit, source_sha1, [output1, output2], stats=file_stats)
+
+                self.stats['files'][audio_file.name] = file_stats
+                self.stats['optimized_size'] += file_stats['optimized_size']
+                self.stats['optimized_resize_size'] += file_stats['optimized_resize_size']
 
     def generate_report(self):
         """Generate optimization report"""
@@ -461,6 +675,15 @@ To restore these assets:
         print(f"   Optimized (same size):   {optimized_mb:.2f} MB ({(1-optimized_mb/original_mb)*100:.1f}% reduction)")
         print(f"   Optimized (smart resize): {resized_mb:.2f} MB ({(1-resized_mb/original_mb)*100:.1f}% reduction)")
 
+        # Pillow decodes each PNG once for every variant; pngquant decodes each variant piped to it
+        decodes = {name: {'pillow': stats['decodes'], 'pngquant': stats.get('pipe_decodes', 0)}
+                   for name, stats in self.stats['files'].items() if 'decodes' in stats}
+        if decodes:
+            repeated = [name for name, count in decodes.items() if count['pillow'] != 1]
+            print(f"\n Source decodes: {sum(c['pillow'] for c in decodes.values())} by Pillow for {len(decodes)} PNGs"
+                  + (f" (more than one: {', '.join(repeated)})" if repeated else " (one each)")
+                  + f", {sum(c['pngquant'] for c in decodes.values())} by pngquant")
+
         print(f"\n Output Locations:")
         print(f"   Same dimensions:  {self.optimized_dir}")
         print(f"   Smart resized:    {self.optimized_resize_dir}")
@@ -472,12 +695,12 @@ To restore these assets:
             'optimized_size_mb': optimized_mb,
             'optimized_resize_mb': resized_mb,
             'files': self.stats['files'],
+            'decodes': decodes,
             'sizing_rules': self.sizing_rules
         }
 
         report_path = self.project_root / 'optimization_report.json'
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        write_text_atomic(report_path, json.dumps(report, indent=2))
 
         print(f"\n Detailed report saved to: {report_path}")
 
@@ -497,12 +720,20 @@ def main():
     project_root = script_dir.parent
     assets_dir = project_root / 'public' / 'assets'
 
+    parser = argparse.ArgumentParser(description='Optimize PNG and WAV assets into backup-safe output folders')
+    parser.add_argument('--fresh', action='store_true', help='Ignore an interrupted run and start over')
+    parser.add_argument('--alpha', choices=ALPHA_MODES, default='zero',
+                        help='RGB under alpha 0: zero it (default), bleed edge colours outward, or leave it')
+    parser.add_argument('--bleed-radius', type=int, default=DEFAULT_BLEED_RADIUS,
+                        help='Pixels to bleed edge colours with --alpha bleed')
+    args = parser.parse_args()
+
     if not assets_dir.exists():
         print(f" Assets directory not found: {assets_dir}")
         return
 
-    optimizer = SmartOptimizer(assets_dir)
-    optimizer.run_optimization()
+    optimizer = SmartOptimizer(assets_dir, args.alpha, args.bleed_radius)
+    optimizer.run_optimization(resume=not args.fresh)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+PNG decode count tests for Terror in the Jungle
+- Counts every real Image.open across the same-size and resized variants,
+  not just the DecodedPng counter, and tells source decodes apart from
+  decodes of encoded output or piped copies
+- pngquant is faked so its decode of each piped variant is counted too
+"""
+
+import io
+import sys
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from smart_optimize_clean import SmartOptimizer  # noqa: E402
+
+REAL_OPEN = Image.open
+
+
+class DecodeCountTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        assets_dir = Path(self.tmp.name) / 'public' / 'assets'
+        assets_dir.mkdir(parents=True)
+        # Tiling texture (max 512) so the resized variant really resizes
+        rng = np.random.default_rng(7)
+        rgba = rng.integers(0, 256, size=(300, 600, 4), dtype=np.uint8)
+        rgba[:, :200, 3] = 0
+        self.path = assets_dir / 'groundtest.png'
+        Image.fromarray(rgba, 'RGBA').save(self.path)
+        self.source_bytes = self.path.read_bytes()
+
+        self.optimizer = SmartOptimizer(str(assets_dir))
+        self.optimizer.prepare_output_dirs()
+        self.optimizer.tools = {'pngquant': False, 'optipng': False, 'ffmpeg': False}
+        self.opens = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def counting_open(self, fp, *args, **kwargs):
+        if isinstance(fp, io.BytesIO):
+            data = fp.getvalue()
+        else:
+            data = Path(fp).read_bytes()
+        self.opens.append('source' if data == self.source_bytes else 'other')
+        return REAL_OPEN(fp, *args, **kwargs)
+
+    def fake_pngquant(self, cmd, input=None, **kwargs):
+        # Stands in for pngquant: it has to decode the PNG it is piped
+        with Image.open(io.BytesIO(input)) as img:
+            img.load()
+        self.opens.append('pipe')
+        return subprocess.CompletedProcess(cmd, 0, stdout=input, stderr=b'')
+
+    def run_variants(self):
+        with mock.patch.object(Image, 'open', side_effect=self.counting_open):
+            source = self.optimizer.decode_png(self.path)
+            same = self.optimizer.optimize_png_same_size(source, self.optimizer.optimized_dir / self.path.name)
+            resized = self.optimizer.optimize_png_smart_resize(
+                source, self.optimizer.optimized_resize_dir / self.path.name)
+            source.close()
+        self.assertTrue(resized['dimensions_changed'])
+        return source, same, resized
+
+    def test_source_decoded_once_across_variants(self):
+        source, same, resized = self.run_variants()
+        self.assertEqual(self.opens.count('source'), 1)
+        self.assertEqual(self.opens.count('pipe'), 0)
+        self.assertEqual(source.decodes, 1)
+        self.assertEqual(source.pipe_decodes, 0)
+        self.assertEqual(same['compression']['method'], 'builtin')
+
+    def test_pngquant_decodes_each_piped_variant(self):
+        self.optimizer.tools['pngquant'] = True
+        with mock.patch('smart_optimize_clean.subprocess.run', side_effect=self.fake_pngquant):
+            source, same, resized = self.run_variants()
+        self.assertEqual(self.opens.count('source'), 1)
+        self.assertEqual(self.opens.count('pipe'), 2)
+        self.assertEqual(source.decodes, 1)
+        self.assertEqual(source.pipe_decodes, self.opens.count('pipe'))
+        self.assertEqual(resized['compression']['method'], 'pngquant')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Asset Pipeline Watch Mode for Terror in the Jungle
+- Polls public/assets and public/assets/transmissions for added, changed
+  or removed PNG/WAV sources (debounced until the file stops changing)
+- Reprocesses only the affected assets on a worker pool, using the same
+  SmartOptimizer steps as smart_optimize_clean.py
+- Publishes every output with an atomic rename and swaps the manifest
+  atomically, so the Vite dev server never serves a half-written file
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Optional, Tuple
+
+from smart_optimize_clean import SmartOptimizer
+from pipeline_journal import file_sha1, write_text_atomic
+
+MANIFEST_VERSION = 1
+
+# Transmissions are meant to sound compressed (see compress_audio.py); only
+# used while audio_codecs.json doesn't pick a codec for them
+TRANSMISSION_QUALITY = '5'
+
+
+class AssetWatcher:
+    def __init__(self, project_root: Path, workers: int = 4, poll_interval: float = 0.2,
+                 debounce: float = 0.3):
+        self.project_root = Path(project_root)
+        self.public_dir = self.project_root / 'public'
+        self.assets_dir = self.public_dir / 'assets'
+        self.transmissions_dir = self.assets_dir / 'transmissions'
+        self.manifest_path = self.public_dir / 'asset_manifest.json'
+
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+
+        self.optimizer = SmartOptimizer(self.assets_dir)
+        self.optimizer.prepare_output_dirs()
+        self.manifest = self.load_manifest()
+
+        # rel path -> (signature, time the signature was first seen)
+        self.pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        self.running: Dict[str, Future] = {}
+        # Audio sources left alone because ffmpeg is missing (reported once each)
+        self.skipped: set = set()
+
+    # ------------------------------------------------------------------
+    # Sources and manifest
+    # ------------------------------------------------------------------
+
+    def discover_sources(self) -> Dict[str, Path]:
+        """Source files the pipeline owns, keyed by path relative to public/assets"""
+        sources = {}
+        patterns = [(self.assets_dir, '*.png'), (self.assets_dir, '*.wav'),
+                    (self.transmissions_dir, '*.wav')]
+        for directory, pattern in patterns:
+            if not directory.exists():
+                continue
+            for path in directory.glob(pattern):
+                if path.name.startswith('.'):
+                    continue
+                sources[path.relative_to(self.assets_dir).as_posix()] = path
+        return sources
+
+    @staticmethod
+    def signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load_manifest(self) -> dict:
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path) as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == MANIFEST_VERSION:
+                    return manifest
+            except (OSError, ValueError):
+                print(f" Ignoring unreadable manifest: {self.manifest_path}")
+        return {'version': MANIFEST_VERSION, 'updated': None, 'assets': {}}
+
+    def save_manifest(self):
+        self.manifest['updated'] = datetime.now().isoformat()
+        write_text_atomic(self.manifest_path, json.dumps(self.manifest, indent=2))
+
+    def can_process(self, rel: str, path: Path) -> bool:
+        """Audio needs ffmpeg; without it the source is skipped, like smart_optimize_clean.py does"""
+        if path.suffix.lower() == '.png' or self.optimizer.tools['ffmpeg']:
+            return True
+        if rel not in self.skipped:
+            self.skipped.add(rel)
+            print(f"  - {rel} skipped (ffmpeg not installed)")
+        return False
+
+    def is_stale(self, rel: str, path: Path) -> bool:
+        entry = self.manifest['assets'].get(rel)
+        if entry is None:
+            return True
+        sig = self.signature(path)
+        if sig is None:
+            return False
+        if [sig[0], sig[1]] == [entry.get('mtime_ns'), entry.get('size')]:
+            return False
+        if file_sha1(path) != entry.get('sha1'):
+            return True
+        # Touched but identical content: remember the new stat so we don't rehash
+        entry['mtime_ns'], entry['size'] = sig
+        return False
+
+    # ------------------------------------------------------------------
+    # Processing (runs on worker threads)
+    # ------------------------------------------------------------------
+
+    def output_targets(self, rel: str, source: Path) -> List[Path]:
+        """Final output paths derived from one source"""
+        if source.suffix.lower() == '.png':
+            return [self.optimizer.optimized_dir / source.name,
+                    self.optimizer.optimized_resize_dir / source.name]
+        category, quality = self.audio_settings(rel, source)
+        audio_name = source.with_suffix(self.optimizer.audio_suffix(category, quality)).name
+        if rel.startswith('transmissions/'):
+            return [self.transmissions_dir / audio_name]
+        return [self.optimizer.optimized_dir / audio_name,
+                self.optimizer.optimized_resize_dir / audio_name]
+
+    def audio_settings(self, rel: str, source: Path) -> Tuple[str, Optional[str]]:
+        """Codec category and Vorbis quality override for one audio source"""
+        if rel.startswith('transmissions/'):
+            chosen = 'transmission' in self.optimizer.audio_codecs
+            return 'transmission', None if chosen else TRANSMISSION_QUALITY
+        return self.optimizer.detect_audio_category(source.name), None
+
+    @staticmethod
+    def publish(staged: Path, target: Path, keep: bool = False):
+        """
+        Move a staged output into place with an atomic rename. Staging lives
+        under public/, so the rename never crosses filesystems. With keep=True
+        the staged file is copied first so it can be published again.
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if keep:
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f'.{target.name}.', suffix='.tmp')
+            os.close(fd)
+            shutil.copy2(staged, tmp_name)
+            os.chmod(tmp_name, 0o644)
+            staged = Path(tmp_name)
+        os.replace(staged, target)
+
+    def process_asset(self, rel: str, source: Path) -> dict:
+        """Rebuild every output of one source and return its manifest entry"""
+        sha1 = file_sha1(source)
+        sig = self.signature(source)
+        targets = self.output_targets(rel, source)
+        staging = Path(tempfile.mkdtemp(dir=targets[0].parent, prefix='.watch-'))
+        stats = {}
+
+        try:
+            if source.suffix.lower() == '.png':
+                staged_same = staging / 'same' / source.name
+                staged_resized = staging / 'resized' / source.name
+                staged_same.parent.mkdir()
+                staged_resized.parent.mkdir()
+                decoded = self.optimizer.decode_png(source)
+                same = self.optimizer.optimize_png_same_size(decoded, staged_same)
+                resized = self.optimizer.optimize_png_smart_resize(decoded, staged_resized)
+                decoded.close()
+                stats = {
+                    'type': self.optimizer.detect_content_type(source.name),
+                    'optimized_size': same['optimized_size'],
+                    'optimized_resize_size': resized['optimized_size'],
+                    'dimensions': resized.get('original_dimensions'),
+                    'new_dimensions': resized.get('new_dimensions'),
+                    'compression': same.get('compression'),
+                    'resize_compression': resized.get('compression'),
+                    'decodes': decoded.decodes,
+                    'pipe_decodes': decoded.pipe_decodes
+                }
+                self.publish(staged_same, targets[0])
+                self.publish(staged_resized, targets[1])
+            else:
+                category, quality = self.audio_settings(rel, source)
+                audio = self.optimizer.optimize_audio(source, staging, quality, category)
+                if audio.get('codec') == 'copy':
+                    raise RuntimeError('audio encode failed, outputs left as they were')
+                staged = staging / audio['output']
+                stats = {'type': 'audio', 'codec': audio.get('codec'), 'optimized_size': audio['optimized_size']}
+                # Encode once, publish to every output directory
+                for target in targets[1:]:
+                    self.publish(staged, target, keep=True)
+                self.publish(staged, targets[0])
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        return {
+            'sha1': sha1,
+            'mtime_ns': sig[0] if sig else None,
+            'size': sig[1] if sig else None,
+            'original_size': sig[1] if sig else None,
+            'outputs': {t.relative_to(self.public_dir).as_posix(): t.stat().st_size for t in targets},
+            'stats': stats,
+            'processed': datetime.now().isoformat()
+        }
+
+    def remove_asset(self, rel: str):
+        entry = self.manifest['assets'].pop(rel, None)
+        if not entry:
+            return
+        for output in entry.get('outputs', {}):
+            path = self.public_dir / output
+            if path.exists():
+                path.unlink()
+        print(f"  - {rel} removed ({len(entry.get('outputs', {}))} outputs deleted)")
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def submit(self, pool: ThreadPoolExecutor, rel: str, source: Path):
+        print(f"  ~ {rel} queued")
+        self.running[rel] = pool.submit(self.process_asset, rel, source)
+
+    def collect(self) -> bool:
+        """Fold finished jobs into the manifest; returns True if anything changed"""
+        changed = False
+        for rel, future in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[rel]
+            try:
+                entry = future.result()
+            except Exception as e:
+                print(f"  ! {rel} failed: {e}")
+                continue
+            # A codec change renames outputs; drop the ones this run no longer produces
+            previous = self.manifest['assets'].get(rel, {})
+            for output in set(previous.get('outputs', {})) - set(entry['outputs']):
+                stale = self.public_dir / output
+                if stale.exists():
+                    stale.unlink()
+            self.manifest['assets'][rel] = entry
+            outputs = ', '.join(entry['outputs'])
+            print(f"  + {rel} -> {outputs}")
+            changed = True
+        return changed
+
+    def scan(self, pool: ThreadPoolExecutor, now: float) -> bool:
+        """Detect changes, debounce them and dispatch ready work"""
+        changed = False
+        sources = self.discover_sources()
+
+        for rel in list(self.manifest['assets']):
+            if rel not in sources and rel not in self.running:
+                self.remove_asset(rel)
+                self.pending.pop(rel, None)
+                changed = True
+
+        for rel, path in sources.items():
+            if rel in self.running or not self.can_process(rel, path):
+                continue
+            sig = self.signature(path)
+            if sig is None:
+                continue
+            pending = self.pending.get(rel)
+            if pending is None or pending[0] != sig:
+                # New or still changing: restart the debounce window
+                if pending is not None or self.is_stale(rel, path):
+                    self.pending[rel] = (sig, now)
+                continue
+            if now - pending[1] >= self.debounce:
+                del self.pending[rel]
+                if self.is_stale(rel, path):
+                    self.submit(pool, rel, path)
+
+        return changed
+
+    def sync_once(self):
+        """Bring every output up to date and exit (incremental build)"""
+        sources = self.discover_sources()
+        for rel in list(self.manifest['assets']):
+            if rel not in sources:
+                self.remove_asset(rel)
+
+        stale = {rel: path for rel, path in sources.items()
+                 if self.can_process(rel, path) and self.is_stale(rel, path)}
+        print(f"\n {len(stale)} of {len(sources)} sources need processing")
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for rel, path in sorted(stale.items()):
+                self.submit(pool, rel, path)
+        self.collect()
+        self.save_manifest()
+
+    def run(self):
+        print("\n" + "=" * 70)
+        print("TERROR IN THE JUNGLE - ASSET WATCH MODE")
+        print("=" * 70)
+
+        if not self.optimizer.check_dependencies():
+            print("\n Continuing without the missing tools (PNGs use the built-in recompressor, "
+                  "audio is skipped without ffmpeg)")
+
+        print(f"\n Watching {self.assets_dir} and {self.transmissions_dir}")
+        print(f" Manifest: {self.manifest_path}")
+        print(f" Workers: {self.workers}, poll {self.poll_interval}s, debounce {self.debounce}s")
+        print(" Press Ctrl-C to stop\n")
+
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+                changed = self.collect()
+                changed = self.scan(pool, time.monotonic()) or changed
+                if changed:
+                    self.save_manifest()
+                time.sleep(self.poll_interval)
+        except KeyboardInterrupt:
+            print("\n Stopping watcher, waiting for running jobs...")
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            if self.collect():
+                self.save_manifest()
+
+
+def main():
+    script_dir = Path(__file__).parent
+    project_root = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Watch public/assets and reprocess changed sources')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help='Worker threads')
+    parser.add_argument('--poll', type=float, default=0.2, help='Polling interval in seconds')
+    parser.add_argument('--debounce', type=float, default=0.3,
+                        help='Seconds a file must stay unchanged before it is processed')
+    parser.add_argument('--once', action='store_true', help='Process stale sources once and exit')
+    args = parser.parse_args()
+
+    if not (project_root / 'public' / 'assets').exists():
+        print(f" Assets directory not found: {project_root / 'public' / 'assets'}")
+        sys.exit(1)
+
+    watcher = AssetWatcher(project_root, args.workers, args.poll, args.debounce)
+    if args.once:
+        watcher.sync_once()
+    else:
+        watcher.run()
+
+
+if __name__ == "__main__":
+    main()
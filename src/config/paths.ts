@@ -6,6 +6,41 @@ export function getAssetPath(filename: string): string {
   return `./assets/${filename}`;
 }
 
+export function getPackPath(packName: string): string {
+  // Asset packs built by scripts/pack_assets.py live next to the assets folder
+  return `./packs/${packName}.pack`;
+}
+
+export function getPackManifestPath(): string {
+  // Which pack holds each asset, written alongside the packs
+  return './packs/packs.json';
+}
+
+export function getLoadPlanPath(): string {
+  // Prioritized load order with LQIP placeholders, built by scripts/build_load_plan.py
+  return './load_plan.json';
+}
+
+export function getSpawnTablePath(): string {
+  // Ranked spawn candidates per game mode zone, built by scripts/bake_spawn_tables.py
+  return './spawn_tables.json';
+}
+
+export function getPrefetchManifestPath(): string {
+  // Per-arrival chunk and asset prefetch lists, built by scripts/build_prefetch_manifest.py
+  return './prefetch_manifest.json';
+}
+
+export function getIndexedPath(filename: string): string {
+  // Palette-indexed sprites and palettes built by scripts/palettize_textures.py
+  return `./indexed/${filename}`;
+}
+
+export function getTerrainPath(filename: string): string {
+  // Baked terrain LOD meshes built by scripts/bake_terrain_lods.py
+  return `./terrain/${filename}`;
+}
+
 export function getBasePath(): string {
   // This will be replaced by Vite with the correct base path
   return import.meta.env.BASE_URL || '/';
@@ -0,0 +1,238 @@
+// Frame-time telemetry capture, analyzed offline by scripts/analyze_frame_telemetry.py.
+//
+// Binary layout (little endian):
+//   'TIJT' magic, u16 version, u32 header length, UTF-8 JSON header
+//   then one fixed-size record per frame:
+//     f64 time_ms     ms since capture start
+//     f32 frame_ms    frame interval (clock delta)
+//     f32 update_ms   SandboxSystemManager.updateSystems, including untimed input/VR HUD work
+//     f32 render_ms   everything after the update: skybox, render, weapon overlay
+//     f32 heap_mb     performance.memory.usedJSHeapSize, NaN where unsupported
+//     u16 combatants  live combatants
+//     u16 flags       FRAME_FLAG_*
+//     f32 system_ms[] one per entry in header.systems
+// NDJSON uses the same header as the first line and one object per frame.
+
+export const TELEMETRY_MAGIC = 'TIJT';
+export const TELEMETRY_VERSION = 1;
+
+export const FRAME_FLAG_GC_SUSPECT = 1;   // heap shrank since the previous frame
+export const FRAME_FLAG_VR = 2;           // XR session presenting
+export const FRAME_FLAG_STALL = 4;        // long frame mostly outside measured work
+
+export type TelemetryFormat = 'binary' | 'ndjson';
+
+const RECORD_FIXED_BYTES = 8 + 4 * 4 + 2 + 2;
+const RECORDS_PER_BLOCK = 4096;
+const ROLLING_FRAMES = 120;
+const GC_DROP_BYTES = 1024 * 1024;
+
+interface MemoryInfo {
+  usedJSHeapSize: number;
+}
+
+export class FrameTelemetry {
+  private systemNames: string[] = [];
+  private systemTimes = new Float32Array(0);
+  private recordBytes = RECORD_FIXED_BYTES;
+
+  // Capture storage: fixed blocks so recording never reallocates mid-session
+  private blocks: ArrayBuffer[] = [];
+  private view?: DataView;
+  private recordsInBlock = 0;
+  private frameCount = 0;
+  private capturing = false;
+  private captureStart = 0;
+  private metadata: Record<string, unknown> = {};
+
+  private frameStart = 0;
+  private updateEnd = 0;
+  private frameMs = 0;
+  private previousHeap = 0;
+
+  // Always-on rolling window for the F1 stats readout
+  private rolling = new Float32Array(ROLLING_FRAMES);
+  private rollingSorted = new Float32Array(ROLLING_FRAMES);
+  private rollingCount = 0;
+  private rollingIndex = 0;
+
+  setSystems(names: string[]): void {
+    this.systemNames = names.slice();
+    this.systemTimes = new Float32Array(names.length);
+    this.recordBytes = RECORD_FIXED_BYTES + 4 * names.length;
+  }
+
+  isCapturing(): boolean {
+    return this.capturing;
+  }
+
+  getFrameCount(): number {
+    return this.frameCount;
+  }
+
+  start(metadata: Record<string, unknown> = {}): void {
+    this.blocks = [];
+    this.view = undefined;
+    this.recordsInBlock = RECORDS_PER_BLOCK;
+    this.frameCount = 0;
+    this.metadata = metadata;
+    this.captureStart = performance.now();
+    this.previousHeap = this.readHeap();
+    this.capturing = true;
+  }
+
+  stop(): void {
+    this.capturing = false;
+  }
+
+  beginFrame(deltaTime: number): void {
+    this.frameStart = performance.now();
+    this.frameMs = deltaTime * 1000;
+    this.systemTimes.fill(0);
+
+    this.rolling[this.rollingIndex] = this.frameMs;
+    this.rollingIndex = (this.rollingIndex + 1) % ROLLING_FRAMES;
+    this.rollingCount = Math.min(this.rollingCount + 1, ROLLING_FRAMES);
+  }
+
+  recordSystem(index: number, ms: number): void {
+    this.systemTimes[index] += ms;
+  }
+
+  markUpdateDone(): void {
+    this.updateEnd = performance.now();
+  }
+
+  endFrame(combatants: number, vrPresenting: boolean): void {
+    if (!this.capturing) return;
+
+    const now = performance.now();
+    const updateMs = this.updateEnd - this.frameStart;
+    const renderMs = now - this.updateEnd;
+    const heap = this.readHeap();
+
+    let flags = vrPresenting ? FRAME_FLAG_VR : 0;
+    if (this.previousHeap - heap > GC_DROP_BYTES) {
+      flags |= FRAME_FLAG_GC_SUSPECT;
+    }
+    if (updateMs + renderMs < 0.5 * this.frameMs && this.frameMs > 2 * this.getPercentile(0.5)) {
+      flags |= FRAME_FLAG_STALL;
+    }
+    this.previousHeap = heap;
+
+    if (this.recordsInBlock >= RECORDS_PER_BLOCK) {
+      const block = new ArrayBuffer(this.recordBytes * RECORDS_PER_BLOCK);
+      this.blocks.push(block);
+      this.view = new DataView(block);
+      this.recordsInBlock = 0;
+    }
+
+    const view = this.view!;
+    let offset = this.recordsInBlock * this.recordBytes;
+    view.setFloat64(offset, this.frameStart - this.captureStart, true);
+    view.setFloat32(offset + 8, this.frameMs, true);
+    view.setFloat32(offset + 12, updateMs, true);
+    view.setFloat32(offset + 16, renderMs, true);
+    view.setFloat32(offset + 20, heap > 0 ? heap / (1024 * 1024) : NaN, true);
+    view.setUint16(offset + 24, Math.min(combatants, 0xffff), true);
+    view.setUint16(offset + 26, flags, true);
+    offset += RECORD_FIXED_BYTES;
+    for (let i = 0; i < this.systemTimes.length; i++) {
+      view.setFloat32(offset + 4 * i, this.systemTimes[i], true);
+    }
+
+    this.recordsInBlock++;
+    this.frameCount++;
+  }
+
+  // Frame-time percentile (ms) over the last ROLLING_FRAMES frames
+  getPercentile(fraction: number): number {
+    if (this.rollingCount === 0) return 0;
+    const sorted = this.rollingSorted.subarray(0, this.rollingCount);
+    sorted.set(this.rolling.subarray(0, this.rollingCount));
+    sorted.sort();
+    return sorted[Math.min(this.rollingCount - 1, Math.floor(fraction * this.rollingCount))];
+  }
+
+  getAverageFps(): number {
+    if (this.rollingCount === 0) return 0;
+    let total = 0;
+    for (let i = 0; i < this.rollingCount; i++) {
+      total += this.rolling[i];
+    }
+    return total > 0 ? 1000 * this.rollingCount / total : 0;
+  }
+
+  export(format: TelemetryFormat = 'binary'): Blob {
+    const header = JSON.stringify({
+      format: 'tij-frame-telemetry',
+      version: TELEMETRY_VERSION,
+      created: new Date().toISOString(),
+      frames: this.frameCount,
+      systems: this.systemNames,
+      record_bytes: this.recordBytes,
+      user_agent: navigator.userAgent,
+      ...this.metadata
+    });
+
+    if (format === 'ndjson') {
+      return new Blob([header + '\n' + this.toNDJSON()], { type: 'application/x-ndjson' });
+    }
+
+    const headerBytes = new TextEncoder().encode(header);
+    const prefix = new DataView(new ArrayBuffer(10));
+    for (let i = 0; i < 4; i++) {
+      prefix.setUint8(i, TELEMETRY_MAGIC.charCodeAt(i));
+    }
+    prefix.setUint16(4, TELEMETRY_VERSION, true);
+    prefix.setUint32(6, headerBytes.length, true);
+
+    const parts: BlobPart[] = [prefix.buffer, headerBytes];
+    this.blocks.forEach((block, index) => {
+      const records = index === this.blocks.length - 1 ? this.recordsInBlock : RECORDS_PER_BLOCK;
+      parts.push(block.slice(0, records * this.recordBytes));
+    });
+    return new Blob(parts, { type: 'application/octet-stream' });
+  }
+
+  download(format: TelemetryFormat = 'binary'): void {
+    const stamp = new Date().toISOString().replace(/[:.]/g, '-');
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(this.export(format));
+    link.download = `frame-telemetry-${stamp}.${format === 'ndjson' ? 'ndjson' : 'tijt'}`;
+    link.click();
+    setTimeout(() => URL.revokeObjectURL(link.href), 1000);
+  }
+
+  private toNDJSON(): string {
+    const lines: string[] = [];
+    this.blocks.forEach((block, index) => {
+      const view = new DataView(block);
+      const records = index === this.blocks.length - 1 ? this.recordsInBlock : RECORDS_PER_BLOCK;
+      for (let r = 0; r < records; r++) {
+        const offset = r * this.recordBytes;
+        const heap = view.getFloat32(offset + 20, true);
+        const systems: number[] = [];
+        for (let i = 0; i < this.systemNames.length; i++) {
+          systems.push(view.getFloat32(offset + RECORD_FIXED_BYTES + 4 * i, true));
+        }
+        lines.push(JSON.stringify({
+          t: view.getFloat64(offset, true),
+          frame: view.getFloat32(offset + 8, true),
+          update: view.getFloat32(offset + 12, true),
+          render: view.getFloat32(offset + 16, true),
+          heap: Number.isNaN(heap) ? null : heap,
+          combatants: view.getUint16(offset + 24, true),
+          flags: view.getUint16(offset + 26, true),
+          systems
+        }));
+      }
+    });
+    return lines.join('\n') + (lines.length ? '\n' : '');
+  }
+
+  private readHeap(): number {
+    const memory = (performance as Performance & { memory?: MemoryInfo }).memory;
+    return memory ? memory.usedJSHeapSize : 0;
+  }
+}
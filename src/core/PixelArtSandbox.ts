@@ -4,6 +4,7 @@ import '../style.css';
 import { LoadingScreen } from '../ui/loading/LoadingScreen';
 import { SandboxSystemManager } from './SandboxSystemManager';
 import { SandboxRenderer } from './SandboxRenderer';
+import { FrameTelemetry, TelemetryFormat } from './FrameTelemetry';
 import { GameMode } from '../config/gameModes';
 
 export class PixelArtSandbox {
@@ -12,6 +13,10 @@ export class PixelArtSandbox {
   private systemManager: SandboxSystemManager;
 
   private clock = new THREE.Clock();
+  private telemetry = new FrameTelemetry();
+  // ?telemetry=ndjson exports captures as NDJSON instead of the binary format
+  private telemetryFormat: TelemetryFormat =
+    new URLSearchParams(window.location.search).get('telemetry') === 'ndjson' ? 'ndjson' : 'binary';
   private isInitialized = false;
   private gameStarted = false;
 
@@ -40,6 +45,8 @@ export class PixelArtSandbox {
     window.addEventListener('keydown', (event) => {
       if (event.key === 'F1') {
         this.togglePerformanceStats();
+      } else if (event.key === 'F2') {
+        this.toggleTelemetryCapture();
       } else if (event.key === 'p' || event.key === 'P') {
         this.togglePostProcessing();
       } else if (event.key === '[') {
@@ -85,6 +92,7 @@ export class PixelArtSandbox {
         (phase, progress) => this.loadingScreen.updateProgress(phase, progress),
         this.sandboxRenderer
       );
+      this.systemManager.setTelemetry(this.telemetry);
 
       // Phase 5: Final setup
       this.loadingScreen.updateProgress('entities', 0);
@@ -258,7 +266,9 @@ export class PixelArtSandbox {
     const combatStats = this.systemManager.combatantSystem.getCombatStats();
 
     console.log('📊 Performance Stats:');
-    console.log(`FPS: ${Math.round(1 / this.clock.getDelta())}`);
+    console.log(`FPS: ${Math.round(this.telemetry.getAverageFps())} ` +
+                `(p50 ${this.telemetry.getPercentile(0.5).toFixed(1)}ms, ` +
+                `p95 ${this.telemetry.getPercentile(0.95).toFixed(1)}ms over the last 120 frames)`);
     console.log(`Draw calls: ${perfStats.drawCalls}`);
     console.log(`Triangles: ${perfStats.triangles}`);
     console.log(`Fern instances: ${debugInfo.fernUsed || 0}/${this.systemManager.globalBillboardSystem.getInstanceCount('fern')}`);
@@ -270,6 +280,24 @@ export class PixelArtSandbox {
     console.log(`Chunks tracked: ${debugInfo.chunksTracked}`);
   }
 
+  private toggleTelemetryCapture(): void {
+    if (!this.gameStarted) return;
+
+    if (!this.telemetry.isCapturing()) {
+      this.telemetry.start({
+        game_mode: this.systemManager.gameModeManager.getCurrentConfig().id,
+        vr: this.sandboxRenderer.isVRPresenting(),
+        pixel_size: this.currentPixelSize
+      });
+      console.log('⏺️ Frame telemetry capture started (F2 to stop and download)');
+      return;
+    }
+
+    this.telemetry.stop();
+    console.log(`⏹️ Frame telemetry captured ${this.telemetry.getFrameCount()} frames`);
+    this.telemetry.download(this.telemetryFormat);
+  }
+
   private togglePostProcessing(): void {
     if (!this.gameStarted || !this.sandboxRenderer.postProcessing) return;
 
@@ -307,6 +335,7 @@ export class PixelArtSandbox {
 - Left Click: Fire
 - Right Click: Aim Down Sights
 - F1: Performance stats
+- F2: Start/stop frame telemetry capture
 - Escape: Release mouse lock
 
 Have fun!
@@ -322,9 +351,11 @@ Have fun!
     if (!this.isInitialized || !this.gameStarted) return;
 
     const deltaTime = this.clock.getDelta();
+    this.telemetry.beginFrame(deltaTime);
 
     // Update all systems
     this.systemManager.updateSystems(deltaTime);
+    this.telemetry.markUpdateDone();
 
     // Get the appropriate camera for VR or desktop mode
     // Use the camera from the CameraRig if available
@@ -356,6 +387,11 @@ Have fun!
     if (this.systemManager.firstPersonWeapon && !this.sandboxRenderer.isVRPresenting()) {
       this.systemManager.firstPersonWeapon.renderWeapon(this.sandboxRenderer.renderer);
     }
+
+    if (this.telemetry.isCapturing()) {
+      this.telemetry.endFrame(this.systemManager.combatantSystem.getCombatStats().total,
+                              this.sandboxRenderer.isVRPresenting());
+    }
   }
 
   public dispose(): void {
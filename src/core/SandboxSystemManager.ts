@@ -27,9 +27,11 @@ import { InputManager } from '../systems/input/InputManager';
 import { VRSystem } from '../systems/vr/VRSystem';
 import { VRHUDSystem } from '../systems/vr/VRHUDSystem';
 import { ModernPlayerController } from '../systems/player/ModernPlayerController';
+import { FrameTelemetry } from './FrameTelemetry';
 
 export class SandboxSystemManager {
   private systems: GameSystem[] = [];
+  private telemetry?: FrameTelemetry;
 
   // Game systems
   public assetLoader!: AssetLoader;
@@ -112,7 +114,7 @@ export class SandboxSystemManager {
 
     // Phase 2: Load textures
     onProgress('textures', 0);
-    await this.assetLoader.init();
+    await this.assetLoader.init(progress => onProgress('textures', progress));
     onProgress('textures', 1);
 
     // Phase 3: Load audio
@@ -406,11 +408,32 @@ export class SandboxSystemManager {
     }
 
     // Update all GameSystem implementations
-    for (const system of this.systems) {
-      system.update(deltaTime);
+    if (this.telemetry?.isCapturing()) {
+      for (let i = 0; i < this.systems.length; i++) {
+        const start = performance.now();
+        this.systems[i].update(deltaTime);
+        this.telemetry.recordSystem(i, performance.now() - start);
+      }
+    } else {
+      for (const system of this.systems) {
+        system.update(deltaTime);
+      }
     }
   }
 
+  setTelemetry(telemetry: FrameTelemetry): void {
+    this.telemetry = telemetry;
+    telemetry.setSystems(this.getSystemNames());
+  }
+
+  // Field name of each system in update order; class names don't survive minification
+  getSystemNames(): string[] {
+    const fields = this as unknown as Record<string, unknown>;
+    return this.systems.map((system, index) =>
+      Object.keys(fields).find(key => key !== 'systems' && fields[key] === system) || `system${index}`
+    );
+  }
+
   private handleVRHUDInput(): void {
     if (!this.vrHUDSystem || !this.vrSystem) return;
 
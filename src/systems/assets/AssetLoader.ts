@@ -1,15 +1,48 @@
 import * as THREE from 'three';
 import { AssetInfo, AssetCategory, GameSystem } from '../../types';
-import { getAssetPath } from '../../config/paths';
+import { getAssetPath, getLoadPlanPath } from '../../config/paths';
+import { AssetPackSet } from './AssetPack';
+
+// One entry of public/load_plan.json (see scripts/build_load_plan.py)
+interface LoadPlanEntry {
+  file: string;
+  tier: 'critical' | 'nearby' | 'deferred';
+  order: number;
+  bytes: number;
+  placeholder?: string;
+}
 
 export class AssetLoader implements GameSystem {
   private assets: Map<string, AssetInfo> = new Map();
   private textureLoader = new THREE.TextureLoader();
   private loadedTextures: Map<string, THREE.Texture> = new Map();
+  private loadPlan: Map<string, LoadPlanEntry> = new Map();
+  private packs?: AssetPackSet;
+  private initPromise?: Promise<void>;
+  private streamingPromise: Promise<void> = Promise.resolve();
+  private streamQueue: AssetInfo[] = [];
+
+  // Full-resolution textures streamed in parallel after startup
+  private readonly STREAM_CONCURRENCY = 4;
+
+  init(onProgress?: (progress: number) => void): Promise<void> {
+    // SandboxSystemManager initializes us early and again with every other system
+    if (!this.initPromise) {
+      this.initPromise = this.load(onProgress);
+    }
+    return this.initPromise;
+  }
 
-  async init(): Promise<void> {
+  private async load(onProgress?: (progress: number) => void): Promise<void> {
     await this.discoverAssets();
-    await this.loadTextures();
+    await this.fetchLoadPlan();
+    this.packs = await AssetPackSet.load();
+    await this.loadTextures(onProgress);
+  }
+
+  // Resolves once every placeholder has been replaced by its full texture
+  whenFullyLoaded(): Promise<void> {
+    return this.streamingPromise;
   }
 
   update(deltaTime: number): void {
@@ -95,31 +128,133 @@ export class AssetLoader implements GameSystem {
     return AssetCategory.UNKNOWN;
   }
 
-  private async loadTextures(): Promise<void> {
-    const loadPromises = Array.from(this.assets.values()).map(async (asset) => {
-      try {
-        const texture = await this.loadTexture(asset.path);
-        
-        // Configure for pixel-perfect rendering
-        texture.magFilter = THREE.NearestFilter;
-        texture.minFilter = THREE.NearestFilter;
-        texture.wrapS = THREE.RepeatWrapping;
-        texture.wrapT = THREE.RepeatWrapping;
-        // Note: flipY will be handled by PixelPerfectUtils.configureTexture()
-        // Downscale extremely large textures to avoid GPU memory exhaustion
-        const resized = this.downscaleIfNeeded(asset.name, texture);
-        const finalTexture = resized || texture;
+  private async fetchLoadPlan(): Promise<void> {
+    try {
+      const response = await fetch(getLoadPlanPath());
+      if (!response.ok) return;
+      const plan = await response.json();
+      for (const entry of plan.assets as LoadPlanEntry[]) {
+        this.loadPlan.set(entry.file, entry);
+      }
+      console.log(`Using load plan with ${this.loadPlan.size} entries`);
+    } catch (error) {
+      console.warn('No load plan available, loading all textures up front', error);
+    }
+  }
+
+  private planEntryFor(asset: AssetInfo): LoadPlanEntry | undefined {
+    const file = asset.path.split('/').pop() || '';
+    return this.loadPlan.get(file);
+  }
+
+  private async loadTextures(onProgress?: (progress: number) => void): Promise<void> {
+    const assets = Array.from(this.assets.values());
+
+    if (this.loadPlan.size === 0) {
+      await Promise.all(assets.map(asset => this.loadFullTexture(asset)));
+      onProgress?.(1);
+      return;
+    }
+
+    const ordered = assets
+      .map(asset => ({ asset, entry: this.planEntryFor(asset) }))
+      .sort((a, b) => (a.entry?.order ?? Infinity) - (b.entry?.order ?? Infinity));
+
+    // Critical textures (and anything without a placeholder) block startup
+    const blocking = ordered.filter(({ entry }) => !entry?.placeholder || entry.tier === 'critical');
+    const progressive = ordered.filter(({ entry }) => entry?.placeholder && entry.tier !== 'critical');
+
+    const totalBytes = blocking.reduce((sum, { entry }) => sum + (entry?.bytes ?? 0), 0);
+    let loadedBytes = 0;
+    await Promise.all(blocking.map(async ({ asset, entry }) => {
+      await this.loadFullTexture(asset);
+      loadedBytes += entry?.bytes ?? 0;
+      if (totalBytes > 0) onProgress?.(loadedBytes / totalBytes);
+    }));
+
+    await Promise.all(progressive.map(({ asset, entry }) => this.loadPlaceholder(asset, entry!.placeholder!)));
+    onProgress?.(1);
+
+    console.log(`Startup textures ready (${(totalBytes / (1024 * 1024)).toFixed(2)} MB), ` +
+      `streaming ${progressive.length} full-resolution textures`);
+    this.streamQueue = progressive.map(({ asset }) => asset);
+    this.streamingPromise = this.streamTextures();
+  }
 
+  private async streamTextures(): Promise<void> {
+    const worker = async () => {
+      let asset: AssetInfo | undefined;
+      while ((asset = this.streamQueue.shift())) {
+        await this.loadFullTexture(asset);
+      }
+    };
+    const workerCount = Math.min(this.STREAM_CONCURRENCY, this.streamQueue.length);
+    await Promise.all(Array.from({ length: workerCount }, () => worker()));
+    console.log('All full-resolution textures loaded');
+  }
+
+  /**
+   * Move still-streaming textures to the front of the queue, in the given
+   * order. Used to warm what a respawn destination needs during the countdown.
+   */
+  prioritizeTextures(names: string[]): void {
+    const wanted = names
+      .map(name => this.streamQueue.find(asset => asset.name === name))
+      .filter((asset): asset is AssetInfo => asset !== undefined);
+    if (wanted.length === 0) return;
+    this.streamQueue = [...wanted, ...this.streamQueue.filter(asset => !wanted.includes(asset))];
+  }
+
+  private configureTexture(texture: THREE.Texture): void {
+    // Configure for pixel-perfect rendering
+    texture.magFilter = THREE.NearestFilter;
+    texture.minFilter = THREE.NearestFilter;
+    texture.wrapS = THREE.RepeatWrapping;
+    texture.wrapT = THREE.RepeatWrapping;
+    // Note: flipY will be handled by PixelPerfectUtils.configureTexture()
+  }
+
+  private async loadPlaceholder(asset: AssetInfo, dataUri: string): Promise<void> {
+    try {
+      const texture = await this.loadTexture(dataUri);
+      this.configureTexture(texture);
+      // Blurred LQIPs read better filtered than as 16px nearest-neighbour blocks
+      texture.magFilter = THREE.LinearFilter;
+      texture.minFilter = THREE.LinearFilter;
+      asset.texture = texture;
+      this.loadedTextures.set(asset.name, texture);
+    } catch (error) {
+      console.warn(`Failed to decode placeholder for ${asset.name}`, error);
+    }
+  }
+
+  private async loadFullTexture(asset: AssetInfo): Promise<void> {
+    try {
+      const texture = await this.loadTexture(asset.path);
+      this.configureTexture(texture);
+      // Downscale extremely large textures to avoid GPU memory exhaustion
+      const resized = this.downscaleIfNeeded(asset.name, texture);
+      const finalTexture = resized || texture;
+
+      const placeholder = this.loadedTextures.get(asset.name);
+      if (placeholder) {
+        // Swap the image into the texture materials already hold. Disposing first
+        // drops the GPU allocation, which was sized for the placeholder.
+        placeholder.dispose();
+        placeholder.image = finalTexture.image;
+        placeholder.magFilter = THREE.NearestFilter;
+        placeholder.minFilter = THREE.NearestFilter;
+        placeholder.needsUpdate = true;
+        finalTexture.dispose();
+      } else {
         asset.texture = finalTexture;
         this.loadedTextures.set(asset.name, finalTexture);
-
-        console.log(`Loaded texture: ${asset.name} (${finalTexture.image.width}x${finalTexture.image.height})`);
-      } catch (error) {
-        console.warn(`Failed to load texture: ${asset.path}`, error);
       }
-    });
 
-    await Promise.all(loadPromises);
+      console.log(`Loaded texture: ${asset.name} (${finalTexture.image.width}x${finalTexture.image.height})`);
+    } catch (error) {
+      console.warn(`Failed to load texture: ${asset.path}`, error);
+    }
   }
 
   // Heuristically clamp texture size by asset type to keep WebGL stable
@@ -162,7 +297,24 @@ export class AssetLoader implements GameSystem {
     }
   }
 
-  private loadTexture(path: string): Promise<THREE.Texture> {
+  private async loadTexture(path: string): Promise<THREE.Texture> {
+    if (this.packs?.has(path)) {
+      try {
+        // One request per category pack instead of one per texture
+        const url = URL.createObjectURL(await this.packs.getBlob(path));
+        try {
+          return await this.loadTextureUrl(url);
+        } finally {
+          URL.revokeObjectURL(url);
+        }
+      } catch (error) {
+        console.warn(`Failed to load ${path} from its pack, fetching it directly`, error);
+      }
+    }
+    return this.loadTextureUrl(path);
+  }
+
+  private loadTextureUrl(path: string): Promise<THREE.Texture> {
     return new Promise((resolve, reject) => {
       this.textureLoader.load(
         path,
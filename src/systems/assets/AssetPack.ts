@@ -0,0 +1,197 @@
+import { getPackManifestPath, getPackPath } from '../../config/paths';
+
+// Reader for the category packs written by scripts/pack_assets.py.
+// Layout: 16-byte header ('TJPK', version, alignment, index length, data offset),
+// a JSON index, then every entry at an aligned absolute offset.
+
+export interface AssetPackEntry {
+  name: string;
+  offset: number;
+  length: number;
+  mime: string;
+  sha256: string;
+}
+
+const PACK_MAGIC = 'TJPK';
+const PACK_VERSION = 1;
+const HEADER_SIZE = 16;
+
+export class AssetPack {
+  readonly name: string;
+  readonly url: string;
+  private entries: Map<string, AssetPackEntry> = new Map();
+  private buffer?: ArrayBuffer;
+
+  private constructor(name: string, url: string, entries: AssetPackEntry[], buffer?: ArrayBuffer) {
+    this.name = name;
+    this.url = url;
+    this.buffer = buffer;
+    entries.forEach(entry => this.entries.set(entry.name, entry));
+  }
+
+  // Fetch a whole pack in one request
+  static async load(packName: string): Promise<AssetPack> {
+    const url = getPackPath(packName);
+    const response = await fetch(url);
+    if (!response.ok) {
+      throw new Error(`Failed to fetch pack ${url}: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+    const { name, entries } = AssetPack.parseIndex(buffer);
+    return new AssetPack(name, url, entries, buffer);
+  }
+
+  // Fetch only the header and index; entries are then pulled with Range requests
+  static async loadIndex(packName: string): Promise<AssetPack> {
+    const url = getPackPath(packName);
+    const head = await AssetPack.fetchRange(url, 0, HEADER_SIZE);
+    const indexLength = new DataView(head).getUint32(8, true);
+    const headerAndIndex = await AssetPack.fetchRange(url, 0, HEADER_SIZE + indexLength);
+    const { name, entries } = AssetPack.parseIndex(headerAndIndex);
+    return new AssetPack(name, url, entries);
+  }
+
+  private static async fetchRange(url: string, start: number, length: number): Promise<ArrayBuffer> {
+    const response = await fetch(url, { headers: { Range: `bytes=${start}-${start + length - 1}` } });
+    if (!response.ok) {
+      throw new Error(`Failed to fetch ${url} [${start}, +${length}]: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+    // A server without Range support returns the whole file
+    return response.status === 206 ? buffer : buffer.slice(start, start + length);
+  }
+
+  private static parseIndex(buffer: ArrayBuffer): { name: string; entries: AssetPackEntry[] } {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== PACK_MAGIC) {
+      throw new Error(`Not an asset pack (magic ${magic})`);
+    }
+    const version = view.getUint16(4, true);
+    if (version !== PACK_VERSION) {
+      throw new Error(`Unsupported asset pack version ${version}`);
+    }
+    const indexLength = view.getUint32(8, true);
+    const json = new TextDecoder().decode(new Uint8Array(buffer, HEADER_SIZE, indexLength));
+    const index = JSON.parse(json);
+    return { name: index.pack, entries: index.entries };
+  }
+
+  has(name: string): boolean {
+    return this.entries.has(name);
+  }
+
+  getEntry(name: string): AssetPackEntry | undefined {
+    return this.entries.get(name);
+  }
+
+  getEntries(): AssetPackEntry[] {
+    return Array.from(this.entries.values());
+  }
+
+  // Zero-copy view into the downloaded pack (only for packs fetched with load())
+  getView(name: string): Uint8Array<ArrayBuffer> | undefined {
+    const entry = this.entries.get(name);
+    if (!entry || !this.buffer) return undefined;
+    return new Uint8Array(this.buffer, entry.offset, entry.length);
+  }
+
+  // Bytes of one entry, using the resident buffer or a Range request
+  async fetchEntry(name: string): Promise<Uint8Array<ArrayBuffer>> {
+    const view = this.getView(name);
+    if (view) return view;
+    const entry = this.entries.get(name);
+    if (!entry) {
+      throw new Error(`Asset ${name} not found in pack ${this.name}`);
+    }
+    return new Uint8Array(await AssetPack.fetchRange(this.url, entry.offset, entry.length));
+  }
+
+  // Blob for texture decoding (createImageBitmap / object URLs)
+  async getBlob(name: string): Promise<Blob> {
+    const entry = this.entries.get(name);
+    if (!entry) {
+      throw new Error(`Asset ${name} not found in pack ${this.name}`);
+    }
+    return new Blob([await this.fetchEntry(name)], { type: entry.mime });
+  }
+
+  // decodeAudioData detaches its input, so audio gets its own copy of the bytes
+  async getAudioData(name: string): Promise<ArrayBuffer> {
+    const bytes = await this.fetchEntry(name);
+    return bytes.slice().buffer;
+  }
+
+  dispose(): void {
+    this.buffer = undefined;
+    this.entries.clear();
+  }
+}
+
+// Entry names in a pack are relative to public/assets
+export function getPackEntryName(path: string): string {
+  return path.replace(/^.*?assets\//, '');
+}
+
+/**
+ * Every pack listed in packs/packs.json. A pack is downloaded in one request
+ * the first time one of its assets is asked for, and shared by every loader.
+ */
+export class AssetPackSet {
+  private static shared?: Promise<AssetPackSet | undefined>;
+  private packForAsset: Map<string, string> = new Map();
+  private packs: Map<string, Promise<AssetPack>> = new Map();
+
+  private constructor(manifest: { packs: { name: string; assets: string[] }[] }) {
+    for (const pack of manifest.packs) {
+      pack.assets.forEach(asset => this.packForAsset.set(asset, pack.name));
+    }
+  }
+
+  // Undefined when no packs were built; callers then load files individually
+  static load(): Promise<AssetPackSet | undefined> {
+    if (!AssetPackSet.shared) {
+      AssetPackSet.shared = AssetPackSet.fetchManifest();
+    }
+    return AssetPackSet.shared;
+  }
+
+  private static async fetchManifest(): Promise<AssetPackSet | undefined> {
+    try {
+      const response = await fetch(getPackManifestPath());
+      if (!response.ok) return undefined;
+      const manifest = await response.json();
+      console.log(`📦 Using ${manifest.packs.length} asset packs`);
+      return new AssetPackSet(manifest);
+    } catch (error) {
+      return undefined;
+    }
+  }
+
+  has(path: string): boolean {
+    return this.packForAsset.has(getPackEntryName(path));
+  }
+
+  private getPack(path: string): Promise<AssetPack> {
+    const packName = this.packForAsset.get(getPackEntryName(path));
+    if (!packName) {
+      return Promise.reject(new Error(`${path} is not in any asset pack`));
+    }
+    let pack = this.packs.get(packName);
+    if (!pack) {
+      pack = AssetPack.load(packName);
+      // Let a failed download be retried rather than cached
+      pack.catch(() => this.packs.delete(packName));
+      this.packs.set(packName, pack);
+    }
+    return pack;
+  }
+
+  async getBlob(path: string): Promise<Blob> {
+    return (await this.getPack(path)).getBlob(getPackEntryName(path));
+  }
+
+  async getAudioData(path: string): Promise<ArrayBuffer> {
+    return (await this.getPack(path)).getAudioData(getPackEntryName(path));
+  }
+}
@@ -0,0 +1,116 @@
+import * as THREE from 'three';
+import { getIndexedPath } from '../../config/paths';
+
+// Palette-indexed sprites written by scripts/palettize_textures.py: an 8-bit
+// index map per sprite plus a shared 256x1 palette per category. Index 0 is
+// transparent. On the GPU this is R8 + a 1KB palette instead of RGBA8.
+
+interface PaletteSpriteEntry {
+  file: string;
+  width: number;
+  height: number;
+}
+
+interface PaletteCategoryEntry {
+  palette: string;
+  colors: number;
+  transparent_index: number;
+  sprites: { [name: string]: PaletteSpriteEntry };
+}
+
+interface PaletteManifest {
+  version: number;
+  palette_size: number;
+  categories: { [category: string]: PaletteCategoryEntry };
+}
+
+// Shader chunk: call paletteSample(indexMap, palette, uv) instead of texture2D(map, uv)
+export const PALETTE_SAMPLE_GLSL = `
+  vec4 paletteSample(sampler2D indexMap, sampler2D palette, vec2 uv) {
+    float index = floor(texture2D(indexMap, uv).r * 255.0 + 0.5);
+    return texture2D(palette, vec2((index + 0.5) / 256.0, 0.5));
+  }
+`;
+
+export class PaletteTextures {
+  private textureLoader = new THREE.TextureLoader();
+  private manifest?: PaletteManifest;
+  private palettes: Map<string, THREE.Texture> = new Map();
+  private indexMaps: Map<string, THREE.Texture> = new Map();
+  private spriteCategories: Map<string, string> = new Map();
+
+  // Returns false when no indexed export has been built
+  async init(): Promise<boolean> {
+    try {
+      const response = await fetch(getIndexedPath('palettes.json'));
+      if (!response.ok) return false;
+      this.manifest = await response.json() as PaletteManifest;
+    } catch (error) {
+      return false;
+    }
+
+    Object.entries(this.manifest.categories).forEach(([category, entry]) => {
+      Object.keys(entry.sprites).forEach(name => this.spriteCategories.set(name, category));
+    });
+    return true;
+  }
+
+  has(name: string): boolean {
+    return this.spriteCategories.has(name);
+  }
+
+  async getPalette(category: string): Promise<THREE.Texture | undefined> {
+    const entry = this.manifest?.categories[category];
+    if (!entry) return undefined;
+
+    let palette = this.palettes.get(category);
+    if (!palette) {
+      palette = await this.loadTexture(getIndexedPath(entry.palette));
+      this.configureLookup(palette);
+      this.palettes.set(category, palette);
+    }
+    return palette;
+  }
+
+  // Index map and its category palette for one sprite
+  async getSprite(name: string): Promise<{ indexMap: THREE.Texture; palette: THREE.Texture } | undefined> {
+    const category = this.spriteCategories.get(name);
+    if (!category || !this.manifest) return undefined;
+
+    const palette = await this.getPalette(category);
+    if (!palette) return undefined;
+
+    let indexMap = this.indexMaps.get(name);
+    if (!indexMap) {
+      const entry = this.manifest.categories[category].sprites[name];
+      indexMap = await this.loadTexture(getIndexedPath(entry.file));
+      this.configureLookup(indexMap);
+      // Grayscale PNG: keep only the red channel on the GPU (R8)
+      indexMap.format = THREE.RedFormat;
+      indexMap.wrapS = THREE.RepeatWrapping;
+      indexMap.wrapT = THREE.RepeatWrapping;
+      this.indexMaps.set(name, indexMap);
+    }
+    return { indexMap, palette };
+  }
+
+  // Indices must never be filtered or mipmapped: neighbours are unrelated colours
+  private configureLookup(texture: THREE.Texture): void {
+    texture.magFilter = THREE.NearestFilter;
+    texture.minFilter = THREE.NearestFilter;
+    texture.generateMipmaps = false;
+  }
+
+  private loadTexture(path: string): Promise<THREE.Texture> {
+    return new Promise((resolve, reject) => {
+      this.textureLoader.load(path, resolve, undefined, reject);
+    });
+  }
+
+  dispose(): void {
+    this.palettes.forEach(texture => texture.dispose());
+    this.indexMaps.forEach(texture => texture.dispose());
+    this.palettes.clear();
+    this.indexMaps.clear();
+  }
+}
@@ -1,6 +1,8 @@
 import * as THREE from 'three';
 import { GameSystem } from '../../types';
 import { AUDIO_POOL_SIZES, SOUND_CONFIGS, SoundConfig } from '../../config/audio';
+import { AmbienceStream, StreamingAmbience } from './StreamingAmbience';
+import { AssetPackSet } from '../assets/AssetPack';
 
 export class AudioManager implements GameSystem {
     private scene: THREE.Scene;
@@ -10,6 +12,7 @@ export class AudioManager implements GameSystem {
     // Audio buffers
     private audioBuffers: Map<string, AudioBuffer> = new Map();
     private audioLoader: THREE.AudioLoader;
+    private packs?: AssetPackSet;
 
     // Sound pools for frequently used sounds
     private playerGunshotPool: THREE.Audio[] = [];
@@ -21,6 +24,10 @@ export class AudioManager implements GameSystem {
     private ambientSounds: THREE.Audio[] = [];
     private currentAmbientTrack?: string;
 
+    // Segmented ambience tracks (streams/streams.json), keyed by file stem
+    private ambienceStreams: Map<string, AmbienceStream> = new Map();
+    private streamingAmbience?: StreamingAmbience;
+
     // Pool sizes
     private readonly GUNSHOT_POOL_SIZE = AUDIO_POOL_SIZES.gunshot;
     private readonly DEATH_POOL_SIZE = AUDIO_POOL_SIZES.death;
@@ -63,6 +70,12 @@ export class AudioManager implements GameSystem {
     async init(): Promise<void> {
         console.log('[AudioManager] Initializing audio system...');
 
+        // Streamed tracks are decoded a segment at a time instead of up front
+        this.ambienceStreams = await StreamingAmbience.loadIndex();
+
+        // Sounds in the audio pack arrive in one request instead of one per file
+        this.packs = await AssetPackSet.load();
+
         // Load all audio buffers
         await this.loadAllAudio();
 
@@ -77,7 +90,7 @@ export class AudioManager implements GameSystem {
 
     // Call this when the game actually starts
     public startAmbient(): void {
-        if (this.ambientSounds.length === 0) {
+        if (this.ambientSounds.length === 0 && !this.streamingAmbience?.isPlaying()) {
             this.startAmbientSounds();
         }
     }
@@ -86,13 +99,55 @@ export class AudioManager implements GameSystem {
         const loadPromises: Promise<void>[] = [];
 
         for (const [key, config] of Object.entries(this.soundConfigs)) {
+            if (this.getAmbienceStream(key)) continue;
             loadPromises.push(this.loadAudio(key, config.path));
         }
 
         await Promise.all(loadPromises);
     }
 
-    private loadAudio(key: string, path: string): Promise<void> {
+    private getAmbienceStream(key: string): AmbienceStream | undefined {
+        const config = this.soundConfigs[key];
+        if (!config) return undefined;
+        const stem = config.path.split('/').pop()!.replace(/\.[^.]+$/, '');
+        return this.ambienceStreams.get(stem);
+    }
+
+    // Stop streaming this codec and replay the track from its full file in SOUND_CONFIGS
+    private async fallBackFromStream(key: string, codec: string): Promise<void> {
+        for (const [name, stream] of this.ambienceStreams) {
+            if (stream.codec === codec) this.ambienceStreams.delete(name);
+        }
+        console.warn(`[AudioManager] ${codec} ambience streams failed to decode, using full tracks`);
+        const config = this.soundConfigs[key];
+        if (!config) return;
+        if (!this.audioBuffers.has(key)) {
+            try {
+                await this.loadAudio(key, config.path);
+            } catch (error) {
+                return;
+            }
+        }
+        // playNextAmbientTrack alternates, so point it back at this track
+        this.currentAmbientTrack = key === 'jungle1' ? 'jungle2' : 'jungle1';
+        this.playNextAmbientTrack();
+    }
+
+    private async loadAudio(key: string, path: string): Promise<void> {
+        if (this.packs?.has(path)) {
+            try {
+                const data = await this.packs.getAudioData(path);
+                this.audioBuffers.set(key, await this.listener.context.decodeAudioData(data));
+                console.log(`[AudioManager] Loaded: ${key} (pack)`);
+                return;
+            } catch (error) {
+                console.warn(`[AudioManager] Failed to load ${key} from its pack, fetching it directly`, error);
+            }
+        }
+        return this.loadAudioFile(key, path);
+    }
+
+    private loadAudioFile(key: string, path: string): Promise<void> {
         return new Promise((resolve, reject) => {
             this.audioLoader.load(
                 path,
@@ -193,12 +248,28 @@ export class AudioManager implements GameSystem {
             if (sound.isPlaying) sound.stop();
         });
         this.ambientSounds = [];
+        this.streamingAmbience?.stop();
 
         // Alternate between jungle1 and jungle2
         const currentTrack = this.currentAmbientTrack || 'jungle1';
         const nextTrack = currentTrack === 'jungle1' ? 'jungle2' : 'jungle1';
         this.currentAmbientTrack = nextTrack;
 
+        const stream = this.getAmbienceStream(nextTrack);
+        if (stream) {
+            if (!this.streamingAmbience) {
+                this.streamingAmbience = new StreamingAmbience(this.listener.context, this.listener.getInput());
+            }
+            // Same gap between tracks as the buffered path
+            this.streamingAmbience.onEnded = () => {
+                setTimeout(() => this.playNextAmbientTrack(), 2000);
+            };
+            // canPlayType can say yes and decodeAudioData still fail (Safari and WebM Opus)
+            this.streamingAmbience.onFailed = () => this.fallBackFromStream(nextTrack, stream.codec);
+            this.streamingAmbience.play(stream, this.soundConfigs[nextTrack].volume || 0.3);
+            return;
+        }
+
         const buffer = this.audioBuffers.get(nextTrack);
         if (!buffer) return;
 
@@ -318,6 +389,7 @@ export class AudioManager implements GameSystem {
         for (const sound of this.ambientSounds) {
             sound.setVolume(clampedVolume * (this.soundConfigs.jungle1.volume || 0.3));
         }
+        this.streamingAmbience?.setVolume(clampedVolume * (this.soundConfigs.jungle1.volume || 0.3));
     }
 
     // Mute/unmute all sounds
@@ -354,6 +426,9 @@ export class AudioManager implements GameSystem {
             if (sound.isPlaying) sound.stop();
         }
 
+        this.streamingAmbience?.dispose();
+        this.streamingAmbience = undefined;
+
         // Clear pools
         this.playerGunshotPool = [];
         this.positionalGunshotPool = [];
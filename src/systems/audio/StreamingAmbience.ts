@@ -0,0 +1,190 @@
+import { getAssetPath } from '../../config/paths';
+
+// Segmented ambience written by `scripts/audio_codecs.py segment`: each track is
+// a run of independently decodable segments plus an index. Only a couple of
+// segments are decoded at a time instead of minutes of PCM.
+
+export interface AmbienceSegment {
+  file: string;
+  start: number;
+  duration: number;
+  frames: number;
+  bytes: number;
+}
+
+export interface AmbienceStream {
+  codec: string;
+  mime: string;
+  sample_rate: number;
+  channels: number;
+  duration: number;
+  segment_seconds: number;
+  overlap_seconds: number;
+  segments: AmbienceSegment[];
+}
+
+interface StreamIndex {
+  version: number;
+  tracks: { [name: string]: AmbienceStream };
+}
+
+interface ScheduledSegment {
+  source: AudioBufferSourceNode;
+  gain: GainNode;
+}
+
+export class StreamingAmbience {
+  private context: AudioContext;
+  private output: GainNode;
+  private stream?: AmbienceStream;
+  private nextSegment = 0;
+  private nextStartTime = 0;
+  private scheduled: ScheduledSegment[] = [];
+  private fillTimer?: number;
+  private filling = false;
+  private playing = false;
+
+  onEnded?: () => void;
+  // A segment could not be fetched or decoded; without a handler the stream just ends
+  onFailed?: (error: unknown) => void;
+
+  // Decoded segments held at once: the one playing and the one queued behind it
+  private readonly LOOKAHEAD_SEGMENTS = 2;
+  private readonly FILL_INTERVAL_MS = 1000;
+  private readonly START_DELAY = 0.1;
+
+  constructor(context: AudioContext, destination: AudioNode) {
+    this.context = context;
+    this.output = context.createGain();
+    this.output.connect(destination);
+  }
+
+  // Streams this browser can decode, keyed by track name (source file stem)
+  static async loadIndex(): Promise<Map<string, AmbienceStream>> {
+    const streams = new Map<string, AmbienceStream>();
+    try {
+      const response = await fetch(getAssetPath('streams/streams.json'));
+      if (!response.ok) return streams;
+      const index = await response.json() as StreamIndex;
+      const probe = document.createElement('audio');
+      Object.entries(index.tracks).forEach(([name, stream]) => {
+        if (probe.canPlayType(stream.mime) !== '') {
+          streams.set(name, stream);
+        }
+      });
+    } catch (error) {
+      // No stream index: callers fall back to fully decoded buffers
+    }
+    return streams;
+  }
+
+  play(stream: AmbienceStream, volume: number): void {
+    this.stop();
+    this.stream = stream;
+    this.nextSegment = 0;
+    this.nextStartTime = this.context.currentTime + this.START_DELAY;
+    this.output.gain.value = volume;
+    this.playing = true;
+    this.fill();
+    this.fillTimer = window.setInterval(() => this.fill(), this.FILL_INTERVAL_MS);
+  }
+
+  setVolume(volume: number): void {
+    this.output.gain.value = volume;
+  }
+
+  isPlaying(): boolean {
+    return this.playing;
+  }
+
+  stop(): void {
+    this.playing = false;
+    if (this.fillTimer !== undefined) {
+      window.clearInterval(this.fillTimer);
+      this.fillTimer = undefined;
+    }
+    this.scheduled.forEach(({ source, gain }) => {
+      source.onended = null;
+      source.stop();
+      gain.disconnect();
+    });
+    this.scheduled = [];
+    this.stream = undefined;
+  }
+
+  dispose(): void {
+    this.stop();
+    this.output.disconnect();
+  }
+
+  private finish(): void {
+    if (!this.playing) return;
+    this.stop();
+    this.onEnded?.();
+  }
+
+  private async fill(): Promise<void> {
+    if (this.filling) return;
+    this.filling = true;
+    try {
+      while (this.playing && this.stream && this.nextSegment < this.stream.segments.length &&
+             this.scheduled.length < this.LOOKAHEAD_SEGMENTS) {
+        await this.scheduleSegment(this.stream, this.nextSegment++);
+      }
+    } catch (error) {
+      console.warn('[StreamingAmbience] Segment failed, stopping stream', error);
+      if (this.playing && this.onFailed) {
+        this.stop();
+        this.onFailed(error);
+      } else {
+        this.finish();
+      }
+    } finally {
+      this.filling = false;
+    }
+  }
+
+  private async scheduleSegment(stream: AmbienceStream, index: number): Promise<void> {
+    const segment = stream.segments[index];
+    const response = await fetch(getAssetPath(segment.file));
+    if (!response.ok) {
+      throw new Error(`Failed to fetch ${segment.file}: ${response.status}`);
+    }
+    const buffer = await this.context.decodeAudioData(await response.arrayBuffer());
+    if (!this.playing || this.stream !== stream) return;
+
+    const source = this.context.createBufferSource();
+    source.buffer = buffer;
+    const gain = this.context.createGain();
+    source.connect(gain);
+    gain.connect(this.output);
+
+    // Neighbouring segments share overlap_seconds of audio; crossfade across it
+    const start = Math.max(this.nextStartTime, this.context.currentTime);
+    const overlap = Math.min(stream.overlap_seconds, buffer.duration);
+    const isFirst = index === 0;
+    const isLast = index === stream.segments.length - 1;
+    gain.gain.setValueAtTime(isFirst ? 1 : 0, start);
+    if (!isFirst) {
+      gain.gain.linearRampToValueAtTime(1, start + overlap);
+    }
+    if (!isLast) {
+      gain.gain.setValueAtTime(1, start + segment.duration);
+      gain.gain.linearRampToValueAtTime(0, start + segment.duration + overlap);
+    }
+    source.start(start);
+    this.nextStartTime = start + segment.duration;
+
+    const entry: ScheduledSegment = { source, gain };
+    this.scheduled.push(entry);
+    source.onended = () => {
+      gain.disconnect();
+      this.scheduled = this.scheduled.filter(item => item !== entry);
+      if (isLast) {
+        this.finish();
+      } else {
+        this.fill();
+      }
+    };
+  }
+}
@@ -161,10 +161,12 @@ export class CombatantSystem implements GameSystem {
     } else {
       // Distribute squads evenly across HQs
       for (let i = 0; i < initialSquadsPerFaction; i++) {
-        const posUS = usHQs[i % usHQs.length].position.clone().add(this.randomSpawnOffset(20, 40));
-        const posOP = opforHQs[i % opforHQs.length].position.clone().add(this.randomSpawnOffset(20, 40));
-        this.spawnSquad(Faction.US, posUS, this.randomSquadSize());
-        this.spawnSquad(Faction.OPFOR, posOP, this.randomSquadSize());
+        const hqUS = usHQs[i % usHQs.length];
+        const hqOP = opforHQs[i % opforHQs.length];
+        const spawnUS = this.getSpawnNear(hqUS.id, hqUS.position, 20, 40);
+        const spawnOP = this.getSpawnNear(hqOP.id, hqOP.position, 20, 40);
+        this.spawnSquad(Faction.US, spawnUS.position, this.randomSquadSize(), spawnUS.slotHeights);
+        this.spawnSquad(Faction.OPFOR, spawnOP.position, this.randomSquadSize(), spawnOP.slotHeights);
       }
     }
 
@@ -207,8 +209,8 @@ export class CombatantSystem implements GameSystem {
     };
   }
 
-  private spawnSquad(faction: Faction, centerPos: THREE.Vector3, size: number): void {
-    const { squad, members } = this.squadManager.createSquad(faction, centerPos, size);
+  private spawnSquad(faction: Faction, centerPos: THREE.Vector3, size: number, slotHeights?: ArrayLike<number>): void {
+    const { squad, members } = this.squadManager.createSquad(faction, centerPos, size, slotHeights);
 
     // Add all squad members to our combatants map
     members.forEach(combatant => {
@@ -471,14 +473,14 @@ export class CombatantSystem implements GameSystem {
 
       for (let i = 0; i < squadsToSpawn; i++) {
         if (this.combatants.size >= this.MAX_COMBATANTS) break;
-        let pos: THREE.Vector3;
+        let spawn: { position: THREE.Vector3; slotHeights?: ArrayLike<number> };
         if (anchors.length > 0) {
           const anchor = anchors[(i + Math.floor(Math.random() * anchors.length)) % anchors.length];
-          pos = anchor.clone().add(this.randomSpawnOffset(20, 50));
+          spawn = this.getSpawnNear(anchor.id, anchor.position, 20, 50);
         } else {
-          pos = this.getSpawnPosition(faction);
+          spawn = { position: this.getSpawnPosition(faction) };
         }
-        this.spawnSquad(faction, pos, this.randomSquadSize());
+        this.spawnSquad(faction, spawn.position, this.randomSquadSize(), spawn.slotHeights);
         console.log(`🎖️ Refill spawn: ${faction} squad of ${this.randomSquadSize()} deployed (${living + (i+1)*avgSquadSize}/${targetPerFaction})`);
       }
     };
@@ -550,24 +552,39 @@ export class CombatantSystem implements GameSystem {
     for (let i = 0; i < maxSquadsThisWave; i++) {
       if (this.combatants.size >= this.MAX_COMBATANTS) break;
       const anchor = anchors[i % anchors.length];
-      const pos = anchor.clone().add(this.randomSpawnOffset(20, 50));
-      this.spawnSquad(faction, pos, this.randomSquadSize());
+      const spawn = this.getSpawnNear(anchor.id, anchor.position, 20, 50);
+      this.spawnSquad(faction, spawn.position, this.randomSquadSize(), spawn.slotHeights);
     }
   }
 
-  private getFactionAnchors(faction: Faction): THREE.Vector3[] {
+  private getFactionAnchors(faction: Faction): Array<{ id: string; position: THREE.Vector3 }> {
     if (!this.zoneManager) return [];
     const zones = this.zoneManager.getAllZones().filter(z => z.owner === faction);
-    const contested = zones.filter(z => !z.isHomeBase && z.state === ZoneState.CONTESTED).map(z => z.position);
-    const captured = zones.filter(z => !z.isHomeBase && z.state !== ZoneState.CONTESTED).map(z => z.position);
-    const hqs = zones.filter(z => z.isHomeBase).map(z => z.position);
+    const toAnchor = (z: { id: string; position: THREE.Vector3 }) => ({ id: z.id, position: z.position });
+    const contested = zones.filter(z => !z.isHomeBase && z.state === ZoneState.CONTESTED).map(toAnchor);
+    const captured = zones.filter(z => !z.isHomeBase && z.state !== ZoneState.CONTESTED).map(toAnchor);
+    const hqs = zones.filter(z => z.isHomeBase).map(toAnchor);
     return [...contested, ...captured, ...hqs];
   }
 
-  private getHQZonesForFaction(faction: Faction, config?: any): Array<{ position: THREE.Vector3 }> {
-    const zones = config?.zones as Array<{ isHomeBase: boolean; owner: Faction; position: THREE.Vector3 }> | undefined;
+  private getHQZonesForFaction(faction: Faction, config?: any): Array<{ id: string; position: THREE.Vector3 }> {
+    const zones = config?.zones as Array<{ id: string; isHomeBase: boolean; owner: Faction; position: THREE.Vector3 }> | undefined;
     if (!zones) return [];
-    return zones.filter(z => z.isHomeBase && z.owner === faction).map(z => ({ position: z.position }));
+    return zones.filter(z => z.isHomeBase && z.owner === faction).map(z => ({ id: z.id, position: z.position }));
+  }
+
+  // Baked spawn candidate for the zone (ground heights included), else a random offset around it
+  private getSpawnNear(
+    zoneId: string,
+    anchor: THREE.Vector3,
+    minRadius: number,
+    maxRadius: number
+  ): { position: THREE.Vector3; slotHeights?: ArrayLike<number> } {
+    const candidate = this.gameModeManager?.getSpawnCandidate(zoneId);
+    if (candidate) {
+      return { position: candidate.position.clone(), slotHeights: candidate.slotHeights };
+    }
+    return { position: anchor.clone().add(this.randomSpawnOffset(minRadius, maxRadius)) };
   }
 
   private randomSquadSize(): number {
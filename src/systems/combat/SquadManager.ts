@@ -17,7 +17,8 @@ export class SquadManager {
   createSquad(
     faction: Faction,
     centerPosition: THREE.Vector3,
-    squadSize: number
+    squadSize: number,
+    slotHeights?: ArrayLike<number>
   ): { squad: Squad; members: Combatant[] } {
     const squadId = `squad_${faction}_${this.nextSquadId++}`;
     const squad: Squad = {
@@ -30,8 +31,13 @@ export class SquadManager {
     const members: Combatant[] = [];
 
     for (let i = 0; i < squadSize; i++) {
-      const position = this.calculateFormationPosition(centerPosition, i);
-      position.y = this.getTerrainHeight(position.x, position.z) + 3;
+      // Table candidates were checked against the terrain once (GameModeManager.getSpawnCandidate),
+      // so members stand exactly on the baked slots and use their heights without a terrain query
+      const position = this.calculateFormationPosition(centerPosition, i, !slotHeights);
+      const ground = slotHeights && i < slotHeights.length
+        ? slotHeights[i]
+        : this.getTerrainHeight(position.x, position.z);
+      position.y = ground + 3;
 
       const role = i === 0 ? 'leader' : 'follower';
       const combatant = this.combatantFactory.createCombatant(
@@ -54,7 +60,7 @@ export class SquadManager {
     return { squad, members };
   }
 
-  private calculateFormationPosition(centerPos: THREE.Vector3, index: number): THREE.Vector3 {
+  private calculateFormationPosition(centerPos: THREE.Vector3, index: number, jitter = true): THREE.Vector3 {
     let offset: THREE.Vector3;
 
     if (index === 0) {
@@ -71,9 +77,11 @@ export class SquadManager {
         -row * 4 // 4 meters behind each row
       );
 
-      // Add small random variation to avoid perfect grid
-      offset.x += (Math.random() - 0.5) * 1.5;
-      offset.z += (Math.random() - 0.5) * 1.5;
+      // Add small random variation to avoid perfect grid (not on baked slots, whose heights are per vertex)
+      if (jitter) {
+        offset.x += (Math.random() - 0.5) * 1.5;
+        offset.z += (Math.random() - 0.5) * 1.5;
+      }
     }
 
     return centerPos.clone().add(offset);
@@ -9,6 +9,7 @@ export class HelipadSystem implements GameSystem {
   private vegetationSystem?: any;
   private gameModeManager?: GameModeManager;
   private helipads: Map<string, THREE.Group> = new Map();
+  private insertionPrefetched = false;
 
   constructor(scene: THREE.Scene) {
     this.scene = scene;
@@ -262,6 +263,12 @@ export class HelipadSystem implements GameSystem {
       const isOpenFrontier = currentConfig.id === 'open_frontier';
 
       if (isOpenFrontier) {
+        // Warm the pad's chunks and textures for helicopter insertion instead of waiting for streaming to reach them
+        if (!this.insertionPrefetched) {
+          this.gameModeManager.prefetchArrival('us_helipad');
+          this.insertionPrefetched = true;
+        }
+
         // Open Frontier mode only: at (40, 0, -1400)
         const openFrontierX = 40;
         const openFrontierZ = -1400;
@@ -300,6 +307,7 @@ export class HelipadSystem implements GameSystem {
       });
     });
     this.helipads.clear();
+    this.insertionPrefetched = false;
     console.log('🧹 HelipadSystem disposed');
   }
 }
\ No newline at end of file
@@ -448,6 +448,12 @@ export class PlayerRespawnManager implements GameSystem {
       z => z.id === 'us_base' || (z.isHomeBase && z.owner === Faction.US)
     );
 
+    const candidate = usBase ? this.gameModeManager?.getSpawnCandidate(usBase.id) : undefined;
+    if (candidate) {
+      this.respawn(candidate.position.clone().add(new THREE.Vector3(0, 2, 0)));
+      return;
+    }
+
     const basePos = usBase ? usBase.position.clone() : new THREE.Vector3(0, 5, -50);
     basePos.y = 5;
     this.respawn(basePos);
@@ -459,7 +465,11 @@ export class PlayerRespawnManager implements GameSystem {
     const zone = this.zoneManager.getAllZones().find(z => z.id === zoneId);
     if (!zone) return;
 
-    const target = zone.position.clone().add(new THREE.Vector3(5, 2, 5));
+    // Baked candidates are already on dry, walkable, low-exposure ground
+    const candidate = this.gameModeManager?.getSpawnCandidate(zoneId);
+    const target = candidate
+      ? candidate.position.clone().add(new THREE.Vector3(0, 2, 0))
+      : zone.position.clone().add(new THREE.Vector3(5, 2, 5));
     this.respawn(target);
   }
 
@@ -520,6 +530,12 @@ export class PlayerRespawnManager implements GameSystem {
     // Show respawn UI immediately
     this.showRespawnUI();
 
+    // Warm the first spawn point (the US base) during the countdown until the player picks another
+    const defaultSpawn = this.availableSpawnPoints[0];
+    if (defaultSpawn) {
+      this.gameModeManager?.prefetchArrival(defaultSpawn.id);
+    }
+
     // Trigger callback
     if (this.onDeathCallback) {
       this.onDeathCallback();
@@ -638,6 +654,7 @@ export class PlayerRespawnManager implements GameSystem {
 
   private selectSpawnPointOnMap(zoneId: string, zoneName: string): void {
     this.selectedSpawnPoint = zoneId;
+    this.gameModeManager?.prefetchArrival(zoneId);
 
     // Update selected spawn info
     const nameElement = document.getElementById('selected-spawn-name');
@@ -1,5 +1,6 @@
 import * as THREE from 'three';
 import { computeBoundsTree, disposeBoundsTree, acceleratedRaycast } from 'three-mesh-bvh';
+import { mergeGeometries } from 'three/examples/jsm/utils/BufferGeometryUtils.js';
 import { AssetLoader } from '../assets/AssetLoader';
 import { NoiseGenerator } from '../../utils/NoiseGenerator';
 import { GlobalBillboardSystem } from '../world/billboard/GlobalBillboardSystem';
@@ -24,6 +25,13 @@ export class ImprovedChunk {
   private heightData: Float32Array;
   private terrainMesh?: THREE.Mesh;
   private terrainGeometry?: THREE.BufferGeometry;
+
+  // Baked LOD meshes (levels 1+); at level 0 a skirt merged into terrainGeometry hides cracks against them
+  private lodMesh?: THREE.Mesh;
+  private lodGeometries: THREE.BufferGeometry[] = [];
+  private hasSkirt = false;
+  private lodLevel = 0;
+  private visible = true;
   
   // Billboard instances - Full jungle layers
   private globalBillboardSystem: GlobalBillboardSystem;
@@ -414,6 +422,11 @@ export class ImprovedChunk {
     return h0 * (1 - fz) + h1 * fz;
   }
 
+  // Height queries only reflect the real terrain once the mesh exists
+  hasTerrain(): boolean {
+    return !!this.terrainMesh && !!this.terrainGeometry;
+  }
+
   /**
    * Get height at world coordinates using raycasting with BVH
    */
@@ -457,6 +470,8 @@ export class ImprovedChunk {
   }
 
   dispose(): void {
+    this.disposeLods();
+
     if (this.terrainMesh) {
       this.scene.remove(this.terrainMesh);
       
@@ -476,9 +491,8 @@ export class ImprovedChunk {
   }
 
   setVisible(visible: boolean): void {
-    if (this.terrainMesh) {
-      this.terrainMesh.visible = visible;
-    }
+    this.visible = visible;
+    this.applyLod();
   }
 
   getPosition(): THREE.Vector3 {
@@ -497,7 +511,119 @@ export class ImprovedChunk {
   }
 
   setLODLevel(level: number): void {
-    // Future: Implement LOD switching
+    this.lodLevel = level;
+    this.applyLod();
+  }
+
+  /**
+   * Attach baked LOD geometries (from TerrainLods, level 1 first). Level 0
+   * keeps the full-resolution mesh and gains a skirt, merged into the same
+   * geometry so it costs no extra draw call, so it meets simplified
+   * neighbours without cracks; the baked meshes carry their own skirts.
+   */
+  setLodGeometries(geometries: THREE.BufferGeometry[], skirtDepth: number): void {
+    if (!this.terrainMesh || geometries.length === 0) return;
+    this.disposeLods();
+
+    const position = this.getPosition();
+    const material = this.terrainMesh.material;
+    this.lodGeometries = geometries;
+
+    this.lodMesh = new THREE.Mesh(geometries[0], material);
+    this.lodMesh.position.copy(position);
+    this.lodMesh.name = `chunk_${this.chunkX},${this.chunkZ}_terrain_lod`;
+    this.lodMesh.receiveShadow = true;
+
+    // Collision and height queries stay on the full-resolution terrainMesh (hidden meshes still raycast)
+    this.lodMesh.raycast = () => {};
+
+    this.mergeSkirt(skirtDepth);
+    this.scene.add(this.lodMesh);
+    this.applyLod();
+  }
+
+  /**
+   * Append the skirt to terrainGeometry and rebuild its BVH. The curtain
+   * hangs below the neighbours' surfaces, so downward height rays still hit
+   * the top first.
+   */
+  private mergeSkirt(depth: number): void {
+    if (!this.terrainMesh || !this.terrainGeometry || this.hasSkirt) return;
+    const skirt = this.createSkirtGeometry(depth);
+    const merged = mergeGeometries([this.terrainGeometry, skirt]);
+    skirt.dispose();
+    if (!merged) return;
+
+    (this.terrainGeometry as any).disposeBoundsTree();
+    this.terrainGeometry.dispose();
+    (merged as any).computeBoundsTree();
+    this.terrainGeometry = merged;
+    this.terrainMesh.geometry = merged;
+    this.hasSkirt = true;
+  }
+
+  private applyLod(): void {
+    if (!this.terrainMesh) return;
+
+    const baked = this.lodMesh !== undefined && this.lodLevel > 0;
+    if (this.lodMesh && baked) {
+      this.lodMesh.geometry = this.lodGeometries[Math.min(this.lodLevel, this.lodGeometries.length) - 1];
+    }
+
+    this.terrainMesh.visible = this.visible && !baked;
+    if (this.lodMesh) this.lodMesh.visible = this.visible && baked;
+  }
+
+  /**
+   * Vertical curtain hanging from the chunk border of the full-resolution grid
+   */
+  private createSkirtGeometry(depth: number): THREE.BufferGeometry {
+    const segments = this.segments;
+    const positions: number[] = [];
+    const uvs: number[] = [];
+    const indices: number[] = [];
+    const sides: Array<(i: number) => [number, number]> = [
+      i => [i, 0],
+      i => [segments, i],
+      i => [segments - i, segments],
+      i => [0, segments - i]
+    ];
+
+    sides.forEach(side => {
+      const base = positions.length / 3;
+      for (let i = 0; i <= segments; i++) {
+        const [col, row] = side(i);
+        const x = (col / segments) * this.size - this.size / 2;
+        const z = (row / segments) * this.size - this.size / 2;
+        const height = this.heightData[row * (segments + 1) + col];
+        positions.push(x, height, z, x, height - depth, z);
+        uvs.push(col / segments, 1 - row / segments, col / segments, 1 - row / segments);
+      }
+      for (let i = 0; i < segments; i++) {
+        const top = base + i * 2;
+        indices.push(top, top + 2, top + 1, top + 1, top + 2, top + 3);
+      }
+    });
+
+    const geometry = new THREE.BufferGeometry();
+    geometry.setAttribute('position', new THREE.Float32BufferAttribute(positions, 3));
+    geometry.setAttribute('uv', new THREE.Float32BufferAttribute(uvs, 2));
+    geometry.setIndex(indices);
+    geometry.computeVertexNormals();
+    return geometry;
+  }
+
+  private disposeLods(): void {
+    if (this.lodMesh) {
+      this.scene.remove(this.lodMesh);
+      this.lodMesh = undefined;
+    }
+    this.lodGeometries.forEach(geometry => geometry.dispose());
+    this.lodGeometries = [];
+  }
+
+  getHeightData(): Float32Array {
+    return this.heightData;
   }
 
   /**
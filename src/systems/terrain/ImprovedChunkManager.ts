@@ -2,6 +2,7 @@ import * as THREE from 'three';
 import { GameSystem } from '../../types';
 import { Chunk } from './Chunk';
 import { ImprovedChunk } from './ImprovedChunk';
+import { TerrainLods } from './TerrainLods';
 import { NoiseGenerator } from '../../utils/NoiseGenerator';
 import { AssetLoader } from '../assets/AssetLoader';
 import { GlobalBillboardSystem } from '../world/billboard/GlobalBillboardSystem';
@@ -23,11 +24,18 @@ export class ImprovedChunkManager implements GameSystem {
   private config: ChunkConfig;
   private noiseGenerator: NoiseGenerator;
   private globalBillboardSystem: GlobalBillboardSystem;
+  private terrainLods?: TerrainLods;
+  private readonly TERRAIN_SEED = 12345; // scripts/bake_terrain_lods.py bakes with the same seed
   
   // Chunk storage
   private chunks: Map<string, ImprovedChunk> = new Map();
   private loadingChunks: Set<string> = new Set();
   private loadQueue: Array<{x: number, z: number, priority: number}> = [];
+
+  // Arrival area being warmed during a respawn countdown; kept loaded until the player gets there
+  private prefetchCenter?: THREE.Vector2;
+  private prefetchRadius = 0;
+  private prefetchChunks: Array<{x: number, z: number}> = [];
   
   // Player tracking
   private playerPosition = new THREE.Vector3();
@@ -64,13 +72,16 @@ export class ImprovedChunkManager implements GameSystem {
     this.assetLoader = assetLoader;
     this.globalBillboardSystem = globalBillboardSystem;
     this.config = config;
-    this.noiseGenerator = new NoiseGenerator(12345);
+    this.noiseGenerator = new NoiseGenerator(this.TERRAIN_SEED);
   }
 
   async init(): Promise<void> {
     console.log('🗺️ Improved ChunkManager: Initializing...');
     const maxChunks = (this.config.loadDistance * 2 + 1) ** 2;
     console.log(`Config: render=${this.config.renderDistance}, load=${this.config.loadDistance}, max chunks=${maxChunks}, chunk size=${this.config.size}`);
+
+    // Optional baked LOD meshes for distant rings; without them every chunk stays full detail
+    this.terrainLods = await TerrainLods.load(this.TERRAIN_SEED, this.config.size);
     
     // Start with smaller immediate area to reduce initial load
     const initialChunks = this.getChunksInRadius(new THREE.Vector3(0, 0, 0), 1);
@@ -109,6 +120,10 @@ export class ImprovedChunkManager implements GameSystem {
       
       // Check if player moved to different chunk
       const currentChunkPos = this.worldToChunkCoord(this.playerPosition);
+      if (this.prefetchCenter && this.chebyshev(currentChunkPos, this.prefetchCenter) <= 1) {
+        // Arrived: the regular distance rules take over from here
+        this.clearPrefetch();
+      }
       if (!currentChunkPos.equals(this.lastChunkPosition)) {
         this.updateLoadQueue();
         this.lastChunkPosition.copy(currentChunkPos);
@@ -130,6 +145,7 @@ export class ImprovedChunkManager implements GameSystem {
     this.chunks.clear();
     this.loadingChunks.clear();
     this.loadQueue = [];
+    this.clearPrefetch();
     console.log('🧹 ImprovedChunkManager: Disposed');
   }
 
@@ -166,6 +182,51 @@ export class ImprovedChunkManager implements GameSystem {
     
     // Sort by priority (closer chunks first)
     this.loadQueue.sort((a, b) => a.priority - b.priority);
+
+    // A pending arrival goes ahead of the area the player is leaving
+    this.queuePrefetchChunks();
+  }
+
+  /**
+   * Warm an arrival area ahead of the player (respawn countdown, helipad).
+   * Chunks are expected nearest first, as scripts/build_prefetch_manifest.py
+   * orders them; they jump the load queue and are kept until the player arrives.
+   */
+  prefetchAround(position: THREE.Vector3, chunks: Array<{x: number, z: number}>, textures: string[] = []): void {
+    this.prefetchCenter = this.worldToChunkCoord(position);
+    this.prefetchChunks = chunks;
+    this.prefetchRadius = chunks.reduce((radius, { x, z }) =>
+      Math.max(radius, this.chebyshev(new THREE.Vector2(x, z), this.prefetchCenter!)), 0);
+    this.queuePrefetchChunks();
+    this.assetLoader.prioritizeTextures(textures);
+  }
+
+  clearPrefetch(): void {
+    this.prefetchCenter = undefined;
+    this.prefetchRadius = 0;
+    this.prefetchChunks = [];
+  }
+
+  private queuePrefetchChunks(): void {
+    if (this.prefetchChunks.length === 0) return;
+    const pending = this.prefetchChunks.filter(({ x, z }) => {
+      const chunkKey = this.getChunkKey(x, z);
+      return !this.chunks.has(chunkKey) && !this.loadingChunks.has(chunkKey);
+    });
+    const queued = new Set(pending.map(({ x, z }) => this.getChunkKey(x, z)));
+    this.loadQueue = [
+      ...pending.map(({ x, z }) => ({ x, z, priority: -1 })),
+      ...this.loadQueue.filter(item => !queued.has(this.getChunkKey(item.x, item.z)))
+    ];
+  }
+
+  private isPrefetched(chunkX: number, chunkZ: number): boolean {
+    return this.prefetchCenter !== undefined &&
+      this.chebyshev(new THREE.Vector2(chunkX, chunkZ), this.prefetchCenter) <= this.prefetchRadius;
+  }
+
+  private chebyshev(a: THREE.Vector2, b: THREE.Vector2): number {
+    return Math.max(Math.abs(a.x - b.x), Math.abs(a.y - b.y));
   }
 
   private async processLoadQueue(): Promise<void> {
@@ -213,6 +274,7 @@ export class ImprovedChunkManager implements GameSystem {
       );
 
       await chunk.generate();
+      await this.attachTerrainLods(chunk, chunkX, chunkZ);
       this.chunks.set(chunkKey, chunk);
       console.log(`✅ Loaded initial chunk (${chunkX}, ${chunkZ})`);
     } catch (error) {
@@ -243,10 +305,11 @@ export class ImprovedChunkManager implements GameSystem {
         );
 
         await chunk.generate();
+        await this.attachTerrainLods(chunk, chunkX, chunkZ);
         const currentDistance = this.getChunkDistanceFromPlayer(chunkX, chunkZ);
 
         // Only add if still needed (player might have moved away)
-        if (currentDistance <= this.config.loadDistance) {
+        if (currentDistance <= this.config.loadDistance || this.isPrefetched(chunkX, chunkZ)) {
           this.chunks.set(chunkKey, chunk);
           console.log(`📦 Async loaded chunk (${chunkX}, ${chunkZ})`);
         } else {
@@ -261,6 +324,19 @@ export class ImprovedChunkManager implements GameSystem {
     }, 0);
   }
 
+  private async attachTerrainLods(chunk: ImprovedChunk, chunkX: number, chunkZ: number): Promise<void> {
+    if (!this.terrainLods) return;
+    try {
+      const geometries = await this.terrainLods.getChunk(chunkX, chunkZ, chunk.getHeightData());
+      if (geometries) {
+        chunk.setLodGeometries(geometries, this.terrainLods.skirtDepth);
+      }
+    } catch (error) {
+      // A missing LOD only costs draw time; the chunk itself is fine
+      console.warn(`⚠️ No terrain LOD for chunk (${chunkX}, ${chunkZ}):`, error);
+    }
+  }
+
   private unloadDistantChunks(): void {
     const chunksToUnload: string[] = [];
     
@@ -269,7 +345,7 @@ export class ImprovedChunkManager implements GameSystem {
       const distance = this.getChunkDistanceFromPlayer(x, z);
       
       // Unload chunks beyond load distance
-      if (distance > this.config.loadDistance + 1) {
+      if (distance > this.config.loadDistance + 1 && !this.isPrefetched(x, z)) {
         chunksToUnload.push(key);
       }
     });
@@ -357,6 +433,12 @@ export class ImprovedChunkManager implements GameSystem {
     return chunk ? chunk.getHeightAt(x, z) : 0;
   }
 
+  // Runtime ground height, or undefined while the chunk under (x, z) is not generated yet
+  getLoadedHeightAt(x: number, z: number): number | undefined {
+    const chunk = this.getChunkAt(new THREE.Vector3(x, 0, z));
+    return chunk?.hasTerrain() ? chunk.getHeightAt(x, z) : undefined;
+  }
+
   // Collision objects registry
   private collisionObjects: Map<string, THREE.Object3D> = new Map();
 
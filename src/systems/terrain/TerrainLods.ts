@@ -0,0 +1,166 @@
+import * as THREE from 'three';
+import { getTerrainPath } from '../../config/paths';
+
+// Reader for the terrain LOD pack written by scripts/bake_terrain_lods.py.
+// Layout: 16-byte header ('TJTL', version, reserved, index length, data offset),
+// a JSON index, then one block per chunk: a 12-byte header per level (vertex count,
+// index count, y min, y step) followed by each level's quantized vertices
+// (u8 col, u8 row, u16 height) and u16 indices padded to 4 bytes.
+
+interface TerrainLodIndex {
+  version: number;
+  seed: number;
+  chunk_size: number;
+  segments: number;
+  skirt_depth: number;
+  levels: Array<{ level: number; max_error: number }>;
+  chunks: Record<string, [number, number]>;
+}
+
+const PACK_MAGIC = 'TJTL';
+const PACK_VERSION = 1;
+const HEADER_SIZE = 16;
+const LEVEL_HEADER_SIZE = 12;
+const VERTEX_SIZE = 4;
+// Slack on top of one quantization step when checking baked heights against the runtime ones
+const HEIGHT_TOLERANCE = 0.01;
+
+export class TerrainLods {
+  readonly url: string;
+  readonly skirtDepth: number;
+  private index: TerrainLodIndex;
+  private buffer?: ArrayBuffer;
+  private mismatched = false;
+
+  private constructor(url: string, index: TerrainLodIndex, buffer?: ArrayBuffer) {
+    this.url = url;
+    this.index = index;
+    this.skirtDepth = index.skirt_depth;
+    this.buffer = buffer;
+  }
+
+  // Fetch the header and index; chunk blocks are then pulled with Range requests.
+  // Resolves to undefined when no pack was baked or it was baked for other terrain settings.
+  static async load(seed: number, chunkSize: number): Promise<TerrainLods | undefined> {
+    const url = getTerrainPath('terrain_lods.bin');
+    try {
+      const response = await fetch(url, { headers: { Range: `bytes=0-${HEADER_SIZE - 1}` } });
+      if (!response.ok) {
+        throw new Error(`Failed to fetch ${url}: ${response.status}`);
+      }
+      // A server without Range support sends the whole pack; keep it instead of refetching per chunk
+      const whole = response.status === 206 ? undefined : await response.arrayBuffer();
+      const head = whole ?? await response.arrayBuffer();
+      const index = TerrainLods.parseIndex(
+        whole ?? await TerrainLods.fetchRange(url, 0, HEADER_SIZE + new DataView(head).getUint32(8, true))
+      );
+      if (index.seed !== seed || index.chunk_size !== chunkSize) {
+        console.warn(`⚠️ Terrain LODs baked for seed ${index.seed} / ${index.chunk_size}m chunks, ` +
+          `terrain uses ${seed} / ${chunkSize}m; rebake with scripts/bake_terrain_lods.py`);
+        return undefined;
+      }
+      console.log(`🏔️ Terrain LODs: ${Object.keys(index.chunks).length} chunks, ` +
+        `${index.levels.map(l => `L${l.level} ≤${l.max_error}m`).join(', ')}`);
+      return new TerrainLods(url, index, whole);
+    } catch (error) {
+      console.warn(`⚠️ Terrain LODs unavailable, distant chunks keep full detail:`, error);
+      return undefined;
+    }
+  }
+
+  private static async fetchRange(url: string, start: number, length: number): Promise<ArrayBuffer> {
+    const response = await fetch(url, { headers: { Range: `bytes=${start}-${start + length - 1}` } });
+    if (!response.ok) {
+      throw new Error(`Failed to fetch ${url} [${start}, +${length}]: ${response.status}`);
+    }
+    const buffer = await response.arrayBuffer();
+    return response.status === 206 ? buffer : buffer.slice(start, start + length);
+  }
+
+  private static parseIndex(buffer: ArrayBuffer): TerrainLodIndex {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+    if (magic !== PACK_MAGIC) {
+      throw new Error(`Not a terrain LOD pack (magic ${magic})`);
+    }
+    const version = view.getUint16(4, true);
+    if (version !== PACK_VERSION) {
+      throw new Error(`Unsupported terrain LOD pack version ${version}`);
+    }
+    const indexLength = view.getUint32(8, true);
+    return JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, HEADER_SIZE, indexLength)));
+  }
+
+  getLevelCount(): number {
+    return this.index.levels.length;
+  }
+
+  /**
+   * One geometry per baked level (LOD 1 and up), laid out like the runtime
+   * chunk mesh (centred, Y up). The chunk's own height data is used to check
+   * the bake: if the offline noise ever drifts from the runtime noise, the
+   * pack is disabled rather than drawing mismatched terrain.
+   */
+  async getChunk(chunkX: number, chunkZ: number, heightData: Float32Array): Promise<THREE.BufferGeometry[] | undefined> {
+    const entry = this.index.chunks[`${chunkX},${chunkZ}`];
+    const segments = this.index.segments;
+    if (this.mismatched || !entry || heightData.length !== (segments + 1) ** 2) {
+      return undefined;
+    }
+
+    const [offset, length] = entry;
+    const block = this.buffer
+      ? this.buffer.slice(offset, offset + length)
+      : await TerrainLods.fetchRange(this.url, offset, length);
+    const view = new DataView(block);
+    const size = this.index.chunk_size;
+    const geometries: THREE.BufferGeometry[] = [];
+    let cursor = this.index.levels.length * LEVEL_HEADER_SIZE;
+
+    for (let level = 0; level < this.index.levels.length; level++) {
+      const header = level * LEVEL_HEADER_SIZE;
+      const vertexCount = view.getUint16(header, true);
+      const indexCount = view.getUint16(header + 2, true);
+      const yMin = view.getFloat32(header + 4, true);
+      const yStep = view.getFloat32(header + 8, true);
+      const tolerance = yStep + HEIGHT_TOLERANCE;
+
+      const positions = new Float32Array(vertexCount * 3);
+      const uvs = new Float32Array(vertexCount * 2);
+      for (let i = 0; i < vertexCount; i++, cursor += VERTEX_SIZE) {
+        const col = view.getUint8(cursor);
+        const row = view.getUint8(cursor + 1);
+        const y = yMin + view.getUint16(cursor + 2, true) * yStep;
+
+        // Surface vertices sit on the grid height, skirt vertices skirtDepth below it
+        const expected = heightData[row * (segments + 1) + col];
+        if (Math.abs(y - expected) > tolerance && Math.abs(y - expected + this.skirtDepth) > tolerance) {
+          this.mismatched = true;
+          geometries.forEach(geometry => geometry.dispose());
+          console.warn(`⚠️ Baked terrain LOD for chunk (${chunkX}, ${chunkZ}) does not match runtime heights ` +
+            `(${y.toFixed(2)} vs ${expected.toFixed(2)}); disabling terrain LODs`);
+          return undefined;
+        }
+
+        positions[i * 3] = (col / segments) * size - size / 2;
+        positions[i * 3 + 1] = y;
+        positions[i * 3 + 2] = (row / segments) * size - size / 2;
+        uvs[i * 2] = col / segments;
+        uvs[i * 2 + 1] = 1 - row / segments;
+      }
+
+      const indices = new Uint16Array(block, cursor, indexCount);
+      cursor += (indexCount * 2 + 3) & ~3;
+
+      const geometry = new THREE.BufferGeometry();
+      geometry.setAttribute('position', new THREE.BufferAttribute(positions, 3));
+      geometry.setAttribute('uv', new THREE.BufferAttribute(uvs, 2));
+      geometry.setIndex(new THREE.BufferAttribute(indices, 1));
+      geometry.computeVertexNormals();
+      geometry.computeBoundingSphere();
+      geometries.push(geometry);
+    }
+
+    return geometries;
+  }
+}
@@ -5,6 +5,8 @@ import { CombatantSystem } from '../combat/CombatantSystem';
 import { TicketSystem } from './TicketSystem';
 import { ImprovedChunkManager } from '../terrain/ImprovedChunkManager';
 import { MinimapSystem } from '../../ui/minimap/MinimapSystem';
+import { SpawnCandidate, SpawnTables } from './SpawnTables';
+import { PrefetchManifest } from './PrefetchManifest';
 
 export class GameModeManager implements GameSystem {
   public currentMode: GameMode = GameMode.ZONE_CONTROL;
@@ -17,6 +19,11 @@ export class GameModeManager implements GameSystem {
   private chunkManager?: ImprovedChunkManager;
   private minimapSystem?: MinimapSystem;
 
+  // Baked spawn candidates per zone (optional)
+  private spawnTables?: SpawnTables;
+  // Chunks and textures to warm per arrival point (optional)
+  private prefetchManifest?: PrefetchManifest;
+
   // Callbacks
   private onModeChange?: (mode: GameMode, config: GameModeConfig) => void;
 
@@ -27,6 +34,8 @@ export class GameModeManager implements GameSystem {
   async init(): Promise<void> {
     console.log('🎮 Initializing Game Mode Manager...');
     console.log(`Default mode: ${this.currentConfig.name}`);
+    this.spawnTables = await SpawnTables.load();
+    this.prefetchManifest = await PrefetchManifest.load();
   }
 
   update(deltaTime: number): void {
@@ -69,6 +78,7 @@ export class GameModeManager implements GameSystem {
     console.log(`🎮 GameModeManager: Switching game mode to: ${mode}`);
     this.currentMode = mode;
     this.currentConfig = getGameModeConfig(mode);
+    this.spawnTables?.reset();
     console.log(`🎮 GameModeManager: World size is now ${this.currentConfig.worldSize}, zones: ${this.currentConfig.zones.length}`);
 
     // Notify listeners
@@ -144,6 +154,23 @@ export class GameModeManager implements GameSystem {
     return this.currentConfig.worldSize;
   }
 
+  // Next baked spawn point for a zone in the current mode, if tables were baked and match the terrain
+  public getSpawnCandidate(zoneId: string): SpawnCandidate | undefined {
+    const candidate = this.spawnTables?.next(this.currentMode, zoneId);
+    if (!candidate || !this.spawnTables) return undefined;
+    const ground = this.chunkManager?.getLoadedHeightAt(candidate.position.x, candidate.position.z);
+    return this.spawnTables.verify(candidate, ground) ? candidate : undefined;
+  }
+
+  // Start warming the chunks and textures around a zone or helipad the player is about to arrive at
+  public prefetchArrival(arrivalId: string): void {
+    const arrival = this.prefetchManifest?.get(this.currentMode, arrivalId);
+    if (!arrival || !this.chunkManager) return;
+    this.chunkManager.prefetchAround(arrival.position, arrival.chunks, arrival.textures);
+    console.log(`🧭 Prefetching ${arrivalId}: ${arrival.chunks.length} chunks (~${arrival.generateSeconds.toFixed(1)}s to generate), ` +
+      `${(arrival.bytes / (1024 * 1024)).toFixed(1)} MB to download`);
+  }
+
   // Get view distance
   public getViewDistance(): number {
     return this.currentConfig.viewDistance;
@@ -0,0 +1,96 @@
+import * as THREE from 'three';
+import { getPrefetchManifestPath } from '../../config/paths';
+
+// Reader for the arrival prefetch lists written by scripts/build_prefetch_manifest.py.
+// Each arrival (spawn zone or helipad) lists the chunks and still-streaming textures
+// needed there, nearest ring first and cheapest first within a ring.
+
+interface PrefetchItem {
+  type: 'chunk' | 'texture';
+  ring: number;
+  // Download size; for chunks that is only the baked LOD block, generation time is separate
+  bytes: number;
+  generate_seconds?: number;
+  key?: string;
+  name?: string;
+  path?: string;
+}
+
+interface PrefetchManifestFile {
+  version: number;
+  chunk_size: number;
+  modes: Record<string, {
+    arrivals: Record<string, { kind: string; position: [number, number]; items: PrefetchItem[] }>;
+  }>;
+}
+
+export interface PrefetchArrival {
+  position: THREE.Vector3;
+  chunks: Array<{ x: number; z: number }>;
+  textures: string[];
+  bytes: number;
+  generateSeconds: number;
+}
+
+const MANIFEST_VERSION = 1;
+const CHUNK_SIZE = 64; // ImprovedChunkManager chunk size the chunk keys refer to
+
+export class PrefetchManifest {
+  private arrivals: Map<string, PrefetchArrival> = new Map();
+
+  private constructor(manifest: PrefetchManifestFile) {
+    for (const [mode, entry] of Object.entries(manifest.modes)) {
+      for (const [arrivalId, arrival] of Object.entries(entry.arrivals)) {
+        const chunks: Array<{ x: number; z: number }> = [];
+        const textures: string[] = [];
+        let bytes = 0;
+        let generateSeconds = 0;
+        for (const item of arrival.items) {
+          bytes += item.bytes;
+          generateSeconds += item.generate_seconds ?? 0;
+          if (item.type === 'chunk' && item.key) {
+            const [x, z] = item.key.split(',').map(Number);
+            chunks.push({ x, z });
+          } else if (item.type === 'texture' && item.name) {
+            textures.push(item.name);
+          }
+          // Audio is listed for byte accounting; AudioManager already loads it all at startup
+        }
+        this.arrivals.set(PrefetchManifest.key(mode, arrivalId), {
+          position: new THREE.Vector3(arrival.position[0], 0, arrival.position[1]),
+          chunks,
+          textures,
+          bytes,
+          generateSeconds
+        });
+      }
+    }
+  }
+
+  // Resolves to undefined when no manifest was built; arrivals then stream in as usual
+  static async load(): Promise<PrefetchManifest | undefined> {
+    try {
+      const response = await fetch(getPrefetchManifestPath());
+      if (!response.ok) return undefined;
+      const manifest = await response.json() as PrefetchManifestFile;
+      if (manifest.version !== MANIFEST_VERSION || manifest.chunk_size !== CHUNK_SIZE) {
+        console.warn(`⚠️ Prefetch manifest v${manifest.version} (chunk ${manifest.chunk_size}) does not match runtime, ignoring`);
+        return undefined;
+      }
+      const prefetch = new PrefetchManifest(manifest);
+      console.log(`🧭 Prefetch manifest: ${prefetch.arrivals.size} arrivals`);
+      return prefetch;
+    } catch (error) {
+      console.warn('No prefetch manifest available, arrivals will stream on demand', error);
+      return undefined;
+    }
+  }
+
+  private static key(mode: string, arrivalId: string): string {
+    return `${mode}:${arrivalId}`;
+  }
+
+  get(mode: string, arrivalId: string): PrefetchArrival | undefined {
+    return this.arrivals.get(PrefetchManifest.key(mode, arrivalId));
+  }
+}
@@ -0,0 +1,111 @@
+import * as THREE from 'three';
+import { getSpawnTablePath } from '../../config/paths';
+
+// Reader for the ranked spawn candidates written by scripts/bake_spawn_tables.py.
+// Each zone's candidates are a flat array with `stride` numbers per candidate:
+// x, y (ground), z, LOS exposure, then the ground height under every formation slot.
+
+export interface SpawnCandidate {
+  position: THREE.Vector3;
+  exposure: number;
+  slotHeights: Float32Array;
+}
+
+interface SpawnTableFile {
+  version: number;
+  seed: number;
+  modes: Record<string, { stride: number; formation: number[][]; zones: Record<string, number[]> }>;
+}
+
+const TABLE_VERSION = 1;
+// Baked heights are rounded to centimetres; a bigger gap means the bake no longer matches the terrain
+const HEIGHT_TOLERANCE = 0.1;
+
+export class SpawnTables {
+  private zones: Map<string, SpawnCandidate[]> = new Map();
+  private cursors: Map<string, number> = new Map();
+  private mismatched = false;
+
+  private constructor(table: SpawnTableFile) {
+    for (const [mode, entry] of Object.entries(table.modes)) {
+      for (const [zoneId, data] of Object.entries(entry.zones)) {
+        const candidates: SpawnCandidate[] = [];
+        for (let i = 0; i + entry.stride <= data.length; i += entry.stride) {
+          candidates.push({
+            position: new THREE.Vector3(data[i], data[i + 1], data[i + 2]),
+            exposure: data[i + 3],
+            slotHeights: Float32Array.from(data.slice(i + 4, i + entry.stride))
+          });
+        }
+        if (candidates.length > 0) {
+          this.zones.set(SpawnTables.key(mode, zoneId), candidates);
+        }
+      }
+    }
+  }
+
+  // Resolves to undefined when no tables were baked; callers keep their random offsets
+  static async load(): Promise<SpawnTables | undefined> {
+    try {
+      const response = await fetch(getSpawnTablePath());
+      if (!response.ok) return undefined;
+      const table = await response.json() as SpawnTableFile;
+      if (table.version !== TABLE_VERSION) {
+        console.warn(`⚠️ Unsupported spawn table version ${table.version}`);
+        return undefined;
+      }
+      const tables = new SpawnTables(table);
+      console.log(`📍 Spawn tables: ${tables.zones.size} zones`);
+      return tables;
+    } catch (error) {
+      console.warn('No spawn tables available, spawning with random offsets', error);
+      return undefined;
+    }
+  }
+
+  private static key(mode: string, zoneId: string): string {
+    return `${mode}:${zoneId}`;
+  }
+
+  has(mode: string, zoneId: string): boolean {
+    return this.zones.has(SpawnTables.key(mode, zoneId));
+  }
+
+  /**
+   * Next candidate for a zone, best ranked first and then round-robin so
+   * back-to-back spawns spread over the zone. The returned candidate is
+   * shared; clone its position before changing it.
+   */
+  next(mode: string, zoneId: string): SpawnCandidate | undefined {
+    if (this.mismatched) return undefined;
+    const key = SpawnTables.key(mode, zoneId);
+    const candidates = this.zones.get(key);
+    if (!candidates) return undefined;
+    const cursor = this.cursors.get(key) ?? 0;
+    this.cursors.set(key, (cursor + 1) % candidates.length);
+    return candidates[cursor];
+  }
+
+  /**
+   * Check a candidate's baked ground against the runtime terrain where that
+   * terrain is already generated (undefined otherwise). One mismatch turns
+   * the tables off for the session, so callers go back to runtime height
+   * queries instead of spawning in the air or underground.
+   */
+  verify(candidate: SpawnCandidate, runtimeGround: number | undefined): boolean {
+    if (this.mismatched) return false;
+    if (runtimeGround === undefined) return true;
+    const drift = Math.abs(runtimeGround - candidate.position.y);
+    if (drift > HEIGHT_TOLERANCE) {
+      console.warn(`⚠️ Spawn tables disagree with terrain by ${drift.toFixed(2)}m, using runtime heights`);
+      this.mismatched = true;
+      return false;
+    }
+    return true;
+  }
+
+  // Start every zone from its best candidate again (new match or mode)
+  reset(): void {
+    this.cursors.clear();
+  }
+}
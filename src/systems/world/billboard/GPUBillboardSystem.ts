@@ -1,5 +1,6 @@
 import * as THREE from 'three';
 import { AssetLoader } from '../../assets/AssetLoader';
+import { PALETTE_SAMPLE_GLSL, PaletteTextures } from '../../assets/PaletteTextures';
 
 // Vertex shader for GPU-based billboard instancing with LOD and culling
 const BILLBOARD_VERTEX_SHADER = `
@@ -93,12 +94,22 @@ const BILLBOARD_FRAGMENT_SHADER = `
   uniform float fadeDistance;
   uniform float maxDistance;
 
+  #ifdef USE_PALETTE
+  uniform sampler2D palette;
+  ${PALETTE_SAMPLE_GLSL}
+  #endif
+
   varying vec2 vUv;
   varying float vDistance;
   varying float vLodFactor;
 
   void main() {
+    #ifdef USE_PALETTE
+    // map is an 8-bit index map (see PaletteTextures)
+    vec4 texColor = paletteSample(map, palette, vUv);
+    #else
     vec4 texColor = texture2D(map, vUv);
+    #endif
 
     // Alpha test for transparency
     if (texColor.a < 0.5) discard;
@@ -119,6 +130,7 @@ const BILLBOARD_FRAGMENT_SHADER = `
 export interface GPUVegetationConfig {
   maxInstances: number;
   texture: THREE.Texture;
+  palette?: THREE.Texture; // When set, texture is a palette index map
   width: number;
   height: number;
   fadeDistance: number;
@@ -180,6 +192,7 @@ export class GPUBillboardVegetation {
     this.material = new THREE.RawShaderMaterial({
       uniforms: {
         map: { value: config.texture },
+        palette: { value: config.palette ?? null },
         time: { value: 0 },
         cameraPosition: { value: new THREE.Vector3() },
         fadeDistance: { value: config.fadeDistance },
@@ -187,6 +200,7 @@ export class GPUBillboardVegetation {
         lodDistances: { value: new THREE.Vector2(150, 300) },
         viewMatrix: { value: new THREE.Matrix4() }
       },
+      defines: config.palette ? { USE_PALETTE: '' } : {},
       vertexShader: BILLBOARD_VERTEX_SHADER,
       fragmentShader: BILLBOARD_FRAGMENT_SHADER,
       transparent: true,
@@ -333,20 +347,41 @@ export class GPUBillboardSystem {
   private chunkInstances: Map<string, Map<string, number[]>> = new Map();
   private scene: THREE.Scene;
   private assetLoader: AssetLoader;
+  private paletteTextures = new PaletteTextures();
+  private usePalettes = false;
 
   constructor(scene: THREE.Scene, assetLoader: AssetLoader) {
     this.scene = scene;
     this.assetLoader = assetLoader;
   }
 
+  // Palette index map (R8 + shared palette) when exported, else the RGBA texture
+  private async spriteTexture(name: string): Promise<{ texture: THREE.Texture; palette?: THREE.Texture }> {
+    if (this.usePalettes && this.paletteTextures.has(name)) {
+      try {
+        const sprite = await this.paletteTextures.getSprite(name);
+        if (sprite) return { texture: sprite.indexMap, palette: sprite.palette };
+      } catch (error) {
+        console.warn(`Failed to load indexed ${name}, using RGBA texture`, error);
+      }
+    }
+    return { texture: this.assetLoader.getTexture(name)! };
+  }
+
   async initialize(): Promise<void> {
     console.log('🚀 Initializing GPU Billboard System...');
 
+    // Indexed sprites exist once scripts/palettize_textures.py has been run
+    this.usePalettes = await this.paletteTextures.init();
+    if (this.usePalettes) {
+      console.log('🎨 GPU Billboard using palette-indexed foliage textures');
+    }
+
     // Initialize each vegetation type with GPU instancing
     const configs: Array<[string, GPUVegetationConfig]> = [
       ['fern', {
         maxInstances: 100000,  // Reduced from 200k
-        texture: this.assetLoader.getTexture('Fern')!,
+        ...await this.spriteTexture('Fern'),
         width: 1.5,
         height: 2.0,
         fadeDistance: 200,  // Reduced fade distance
@@ -354,7 +389,7 @@ export class GPUBillboardSystem {
       }],
       ['elephantEar', {
         maxInstances: 30000,  // Reduced from 50k
-        texture: this.assetLoader.getTexture('ElephantEarPlants')!,
+        ...await this.spriteTexture('ElephantEarPlants'),
         width: 2.5,
         height: 3.0,
         fadeDistance: 250,
@@ -362,7 +397,7 @@ export class GPUBillboardSystem {
       }],
       ['fanPalm', {
         maxInstances: 25000,  // Reduced from 40k
-        texture: this.assetLoader.getTexture('FanPalmCluster')!,
+        ...await this.spriteTexture('FanPalmCluster'),
         width: 3,
         height: 4,
         fadeDistance: 300,
@@ -370,7 +405,7 @@ export class GPUBillboardSystem {
       }],
       ['coconut', {
         maxInstances: 20000,  // Reduced from 30k
-        texture: this.assetLoader.getTexture('CoconutPalm')!,
+        ...await this.spriteTexture('CoconutPalm'),
         width: 5,
         height: 7,
         fadeDistance: 350,
@@ -378,7 +413,7 @@ export class GPUBillboardSystem {
       }],
       ['areca', {
         maxInstances: 30000,  // Reduced from 50k
-        texture: this.assetLoader.getTexture('ArecaPalmCluster')!,
+        ...await this.spriteTexture('ArecaPalmCluster'),
         width: 4,
         height: 6,
         fadeDistance: 300,
@@ -386,7 +421,7 @@ export class GPUBillboardSystem {
       }],
       ['dipterocarp', {
         maxInstances: 10000,
-        texture: this.assetLoader.getTexture('DipterocarpGiant')!,
+        ...await this.spriteTexture('DipterocarpGiant'),
         width: 15,
         height: 20,
         fadeDistance: 500,
@@ -394,7 +429,7 @@ export class GPUBillboardSystem {
       }],
       ['banyan', {
         maxInstances: 10000,
-        texture: this.assetLoader.getTexture('TwisterBanyan')!,
+        ...await this.spriteTexture('TwisterBanyan'),
         width: 14,
         height: 18,
         fadeDistance: 500,
@@ -525,5 +560,6 @@ export class GPUBillboardSystem {
     this.vegetationTypes.forEach(vegetation => vegetation.dispose());
     this.vegetationTypes.clear();
     this.chunkInstances.clear();
+    this.paletteTextures.dispose();
   }
 }
\ No newline at end of file
@@ -21,6 +21,11 @@ export class LoadingStyles {
         width: 100%;
         height: 100%;
         background-image: url('./assets/background.png');
+        /* Resized variants from scripts/generate_icons.py; older browsers keep the PNG */
+        background-image: image-set(
+          url('./splash/background-1536.webp') type('image/webp'),
+          url('./splash/background-1536.jpg') type('image/jpeg')
+        );
         background-size: cover;
         background-position: center;
         background-repeat: no-repeat;
@@ -36,6 +41,15 @@ export class LoadingStyles {
         padding: 1rem;
       }
 
+      @media (max-width: 900px) {
+        #loading-screen {
+          background-image: image-set(
+            url('./splash/background-768.webp') type('image/webp'),
+            url('./splash/background-768.jpg') type('image/jpeg')
+          );
+        }
+      }
+
       /* Overlay for better text readability */
       #loading-screen::before {
         content: '';